@@ -8,6 +8,7 @@ import (
 	"os"
 	"os/signal"
 	"syscall"
+	"time"
 
 	"github.com/containerd/containerd"
 	"github.com/containerd/go-cni"
@@ -135,8 +136,24 @@ func main() {
 		log.Fatalf("Failed to listen: %v", err)
 	}
 
+	// Agent-side readiness: return workers only once their RIE port accepts
+	// connections (AGENT_READINESS_TIMEOUT=0 leaves the check to the Gateway).
+	var serverOpts []api.Option
+	readinessTimeout := 10 * time.Second
+	if v := os.Getenv("AGENT_READINESS_TIMEOUT"); v != "" {
+		d, err := time.ParseDuration(v)
+		if err != nil {
+			log.Fatalf("Invalid AGENT_READINESS_TIMEOUT %q: %v", v, err)
+		}
+		readinessTimeout = d
+	}
+	if readinessTimeout > 0 {
+		serverOpts = append(serverOpts, api.WithReadinessProbe(api.TCPReadinessProbe(readinessTimeout)))
+		log.Printf("Agent-side readiness check enabled (timeout: %s)", readinessTimeout)
+	}
+
 	grpcServer := grpc.NewServer()
-	agentServer := api.NewAgentServer(rt)
+	agentServer := api.NewAgentServer(rt, serverOpts...)
 	pb.RegisterAgentServiceServer(grpcServer, agentServer)
 
 	// Enable reflection for debugging (grpcurl etc.)
@@ -0,0 +1,52 @@
+package api
+
+import (
+	"context"
+	"fmt"
+	"net"
+	"strconv"
+	"time"
+
+	"github.com/poruru/edge-serverless-box/services/agent/internal/runtime"
+)
+
+const (
+	readinessInitialBackoff = 2 * time.Millisecond
+	readinessMaxBackoff     = 50 * time.Millisecond
+	readinessDialTimeout    = time.Second
+)
+
+// ReadinessProbe blocks until a freshly started worker accepts invocations.
+type ReadinessProbe func(ctx context.Context, worker *runtime.WorkerInfo) error
+
+// TCPReadinessProbe dials the worker's RIE port until it accepts a connection.
+// The Agent sits next to the container, so retries start at a few milliseconds
+// and back off exponentially; the whole check gives up after timeout.
+func TCPReadinessProbe(timeout time.Duration) ReadinessProbe {
+	return func(ctx context.Context, worker *runtime.WorkerInfo) error {
+		ctx, cancel := context.WithTimeout(ctx, timeout)
+		defer cancel()
+
+		addr := net.JoinHostPort(worker.IPAddress, strconv.Itoa(worker.Port))
+		dialer := net.Dialer{Timeout: readinessDialTimeout}
+		backoff := readinessInitialBackoff
+		for {
+			conn, err := dialer.DialContext(ctx, "tcp", addr)
+			if err == nil {
+				conn.Close()
+				return nil
+			}
+
+			timer := time.NewTimer(backoff)
+			select {
+			case <-ctx.Done():
+				timer.Stop()
+				return fmt.Errorf("worker %s not ready on %s: %w", worker.ID, addr, err)
+			case <-timer.C:
+			}
+			if backoff < readinessMaxBackoff {
+				backoff = min(backoff*2, readinessMaxBackoff)
+			}
+		}
+	}
+}
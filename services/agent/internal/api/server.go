@@ -2,6 +2,7 @@ package api
 
 import (
 	"context"
+	"log"
 	"time"
 
 	"github.com/poruru/edge-serverless-box/services/agent/internal/runtime"
@@ -10,15 +11,34 @@ import (
 	"google.golang.org/grpc/status"
 )
 
+// maxEnsureBatch caps EnsureContainers so one call cannot flood the runtime.
+const maxEnsureBatch = 32
+
 type AgentServer struct {
 	pb.UnimplementedAgentServiceServer
-	runtime runtime.ContainerRuntime
+	runtime   runtime.ContainerRuntime
+	readiness ReadinessProbe
+}
+
+// Option configures an AgentServer.
+type Option func(*AgentServer)
+
+// WithReadinessProbe makes Ensure RPCs return workers only once the probe
+// passes, marking them ready so the Gateway can skip its own check.
+func WithReadinessProbe(probe ReadinessProbe) Option {
+	return func(s *AgentServer) {
+		s.readiness = probe
+	}
 }
 
-func NewAgentServer(rt runtime.ContainerRuntime) *AgentServer {
-	return &AgentServer{
+func NewAgentServer(rt runtime.ContainerRuntime, opts ...Option) *AgentServer {
+	s := &AgentServer{
 		runtime: rt,
 	}
+	for _, opt := range opts {
+		opt(s)
+	}
+	return s
 }
 
 func (s *AgentServer) EnsureContainer(ctx context.Context, req *pb.EnsureContainerRequest) (*pb.WorkerInfo, error) {
@@ -26,7 +46,7 @@ func (s *AgentServer) EnsureContainer(ctx context.Context, req *pb.EnsureContain
 		return nil, status.Error(codes.InvalidArgument, "function_name is required")
 	}
 
-	info, err := s.runtime.Ensure(ctx, runtime.EnsureRequest{
+	worker, err := s.ensureReady(ctx, runtime.EnsureRequest{
 		FunctionName: req.FunctionName,
 		Image:        req.Image,
 		Env:          req.Env,
@@ -35,11 +55,108 @@ func (s *AgentServer) EnsureContainer(ctx context.Context, req *pb.EnsureContain
 		return nil, status.Errorf(codes.Internal, "failed to ensure container: %v", err)
 	}
 
+	return worker, nil
+}
+
+// EnsureContainers creates req.Count containers concurrently and streams each
+// one as soon as it is ready. It fails only when none of them started.
+func (s *AgentServer) EnsureContainers(req *pb.EnsureContainersRequest, stream pb.AgentService_EnsureContainersServer) error {
+	spec := req.GetContainer()
+	if spec.GetFunctionName() == "" {
+		return status.Error(codes.InvalidArgument, "container.function_name is required")
+	}
+	count := int(req.GetCount())
+	if count < 1 || count > maxEnsureBatch {
+		return status.Errorf(codes.InvalidArgument, "count must be between 1 and %d", maxEnsureBatch)
+	}
+
+	ctx := stream.Context()
+	ensureReq := runtime.EnsureRequest{
+		FunctionName: spec.FunctionName,
+		Image:        spec.Image,
+		Env:          spec.Env,
+	}
+
+	type result struct {
+		worker *pb.WorkerInfo
+		err    error
+	}
+	results := make(chan result, count)
+	for i := 0; i < count; i++ {
+		go func() {
+			worker, err := s.ensureReady(ctx, ensureReq)
+			results <- result{worker: worker, err: err}
+		}()
+	}
+
+	sent := 0
+	var firstErr, sendErr error
+	for i := 0; i < count; i++ {
+		r := <-results
+		if r.err != nil {
+			if firstErr == nil {
+				firstErr = r.err
+			}
+			continue
+		}
+		if sendErr == nil {
+			sendErr = stream.Send(r.worker)
+			if sendErr == nil {
+				sent++
+				continue
+			}
+		}
+		// The Gateway went away: nobody will ever use this container.
+		s.destroy(ctx, r.worker.Id)
+	}
+
+	if sendErr != nil {
+		return sendErr
+	}
+	if sent == 0 {
+		return status.Errorf(codes.Internal, "failed to ensure containers: %v", firstErr)
+	}
+	if firstErr != nil {
+		log.Printf("EnsureContainers %s: %d/%d started, first error: %v", spec.FunctionName, sent, count, firstErr)
+	}
+	return nil
+}
+
+// ensureReady starts a container and, when a readiness probe is configured,
+// waits until it accepts invocations. Containers that never become ready are
+// destroyed.
+func (s *AgentServer) ensureReady(ctx context.Context, req runtime.EnsureRequest) (*pb.WorkerInfo, error) {
+	info, err := s.runtime.Ensure(ctx, req)
+	if err != nil {
+		return nil, err
+	}
+
+	worker := toWorkerInfo(info)
+	if s.readiness == nil {
+		return worker, nil
+	}
+	if err := s.readiness(ctx, info); err != nil {
+		s.destroy(ctx, info.ID)
+		return nil, err
+	}
+	worker.Ready = true
+	return worker, nil
+}
+
+// destroy removes a container that is not handed to the Gateway, even when
+// the request that created it was cancelled.
+func (s *AgentServer) destroy(ctx context.Context, containerID string) {
+	if err := s.runtime.Destroy(context.WithoutCancel(ctx), containerID); err != nil {
+		log.Printf("Failed to destroy unused container %s: %v", containerID, err)
+	}
+}
+
+func toWorkerInfo(info *runtime.WorkerInfo) *pb.WorkerInfo {
 	return &pb.WorkerInfo{
 		Id:        info.ID,
 		IpAddress: info.IPAddress,
 		Port:      int32(info.Port),
-	}, nil
+	}
 }
 
 func (s *AgentServer) DestroyContainer(ctx context.Context, req *pb.DestroyContainerRequest) (*pb.DestroyContainerResponse, error) {
@@ -2,6 +2,7 @@ package api_test
 
 import (
 	"context"
+	"io"
 	"net"
 	"testing"
 	"time"
@@ -83,12 +84,12 @@ const bufSize = 1024 * 1024
 
 var lis *bufconn.Listener
 
-func initServer(t *testing.T, mockRT *MockRuntime) *grpc.ClientConn {
+func initServer(t *testing.T, mockRT *MockRuntime, opts ...api.Option) *grpc.ClientConn {
 	lis = bufconn.Listen(bufSize)
 	s := grpc.NewServer()
 
 	// Inject mock runtime
-	server := api.NewAgentServer(mockRT)
+	server := api.NewAgentServer(mockRT, opts...)
 	pb.RegisterAgentServiceServer(s, server)
 
 	go func() {
@@ -147,6 +148,143 @@ func TestEnsureContainer(t *testing.T) {
 	mockRT.AssertExpectations(t)
 }
 
+func TestEnsureContainers(t *testing.T) {
+	mockRT := new(MockRuntime)
+	conn := initServer(t, mockRT)
+	defer conn.Close()
+
+	client := pb.NewAgentServiceClient(conn)
+
+	ensureReq := runtime.EnsureRequest{
+		FunctionName: "test-func",
+		Image:        "test-image",
+		Env:          map[string]string{"foo": "bar"},
+	}
+
+	mockRT.On("Ensure", mock.Anything, ensureReq).Return(&runtime.WorkerInfo{
+		ID:        "container-1",
+		IPAddress: "10.0.0.9",
+		Port:      8080,
+	}, nil).Twice()
+	mockRT.On("Ensure", mock.Anything, ensureReq).Return(nil, assert.AnError).Once()
+
+	stream, err := client.EnsureContainers(context.Background(), &pb.EnsureContainersRequest{
+		Container: &pb.EnsureContainerRequest{
+			FunctionName: ensureReq.FunctionName,
+			Image:        ensureReq.Image,
+			Env:          ensureReq.Env,
+		},
+		Count: 3,
+	})
+	assert.NoError(t, err)
+
+	workers := recvWorkers(t, stream)
+	assert.Len(t, workers, 2)
+	mockRT.AssertNumberOfCalls(t, "Ensure", 3)
+}
+
+func recvWorkers(t *testing.T, stream pb.AgentService_EnsureContainersClient) []*pb.WorkerInfo {
+	var workers []*pb.WorkerInfo
+	for {
+		worker, err := stream.Recv()
+		if err == io.EOF {
+			return workers
+		}
+		if !assert.NoError(t, err) {
+			return workers
+		}
+		workers = append(workers, worker)
+	}
+}
+
+func TestEnsureContainerWithReadinessProbe(t *testing.T) {
+	rie, err := net.Listen("tcp", "127.0.0.1:0")
+	if err != nil {
+		t.Fatalf("Failed to listen: %v", err)
+	}
+	defer rie.Close()
+
+	mockRT := new(MockRuntime)
+	probe := api.TCPReadinessProbe(time.Second)
+	conn := initServer(t, mockRT, api.WithReadinessProbe(probe))
+	defer conn.Close()
+
+	client := pb.NewAgentServiceClient(conn)
+	mockRT.On("Ensure", mock.Anything, mock.Anything).Return(&runtime.WorkerInfo{
+		ID:        "container-1",
+		IPAddress: "127.0.0.1",
+		Port:      rie.Addr().(*net.TCPAddr).Port,
+	}, nil)
+
+	resp, err := client.EnsureContainer(context.Background(), &pb.EnsureContainerRequest{FunctionName: "test-func"})
+
+	assert.NoError(t, err)
+	assert.True(t, resp.Ready)
+	mockRT.AssertNotCalled(t, "Destroy", mock.Anything, mock.Anything)
+}
+
+func TestEnsureContainersDestroysWorkersThatNeverBecomeReady(t *testing.T) {
+	mockRT := new(MockRuntime)
+	failing := func(ctx context.Context, worker *runtime.WorkerInfo) error {
+		if worker.ID == "container-bad" {
+			return assert.AnError
+		}
+		return nil
+	}
+	conn := initServer(t, mockRT, api.WithReadinessProbe(failing))
+	defer conn.Close()
+
+	client := pb.NewAgentServiceClient(conn)
+	mockRT.On("Ensure", mock.Anything, mock.Anything).Return(&runtime.WorkerInfo{ID: "container-ok"}, nil).Once()
+	mockRT.On("Ensure", mock.Anything, mock.Anything).Return(&runtime.WorkerInfo{ID: "container-bad"}, nil).Once()
+	mockRT.On("Destroy", mock.Anything, "container-bad").Return(nil).Once()
+
+	stream, err := client.EnsureContainers(context.Background(), &pb.EnsureContainersRequest{
+		Container: &pb.EnsureContainerRequest{FunctionName: "test-func"},
+		Count:     2,
+	})
+	assert.NoError(t, err)
+
+	workers := recvWorkers(t, stream)
+	if assert.Len(t, workers, 1) {
+		assert.Equal(t, "container-ok", workers[0].Id)
+		assert.True(t, workers[0].Ready)
+	}
+	mockRT.AssertExpectations(t)
+}
+
+func TestTCPReadinessProbeTimesOut(t *testing.T) {
+	closed, err := net.Listen("tcp", "127.0.0.1:0")
+	if err != nil {
+		t.Fatalf("Failed to listen: %v", err)
+	}
+	port := closed.Addr().(*net.TCPAddr).Port
+	closed.Close()
+
+	probe := api.TCPReadinessProbe(50 * time.Millisecond)
+	err = probe(context.Background(), &runtime.WorkerInfo{ID: "c1", IPAddress: "127.0.0.1", Port: port})
+
+	assert.Error(t, err)
+}
+
+func TestEnsureContainersRejectsInvalidCount(t *testing.T) {
+	mockRT := new(MockRuntime)
+	conn := initServer(t, mockRT)
+	defer conn.Close()
+
+	client := pb.NewAgentServiceClient(conn)
+
+	stream, err := client.EnsureContainers(context.Background(), &pb.EnsureContainersRequest{
+		Container: &pb.EnsureContainerRequest{FunctionName: "test-func"},
+		Count:     0,
+	})
+	assert.NoError(t, err)
+
+	_, err = stream.Recv()
+	assert.Error(t, err)
+	mockRT.AssertNotCalled(t, "Ensure", mock.Anything, mock.Anything)
+}
+
 func TestDestroyContainer(t *testing.T) {
 	mockRT := new(MockRuntime)
 	conn := initServer(t, mockRT)
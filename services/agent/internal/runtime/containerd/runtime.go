@@ -159,7 +159,7 @@ func (r *Runtime) Ensure(ctx context.Context, req runtime.EnsureRequest) (*runti
 		}
 	}
 
-	containerID := fmt.Sprintf("%s%s-%d", runtime.ContainerNamePrefix, req.FunctionName, time.Now().UnixNano())
+	containerID := runtime.NewContainerName(req.FunctionName)
 
 	// 1. Ensure image (only for Cold Start)
 	imgObj, err := r.ensureImage(ctx, image)
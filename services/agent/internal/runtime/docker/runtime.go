@@ -56,7 +56,7 @@ func (r *Runtime) Ensure(ctx context.Context, req runtime.EnsureRequest) (*runti
 		}
 	}
 
-	containerName := fmt.Sprintf("%s%s-%d", runtime.ContainerNamePrefix, req.FunctionName, time.Now().UnixNano())
+	containerName := runtime.NewContainerName(req.FunctionName)
 
 	// Phase 5 Step 0: Pull image from registry if not present
 	fmt.Printf("[Agent] Pulling image %s...\n", imageName)
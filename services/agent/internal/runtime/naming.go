@@ -0,0 +1,19 @@
+package runtime
+
+import (
+	"fmt"
+	"sync/atomic"
+	"time"
+)
+
+// containerSeq disambiguates names created in the same nanosecond.
+var containerSeq atomic.Uint64
+
+// NewContainerName returns a unique container name (and containerd ID) for a function.
+// EnsureContainers creates a batch from parallel goroutines, so the timestamp alone
+// can repeat. The suffix after the last "-" stays a single number, so the function
+// name can still be recovered from the name.
+func NewContainerName(functionName string) string {
+	seq := containerSeq.Add(1) % 1000
+	return fmt.Sprintf("%s%s-%d%03d", ContainerNamePrefix, functionName, time.Now().UnixNano(), seq)
+}
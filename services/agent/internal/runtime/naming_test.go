@@ -0,0 +1,34 @@
+package runtime
+
+import (
+	"strings"
+	"sync"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+)
+
+func TestNewContainerName_UniqueAcrossGoroutines(t *testing.T) {
+	const workers = 64
+	names := make(chan string, workers)
+	var wg sync.WaitGroup
+	for i := 0; i < workers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			names <- NewContainerName("my-func")
+		}()
+	}
+	wg.Wait()
+	close(names)
+
+	seen := make(map[string]bool)
+	for name := range names {
+		assert.True(t, strings.HasPrefix(name, ContainerNamePrefix+"my-func-"))
+		suffix := strings.TrimPrefix(name, ContainerNamePrefix+"my-func-")
+		assert.NotContains(t, suffix, "-")
+		assert.False(t, seen[name], "duplicate container name %s", name)
+		seen[name] = true
+	}
+	assert.Len(t, seen, workers)
+}
@@ -359,6 +359,7 @@ type WorkerInfo struct {
 	Name          string                 `protobuf:"bytes,2,opt,name=name,proto3" json:"name,omitempty"`
 	IpAddress     string                 `protobuf:"bytes,3,opt,name=ip_address,json=ipAddress,proto3" json:"ip_address,omitempty"`
 	Port          int32                  `protobuf:"varint,4,opt,name=port,proto3" json:"port,omitempty"`
+	Ready         bool                   `protobuf:"varint,5,opt,name=ready,proto3" json:"ready,omitempty"` // RIE port verified by the Agent (Gateway can skip its own check)
 	unknownFields protoimpl.UnknownFields
 	sizeCache     protoimpl.SizeCache
 }
@@ -421,6 +422,13 @@ func (x *WorkerInfo) GetPort() int32 {
 	return 0
 }
 
+func (x *WorkerInfo) GetReady() bool {
+	if x != nil {
+		return x.Ready
+	}
+	return false
+}
+
 // Phase 3: message for ListContainers.
 type ListContainersRequest struct {
 	state         protoimpl.MessageState `protogen:"open.v1"`
@@ -807,6 +815,59 @@ func (x *ContainerMetrics) GetCollectedAt() int64 {
 	return 0
 }
 
+// Batch provisioning
+type EnsureContainersRequest struct {
+	state         protoimpl.MessageState  `protogen:"open.v1"`
+	Container     *EnsureContainerRequest `protobuf:"bytes,1,opt,name=container,proto3" json:"container,omitempty"` // Per-container spec (same as EnsureContainer)
+	Count         int32                   `protobuf:"varint,2,opt,name=count,proto3" json:"count,omitempty"`        // Number of containers to create
+	unknownFields protoimpl.UnknownFields
+	sizeCache     protoimpl.SizeCache
+}
+
+func (x *EnsureContainersRequest) Reset() {
+	*x = EnsureContainersRequest{}
+	mi := &file_agent_proto_msgTypes[14]
+	ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+	ms.StoreMessageInfo(mi)
+}
+
+func (x *EnsureContainersRequest) String() string {
+	return protoimpl.X.MessageStringOf(x)
+}
+
+func (*EnsureContainersRequest) ProtoMessage() {}
+
+func (x *EnsureContainersRequest) ProtoReflect() protoreflect.Message {
+	mi := &file_agent_proto_msgTypes[14]
+	if x != nil {
+		ms := protoimpl.X.MessageStateOf(protoimpl.Pointer(x))
+		if ms.LoadMessageInfo() == nil {
+			ms.StoreMessageInfo(mi)
+		}
+		return ms
+	}
+	return mi.MessageOf(x)
+}
+
+// Deprecated: Use EnsureContainersRequest.ProtoReflect.Descriptor instead.
+func (*EnsureContainersRequest) Descriptor() ([]byte, []int) {
+	return file_agent_proto_rawDescGZIP(), []int{14}
+}
+
+func (x *EnsureContainersRequest) GetContainer() *EnsureContainerRequest {
+	if x != nil {
+		return x.Container
+	}
+	return nil
+}
+
+func (x *EnsureContainersRequest) GetCount() int32 {
+	if x != nil {
+		return x.Count
+	}
+	return 0
+}
+
 var File_agent_proto protoreflect.FileDescriptor
 
 const file_agent_proto_rawDesc = "" +
@@ -831,14 +892,15 @@ const file_agent_proto_rawDesc = "" +
 	"\rfunction_name\x18\x01 \x01(\tR\ffunctionName\x12!\n" +
 	"\fcontainer_id\x18\x02 \x01(\tR\vcontainerId\"4\n" +
 	"\x18DestroyContainerResponse\x12\x18\n" +
-	"\asuccess\x18\x01 \x01(\bR\asuccess\"c\n" +
+	"\asuccess\x18\x01 \x01(\bR\asuccess\"y\n" +
 	"\n" +
 	"WorkerInfo\x12\x0e\n" +
 	"\x02id\x18\x01 \x01(\tR\x02id\x12\x12\n" +
 	"\x04name\x18\x02 \x01(\tR\x04name\x12\x1d\n" +
 	"\n" +
 	"ip_address\x18\x03 \x01(\tR\tipAddress\x12\x12\n" +
-	"\x04port\x18\x04 \x01(\x05R\x04port\"\x17\n" +
+	"\x04port\x18\x04 \x01(\x05R\x04port\x12\x14\n" +
+	"\x05ready\x18\x05 \x01(\bR\x05ready\"\x17\n" +
 	"\x15ListContainersRequest\"V\n" +
 	"\x16ListContainersResponse\x12<\n" +
 	"\n" +
@@ -873,9 +935,13 @@ const file_agent_proto_rawDesc = "" +
 	"\rrestart_count\x18\n" +
 	" \x01(\rR\frestartCount\x12\x1b\n" +
 	"\texit_time\x18\v \x01(\x03R\bexitTime\x12!\n" +
-	"\fcollected_at\x18\f \x01(\x03R\vcollectedAt2\xca\x04\n" +
+	"\fcollected_at\x18\f \x01(\x03R\vcollectedAt\"s\n" +
+	"\x17EnsureContainersRequest\x12B\n" +
+	"\tcontainer\x18\x01 \x01(\v2$.esb.agent.v1.EnsureContainerRequestR\tcontainer\x12\x14\n" +
+	"\x05count\x18\x02 \x01(\x05R\x05count2\xa1\x05\n" +
 	"\fAgentService\x12Q\n" +
-	"\x0fEnsureContainer\x12$.esb.agent.v1.EnsureContainerRequest\x1a\x18.esb.agent.v1.WorkerInfo\x12a\n" +
+	"\x0fEnsureContainer\x12$.esb.agent.v1.EnsureContainerRequest\x1a\x18.esb.agent.v1.WorkerInfo\x12U\n" +
+	"\x10EnsureContainers\x12%.esb.agent.v1.EnsureContainersRequest\x1a\x18.esb.agent.v1.WorkerInfo0\x01\x12a\n" +
 	"\x10DestroyContainer\x12%.esb.agent.v1.DestroyContainerRequest\x1a&.esb.agent.v1.DestroyContainerResponse\x12[\n" +
 	"\x0ePauseContainer\x12#.esb.agent.v1.PauseContainerRequest\x1a$.esb.agent.v1.PauseContainerResponse\x12^\n" +
 	"\x0fResumeContainer\x12$.esb.agent.v1.ResumeContainerRequest\x1a%.esb.agent.v1.ResumeContainerResponse\x12[\n" +
@@ -894,7 +960,7 @@ func file_agent_proto_rawDescGZIP() []byte {
 	return file_agent_proto_rawDescData
 }
 
-var file_agent_proto_msgTypes = make([]protoimpl.MessageInfo, 15)
+var file_agent_proto_msgTypes = make([]protoimpl.MessageInfo, 16)
 var file_agent_proto_goTypes = []any{
 	(*PauseContainerRequest)(nil),       // 0: esb.agent.v1.PauseContainerRequest
 	(*PauseContainerResponse)(nil),      // 1: esb.agent.v1.PauseContainerResponse
@@ -910,29 +976,33 @@ var file_agent_proto_goTypes = []any{
 	(*GetContainerMetricsRequest)(nil),  // 11: esb.agent.v1.GetContainerMetricsRequest
 	(*GetContainerMetricsResponse)(nil), // 12: esb.agent.v1.GetContainerMetricsResponse
 	(*ContainerMetrics)(nil),            // 13: esb.agent.v1.ContainerMetrics
-	nil,                                 // 14: esb.agent.v1.EnsureContainerRequest.EnvEntry
+	(*EnsureContainersRequest)(nil),     // 14: esb.agent.v1.EnsureContainersRequest
+	nil,                                 // 15: esb.agent.v1.EnsureContainerRequest.EnvEntry
 }
 var file_agent_proto_depIdxs = []int32{
-	14, // 0: esb.agent.v1.EnsureContainerRequest.env:type_name -> esb.agent.v1.EnsureContainerRequest.EnvEntry
+	15, // 0: esb.agent.v1.EnsureContainerRequest.env:type_name -> esb.agent.v1.EnsureContainerRequest.EnvEntry
 	10, // 1: esb.agent.v1.ListContainersResponse.containers:type_name -> esb.agent.v1.ContainerState
 	13, // 2: esb.agent.v1.GetContainerMetricsResponse.metrics:type_name -> esb.agent.v1.ContainerMetrics
-	4,  // 3: esb.agent.v1.AgentService.EnsureContainer:input_type -> esb.agent.v1.EnsureContainerRequest
-	5,  // 4: esb.agent.v1.AgentService.DestroyContainer:input_type -> esb.agent.v1.DestroyContainerRequest
-	0,  // 5: esb.agent.v1.AgentService.PauseContainer:input_type -> esb.agent.v1.PauseContainerRequest
-	2,  // 6: esb.agent.v1.AgentService.ResumeContainer:input_type -> esb.agent.v1.ResumeContainerRequest
-	8,  // 7: esb.agent.v1.AgentService.ListContainers:input_type -> esb.agent.v1.ListContainersRequest
-	11, // 8: esb.agent.v1.AgentService.GetContainerMetrics:input_type -> esb.agent.v1.GetContainerMetricsRequest
-	7,  // 9: esb.agent.v1.AgentService.EnsureContainer:output_type -> esb.agent.v1.WorkerInfo
-	6,  // 10: esb.agent.v1.AgentService.DestroyContainer:output_type -> esb.agent.v1.DestroyContainerResponse
-	1,  // 11: esb.agent.v1.AgentService.PauseContainer:output_type -> esb.agent.v1.PauseContainerResponse
-	3,  // 12: esb.agent.v1.AgentService.ResumeContainer:output_type -> esb.agent.v1.ResumeContainerResponse
-	9,  // 13: esb.agent.v1.AgentService.ListContainers:output_type -> esb.agent.v1.ListContainersResponse
-	12, // 14: esb.agent.v1.AgentService.GetContainerMetrics:output_type -> esb.agent.v1.GetContainerMetricsResponse
-	9,  // [9:15] is the sub-list for method output_type
-	3,  // [3:9] is the sub-list for method input_type
-	3,  // [3:3] is the sub-list for extension type_name
-	3,  // [3:3] is the sub-list for extension extendee
-	0,  // [0:3] is the sub-list for field type_name
+	4,  // 3: esb.agent.v1.EnsureContainersRequest.container:type_name -> esb.agent.v1.EnsureContainerRequest
+	4,  // 4: esb.agent.v1.AgentService.EnsureContainer:input_type -> esb.agent.v1.EnsureContainerRequest
+	14, // 5: esb.agent.v1.AgentService.EnsureContainers:input_type -> esb.agent.v1.EnsureContainersRequest
+	5,  // 6: esb.agent.v1.AgentService.DestroyContainer:input_type -> esb.agent.v1.DestroyContainerRequest
+	0,  // 7: esb.agent.v1.AgentService.PauseContainer:input_type -> esb.agent.v1.PauseContainerRequest
+	2,  // 8: esb.agent.v1.AgentService.ResumeContainer:input_type -> esb.agent.v1.ResumeContainerRequest
+	8,  // 9: esb.agent.v1.AgentService.ListContainers:input_type -> esb.agent.v1.ListContainersRequest
+	11, // 10: esb.agent.v1.AgentService.GetContainerMetrics:input_type -> esb.agent.v1.GetContainerMetricsRequest
+	7,  // 11: esb.agent.v1.AgentService.EnsureContainer:output_type -> esb.agent.v1.WorkerInfo
+	7,  // 12: esb.agent.v1.AgentService.EnsureContainers:output_type -> esb.agent.v1.WorkerInfo
+	6,  // 13: esb.agent.v1.AgentService.DestroyContainer:output_type -> esb.agent.v1.DestroyContainerResponse
+	1,  // 14: esb.agent.v1.AgentService.PauseContainer:output_type -> esb.agent.v1.PauseContainerResponse
+	3,  // 15: esb.agent.v1.AgentService.ResumeContainer:output_type -> esb.agent.v1.ResumeContainerResponse
+	9,  // 16: esb.agent.v1.AgentService.ListContainers:output_type -> esb.agent.v1.ListContainersResponse
+	12, // 17: esb.agent.v1.AgentService.GetContainerMetrics:output_type -> esb.agent.v1.GetContainerMetricsResponse
+	11, // [11:18] is the sub-list for method output_type
+	4,  // [4:11] is the sub-list for method input_type
+	4,  // [4:4] is the sub-list for extension type_name
+	4,  // [4:4] is the sub-list for extension extendee
+	0,  // [0:4] is the sub-list for field type_name
 }
 
 func init() { file_agent_proto_init() }
@@ -946,7 +1016,7 @@ func file_agent_proto_init() {
 			GoPackagePath: reflect.TypeOf(x{}).PkgPath(),
 			RawDescriptor: unsafe.Slice(unsafe.StringData(file_agent_proto_rawDesc), len(file_agent_proto_rawDesc)),
 			NumEnums:      0,
-			NumMessages:   15,
+			NumMessages:   16,
 			NumExtensions: 0,
 			NumServices:   1,
 		},
@@ -20,6 +20,7 @@ const _ = grpc.SupportPackageIsVersion9
 
 const (
 	AgentService_EnsureContainer_FullMethodName     = "/esb.agent.v1.AgentService/EnsureContainer"
+	AgentService_EnsureContainers_FullMethodName    = "/esb.agent.v1.AgentService/EnsureContainers"
 	AgentService_DestroyContainer_FullMethodName    = "/esb.agent.v1.AgentService/DestroyContainer"
 	AgentService_PauseContainer_FullMethodName      = "/esb.agent.v1.AgentService/PauseContainer"
 	AgentService_ResumeContainer_FullMethodName     = "/esb.agent.v1.AgentService/ResumeContainer"
@@ -32,7 +33,11 @@ const (
 // For semantics around ctx use and closing/ending streaming RPCs, please refer to https://pkg.go.dev/google.golang.org/grpc/?tab=doc#ClientConn.NewStream.
 type AgentServiceClient interface {
 	// Ensure a container and return connection info (start if missing, reuse if present).
+	// With Agent-side readiness enabled, returns once the RIE port accepts connections.
 	EnsureContainer(ctx context.Context, in *EnsureContainerRequest, opts ...grpc.CallOption) (*WorkerInfo, error)
+	// Create `count` containers for one function concurrently (burst scale-out).
+	// Streams each worker as soon as it is ready; fails only if none started.
+	EnsureContainers(ctx context.Context, in *EnsureContainersRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[WorkerInfo], error)
 	// Explicitly stop and remove a container.
 	DestroyContainer(ctx context.Context, in *DestroyContainerRequest, opts ...grpc.CallOption) (*DestroyContainerResponse, error)
 	// Pause a container (for warm starts).
@@ -63,6 +68,25 @@ func (c *agentServiceClient) EnsureContainer(ctx context.Context, in *EnsureCont
 	return out, nil
 }
 
+func (c *agentServiceClient) EnsureContainers(ctx context.Context, in *EnsureContainersRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[WorkerInfo], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AgentService_ServiceDesc.Streams[0], AgentService_EnsureContainers_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[EnsureContainersRequest, WorkerInfo]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AgentService_EnsureContainersClient = grpc.ServerStreamingClient[WorkerInfo]
+
 func (c *agentServiceClient) DestroyContainer(ctx context.Context, in *DestroyContainerRequest, opts ...grpc.CallOption) (*DestroyContainerResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(DestroyContainerResponse)
@@ -118,7 +142,11 @@ func (c *agentServiceClient) GetContainerMetrics(ctx context.Context, in *GetCon
 // for forward compatibility.
 type AgentServiceServer interface {
 	// Ensure a container and return connection info (start if missing, reuse if present).
+	// With Agent-side readiness enabled, returns once the RIE port accepts connections.
 	EnsureContainer(context.Context, *EnsureContainerRequest) (*WorkerInfo, error)
+	// Create `count` containers for one function concurrently (burst scale-out).
+	// Streams each worker as soon as it is ready; fails only if none started.
+	EnsureContainers(*EnsureContainersRequest, grpc.ServerStreamingServer[WorkerInfo]) error
 	// Explicitly stop and remove a container.
 	DestroyContainer(context.Context, *DestroyContainerRequest) (*DestroyContainerResponse, error)
 	// Pause a container (for warm starts).
@@ -142,6 +170,9 @@ type UnimplementedAgentServiceServer struct{}
 func (UnimplementedAgentServiceServer) EnsureContainer(context.Context, *EnsureContainerRequest) (*WorkerInfo, error) {
 	return nil, status.Error(codes.Unimplemented, "method EnsureContainer not implemented")
 }
+func (UnimplementedAgentServiceServer) EnsureContainers(*EnsureContainersRequest, grpc.ServerStreamingServer[WorkerInfo]) error {
+	return status.Error(codes.Unimplemented, "method EnsureContainers not implemented")
+}
 func (UnimplementedAgentServiceServer) DestroyContainer(context.Context, *DestroyContainerRequest) (*DestroyContainerResponse, error) {
 	return nil, status.Error(codes.Unimplemented, "method DestroyContainer not implemented")
 }
@@ -196,6 +227,17 @@ func _AgentService_EnsureContainer_Handler(srv interface{}, ctx context.Context,
 	return interceptor(ctx, in, info, handler)
 }
 
+func _AgentService_EnsureContainers_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(EnsureContainersRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(AgentServiceServer).EnsureContainers(m, &grpc.GenericServerStream[EnsureContainersRequest, WorkerInfo]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AgentService_EnsureContainersServer = grpc.ServerStreamingServer[WorkerInfo]
+
 func _AgentService_DestroyContainer_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(DestroyContainerRequest)
 	if err := dec(in); err != nil {
@@ -318,6 +360,12 @@ var AgentService_ServiceDesc = grpc.ServiceDesc{
 			Handler:    _AgentService_GetContainerMetrics_Handler,
 		},
 	},
-	Streams:  []grpc.StreamDesc{},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "EnsureContainers",
+			Handler:       _AgentService_EnsureContainers_Handler,
+			ServerStreams: true,
+		},
+	},
 	Metadata: "agent.proto",
 }
@@ -0,0 +1,57 @@
+"""
+JSON Codec
+
+Single JSON encode/decode entry point for the Gateway and common logging.
+Uses orjson when it is installed and falls back to the stdlib json module.
+
+All functions work on bytes so request/response payloads go straight to and
+from the wire without intermediate str copies.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both.
+JSONDecodeError = json.JSONDecodeError
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes (non-ASCII kept as-is, compact separators).
+
+    Values orjson cannot encode (e.g. integers above 64 bits, non-str keys)
+    are retried with the stdlib encoder, so both backends accept the same input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default)
+        except TypeError:
+            pass
+    text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+    return text.encode("utf-8")
+
+
+def dumps_str(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Serialize to a JSON str (for APIs that require text, e.g. log formatters)."""
+    return dumps(obj, default=default).decode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Raises:
+        JSONDecodeError: when the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
@@ -9,7 +9,6 @@ Provides:
 """
 
 import atexit
-import json
 import logging
 import logging.config
 import logging.handlers
@@ -24,6 +23,8 @@ from datetime import datetime, timezone
 
 import yaml
 
+from . import json_codec
+
 
 class CustomJsonFormatter(logging.Formatter):
     """
@@ -38,6 +39,10 @@ class CustomJsonFormatter(logging.Formatter):
     """
 
     def format(self, record: logging.LogRecord) -> str:
+        return json_codec.dumps_str(self.build_log_data(record))
+
+    def build_log_data(self, record: logging.LogRecord) -> dict:
+        """Build the log payload dict (lets handlers serialize it once)."""
         # Trace ID resolution
         trace_id = getattr(record, "trace_id", None)
         if not trace_id:
@@ -105,7 +110,7 @@ class CustomJsonFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_data, ensure_ascii=False)
+        return log_data
 
 
 def setup_logging(config_path: str = "logging.yml"):
@@ -145,17 +150,23 @@ class VictoriaLogsHandler(logging.Handler):
 
     def emit(self, record: logging.LogRecord):
         try:
-            # Build log message.
-            if self.formatter:
-                msg = self.formatter.format(record)
+            # Build log payload. CustomJsonFormatter hands over the dict
+            # directly, avoiding a dump/reload round trip per record.
+            if isinstance(self.formatter, CustomJsonFormatter):
+                log_entry = self.formatter.build_log_data(record)
             else:
-                msg = record.getMessage()
+                if self.formatter:
+                    msg = self.formatter.format(record)
+                else:
+                    msg = record.getMessage()
 
-            # Expect JSON; wrap otherwise.
-            try:
-                log_entry = json.loads(msg)
-            except json.JSONDecodeError:
-                log_entry = {"message": msg, "level": record.levelname}
+                # Expect JSON; wrap otherwise.
+                try:
+                    log_entry = json_codec.loads(msg)
+                except json_codec.JSONDecodeError:
+                    log_entry = {"message": msg, "level": record.levelname}
+                if not isinstance(log_entry, dict):
+                    log_entry = {"message": msg, "level": record.levelname}
 
             # Merge stream_fields into the log payload.
             # Include them in JSON body as well as URL params so VictoriaLogs
@@ -178,7 +189,7 @@ class VictoriaLogsHandler(logging.Handler):
             full_url = f"{self.url}?{query_string}"
 
             # Send data.
-            data = json.dumps(log_entry, ensure_ascii=False).encode("utf-8")
+            data = json_codec.dumps(log_entry)
             req = urllib.request.Request(
                 full_url,
                 data=data,
@@ -192,13 +203,12 @@ class VictoriaLogsHandler(logging.Handler):
             except (OSError, urllib.error.URLError) as e:
                 # Fallback: write to stderr.
                 # Use sys.__stderr__ to avoid StreamToLogger infinite loops.
-                fallback_msg = json.dumps(
+                fallback_msg = json_codec.dumps_str(
                     {
                         "fallback": "victorialogs_failed",
                         "error": str(e),
                         "original_log": log_entry,
-                    },
-                    ensure_ascii=False,
+                    }
                 )
                 stream = getattr(sys, "__stderr__", sys.stderr)
                 try:
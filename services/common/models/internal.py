@@ -8,7 +8,7 @@ from pydantic import BaseModel, Field
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerInfo:
     """
     Metadata required for container state management.
@@ -16,6 +16,7 @@ class WorkerInfo:
     Auto-scaling support:
     - Set frozen=False (to update last_used_at)
     - Use id-based __eq__/__hash__ (identity in Set/Dict)
+    - Use __slots__ (one instance per container, touched on every acquire/release)
     """
 
     id: str  # Container ID (Docker ID)
@@ -24,6 +25,8 @@ class WorkerInfo:
     port: int = 8080  # Service port
     created_at: float = 0.0  # Creation time
     last_used_at: float = 0.0  # Last used time (for auto-scaling)
+    initialized: bool = False  # Handler module imported (warm-up or served invocation)
+    invocations: int = 0  # Invocations served (for recycling)
 
     def __eq__(self, other):
         if isinstance(other, WorkerInfo):
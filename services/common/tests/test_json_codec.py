@@ -0,0 +1,116 @@
+"""
+Tests for services.common.core.json_codec
+"""
+
+import json
+import timeit
+
+import pytest
+
+from services.common.core import json_codec
+
+
+class TestJsonCodec:
+    def test_dumps_returns_compact_utf8_bytes(self):
+        data = json_codec.dumps({"message": "こんにちは", "n": 1})
+
+        assert isinstance(data, bytes)
+        assert data == '{"message":"こんにちは","n":1}'.encode("utf-8")
+
+    def test_loads_accepts_bytes_str_and_memoryview(self):
+        raw = b'{"a": [1, 2, {"b": null}]}'
+        expected = {"a": [1, 2, {"b": None}]}
+
+        assert json_codec.loads(raw) == expected
+        assert json_codec.loads(raw.decode()) == expected
+        assert json_codec.loads(memoryview(raw)) == expected
+
+    def test_loads_raises_stdlib_compatible_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"not json")
+        with pytest.raises(ValueError):
+            json_codec.loads("{")
+
+    def test_dumps_falls_back_for_values_orjson_rejects(self):
+        data = {"big": 2**70, 1: "non-str key"}
+
+        assert json.loads(json_codec.dumps(data)) == {"big": 2**70, "1": "non-str key"}
+
+    def test_dumps_default_hook(self):
+        class Custom:
+            pass
+
+        assert json_codec.dumps_str({"v": Custom()}, default=lambda o: "custom") == (
+            '{"v":"custom"}'
+        )
+        with pytest.raises(TypeError):
+            json_codec.dumps({"v": Custom()})
+
+    def test_stdlib_backend(self, monkeypatch):
+        monkeypatch.setattr(json_codec, "orjson", None)
+
+        assert json_codec.dumps({"k": "ü"}) == '{"k":"ü"}'.encode("utf-8")
+        assert json_codec.loads(memoryview(b'{"k": 1}')) == {"k": 1}
+
+
+def _proxy_event() -> dict:
+    headers = {f"x-header-{i}": f"value-{i}" for i in range(20)}
+    return {
+        "resource": "/api/items/{id}",
+        "path": "/api/items/42",
+        "httpMethod": "POST",
+        "headers": headers,
+        "multiValueHeaders": {k: [v] for k, v in headers.items()},
+        "pathParameters": {"id": "42"},
+        "requestContext": {
+            "identity": {"sourceIp": "10.0.0.1", "userAgent": "bench"},
+            "requestId": "req-1",
+            "stage": "prod",
+        },
+        "body": json.dumps({"items": [{"id": i, "name": f"item-{i}"} for i in range(50)]}),
+        "isBase64Encoded": False,
+    }
+
+
+def test_codec_matches_stdlib_per_request():
+    """
+    Per-request JSON work on the gateway hot path: encode the proxy event,
+    decode the RIE envelope, decode the body.
+    """
+    event = _proxy_event()
+    response = json.dumps({"statusCode": 200, "headers": {}, "body": event["body"]}).encode()
+
+    assert json.loads(json_codec.dumps(event)) == event
+    envelope = json_codec.loads(response)
+    assert envelope == json.loads(response)
+    assert json_codec.loads(envelope["body"]) == json.loads(event["body"])
+
+
+@pytest.mark.slow
+def test_codec_benchmark_per_request(capsys):
+    """The same per-request JSON work, timed against the stdlib json module."""
+    event = _proxy_event()
+    response = json.dumps({"statusCode": 200, "headers": {}, "body": event["body"]}).encode()
+
+    def stdlib_request():
+        json.dumps(event).encode("utf-8")
+        envelope = json.loads(response)
+        json.loads(envelope["body"])
+
+    def codec_request():
+        json_codec.dumps(event)
+        envelope = json_codec.loads(response)
+        json_codec.loads(envelope["body"])
+
+    number = 2000
+    stdlib_us = min(timeit.repeat(stdlib_request, number=number, repeat=5)) / number * 1e6
+    codec_us = min(timeit.repeat(codec_request, number=number, repeat=5)) / number * 1e6
+
+    with capsys.disabled():
+        print(
+            f"\n[json_codec:{json_codec.BACKEND}] stdlib={stdlib_us:.1f}us "
+            f"codec={codec_us:.1f}us saved={stdlib_us - codec_us:.1f}us/request"
+        )
+
+    if json_codec.BACKEND == "orjson":
+        assert codec_us < stdlib_us
@@ -132,6 +132,7 @@ async def resolve_lambda_target(request: Request, route_matcher: RouteMatcherDep
         path_params=path_params,
         route_path=route_path,
         function_config=function_config,
+        response_stream=route_matcher.is_response_stream(path, method),
     )
 
 
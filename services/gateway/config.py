@@ -26,6 +26,9 @@ class GatewayConfig(BaseAppConfig):
     FUNCTIONS_CONFIG_PATH: str = Field(
         default="/app/config/functions.yml", description="Lambda function definition file path"
     )
+    ROUTE_CACHE_SIZE: int = Field(
+        default=1024, description="Max cached (method, path) route resolutions"
+    )
     SSL_CERT_PATH: str = Field(default="/app/config/ssl/server.crt", description="SSL cert path")
     SSL_KEY_PATH: str = Field(default="/app/config/ssl/server.key", description="SSL key path")
     DATA_ROOT_PATH: str = Field(default="/data", description="Root path for child container data")
@@ -49,6 +52,24 @@ class GatewayConfig(BaseAppConfig):
     CONTAINERS_NETWORK: str = Field(..., description="Network for Lambda containers")
     GATEWAY_INTERNAL_URL: str = Field(..., description="Gateway URL from containers")
     LAMBDA_INVOKE_TIMEOUT: float = Field(default=30.0, description="Lambda invoke timeout (seconds)")
+    RIE_PINNED_TRANSPORT: bool = Field(
+        default=True,
+        description="Keep one persistent RIE connection per worker instead of the shared client",
+    )
+
+    # Request handling
+    EVENT_BUILDER: str = Field(
+        default="fast",
+        description="Proxy event builder: 'fast' (dict-based) or 'pydantic' (model-based)",
+    )
+    REQUEST_BODY_SPOOL_THRESHOLD: int = Field(
+        default=1024 * 1024,
+        description="Request bodies above this size (bytes) spill to disk and are streamed to RIE",
+    )
+    RESPONSE_PASSTHROUGH: bool = Field(
+        default=True,
+        description="Forward Lambda response bodies as-is instead of parsing and re-encoding",
+    )
 
     # Flow control (Phase 4-1)
     MAX_CONCURRENT_REQUESTS: int = Field(default=10, description="Max concurrent per function")
@@ -59,11 +80,116 @@ class GatewayConfig(BaseAppConfig):
     CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = Field(
         default=30.0, description="Wait time before recovery attempt (seconds)"
     )
+    ADAPTIVE_CONCURRENCY: bool = Field(
+        default=False,
+        description="Adapt each function's in-flight limit (up to max_capacity) to its RTT",
+    )
+    ADAPTIVE_CONCURRENCY_TOLERANCE: float = Field(
+        default=2.0, description="RTT growth over the min-RTT baseline tolerated before backing off"
+    )
+    ADAPTIVE_CONCURRENCY_MIN_LIMIT: int = Field(
+        default=1, description="Lowest in-flight limit the adaptive limiter may set"
+    )
+    OUTLIER_DETECTION: bool = Field(
+        default=False,
+        description="Eject and replace workers whose latency or error rate stands out",
+    )
+    OUTLIER_LATENCY_FACTOR: float = Field(
+        default=3.0, description="Latency over the sibling median that makes a worker an outlier"
+    )
+    OUTLIER_CONSECUTIVE_ERRORS: int = Field(
+        default=3, description="Failures in a row that make a worker an outlier"
+    )
+    OUTLIER_EJECTION_INTERVAL: float = Field(
+        default=10.0, description="Minimum seconds between two ejections of one function"
+    )
+    RECYCLE_CHECK_INTERVAL: float = Field(
+        default=30.0,
+        description="Seconds between checks of scaling.recycle memory_high_water",
+    )
+    REQUEST_TIMEOUT_HEADER: str = Field(
+        default="X-Request-Timeout",
+        description="Request header carrying the client's timeout (seconds) "
+        "for deadline propagation",
+    )
 
     # Auto-Scaling
     DEFAULT_MAX_CAPACITY: int = Field(default=1, description="Default max capacity")
     DEFAULT_MIN_CAPACITY: int = Field(default=0, description="Default min capacity")
+    NODE_CONCURRENCY_LIMIT: int = Field(
+        default=0,
+        description="Max containers on the node across all functions (0: unlimited); "
+        "scaling.reserved_concurrency is guaranteed, the rest is shared by weight",
+    )
     POOL_ACQUIRE_TIMEOUT: float = Field(default=30.0, description="Worker acquisition timeout")
+    POOL_MAX_QUEUE: int = Field(
+        default=0,
+        description="Default max requests queued per function for a worker (0: unbounded); "
+        "overridden by scaling.max_queue",
+    )
+    ADMISSION_CONTROL: bool = Field(
+        default=False,
+        description="Reject requests with 429 / Retry-After when the expected worker wait "
+        "exceeds the acquire timeout or the queue is full",
+    )
+    POOL_SELECTION: str = Field(
+        default="lifo",
+        description="Idle worker selection (lifo: reuse the most recently released worker, fifo)",
+    )
+    ASYNC_CAPACITY_SHARE: float = Field(
+        default=0.5,
+        description="Share of a pool's max_capacity async (Event) invocations may hold "
+        "while sync / interactive requests are waiting",
+    )
+    PROVISION_BATCH_MAX: int = Field(
+        default=8,
+        ge=1,
+        # The Agent rejects EnsureContainers with count > maxEnsureBatch (server.go).
+        le=32,
+        description="Max containers requested per provision call (burst scale-out)",
+    )
+    WARMUP_INVOCATION: bool = Field(
+        default=False,
+        description="Send a warm-up invocation to new workers so the handler is imported "
+        "before the first request (needs images built with the current sitecustomize.py)",
+    )
+    READINESS_POLL_FALLBACK: bool = Field(
+        default=True,
+        description="Poll the RIE port from the Gateway when the Agent did not confirm readiness",
+    )
+    PROVISION_RATE_LIMIT: float = Field(
+        default=20.0,
+        description="Gateway-wide container creations per second (0 disables the token bucket)",
+    )
+    PROVISION_BURST: int = Field(
+        default=20, description="Container creations allowed at once by the token bucket"
+    )
+    PROVISION_MAX_IN_FLIGHT: int = Field(
+        default=16, description="Gateway-wide max containers being created at once (0: unlimited)"
+    )
+    PREDICTIVE_SCALING: bool = Field(
+        default=False,
+        description="Pre-provision workers when forecast concurrency exceeds warm capacity",
+    )
+    AUTOSCALE_INTERVAL: float = Field(
+        default=1.0, description="Arrival-rate sampling / forecast interval (seconds)"
+    )
+    AUTOSCALE_HORIZON: float = Field(
+        default=5.0, description="How far ahead the arrival rate is forecast (seconds)"
+    )
+    AUTOSCALE_COOLDOWN: float = Field(
+        default=10.0, description="Min seconds between predictive scale-outs of a function"
+    )
+    CAPACITY_SCHEDULE_INTERVAL: float = Field(
+        default=30.0, description="Seconds between scaling.schedule evaluations"
+    )
+    CAPACITY_SCHEDULE_RAMP_SECONDS: float = Field(
+        default=300.0,
+        description="Default seconds before a schedule window over which its floor is raised",
+    )
+    PREWARM_CONCURRENCY: int = Field(
+        default=4, description="Max parallel provisions when filling min_capacity"
+    )
     HEARTBEAT_INTERVAL: int = Field(default=30, description="Heartbeat interval (seconds)")
     GATEWAY_IDLE_TIMEOUT_SECONDS: int = Field(
         default=300, description="Gateway idle timeout (seconds)"
@@ -6,7 +6,13 @@ Provides shared logic such as authentication and proxying.
 
 from .security import create_access_token, verify_token
 from .utils import parse_lambda_response
-from .event_builder import EventBuilder, V1ProxyEventBuilder
+from .event_builder import (
+    EventBuilder,
+    V1ProxyEventBuilder,
+    V1FastProxyEventBuilder,
+    create_event_builder,
+)
+from .request_body import SpooledRequestBody, render_proxy_event
 
 __all__ = [
     "create_access_token",
@@ -14,4 +20,8 @@ __all__ = [
     "parse_lambda_response",
     "EventBuilder",
     "V1ProxyEventBuilder",
+    "V1FastProxyEventBuilder",
+    "create_event_builder",
+    "SpooledRequestBody",
+    "render_proxy_event",
 ]
@@ -0,0 +1,168 @@
+"""
+Adaptive concurrency limit per function.
+
+max_capacity is a static ceiling. When a function's downstream (database,
+object storage) slows down, pushing full concurrency into it only makes every
+invocation slower. AdaptiveLimiter follows the gradient algorithm:
+
+- min_rtt: lowest invocation RTT seen over the last `window` samples (baseline)
+- rtt: smoothed recent RTT
+- gradient = clamp(tolerance * min_rtt / rtt, 0.5, 1.0)
+- limit = limit * gradient + sqrt(limit), smoothed and bounded by
+  [min_limit, max_limit]
+
+While RTT stays within `tolerance` of the baseline the limit grows back
+toward max_limit; as RTT rises the limit shrinks. Timeouts and connection
+errors cut the limit multiplicatively (AIMD backoff).
+"""
+
+import asyncio
+import logging
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger("gateway.adaptive_limiter")
+
+# Weight of a new sample in the smoothed RTT.
+RTT_ALPHA = 0.1
+# Weight of the gradient-derived limit in the new limit.
+LIMIT_SMOOTHING = 0.2
+# Multiplicative decrease on timeouts / connection errors.
+DROP_BACKOFF = 0.9
+
+
+class ConcurrencyLimitExceededError(Exception):
+    """Raised when a request arrives while the adaptive limit is in use."""
+
+    def __init__(self, limit: int, retry_after: float):
+        self.limit = limit
+        self.retry_after = retry_after
+        super().__init__(f"Adaptive concurrency limit reached ({limit} in flight)")
+
+
+class AdaptiveLimiter:
+    """
+    In-flight invocation limit of one function, adjusted from observed RTT.
+
+    All state changes are synchronous, so no lock is needed. Callers that may
+    not be rejected (already accepted async invocations) wait in FIFO order.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        tolerance: float = 2.0,
+        window: int = 100,
+    ):
+        """
+        Args:
+            max_limit: upper bound (the function's max_capacity)
+            min_limit: lower bound
+            tolerance: RTT growth over min_rtt tolerated before the limit shrinks
+            window: samples after which min_rtt is re-measured, so the baseline
+                can follow a permanent change in the function's latency
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.tolerance = max(1.0, tolerance)
+        self.window = max(1, window)
+        self._limit = float(self.max_limit)
+        self.in_flight = 0
+        self.min_rtt: Optional[float] = None
+        self.rtt: Optional[float] = None
+        self._window_min: Optional[float] = None
+        self._window_samples = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self.rejected = 0
+        self.drops = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    async def acquire(self, wait: bool = False) -> None:
+        """
+        Take an in-flight slot.
+
+        Raises ConcurrencyLimitExceededError when the limit is in use, unless
+        `wait` is set, in which case the caller queues for a slot.
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        if not wait:
+            self.rejected += 1
+            raise ConcurrencyLimitExceededError(self.limit, max(1.0, self.rtt or 1.0))
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+    def release(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            future = self._waiters.popleft()
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def record(self, rtt: float) -> None:
+        """Adjust the limit from one successful invocation's RTT (seconds)."""
+        if rtt <= 0:
+            return
+        self._window_samples += 1
+        self._window_min = rtt if self._window_min is None else min(self._window_min, rtt)
+        if self.min_rtt is None or rtt < self.min_rtt:
+            self.min_rtt = rtt
+        elif self._window_samples >= self.window:
+            # Re-baseline: min_rtt becomes the minimum of the last window.
+            self.min_rtt = self._window_min
+        if self._window_samples >= self.window:
+            self._window_samples = 0
+            self._window_min = None
+
+        self.rtt = rtt if self.rtt is None else self.rtt + RTT_ALPHA * (rtt - self.rtt)
+        gradient = max(0.5, min(1.0, self.tolerance * self.min_rtt / self.rtt))
+        target = self._limit * gradient + math.sqrt(self._limit)
+        if self.in_flight < self._limit / 2:
+            # Not using the limit: no evidence that more concurrency is fine.
+            target = min(target, self._limit)
+        self._set_limit((1 - LIMIT_SMOOTHING) * self._limit + LIMIT_SMOOTHING * target)
+
+    def record_drop(self) -> None:
+        """A timeout or connection error: back off multiplicatively."""
+        self.drops += 1
+        self._set_limit(self._limit * DROP_BACKOFF)
+
+    def _set_limit(self, limit: float) -> None:
+        previous = self.limit
+        self._limit = min(float(self.max_limit), max(float(self.min_limit), limit))
+        if self.limit != previous:
+            logger.debug(f"Adaptive concurrency limit {previous} -> {self.limit}")
+            self._wake()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "waiting": sum(1 for f in self._waiters if not f.done()),
+            "min_rtt_ms": round(self.min_rtt * 1000, 2) if self.min_rtt is not None else None,
+            "rtt_ms": round(self.rtt * 1000, 2) if self.rtt is not None else None,
+            "rejected": self.rejected,
+            "drops": self.drops,
+        }
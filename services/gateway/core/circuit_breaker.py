@@ -24,6 +24,9 @@ class CircuitBreaker:
         self.failures = 0
         self.last_failure_time: float = 0
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        # Bumped on every reset; failures counted elsewhere are only comparable
+        # with `failures` while the generation is unchanged.
+        self.generation = 0
 
     async def call(self, func: Callable, *args, **kwargs) -> Any:
         """
@@ -55,8 +58,24 @@ class CircuitBreaker:
 
             raise e
 
+    def forgive(self, count: int, generation: int) -> None:
+        """
+        Drop failures caused by one worker that has since been ejected.
+
+        `count` is the worker's failures recorded during `generation`; failures
+        from before the last reset are already gone and are not taken back
+        again. The circuit closes again if it was only open because of them.
+        """
+        if count <= 0 or generation != self.generation:
+            return
+        self.failures = max(0, self.failures - count)
+        if self.state != "CLOSED" and self.failures < self.failure_threshold:
+            self.state = "CLOSED"
+            logger.info("Circuit Breaker closed (failures came from an ejected worker)")
+
     def reset(self):
         """Reset state to CLOSED."""
         self.failures = 0
         self.state = "CLOSED"
         self.last_failure_time = 0
+        self.generation += 1
@@ -1,11 +1,15 @@
 import asyncio
+import logging
 from collections import deque
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 from services.gateway.core.exceptions import ResourceExhaustedError
 
 if TYPE_CHECKING:
+    from services.gateway.services.container_pool import ContainerPool
     from services.gateway.services.function_registry import FunctionRegistry
 
+logger = logging.getLogger("gateway.concurrency")
+
 
 class FunctionThrottle:
     """
@@ -95,3 +99,158 @@ class ConcurrencyManager:
     @property
     def default_timeout(self) -> int:
         return self._default_timeout
+
+
+class ConcurrencyBudget:
+    """
+    Node-wide container budget, modelled on Lambda account concurrency.
+
+    Every container (including in-flight provisions) counts against `limit`.
+    A function's first `reserved` containers come out of its reservation, the
+    rest out of the unreserved shared pool (limit - all reservations).
+
+    ContainerPools ask allows() before reserving a provisioning slot and call
+    rebalance() whenever they free capacity. When the shared pool is saturated,
+    freed capacity goes to the waiting function with the lowest shared usage
+    per weight (weighted fair share), so one hot function cannot starve the
+    others. A function that is blocked by the budget may also have an idle
+    container reclaimed from the function furthest above its share.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        reclaim: Optional[Callable[[str], bool]] = None,
+    ):
+        """
+        Args:
+            limit: max containers on the node (<= 0: unlimited)
+            reclaim: callback(function_name) freeing an idle container of that
+                function; returns False when it had none to give
+        """
+        self.limit = limit
+        self.reclaim = reclaim
+        self._pools: Dict[str, "ContainerPool"] = {}
+        self._reserved: Dict[str, int] = {}
+        self._weights: Dict[str, float] = {}
+        self._throttled: Dict[str, int] = {}
+        self._reclaimed: Dict[str, int] = {}
+
+    def check_reservations(self, reserved: Dict[str, int]) -> None:
+        """
+        Validate every function's reservation against the node limit.
+
+        Pools register lazily, so an over-committed configuration would only
+        show up as a shared pool silently clamped to 0. Reservations are
+        guarantees: more than `limit` of them cannot all be honoured.
+
+        Raises:
+            ValueError: the reservations add up to more than `limit`
+        """
+        total = sum(max(0, int(count)) for count in reserved.values())
+        if total > self.limit:
+            raise ValueError(
+                f"reserved_concurrency adds up to {total}, above "
+                f"NODE_CONCURRENCY_LIMIT={self.limit}: "
+                + ", ".join(f"{name}={count}" for name, count in sorted(reserved.items()) if count)
+            )
+        unreserved = sorted(name for name, count in reserved.items() if not count)
+        if total == self.limit and total > 0 and unreserved:
+            logger.warning(
+                "reserved_concurrency uses all of NODE_CONCURRENCY_LIMIT=%d; "
+                "functions without a reservation get no capacity: %s",
+                self.limit,
+                ", ".join(unreserved),
+            )
+
+    def register(self, pool: "ContainerPool", reserved: int = 0, weight: float = 1.0) -> None:
+        name = pool.function_name
+        self._pools[name] = pool
+        self._reserved[name] = max(0, int(reserved))
+        self._weights[name] = float(weight) if weight and weight > 0 else 1.0
+        pool.budget = self
+
+    @property
+    def shared_limit(self) -> int:
+        """Containers available to functions beyond their reservations."""
+        return max(0, self.limit - sum(self._reserved.values()))
+
+    def _usage(self, name: str) -> int:
+        pool = self._pools[name]
+        return pool.size + pool.provisioning
+
+    def _shared_usage(self, name: str) -> int:
+        return max(0, self._usage(name) - self._reserved.get(name, 0))
+
+    def _shared_used(self) -> int:
+        return sum(self._shared_usage(name) for name in self._pools)
+
+    def _share(self, name: str) -> float:
+        return self._shared_usage(name) / self._weights.get(name, 1.0)
+
+    def allows(self, function_name: str) -> bool:
+        """Whether function_name may add one container right now."""
+        if self.limit <= 0 or function_name not in self._pools:
+            return True
+        if self._usage(function_name) < self._reserved.get(function_name, 0):
+            return True
+        return self._shared_used() < self.shared_limit
+
+    def rebalance(self) -> None:
+        """Hand freed capacity to waiting pools, lowest weighted shared usage first."""
+        while True:
+            waiting = [
+                pool
+                for pool in self._pools.values()
+                if pool.has_capacity_waiters and pool.has_capacity()
+            ]
+            if not waiting:
+                return
+            pool = min(waiting, key=lambda p: self._share(p.function_name))
+            if not pool.grant_one():
+                return
+
+    def blocked(self, function_name: str) -> None:
+        """
+        A pool could not provision for function_name because of the budget.
+
+        Reclaims one idle container from the function furthest above its
+        weighted share, if that function is above the blocked one's share.
+        """
+        self._throttled[function_name] = self._throttled.get(function_name, 0) + 1
+        if self.reclaim is None:
+            return
+        own_share = (self._shared_usage(function_name) + 1) / self._weights.get(function_name, 1.0)
+        victims = sorted(
+            (
+                name
+                for name in self._pools
+                if name != function_name and self._shared_usage(name) > 0
+            ),
+            key=self._share,
+            reverse=True,
+        )
+        for name in victims:
+            if self._share(name) <= own_share:
+                return
+            if self.reclaim(name):
+                self._reclaimed[name] = self._reclaimed.get(name, 0) + 1
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "shared_limit": self.shared_limit,
+            "shared_used": self._shared_used(),
+            "functions": {
+                name: {
+                    "containers": self._usage(name),
+                    "reserved": self._reserved[name],
+                    "weight": self._weights[name],
+                    "waiting": pool.waiting,
+                    "throttled": self._throttled.get(name, 0),
+                    "reclaimed": self._reclaimed.get(name, 0),
+                }
+                for name, pool in self._pools.items()
+            },
+        }
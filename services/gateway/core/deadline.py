@@ -0,0 +1,55 @@
+"""
+Request deadlines.
+
+An invocation gets one absolute deadline when it enters the Gateway: the pool
+acquire timeout plus the function's timeout, shortened by the client's
+timeout header when present. Admission, pool acquire and the RIE call all
+spend from this one budget instead of applying independent timeouts.
+"""
+
+import math
+import time
+from typing import Optional
+
+
+class Deadline:
+    """Absolute point in time (monotonic clock) by which a request must finish."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + max(0.0, seconds))
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def cap(self, seconds: float) -> float:
+        """`seconds`, shortened to what is left of the deadline."""
+        return min(seconds, self.remaining())
+
+    def earliest(self, other: Optional["Deadline"]) -> "Deadline":
+        if other is None or self.expires_at <= other.expires_at:
+            return self
+        return other
+
+
+def parse_timeout_header(value: Optional[str]) -> Optional[float]:
+    """Seconds from a client timeout header; None when absent or invalid."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    if not math.isfinite(seconds) or seconds <= 0:
+        return None
+    return seconds
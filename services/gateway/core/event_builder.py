@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, List
+from urllib.parse import parse_qsl
 from fastapi import Request
 import base64
 import logging
@@ -108,3 +109,135 @@ class V1ProxyEventBuilder(EventBuilder):
         )
 
         return event_model.model_dump(exclude_none=True, by_alias=True)
+
+
+class V1FastProxyEventBuilder(EventBuilder):
+    """
+    API Gateway V1 (REST API) compatible event builder without Pydantic.
+
+    Produces the same dict as V1ProxyEventBuilder (including key order and
+    omitted None fields), but assembles it directly in a single pass over
+    the raw ASGI headers and query string.
+    """
+
+    async def build(self, request: Request, body: bytes, **kwargs) -> Dict[str, Any]:
+        """
+        Build an API Gateway Lambda Proxy Integration-compatible event dict.
+        """
+        scope = request.scope
+        path = request.url.path
+        user_id = kwargs.get("user_id", "anonymous")
+        path_params = kwargs.get("path_params", {})
+        route_path = kwargs.get("route_path", path)
+
+        # Headers (ASGI keys are already lowercase). Single-value maps keep the
+        # last value; lookups like user-agent keep the first, as Headers.get does.
+        headers: Dict[str, str] = {}
+        multi_headers: Dict[str, List[str]] = {}
+        user_agent = None
+        content_encoding = ""
+        for raw_key, raw_value in scope["headers"]:
+            key = raw_key.decode("latin-1")
+            value = raw_value.decode("latin-1")
+            headers[key] = value
+            values = multi_headers.get(key)
+            if values is None:
+                multi_headers[key] = [value]
+                if key == "user-agent":
+                    user_agent = value
+                elif key == "content-encoding":
+                    content_encoding = value
+            else:
+                values.append(value)
+
+        # Check if gzip-compressed.
+        is_base64 = "gzip" in content_encoding.lower()
+
+        # Process body.
+        if is_base64:
+            body_content = base64.b64encode(body).decode("utf-8")
+        else:
+            try:
+                body_content = body.decode("utf-8")
+            except UnicodeDecodeError:
+                body_content = base64.b64encode(body).decode("utf-8")
+                is_base64 = True
+
+        # Get RequestID (from context).
+        aws_request_id = get_request_id()
+
+        # Fallback (middleware should usually generate it).
+        if not aws_request_id:
+            aws_request_id = str(uuid.uuid4())
+
+        client = scope.get("client")
+        identity: Dict[str, Any] = {"sourceIp": client[0] if client else "unknown"}
+        if user_agent is not None:
+            identity["userAgent"] = user_agent
+
+        event: Dict[str, Any] = {
+            "resource": route_path,
+            "path": path,
+            "httpMethod": request.method,
+            "headers": headers,
+            "multiValueHeaders": multi_headers,
+        }
+
+        # Query parameters.
+        query_string = scope.get("query_string", b"")
+        if query_string:
+            query_params: Dict[str, str] = {}
+            multi_query_params: Dict[str, List[str]] = {}
+            for key, value in parse_qsl(query_string.decode("latin-1"), keep_blank_values=True):
+                query_params[key] = value
+                values = multi_query_params.get(key)
+                if values is None:
+                    multi_query_params[key] = [value]
+                else:
+                    values.append(value)
+            if query_params:
+                event["queryStringParameters"] = query_params
+                event["multiValueQueryStringParameters"] = multi_query_params
+
+        if path_params:
+            event["pathParameters"] = dict(path_params)
+
+        authorizer: Dict[str, Any] = {
+            "claims": {"cognito:username": user_id, "username": user_id},
+        }
+        if user_id is not None:
+            authorizer["cognito:username"] = user_id
+
+        event["requestContext"] = {
+            "identity": identity,
+            "authorizer": authorizer,
+            "requestId": aws_request_id,
+            "stage": "prod",
+            "path": path,
+            "protocol": f"HTTP/{scope.get('http_version', '1.1')}",
+        }
+
+        if body_content:
+            event["body"] = body_content
+        event["isBase64Encoded"] = is_base64
+
+        return event
+
+
+EVENT_BUILDERS = {
+    "pydantic": V1ProxyEventBuilder,
+    "fast": V1FastProxyEventBuilder,
+}
+
+
+def create_event_builder(name: str) -> EventBuilder:
+    """
+    Create the event builder selected by config (EVENT_BUILDER).
+
+    Unknown names fall back to the fast builder.
+    """
+    builder_cls = EVENT_BUILDERS.get(name.strip().lower())
+    if builder_cls is None:
+        logger.warning(f"Unknown event builder '{name}', using 'fast'")
+        builder_cls = V1FastProxyEventBuilder
+    return builder_cls()
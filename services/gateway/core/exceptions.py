@@ -5,6 +5,7 @@ Represent errors related to Lambda invocation.
 """
 
 import logging
+from typing import Optional
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
@@ -46,6 +47,15 @@ class LambdaExecutionError(LambdaInvokeError):
         super().__init__(f"Lambda execution failed for {function_name}: {cause}")
 
 
+class DeadlineExceededError(LambdaInvokeError):
+    """Raised when a request's deadline passes before it is answered."""
+
+    def __init__(self, function_name: str, stage: str):
+        self.function_name = function_name
+        self.stage = stage
+        super().__init__(f"Deadline exceeded for {function_name} while {stage}")
+
+
 class OrchestratorError(LambdaInvokeError):
     """Error from the orchestrator service."""
 
@@ -73,10 +83,22 @@ class OrchestratorUnreachableError(LambdaInvokeError):
 class ResourceExhaustedError(LambdaInvokeError):
     """Raised when resources are exhausted (queue full or timeout)."""
 
-    def __init__(self, detail: str = "Request timed out in queue"):
+    def __init__(
+        self, detail: str = "Request timed out in queue", retry_after: Optional[float] = None
+    ):
+        # Seconds the client should wait before retrying (Retry-After), if known.
+        self.retry_after = retry_after
         super().__init__(detail)
 
 
+class AdmissionRejectedError(ResourceExhaustedError):
+    """Raised when a request is shed instead of queued for a worker."""
+
+    def __init__(self, function_name: str, reason: str, retry_after: float):
+        self.function_name = function_name
+        super().__init__(f"Admission rejected for {function_name}: {reason}", retry_after)
+
+
 # ===========================================
 # Exception Handlers
 # ===========================================
@@ -0,0 +1,188 @@
+"""
+Per-worker outlier detection.
+
+The circuit breaker counts failures per function, so one sick container
+(slow disk, leaked memory, stuck thread) keeps being handed out and drags
+down the tail latency of the whole function. OutlierDetector keeps smoothed
+latency and error rate per worker and flags a worker whose numbers stand out
+against the median of its siblings:
+
+- latency: more than `latency_factor` x the sibling median
+- error rate: more than ERROR_RATE_MARGIN above the sibling median
+- `consecutive_errors` failures in a row while most siblings' last
+  invocation succeeded
+
+Workers are judged against at least `min_siblings` siblings with
+MIN_SAMPLES invocations each; latency and error rate also need MIN_SAMPLES
+of the worker itself. At most one worker per function is ejected per
+`interval` seconds. When every worker fails the same way, the function is
+at fault and the circuit breaker handles it.
+"""
+
+import statistics
+import time
+from typing import Any, Dict, List, Optional
+
+# Weight of a new sample in the smoothed latency / error rate.
+SAMPLE_ALPHA = 0.2
+# Invocations needed before a worker is judged or used as a reference.
+MIN_SAMPLES = 10
+# Error rate (0..1) above the sibling median that counts as an outlier.
+ERROR_RATE_MARGIN = 0.5
+# Latency gap (seconds) below which a worker is never a latency outlier.
+MIN_LATENCY_GAP = 0.05
+# Workers without invocations for this long are dropped from the statistics.
+STALE_AFTER = 600.0
+
+
+class _WorkerStats:
+    __slots__ = (
+        "samples",
+        "latency",
+        "error_rate",
+        "consecutive_errors",
+        "failures",
+        "generation",
+        "updated_at",
+    )
+
+    def __init__(self) -> None:
+        self.samples = 0
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        self.consecutive_errors = 0
+        # Failures also counted by the function's circuit breaker, since the
+        # breaker's last reset (`generation`).
+        self.failures = 0
+        self.generation = 0
+        self.updated_at = 0.0
+
+    def record(self, rtt: Optional[float], ok: bool, now: float, generation: int) -> None:
+        if generation != self.generation:
+            self.failures = 0
+            self.generation = generation
+        self.samples += 1
+        self.updated_at = now
+        self.error_rate += SAMPLE_ALPHA * ((0.0 if ok else 1.0) - self.error_rate)
+        if ok:
+            self.consecutive_errors = 0
+        else:
+            self.consecutive_errors += 1
+            self.failures += 1
+        if rtt is not None:
+            self.latency = (
+                rtt if self.latency is None else self.latency + SAMPLE_ALPHA * (rtt - self.latency)
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "latency_ms": round(self.latency * 1000, 2) if self.latency is not None else None,
+            "error_rate": round(self.error_rate, 3),
+            "consecutive_errors": self.consecutive_errors,
+        }
+
+
+class OutlierDetector:
+    """
+    Latency / error statistics of one function's workers.
+
+    All state changes are synchronous, so no lock is needed.
+    """
+
+    def __init__(
+        self,
+        latency_factor: float = 3.0,
+        consecutive_errors: int = 3,
+        min_siblings: int = 2,
+        interval: float = 10.0,
+    ):
+        """
+        Args:
+            latency_factor: latency over the sibling median that makes an outlier
+            consecutive_errors: failures in a row that make an outlier
+            min_siblings: judged siblings needed before anyone is ejected
+            interval: minimum seconds between two ejections
+        """
+        self.latency_factor = max(1.0, latency_factor)
+        self.consecutive_errors = max(1, consecutive_errors)
+        self.min_siblings = max(1, min_siblings)
+        self.interval = interval
+        self._workers: Dict[str, _WorkerStats] = {}
+        self._last_ejection = float("-inf")
+        self.ejected = 0
+
+    def record(
+        self, worker_id: str, rtt: Optional[float], ok: bool, generation: int = 0
+    ) -> Optional[str]:
+        """
+        Record one invocation (rtt: None when it is not a latency sample).
+
+        `generation` is the circuit breaker's current reset generation; failures
+        recorded in earlier generations are no longer counted for forget().
+
+        Returns why the worker should be ejected, or None.
+        """
+        now = time.monotonic()
+        worker = self._workers.get(worker_id)
+        if worker is None:
+            worker = self._workers[worker_id] = _WorkerStats()
+        worker.record(rtt, ok, now, generation)
+
+        if now - self._last_ejection < self.interval:
+            return None
+        siblings = self._siblings(worker_id, now)
+        if len(siblings) < self.min_siblings:
+            return None
+
+        reason = self._judge(worker, siblings)
+        if reason is not None:
+            self._last_ejection = now
+            self.ejected += 1
+        return reason
+
+    def _siblings(self, worker_id: str, now: float) -> List[_WorkerStats]:
+        siblings = []
+        for other_id, other in list(self._workers.items()):
+            if other_id == worker_id:
+                continue
+            if now - other.updated_at > STALE_AFTER:
+                # Pruned or evicted elsewhere without being forgotten.
+                del self._workers[other_id]
+            elif other.samples >= MIN_SAMPLES:
+                siblings.append(other)
+        return siblings
+
+    def _judge(self, worker: _WorkerStats, siblings: List[_WorkerStats]) -> Optional[str]:
+        healthy = sum(1 for s in siblings if s.consecutive_errors == 0)
+        if worker.consecutive_errors >= self.consecutive_errors and healthy * 2 > len(siblings):
+            return f"{worker.consecutive_errors} consecutive errors"
+        if worker.samples < MIN_SAMPLES:
+            return None
+        error_median = statistics.median(s.error_rate for s in siblings)
+        if worker.error_rate - error_median > ERROR_RATE_MARGIN:
+            return f"error rate {worker.error_rate:.2f} (siblings {error_median:.2f})"
+
+        latencies = [s.latency for s in siblings if s.latency is not None]
+        if worker.latency is None or len(latencies) < self.min_siblings:
+            return None
+        latency_median = statistics.median(latencies)
+        if (
+            worker.latency > self.latency_factor * latency_median
+            and worker.latency - latency_median > MIN_LATENCY_GAP
+        ):
+            return f"latency {worker.latency * 1000:.0f}ms (siblings {latency_median * 1000:.0f}ms)"
+        return None
+
+    def forget(self, worker_id: str, generation: int = 0) -> int:
+        """Drop a removed worker; returns the failures it recorded in `generation`."""
+        worker = self._workers.pop(worker_id, None)
+        if worker is None or worker.generation != generation:
+            return 0
+        return worker.failures
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "ejected": self.ejected,
+            "workers": {worker_id: s.stats() for worker_id, s in self._workers.items()},
+        }
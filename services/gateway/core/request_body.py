@@ -0,0 +1,155 @@
+"""
+Request body spooling and streamed proxy event rendering.
+
+The client body is read chunk by chunk into a SpooledTemporaryFile (kept in
+memory up to a threshold, spilled to disk above it). Large bodies are then
+spliced into the pre-rendered proxy event JSON as an async generator, so the
+payload sent to RIE is never materialized in full and peak memory per
+request does not grow with the payload size.
+"""
+
+import asyncio
+import base64
+import codecs
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator, Dict, Union
+
+from fastapi import Request
+
+from services.common.core import json_codec
+
+# Read size for streaming out of the spool. Multiple of 3 so each base64
+# chunk encodes without padding and chunks can be concatenated.
+STREAM_CHUNK_SIZE = 48 * 1024
+
+Payload = Union[bytes, AsyncIterator[bytes]]
+
+
+class SpooledRequestBody:
+    """
+    Request body buffered in a SpooledTemporaryFile.
+
+    UTF-8 validity is tracked incrementally while reading, so the proxy event
+    knows whether the body must be base64-encoded before any byte is emitted.
+    """
+
+    def __init__(self, max_memory: int):
+        self._file = SpooledTemporaryFile(max_size=max_memory)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.size = 0
+        self.is_utf8 = True
+
+    @classmethod
+    async def from_request(cls, request: Request, max_memory: int) -> "SpooledRequestBody":
+        """Consume the request stream into a new spool."""
+        body = cls(max_memory)
+        try:
+            async for chunk in request.stream():
+                await body.write(chunk)
+            body.finish()
+        except BaseException:
+            body.close()
+            raise
+        return body
+
+    async def write(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        if self.is_utf8:
+            try:
+                self._decoder.decode(chunk)
+            except UnicodeDecodeError:
+                self.is_utf8 = False
+        if self.in_memory:
+            self._file.write(chunk)
+        else:
+            await asyncio.to_thread(self._file.write, chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> None:
+        """Mark the end of input (detects a truncated trailing UTF-8 sequence)."""
+        if self.is_utf8:
+            try:
+                self._decoder.decode(b"", final=True)
+            except UnicodeDecodeError:
+                self.is_utf8 = False
+        self._file.seek(0)
+
+    @property
+    def in_memory(self) -> bool:
+        """True while the spool has not rolled over to disk."""
+        return not getattr(self._file, "_rolled", False)
+
+    def getvalue(self) -> bytes:
+        """Return the whole body (only meant for in-memory spools)."""
+        self._file.seek(0)
+        return self._file.read()
+
+    async def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Yield the raw body in chunks, reading disk-backed spools off the event loop."""
+        self._file.seek(0)
+        while True:
+            if self.in_memory:
+                chunk = self._file.read(chunk_size)
+            else:
+                chunk = await asyncio.to_thread(self._file.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def as_payload(self) -> Payload:
+        """Raw body as an RIE payload: bytes while in memory, chunk stream once spilled."""
+        if self.in_memory:
+            return self.getvalue()
+        return self.iter_chunks()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def render_proxy_event(event: Dict[str, Any], body: SpooledRequestBody) -> Payload:
+    """
+    Render a proxy event (built without a body) with the spooled body spliced in.
+
+    Args:
+        event: event dict from an EventBuilder called with an empty body
+        body: spooled request body
+
+    Returns:
+        bytes for in-memory bodies; an async byte iterator for spilled bodies.
+        Both serialize the same event the builders produce for the full body.
+    """
+    # Builders flag gzip bodies as base64 even when called with an empty body.
+    is_base64 = bool(event.pop("isBase64Encoded", False)) or not body.is_utf8
+    event.pop("body", None)
+
+    if body.size == 0 or body.in_memory:
+        if body.size:
+            raw = body.getvalue()
+            event["body"] = (
+                base64.b64encode(raw).decode("ascii") if is_base64 else raw.decode("utf-8")
+            )
+        event["isBase64Encoded"] = is_base64
+        return json_codec.dumps(event)
+
+    # "body" and "isBase64Encoded" are the last keys of the event.
+    prefix = json_codec.dumps(event)[:-1] + b',"body":"'
+    suffix = b'","isBase64Encoded":' + (b"true" if is_base64 else b"false") + b"}"
+    return _stream_event(prefix, body, is_base64, suffix)
+
+
+async def _stream_event(
+    prefix: bytes, body: SpooledRequestBody, is_base64: bool, suffix: bytes
+) -> AsyncIterator[bytes]:
+    yield prefix
+    if is_base64:
+        async for chunk in body.iter_chunks():
+            yield base64.b64encode(chunk)
+    else:
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        async for chunk in body.iter_chunks():
+            text = decoder.decode(chunk)
+            if text:
+                # Encode as a JSON string and drop the surrounding quotes.
+                yield json_codec.dumps(text)[1:-1]
+    yield suffix
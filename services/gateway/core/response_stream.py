@@ -0,0 +1,143 @@
+"""
+Lambda response streaming helpers.
+
+- InvokeWithResponseStream: wraps raw RIE output chunks into
+  application/vnd.amazon.eventstream messages (PayloadChunk / InvokeComplete)
+  as boto3 expects them.
+- Streamed HTTP routes: splits the HTTP integration prelude (JSON metadata
+  followed by 8 NUL bytes, written by awslambda.HttpResponseStream) from the
+  body stream.
+"""
+
+import struct
+import zlib
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi.responses import StreamingResponse
+
+from services.common.core import json_codec
+
+# Separator between the JSON metadata prelude and the body.
+PRELUDE_DELIMITER = b"\x00" * 8
+# Give up looking for a prelude after this many buffered bytes.
+MAX_PRELUDE_BYTES = 64 * 1024
+
+EVENT_STREAM_CONTENT_TYPE = "application/vnd.amazon.eventstream"
+
+# Event stream header value type for UTF-8 strings.
+_STRING_HEADER = 7
+
+
+def _encode_headers(headers: Dict[str, str]) -> bytes:
+    out = bytearray()
+    for name, value in headers.items():
+        name_bytes = name.encode("utf-8")
+        value_bytes = value.encode("utf-8")
+        out += struct.pack("!B", len(name_bytes)) + name_bytes
+        out += struct.pack("!BH", _STRING_HEADER, len(value_bytes)) + value_bytes
+    return bytes(out)
+
+
+def encode_event(event_type: str, payload: bytes, content_type: Optional[str] = None) -> bytes:
+    """
+    Encode one event stream message.
+
+    Layout: total length, headers length, prelude CRC, headers, payload, message CRC
+    (all integers big-endian uint32).
+    """
+    headers = {":event-type": event_type, ":message-type": "event"}
+    if content_type:
+        headers[":content-type"] = content_type
+    header_bytes = _encode_headers(headers)
+
+    total_length = 12 + len(header_bytes) + len(payload) + 4
+    prelude = struct.pack("!II", total_length, len(header_bytes))
+    message = prelude + struct.pack("!I", zlib.crc32(prelude)) + header_bytes + payload
+    return message + struct.pack("!I", zlib.crc32(message))
+
+
+def encode_payload_chunk(chunk: bytes) -> bytes:
+    return encode_event("PayloadChunk", chunk, "application/octet-stream")
+
+
+def encode_invoke_complete(
+    error_code: Optional[str] = None, error_details: Optional[str] = None
+) -> bytes:
+    complete: Dict[str, Any] = {}
+    if error_code:
+        complete["ErrorCode"] = error_code
+        complete["ErrorDetails"] = error_details or ""
+    return encode_event("InvokeComplete", json_codec.dumps(complete), "application/json")
+
+
+async def read_stream_prelude(
+    chunks: AsyncIterator[bytes],
+) -> Tuple[Optional[Dict[str, Any]], bytes, bool]:
+    """
+    Read from a streamed Lambda response until the HTTP integration prelude ends.
+
+    Args:
+        chunks: body chunks from RIE
+
+    Returns:
+        Tuple of:
+            - prelude: parsed metadata dict (None when the stream has no prelude)
+            - buffered: bytes read past the prelude (everything read when None)
+            - exhausted: True when the stream was read to the end
+
+    Output that does not start with "{" cannot carry a prelude and is returned
+    as soon as that is known, so raw streams keep their first-chunk latency.
+    JSON output without a prelude (a buffered handler returning a proxy
+    envelope) is read to the end so the caller can parse it as usual.
+    """
+    buffered = bytearray()
+    searching = True
+    async for chunk in chunks:
+        buffered += chunk
+        if not searching:
+            continue
+        end = buffered.find(PRELUDE_DELIMITER)
+        if end != -1:
+            prelude = _parse_prelude(bytes(buffered[:end]))
+            if prelude is not None:
+                return prelude, bytes(buffered[end + len(PRELUDE_DELIMITER) :]), False
+            searching = False
+        elif len(buffered) > MAX_PRELUDE_BYTES:
+            searching = False
+        else:
+            head = buffered.lstrip()
+            if head and not head.startswith(b"{"):
+                return None, bytes(buffered), False
+    return None, bytes(buffered), True
+
+
+def _parse_prelude(data: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        prelude = json_codec.loads(data)
+    except ValueError:
+        return None
+    return prelude if isinstance(prelude, dict) else None
+
+
+class ClosingStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that always runs `on_close` once sending ends.
+
+    Used to release the RIE stream (and its worker) even when the client
+    disconnects before the body iterator is started.
+    """
+
+    def __init__(
+        self,
+        content: AsyncIterator[bytes],
+        on_close: Callable[[], Awaitable[Any]],
+        **kwargs: Any,
+    ):
+        super().__init__(content, **kwargs)
+        self._on_close = on_close
+
+    async def __call__(self, scope, receive, send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await self._on_close()
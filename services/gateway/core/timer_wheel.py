@@ -0,0 +1,162 @@
+"""
+Hashed timer wheel for per-worker deadlines.
+
+Idle pause, idle pruning and recycling each need one deadline per worker that
+moves on every release. One asyncio Task per deadline means a create/cancel
+pair per invocation, and a periodic scan only expires workers at the scan
+interval. The wheel keeps every deadline in one of `slots` buckets (by tick)
+and a single driver task visits one bucket per `tick` seconds:
+
+- schedule / reschedule / cancel are O(1) (dict operations)
+- a timer fires at the first tick boundary at or after its deadline, i.e.
+  less than `tick` late
+- deadlines further out than one revolution (`slots` x `tick` seconds) stay
+  in their bucket and are skipped until their round comes
+
+The driver task only runs while timers are pending. Callbacks run
+synchronously in the driver task; long work must be spawned by the callback.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger("gateway.timer_wheel")
+
+
+class _Timer:
+    __slots__ = ("key", "deadline", "tick", "callback")
+
+    def __init__(
+        self, key: Hashable, deadline: float, tick: int, callback: Callable[[], None]
+    ) -> None:
+        self.key = key
+        self.deadline = deadline
+        self.tick = tick
+        self.callback = callback
+
+
+class TimerWheel:
+    """
+    Keyed one-shot timers on a single driver task.
+
+    Scheduling a key that is already pending moves its timer.
+    """
+
+    def __init__(
+        self,
+        tick: float = 1.0,
+        slots: int = 512,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            tick: seconds per bucket (maximum lateness of a timer)
+            slots: buckets per revolution
+            clock: monotonic time source
+        """
+        if tick <= 0:
+            raise ValueError(f"tick must be positive, got {tick}")
+        self.tick = tick
+        self._clock = clock
+        self._slots: List[Dict[Hashable, _Timer]] = [{} for _ in range(max(1, slots))]
+        self._timers: Dict[Hashable, _Timer] = {}
+        # First tick not processed yet.
+        self._next_tick = math.floor(clock() / tick)
+        self._task: Optional[asyncio.Task] = None
+        self.fired = 0
+
+    def schedule(self, key: Hashable, delay: float, callback: Callable[[], None]) -> None:
+        """Run `callback` once, `delay` seconds from now (replaces a pending `key`)."""
+        now = self._clock()
+        if not self._timers:
+            # Nothing pending: skip the ticks elapsed since the wheel went empty.
+            self._next_tick = max(self._next_tick, math.floor(now / self.tick))
+        self.cancel(key)
+        deadline = now + max(0.0, delay)
+        tick = max(math.ceil(deadline / self.tick), self._next_tick)
+        timer = _Timer(key, deadline, tick, callback)
+        self._timers[key] = timer
+        self._slots[tick % len(self._slots)][key] = timer
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def cancel(self, key: Hashable) -> bool:
+        """Drop a pending timer; returns whether one was pending."""
+        timer = self._timers.pop(key, None)
+        if timer is None:
+            return False
+        del self._slots[timer.tick % len(self._slots)][key]
+        return True
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Clock time at which `key` is due, or None when it is not pending."""
+        timer = self._timers.get(key)
+        return timer.deadline if timer is not None else None
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._timers
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Fire every timer due by `now` (default: the clock).
+
+        Returns:
+            Number of timers fired
+        """
+        if now is None:
+            now = self._clock()
+        current = math.floor(now / self.tick)
+        if current < self._next_tick:
+            return 0
+        expired: List[_Timer] = []
+        # After a stall longer than one revolution every bucket is visited once.
+        ticks = min(current - self._next_tick + 1, len(self._slots))
+        for tick in range(current - ticks + 1, current + 1):
+            bucket = self._slots[tick % len(self._slots)]
+            for key, timer in list(bucket.items()):
+                if timer.tick <= current:
+                    del bucket[key]
+                    del self._timers[key]
+                    expired.append(timer)
+        self._next_tick = current + 1
+
+        expired.sort(key=lambda timer: timer.deadline)
+        for timer in expired:
+            try:
+                timer.callback()
+            except Exception as e:
+                logger.error(f"Timer {timer.key!r} failed: {e}")
+        self.fired += len(expired)
+        return len(expired)
+
+    async def _run(self) -> None:
+        try:
+            while self._timers:
+                await asyncio.sleep(max(0.0, self._next_tick * self.tick - self._clock()))
+                self.advance()
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    async def stop(self) -> None:
+        """Drop every pending timer and stop the driver task."""
+        self._timers.clear()
+        for bucket in self._slots:
+            bucket.clear()
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def stats(self) -> Dict[str, float]:
+        return {"pending": len(self._timers), "fired": self.fired, "tick": self.tick}
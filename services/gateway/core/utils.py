@@ -2,21 +2,32 @@
 Gateway Utility Module
 """
 
-import json
+import base64
+import binascii
 import logging
 from typing import Dict, Any
 
 import httpx
 
+from services.common.core import json_codec
+
 logger = logging.getLogger("gateway.utils")
 
+# An API Gateway proxy envelope always contains this key.
+_ENVELOPE_MARKER = b'"statusCode"'
+_DEFAULT_CONTENT_TYPE = "application/json"
+
 
-def parse_lambda_response(lambda_response: httpx.Response) -> Dict[str, Any]:
+def parse_lambda_response(
+    lambda_response: httpx.Response, passthrough: bool = False
+) -> Dict[str, Any]:
     """
     Parse Lambda RIE response and convert to FastAPI response data.
 
     Args:
         lambda_response: raw response from Lambda RIE
+        passthrough: emit the body bytes as-is instead of parsing it
+            (always returns "raw_content"; see _passthrough_lambda_response)
 
     Returns:
         Dict for FastAPI response:
@@ -27,8 +38,11 @@ def parse_lambda_response(lambda_response: httpx.Response) -> Dict[str, Any]:
             "raw_content": bytes (only when JSON parsing fails)
         }
     """
+    if passthrough:
+        return _passthrough_lambda_response(lambda_response)
+
     try:
-        response_data = lambda_response.json()
+        response_data = json_codec.loads(lambda_response.content)
 
         # When Lambda response uses API Gateway format.
         if isinstance(response_data, dict) and "statusCode" in response_data:
@@ -39,8 +53,8 @@ def parse_lambda_response(lambda_response: httpx.Response) -> Dict[str, Any]:
             # Parse body if it's a JSON string.
             if isinstance(response_body, str):
                 try:
-                    response_body = json.loads(response_body)
-                except json.JSONDecodeError:
+                    response_body = json_codec.loads(response_body)
+                except json_codec.JSONDecodeError:
                     logger.warning(
                         "Failed to parse Lambda response body as JSON. Returning as string.",
                         extra={
@@ -57,9 +71,81 @@ def parse_lambda_response(lambda_response: httpx.Response) -> Dict[str, Any]:
         else:
             return {"status_code": 200, "content": response_data, "headers": {}}
 
-    except json.JSONDecodeError:
+    except json_codec.JSONDecodeError:
         return {
             "status_code": lambda_response.status_code,
             "raw_content": lambda_response.content,
             "headers": dict(lambda_response.headers),
         }
+
+
+def _passthrough_lambda_response(lambda_response: httpx.Response) -> Dict[str, Any]:
+    """
+    Convert a Lambda RIE response without re-parsing or re-encoding the body.
+
+    - Output without an API Gateway envelope is already JSON and is forwarded
+      untouched (not even parsed).
+    - Envelope string bodies are emitted as-is with the Lambda-supplied
+      Content-Type (application/json when absent).
+    - isBase64Encoded bodies are decoded straight to bytes.
+    - Only the envelope itself is parsed; the body is never JSON-decoded.
+    """
+    content = lambda_response.content
+
+    if _ENVELOPE_MARKER not in content:
+        return {
+            "status_code": lambda_response.status_code,
+            "raw_content": content,
+            "headers": {
+                "Content-Type": lambda_response.headers.get("content-type", _DEFAULT_CONTENT_TYPE)
+            },
+        }
+
+    try:
+        response_data = json_codec.loads(content)
+    except json_codec.JSONDecodeError:
+        return {
+            "status_code": lambda_response.status_code,
+            "raw_content": content,
+            "headers": dict(lambda_response.headers),
+        }
+
+    if not isinstance(response_data, dict) or "statusCode" not in response_data:
+        # "statusCode" appeared somewhere nested; still plain JSON output.
+        return {
+            "status_code": 200,
+            "raw_content": content,
+            "headers": {"Content-Type": _DEFAULT_CONTENT_TYPE},
+        }
+
+    status_code = response_data.get("statusCode", 200)
+    response_headers = {str(k): str(v) for k, v in (response_data.get("headers") or {}).items()}
+    if not any(k.lower() == "content-type" for k in response_headers):
+        response_headers["Content-Type"] = _DEFAULT_CONTENT_TYPE
+
+    response_body = response_data.get("body")
+    if response_body is None:
+        body_bytes = b""
+    elif isinstance(response_body, str):
+        body_bytes = None
+        if response_data.get("isBase64Encoded"):
+            try:
+                body_bytes = base64.b64decode(response_body)
+            except (binascii.Error, ValueError):
+                logger.warning(
+                    "Lambda response flagged isBase64Encoded but body is not valid base64. "
+                    "Returning as string.",
+                    extra={"snippet": response_body[:200], "status_code": status_code},
+                )
+        if body_bytes is None:
+            body_bytes = response_body.encode("utf-8")
+    else:
+        # Non-string body (dict/list/number): API Gateway would reject it,
+        # but keep serving it as JSON like the parsing mode does.
+        body_bytes = json_codec.dumps(response_body)
+
+    return {
+        "status_code": status_code,
+        "raw_content": body_bytes,
+        "headers": response_headers,
+    }
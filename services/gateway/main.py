@@ -5,30 +5,45 @@ Replicates AWS API Gateway and Lambda Authorizer behavior and forwards
 requests to Lambda RIE containers based on routing.yml.
 """
 
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
 from dataclasses import asdict
 from fastapi import FastAPI, Request, HTTPException, Header, BackgroundTasks
 from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from typing import Optional
+from typing import Awaitable, Optional, TypeVar
 from datetime import datetime, timezone
 import asyncio
 import httpx
+import math
 import logging
-import json
 from .config import config
 from .core.security import create_access_token
 from .core.utils import parse_lambda_response
 from .models import AuthRequest, AuthResponse, AuthenticationResult
-from .core.event_builder import V1ProxyEventBuilder
+from .core.event_builder import create_event_builder
+from .core.request_body import Payload, SpooledRequestBody, render_proxy_event
+from .core.response_stream import (
+    EVENT_STREAM_CONTENT_TYPE,
+    ClosingStreamingResponse,
+    encode_invoke_complete,
+    encode_payload_chunk,
+    read_stream_prelude,
+)
 
 # Services Imports
 from .services.function_registry import FunctionRegistry
 from .services.route_matcher import RouteMatcher
 from .services.lambda_invoker import LambdaInvoker
 from .services.pool_manager import PoolManager
+from .services.container_pool import LANE_ASYNC, LANE_INTERACTIVE
 from .services.janitor import HeartbeatJanitor
+from .services.rie_transport import RieTransportPool
+from .services.warmup import WarmupInvoker
+from .services.autoscaler import PredictiveAutoscaler
+from .services.provision_scheduler import ProvisionScheduler
+from .core.concurrency import ConcurrencyBudget
+from .core.deadline import Deadline, parse_timeout_header
 
 from .api.deps import (
     UserIdDep,
@@ -45,6 +60,7 @@ from .core.exceptions import (
     http_exception_handler,
     validation_exception_handler,
     ContainerStartError,
+    DeadlineExceededError,
     LambdaExecutionError,
     FunctionNotFoundError,
     ResourceExhaustedError,
@@ -80,21 +96,41 @@ async def lifespan(app: FastAPI):
     # === Auto-Scaling: Pool Initialization ===
     def config_loader(function_name: str):
         """Load scaling config for a function"""
-        func_config = function_registry.get_function_config(function_name) or {}
+        plan = function_registry.get_invocation_plan(function_name)
+        if plan is None:
+            return {
+                "scaling": {
+                    "max_capacity": config.DEFAULT_MAX_CAPACITY,
+                    "min_capacity": config.DEFAULT_MIN_CAPACITY,
+                    "acquire_timeout": config.POOL_ACQUIRE_TIMEOUT,
+                    "max_queue": config.POOL_MAX_QUEUE,
+                }
+            }
         return {
             "scaling": {
-                "max_capacity": func_config.get("scaling", {}).get(
-                    "max_capacity", config.DEFAULT_MAX_CAPACITY
-                ),
-                "min_capacity": func_config.get("scaling", {}).get(
-                    "min_capacity", config.DEFAULT_MIN_CAPACITY
-                ),
-                "acquire_timeout": func_config.get("scaling", {}).get(
-                    "acquire_timeout", config.POOL_ACQUIRE_TIMEOUT
-                ),
+                "max_capacity": plan.max_capacity,
+                "min_capacity": plan.min_capacity,
+                "acquire_timeout": plan.acquire_timeout,
+                "max_queue": plan.max_queue,
+                "reserved_concurrency": plan.reserved_concurrency,
+                "weight": plan.weight,
+                "schedule": plan.schedule,
+                "recycle": plan.recycle,
             }
         }
 
+    # Node-wide budget: reservations are guarantees, so refuse to start when
+    # they add up to more than the node can run.
+    concurrency_budget = None
+    if config.NODE_CONCURRENCY_LIMIT > 0:
+        concurrency_budget = ConcurrencyBudget(config.NODE_CONCURRENCY_LIMIT)
+        concurrency_budget.check_reservations(
+            {
+                name: function_registry.get_invocation_plan(name).reserved_concurrency
+                for name in function_registry.list_function_names()
+            }
+        )
+
     logger.info(f"Initializing Gateway with Go Agent gRPC Backend: {config.AGENT_GRPC_ADDRESS}")
 
     # New ARCH: PoolManager -> GrpcProvisionClient -> Agent
@@ -106,13 +142,59 @@ async def lifespan(app: FastAPI):
     channel = grpc.aio.insecure_channel(config.AGENT_GRPC_ADDRESS)
     agent_stub = agent_pb2_grpc.AgentServiceStub(channel)
 
-    grpc_provision_client = GrpcProvisionClient(agent_stub, function_registry)
+    # Pinned per-worker RIE connections (opened after readiness).
+    rie_transports = (
+        RieTransportPool(timeout=config.LAMBDA_INVOKE_TIMEOUT)
+        if config.RIE_PINNED_TRANSPORT
+        else None
+    )
+
+    grpc_provision_client = GrpcProvisionClient(
+        agent_stub,
+        function_registry,
+        transports=rie_transports,
+        readiness_fallback=config.READINESS_POLL_FALLBACK,
+    )
+
+    # Warm-up invocation: import the handler before a new worker serves requests.
+    warmup = (
+        WarmupInvoker(client, timeout=config.LAMBDA_INVOKE_TIMEOUT, transports=rie_transports)
+        if config.WARMUP_INVOCATION
+        else None
+    )
 
     pool_manager = PoolManager(
         provision_client=grpc_provision_client,
         config_loader=config_loader,
         pause_enabled=config.ENABLE_CONTAINER_PAUSE,
         pause_idle_seconds=config.PAUSE_IDLE_SECONDS,
+        prewarm_concurrency=config.PREWARM_CONCURRENCY,
+        selection=config.POOL_SELECTION,
+        provision_batch_max=config.PROVISION_BATCH_MAX,
+        warmup=warmup.warm if warmup is not None else None,
+        autoscaler=(
+            PredictiveAutoscaler(
+                interval=config.AUTOSCALE_INTERVAL,
+                horizon=config.AUTOSCALE_HORIZON,
+                cooldown=config.AUTOSCALE_COOLDOWN,
+            )
+            if config.PREDICTIVE_SCALING
+            else None
+        ),
+        schedule_interval=config.CAPACITY_SCHEDULE_INTERVAL,
+        schedule_ramp=config.CAPACITY_SCHEDULE_RAMP_SECONDS,
+        # Cold-start burst limiter shared by all pools.
+        provision_scheduler=ProvisionScheduler(
+            rate=config.PROVISION_RATE_LIMIT,
+            burst=config.PROVISION_BURST,
+            max_in_flight=config.PROVISION_MAX_IN_FLIGHT,
+        ),
+        concurrency_budget=concurrency_budget,
+        async_share=config.ASYNC_CAPACITY_SHARE,
+        admission_control=config.ADMISSION_CONTROL,
+        recycle_interval=config.RECYCLE_CHECK_INTERVAL,
+        # Idle workers expire by timer, within a second of the timeout.
+        idle_timeout=config.GATEWAY_IDLE_TIMEOUT_SECONDS,
     )
     if config.ENABLE_CONTAINER_PAUSE:
         logger.info(
@@ -122,6 +204,11 @@ async def lifespan(app: FastAPI):
     # Cleanup orphan containers from previous runs
     await pool_manager.cleanup_all_containers()
 
+    # Provisioned concurrency: warm min_capacity workers in the background.
+    pool_manager.schedule_min_capacity(function_registry.list_function_names())
+    # Scheduled provisioned concurrency: raise/lower floors per scaling.schedule.
+    await pool_manager.start_capacity_schedule(function_registry.list_function_names())
+
     invocation_backend = pool_manager
 
     janitor = HeartbeatJanitor(
@@ -129,8 +216,11 @@ async def lifespan(app: FastAPI):
         manager_client=None,  # gRPC mode doesn't need manager heartbeats
         interval=config.HEARTBEAT_INTERVAL,
         idle_timeout=config.GATEWAY_IDLE_TIMEOUT_SECONDS,
+        prune=False,
     )
     await janitor.start()
+    await pool_manager.start_autoscaler()
+    await pool_manager.start_recycler()
 
     # Create LambdaInvoker with chosen backend
     lambda_invoker = LambdaInvoker(
@@ -138,6 +228,9 @@ async def lifespan(app: FastAPI):
         registry=function_registry,
         config=config,
         backend=invocation_backend,
+        transports=rie_transports,
+        adaptive_concurrency=config.ADAPTIVE_CONCURRENCY,
+        outlier_detection=config.OUTLIER_DETECTION,
     )
 
     # Store in app.state for DI
@@ -145,7 +238,7 @@ async def lifespan(app: FastAPI):
     app.state.function_registry = function_registry
     app.state.route_matcher = route_matcher
     app.state.lambda_invoker = lambda_invoker
-    app.state.event_builder = V1ProxyEventBuilder()
+    app.state.event_builder = create_event_builder(config.EVENT_BUILDER)
     app.state.pool_manager = pool_manager
 
     logger.info("Gateway initialized with shared resources.")
@@ -160,6 +253,8 @@ async def lifespan(app: FastAPI):
         await pool_manager.shutdown_all()
 
     logger.info("Gateway shutting down, closing http client.")
+    if rie_transports is not None:
+        await rie_transports.aclose()
     await client.aclose()
 
 
@@ -256,12 +351,74 @@ async def function_not_found_handler(request: Request, exc: FunctionNotFoundErro
 
 @app.exception_handler(ResourceExhaustedError)
 async def resource_exhausted_handler(request: Request, exc: ResourceExhaustedError):
+    headers = None
+    if exc.retry_after is not None:
+        # boto3 treats TooManyRequestsException as throttling and backs off.
+        headers = {
+            "Retry-After": str(math.ceil(exc.retry_after)),
+            "x-amzn-ErrorType": "TooManyRequestsException",
+        }
     return JSONResponse(
         status_code=429,
         content={"message": "Too Many Requests", "detail": str(exc)},
+        headers=headers,
     )
 
 
+@app.exception_handler(DeadlineExceededError)
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError):
+    return JSONResponse(
+        status_code=504,
+        content={"message": "Gateway Timeout", "detail": str(exc)},
+    )
+
+
+# Non-standard status (nginx) logged when the client closed the connection first.
+CLIENT_CLOSED_REQUEST = 499
+
+T = TypeVar("T")
+
+
+def _client_deadline(request: Request) -> Optional[Deadline]:
+    """Deadline from the client's timeout header, if it sent one."""
+    seconds = parse_timeout_header(request.headers.get(config.REQUEST_TIMEOUT_HEADER))
+    return Deadline.after(seconds) if seconds is not None else None
+
+
+async def _wait_for_disconnect(request: Request) -> None:
+    """Return once the client closes the connection (the body must already be read)."""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+async def _unless_disconnected(request: Request, invocation: Awaitable[T]) -> Optional[T]:
+    """
+    Await the invocation, cancelling it if the client disconnects first.
+
+    Returns None on disconnect; the invoker then destroys the busy worker
+    instead of letting it run to completion for nobody.
+    """
+    task = asyncio.ensure_future(invocation)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    try:
+        done, _ = await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    except BaseException:
+        task.cancel()
+        raise
+    finally:
+        watcher.cancel()
+    if task in done:
+        return task.result()
+
+    task.cancel()
+    with suppress(asyncio.CancelledError, Exception):
+        await task
+    logger.info(f"Client disconnected; cancelled invocation ({request.url.path})")
+    return None
+
+
 # ===========================================
 # Endpoint definitions.
 # ===========================================
@@ -342,6 +499,56 @@ async def list_container_metrics(user_id: UserIdDep, pool_manager: PoolManagerDe
     return {"containers": metrics_list, "failures": failures}
 
 
+@app.get("/metrics/transports")
+async def list_transport_metrics(user_id: UserIdDep, invoker: LambdaInvokerDep):
+    """Pinned RIE connection timings per worker (connect / TTFB in ms)."""
+    if invoker.transports is None:
+        return {"transports": {}}
+    return {"transports": invoker.transports.stats()}
+
+
+@app.get("/metrics/autoscaler")
+async def list_autoscaler_metrics(user_id: UserIdDep, pool_manager: PoolManagerDep):
+    """Predictive scale-out forecasts and hit/miss/wasted pre-provision counts per function."""
+    if pool_manager.autoscaler is None:
+        return {"functions": {}}
+    return {"functions": pool_manager.autoscaler.stats()}
+
+
+@app.get("/metrics/provisioning")
+async def list_provisioning_metrics(user_id: UserIdDep, pool_manager: PoolManagerDep):
+    """Gateway-wide provisioning limiter state and queue latency per function."""
+    if pool_manager.provision_scheduler is None:
+        return {"provisioning": {}}
+    return {"provisioning": pool_manager.provision_scheduler.stats()}
+
+
+@app.get("/metrics/concurrency")
+async def list_concurrency_metrics(user_id: UserIdDep, pool_manager: PoolManagerDep):
+    """Node concurrency budget: containers, reservations and fair-share state per function."""
+    if pool_manager.concurrency_budget is None:
+        return {"budget": None}
+    return {"budget": pool_manager.concurrency_budget.stats()}
+
+
+@app.get("/metrics/limits")
+async def list_limit_metrics(user_id: UserIdDep, invoker: LambdaInvokerDep):
+    """Adaptive concurrency limits: current limit, min-RTT estimate and rejections."""
+    return {"functions": invoker.limiter_stats()}
+
+
+@app.get("/metrics/outliers")
+async def list_outlier_metrics(user_id: UserIdDep, invoker: LambdaInvokerDep):
+    """Per-worker latency / error statistics and outlier ejections per function."""
+    return {"functions": invoker.outlier_stats()}
+
+
+@app.get("/metrics/lanes")
+async def list_lane_metrics(user_id: UserIdDep, pool_manager: PoolManagerDep):
+    """Waiting / in-use callers and acquire wait times per priority lane and function."""
+    return {"functions": pool_manager.lane_stats()}
+
+
 # ===========================================
 # AWS Lambda Service Compatible Endpoint
 # ===========================================
@@ -366,34 +573,134 @@ async def invoke_lambda_api(
     # Retrieve dependencies (Now injected via DI)
 
     # Check function existence (for 404).
-    if registry.get_function_config(function_name) is None:
+    if registry.get_invocation_plan(function_name) is None:
         return JSONResponse(
             status_code=404,
             content={"message": f"Function not found: {function_name}"},
         )
 
     invocation_type = request.headers.get("X-Amz-Invocation-Type", "RequestResponse")
-    body = await request.body()
+    deadline = _client_deadline(request)
+    body = await SpooledRequestBody.from_request(request, config.REQUEST_BODY_SPOOL_THRESHOLD)
+
+    if invocation_type == "Event":
+        # Async invoke: run in background, return 202 immediately.
+        # The spool is owned (and closed) by the background task.
+        background_tasks.add_task(_invoke_and_close, invoker, function_name, body)
+        return Response(status_code=202, content=b"", media_type="application/json")
 
     try:
-        if invocation_type == "Event":
-            # Async invoke: run in background, return 202 immediately.
-            background_tasks.add_task(invoker.invoke_function, function_name, body)
-            return Response(status_code=202, content=b"", media_type="application/json")
-        else:
-            # Sync invoke: wait for the result.
-            resp = await invoker.invoke_function(function_name, body)
-            # Pass through the RIE response to the client (boto3).
-            return Response(
-                content=resp.content,
-                status_code=resp.status_code,
-                headers=dict(resp.headers),
-                media_type="application/json",
-            )
+        # Sync invoke: wait for the result (abandoned if the client disconnects).
+        resp = await _unless_disconnected(
+            request, invoker.invoke_function(function_name, body.as_payload(), deadline=deadline)
+        )
+        if resp is None:
+            return Response(status_code=CLIENT_CLOSED_REQUEST)
+        # Pass through the RIE response to the client (boto3).
+        return Response(
+            content=resp.content,
+            status_code=resp.status_code,
+            headers=dict(resp.headers),
+            media_type="application/json",
+        )
     except ContainerStartError as e:
         return JSONResponse(status_code=503, content={"message": str(e)})
     except LambdaExecutionError as e:
         return JSONResponse(status_code=502, content={"message": str(e)})
+    finally:
+        body.close()
+
+
+async def _invoke_and_close(
+    invoker: LambdaInvoker, function_name: str, body: SpooledRequestBody
+) -> None:
+    """Background Event invocation that releases the request body spool afterwards."""
+    try:
+        await invoker.invoke_function(function_name, body.as_payload(), lane=LANE_ASYNC)
+    finally:
+        body.close()
+
+
+@app.post("/2021-11-15/functions/{function_name}/response-streaming-invocations")
+async def invoke_lambda_stream_api(
+    function_name: str,
+    request: Request,
+    invoker: LambdaInvokerDep,
+    registry: FunctionRegistryDep,
+):
+    """
+    AWS Lambda InvokeWithResponseStream API compatible endpoint.
+    Handles requests from boto3.client('lambda').invoke_with_response_stream().
+
+    RIE output is forwarded as PayloadChunk events while the function runs,
+    followed by an InvokeComplete event.
+    """
+    if registry.get_invocation_plan(function_name) is None:
+        return JSONResponse(
+            status_code=404,
+            content={"message": f"Function not found: {function_name}"},
+        )
+
+    deadline = _client_deadline(request)
+    body = await SpooledRequestBody.from_request(request, config.REQUEST_BODY_SPOOL_THRESHOLD)
+    stack = AsyncExitStack()
+    try:
+        rie_response = await _unless_disconnected(
+            request,
+            stack.enter_async_context(
+                invoker.stream_function(function_name, body.as_payload(), deadline=deadline)
+            ),
+        )
+    except ContainerStartError as e:
+        return JSONResponse(status_code=503, content={"message": str(e)})
+    except LambdaExecutionError as e:
+        function_error = _function_error(e)
+        if function_error is None:
+            return JSONResponse(status_code=502, content={"message": str(e)})
+        # The function ran and failed: like Lambda, report it in the stream.
+        return Response(
+            content=encode_invoke_complete(
+                error_code=function_error.headers["X-Amz-Function-Error"],
+                error_details=function_error.text,
+            ),
+            media_type=EVENT_STREAM_CONTENT_TYPE,
+            headers={"X-Amz-Executed-Version": "$LATEST"},
+        )
+    finally:
+        # The request has been sent once the response headers are available.
+        body.close()
+    if rie_response is None:
+        await stack.aclose()
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+    return ClosingStreamingResponse(
+        _event_stream(function_name, rie_response),
+        on_close=stack.aclose,
+        media_type=EVENT_STREAM_CONTENT_TYPE,
+        headers={"X-Amz-Executed-Version": "$LATEST"},
+    )
+
+
+def _function_error(error: LambdaExecutionError) -> Optional[httpx.Response]:
+    """The RIE response when the function itself failed, None for gateway-side failures."""
+    cause = error.cause
+    if isinstance(cause, httpx.HTTPStatusError) and cause.response.headers.get(
+        "X-Amz-Function-Error"
+    ):
+        return cause.response
+    return None
+
+
+async def _event_stream(function_name: str, rie_response: httpx.Response):
+    """Wrap RIE output chunks into InvokeWithResponseStream events."""
+    try:
+        async for chunk in rie_response.aiter_bytes():
+            yield encode_payload_chunk(chunk)
+    except httpx.HTTPError as e:
+        logger.error(f"Lambda response stream for {function_name} failed: {e}")
+        yield encode_invoke_complete(error_code=type(e).__name__, error_details=str(e))
+        return
+    yield encode_invoke_complete()
 
 
 @app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "DELETE"])
@@ -411,31 +718,37 @@ async def gateway_handler(
     Authentication and routing resolution are handled via DI.
     """
     # Build Event and Invoke Lambda
+    deadline = _client_deadline(request)
+    body = await SpooledRequestBody.from_request(request, config.REQUEST_BODY_SPOOL_THRESHOLD)
     try:
-        body = await request.body()
+        # The event is built without the body; render_proxy_event splices the
+        # spooled body in, streaming it when it has spilled to disk.
         event = await event_builder.build(
             request=request,
-            body=body,
+            body=b"",
             user_id=user_id,
             path_params=target.path_params,
             route_path=target.route_path,
         )
 
         # Invoke Lambda via LambdaInvoker (handles container ensure & RIE req)
-        payload = json.dumps(event).encode("utf-8")
-        lambda_response = await invoker.invoke_function(target.container_name, payload)
-
-        # Transform response.
-        result = parse_lambda_response(lambda_response)
-        if "raw_content" in result:
-            return Response(
-                content=result["raw_content"],
-                status_code=result["status_code"],
-                headers=result["headers"],
+        payload = render_proxy_event(event, body)
+        if target.response_stream:
+            return await _stream_lambda_response(
+                request, invoker, target.container_name, payload, deadline
             )
-        return JSONResponse(
-            status_code=result["status_code"], content=result["content"], headers=result["headers"]
+
+        lambda_response = await _unless_disconnected(
+            request,
+            invoker.invoke_function(
+                target.container_name, payload, lane=LANE_INTERACTIVE, deadline=deadline
+            ),
         )
+        if lambda_response is None:
+            return Response(status_code=CLIENT_CLOSED_REQUEST)
+
+        # Transform response.
+        return _to_response(lambda_response)
 
     except httpx.RequestError as e:
         # Invalidate cache on Lambda connection failure.
@@ -457,6 +770,99 @@ async def gateway_handler(
         return JSONResponse(status_code=503, content={"message": str(e)})
     except LambdaExecutionError as e:
         return JSONResponse(status_code=502, content={"message": str(e)})
+    finally:
+        body.close()
+
+
+def _to_response(lambda_response: httpx.Response) -> Response:
+    """Convert a buffered RIE response into the client response."""
+    result = parse_lambda_response(lambda_response, passthrough=config.RESPONSE_PASSTHROUGH)
+    if "raw_content" in result:
+        return Response(
+            content=result["raw_content"],
+            status_code=result["status_code"],
+            headers=result["headers"],
+        )
+    return JSONResponse(
+        status_code=result["status_code"], content=result["content"], headers=result["headers"]
+    )
+
+
+async def _stream_lambda_response(
+    request: Request,
+    invoker: LambdaInvoker,
+    function_name: str,
+    payload: Payload,
+    deadline: Optional[Deadline] = None,
+) -> Response:
+    """
+    Forward a streamed Lambda response (routing.yml `response_stream: true`).
+
+    Status and headers come from the HTTP integration prelude; the body is
+    forwarded chunk by chunk. Handlers that return a regular proxy envelope
+    are read to the end and converted as usual.
+    """
+    stack = AsyncExitStack()
+
+    async def open_stream():
+        rie_response = await stack.enter_async_context(
+            invoker.stream_function(
+                function_name, payload, lane=LANE_INTERACTIVE, deadline=deadline
+            )
+        )
+        chunks = rie_response.aiter_bytes()
+        return (rie_response, chunks, *await read_stream_prelude(chunks))
+
+    try:
+        opened = await _unless_disconnected(request, open_stream())
+    except BaseException:
+        await stack.aclose()
+        raise
+    if opened is None:
+        await stack.aclose()
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    rie_response, chunks, prelude, buffered, exhausted = opened
+
+    if exhausted:
+        await stack.aclose()
+        # Framing headers (chunked transfer) do not apply to the buffered copy.
+        content_type = rie_response.headers.get("content-type", "application/json")
+        buffered_response = httpx.Response(
+            rie_response.status_code, headers={"Content-Type": content_type}, content=buffered
+        )
+        return _to_response(buffered_response)
+
+    cookies = []
+    if prelude is not None:
+        status_code = prelude.get("statusCode", 200)
+        headers = {str(k): str(v) for k, v in (prelude.get("headers") or {}).items()}
+        cookies = prelude.get("cookies") or []
+    else:
+        status_code = rie_response.status_code
+        headers = {}
+    if not any(k.lower() == "content-type" for k in headers):
+        headers["Content-Type"] = "application/octet-stream"
+
+    response = ClosingStreamingResponse(
+        _forward_chunks(function_name, buffered, chunks),
+        on_close=stack.aclose,
+        status_code=status_code,
+        headers=headers,
+    )
+    for cookie in cookies:
+        response.raw_headers.append((b"set-cookie", str(cookie).encode("latin-1")))
+    return response
+
+
+async def _forward_chunks(function_name: str, first: bytes, chunks):
+    if first:
+        yield first
+    try:
+        async for chunk in chunks:
+            yield chunk
+    except httpx.HTTPError as e:
+        # Headers are already sent; the client sees a truncated body.
+        logger.error(f"Lambda response stream for {function_name} failed: {e}")
 
 
 if __name__ == "__main__":
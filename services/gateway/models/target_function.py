@@ -17,3 +17,5 @@ class TargetFunction(BaseModel):
     path_params: Dict[str, str]
     route_path: str
     function_config: Dict[str, Any]
+    # Forward the Lambda output as it is produced (routing.yml `response_stream`).
+    response_stream: bool = False
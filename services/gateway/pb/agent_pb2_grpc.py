@@ -39,6 +39,11 @@ class AgentServiceStub(object):
                 request_serializer=agent__pb2.EnsureContainerRequest.SerializeToString,
                 response_deserializer=agent__pb2.WorkerInfo.FromString,
                 _registered_method=True)
+        self.EnsureContainers = channel.unary_stream(
+                '/esb.agent.v1.AgentService/EnsureContainers',
+                request_serializer=agent__pb2.EnsureContainersRequest.SerializeToString,
+                response_deserializer=agent__pb2.WorkerInfo.FromString,
+                _registered_method=True)
         self.DestroyContainer = channel.unary_unary(
                 '/esb.agent.v1.AgentService/DestroyContainer',
                 request_serializer=agent__pb2.DestroyContainerRequest.SerializeToString,
@@ -70,7 +75,17 @@ class AgentServiceServicer(object):
     """Missing associated documentation comment in .proto file."""
 
     def EnsureContainer(self, request, context):
-        """Ensure a container and return connection info (start if missing, reuse if present)."""
+        """Ensure a container and return connection info (start if missing, reuse if present).
+        With Agent-side readiness enabled, returns once the RIE port accepts connections.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def EnsureContainers(self, request, context):
+        """Create `count` containers for one function concurrently (burst scale-out).
+        Streams each worker as soon as it is ready; fails only if none started.
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
@@ -114,6 +129,11 @@ def add_AgentServiceServicer_to_server(servicer, server):
                     request_deserializer=agent__pb2.EnsureContainerRequest.FromString,
                     response_serializer=agent__pb2.WorkerInfo.SerializeToString,
             ),
+            'EnsureContainers': grpc.unary_stream_rpc_method_handler(
+                    servicer.EnsureContainers,
+                    request_deserializer=agent__pb2.EnsureContainersRequest.FromString,
+                    response_serializer=agent__pb2.WorkerInfo.SerializeToString,
+            ),
             'DestroyContainer': grpc.unary_unary_rpc_method_handler(
                     servicer.DestroyContainer,
                     request_deserializer=agent__pb2.DestroyContainerRequest.FromString,
@@ -177,6 +197,33 @@ class AgentService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def EnsureContainers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/esb.agent.v1.AgentService/EnsureContainers',
+            agent__pb2.EnsureContainersRequest.SerializeToString,
+            agent__pb2.WorkerInfo.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def DestroyContainer(request,
             target,
@@ -0,0 +1,197 @@
+"""
+PredictiveAutoscaler - forecast-driven scale-out for ContainerPools
+
+ContainerPool only scales out reactively (an acquire finds no idle worker),
+so every ramp-up is paid as cold starts on user requests. PoolManager feeds
+the autoscaler every acquire/release and asks it once per tick how many
+workers each pool should pre-provision:
+
+- arrival rate: Holt's linear smoothing (EWMA level + EWMA trend) of acquires
+  per second, extrapolated `horizon` seconds ahead
+- service time: EWMA of how long a worker stays acquired
+- predicted concurrency: forecast rate x service time (Little's law), never
+  below the concurrency in use right now
+
+When the prediction exceeds warm capacity (workers + in-flight provisions)
+the difference is pre-provisioned, capped at max_capacity and at most once
+per cooldown per function.
+
+Per-function metrics:
+- hits: pre-provisioned workers that served a request
+- misses: workers a request had to wait for (reactive cold starts)
+- wasted: pre-provisioned workers removed without serving any request
+"""
+
+import math
+import time
+from typing import Any, Dict, Optional, Set
+
+from services.common.models.internal import WorkerInfo
+
+
+class _FunctionLoad:
+    """Arrival/service-time forecast and scale-out counters of one function."""
+
+    def __init__(self) -> None:
+        self.arrivals = 0
+        self.rate_level = 0.0
+        self.rate_trend = 0.0
+        self.service_time: Optional[float] = None
+        self.predicted = 0.0
+        self.last_scale_out = -math.inf
+        # Pre-provisioned workers that have not served a request yet.
+        self.unused: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+        self.wasted = 0
+        self.pre_provisioned = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "arrival_rate": round(self.rate_level, 3),
+            "arrival_trend": round(self.rate_trend, 3),
+            "service_time_ms": (
+                round(self.service_time * 1000, 1) if self.service_time is not None else None
+            ),
+            "predicted_concurrency": round(self.predicted, 2),
+            "pre_provisioned": self.pre_provisioned,
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+        }
+
+
+class PredictiveAutoscaler:
+    """
+    Per-function arrival-rate forecaster deciding pre-provisions.
+
+    Holds no reference to the pools; PoolManager reports events and applies
+    the decisions returned by plan().
+    """
+
+    def __init__(
+        self,
+        interval: float = 1.0,
+        horizon: float = 5.0,
+        cooldown: float = 10.0,
+        alpha: float = 0.5,
+        beta: float = 0.3,
+    ):
+        """
+        Args:
+            interval: seconds between forecasts (PoolManager's autoscale loop)
+            horizon: how far ahead (seconds) the arrival rate is extrapolated
+            cooldown: min seconds between two scale-outs of the same function
+            alpha: EWMA weight of the newest arrival-rate sample (level)
+            beta: EWMA weight of the newest slope sample (trend)
+        """
+        self.interval = interval
+        self.horizon = horizon
+        self.cooldown = cooldown
+        self.alpha = alpha
+        self.beta = beta
+        self._loads: Dict[str, _FunctionLoad] = {}
+        # worker id -> monotonic acquire time (service-time samples).
+        self._acquired_at: Dict[str, float] = {}
+        self._last_tick: Optional[float] = None
+
+    def _load(self, function_name: str) -> _FunctionLoad:
+        load = self._loads.get(function_name)
+        if load is None:
+            load = self._loads[function_name] = _FunctionLoad()
+        return load
+
+    def record_acquire(self, function_name: str, worker: WorkerInfo) -> None:
+        load = self._load(function_name)
+        load.arrivals += 1
+        self._acquired_at[worker.id] = time.monotonic()
+        if worker.id in load.unused:
+            load.unused.discard(worker.id)
+            load.hits += 1
+
+    def record_release(self, function_name: str, worker: WorkerInfo) -> None:
+        started = self._acquired_at.pop(worker.id, None)
+        if started is None:
+            return
+        sample = time.monotonic() - started
+        load = self._load(function_name)
+        if load.service_time is None:
+            load.service_time = sample
+        else:
+            load.service_time += self.alpha * (sample - load.service_time)
+
+    def record_miss(self, function_name: str, count: int = 1) -> None:
+        """Workers provisioned while requests waited for them."""
+        self._load(function_name).misses += count
+
+    def record_pre_provisioned(self, function_name: str, worker: WorkerInfo) -> None:
+        load = self._load(function_name)
+        load.pre_provisioned += 1
+        load.unused.add(worker.id)
+
+    def record_removed(self, function_name: str, worker: WorkerInfo) -> None:
+        """A worker left the pool (pruned, evicted)."""
+        self._acquired_at.pop(worker.id, None)
+        load = self._loads.get(function_name)
+        if load is not None and worker.id in load.unused:
+            load.unused.discard(worker.id)
+            load.wasted += 1
+
+    def observe(self, now: Optional[float] = None) -> None:
+        """Fold the arrivals counted since the previous tick into every forecast."""
+        now = time.monotonic() if now is None else now
+        if self._last_tick is None:
+            self._last_tick = now
+            return
+        elapsed = now - self._last_tick
+        if elapsed <= 0:
+            return
+        self._last_tick = now
+
+        for load in self._loads.values():
+            rate = load.arrivals / elapsed
+            load.arrivals = 0
+            previous = load.rate_level
+            load.rate_level = self.alpha * rate + (1 - self.alpha) * (
+                load.rate_level + load.rate_trend * elapsed
+            )
+            slope = (load.rate_level - previous) / elapsed
+            load.rate_trend = self.beta * slope + (1 - self.beta) * load.rate_trend
+
+    def plan(
+        self,
+        function_name: str,
+        busy: int,
+        warm: int,
+        max_capacity: int,
+        now: Optional[float] = None,
+    ) -> int:
+        """
+        Number of workers to pre-provision for a function right now.
+
+        Args:
+            busy: workers currently acquired
+            warm: workers in the pool plus in-flight provisions
+            max_capacity: the pool's hard cap
+        """
+        load = self._loads.get(function_name)
+        if load is None:
+            return 0
+        now = time.monotonic() if now is None else now
+
+        predicted = float(busy)
+        if load.service_time is not None:
+            rate = max(0.0, load.rate_level + load.rate_trend * self.horizon)
+            predicted = max(predicted, rate * load.service_time)
+        load.predicted = predicted
+
+        # Tolerate float noise so 2.0000001 does not round up to 3 workers.
+        target = min(max_capacity, math.ceil(predicted - 1e-6))
+        deficit = target - warm
+        if deficit <= 0 or now - load.last_scale_out < self.cooldown:
+            return 0
+        load.last_scale_out = now
+        return deficit
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: load.stats() for name, load in self._loads.items()}
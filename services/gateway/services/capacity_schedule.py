@@ -0,0 +1,158 @@
+"""
+Capacity schedule - time windows that raise a function's warm floor
+
+functions.yml may declare windows of provisioned concurrency next to the
+static min_capacity:
+
+    scaling:
+      min_capacity: 1
+      max_capacity: 20
+      schedule:
+        - name: shift-start
+          start: "08:00"        # floor reached at this time
+          end: "12:00"          # floor drops back afterwards (may wrap midnight)
+          min_capacity: 10
+          days: [mon, tue, wed, thu, fri]   # optional, default every day
+          timezone: Asia/Tokyo  # optional, default UTC
+          ramp: 600             # optional, seconds of gradual warm-up before start
+
+Before `start` the floor climbs linearly from the static min_capacity to the
+window's, so containers are created a few at a time instead of all at once.
+"""
+
+import datetime
+import math
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+DAY_NAMES = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+
+
+@dataclass(frozen=True, slots=True)
+class CapacityWindow:
+    """One recurring window of raised min_capacity."""
+
+    name: str
+    start: datetime.time
+    end: datetime.time
+    min_capacity: int
+    # Weekdays (Monday=0) the window starts on; empty means every day.
+    days: Tuple[int, ...] = ()
+    timezone: str = "UTC"
+    # Seconds before `start` during which the floor is raised gradually.
+    ramp: Optional[float] = None
+
+    def floor_at(self, now: datetime.datetime, base: int, default_ramp: float) -> int:
+        """Floor this window asks for at `now` (`base` when it is not active)."""
+        ramp = datetime.timedelta(
+            seconds=max(0.0, self.ramp if self.ramp is not None else default_ramp)
+        )
+        local = now.astimezone(ZoneInfo(self.timezone))
+        floor = base
+        # Yesterday's window may run past midnight, tomorrow's ramp may start today.
+        for offset in (-1, 0, 1):
+            day = local.date() + datetime.timedelta(days=offset)
+            if self.days and day.weekday() not in self.days:
+                continue
+            start = datetime.datetime.combine(day, self.start, tzinfo=local.tzinfo)
+            end = datetime.datetime.combine(day, self.end, tzinfo=local.tzinfo)
+            if end <= start:
+                end += datetime.timedelta(days=1)
+            if not start - ramp <= local < end:
+                continue
+            if local >= start:
+                floor = max(floor, self.min_capacity)
+            else:
+                progress = 1 - (start - local) / ramp
+                floor = max(floor, base + math.ceil((self.min_capacity - base) * progress))
+        return floor
+
+
+def _parse_time(value: Any, field: str) -> datetime.time:
+    if isinstance(value, int) and not isinstance(value, bool):
+        # YAML 1.1 reads an unquoted 8:30 as sexagesimal minutes (510).
+        hours, minutes = divmod(value, 60)
+        if 0 <= hours < 24:
+            return datetime.time(hours, minutes)
+    try:
+        return datetime.time.fromisoformat(str(value))
+    except ValueError:
+        raise ValueError(f"schedule {field} must be HH:MM, got {value!r}") from None
+
+
+def _parse_day(name: str) -> int:
+    try:
+        return DAY_NAMES.index(name.strip().lower()[:3])
+    except ValueError:
+        raise ValueError(f"Unknown schedule day: {name!r}") from None
+
+
+def _parse_days(value: Any) -> Tuple[int, ...]:
+    """Parse ["mon", "wed"], "mon-fri" or a mix of both into weekday numbers."""
+    if value is None:
+        return ()
+    if isinstance(value, str):
+        value = value.split(",")
+    days = set()
+    for item in value:
+        first, _, last = str(item).partition("-")
+        start = _parse_day(first)
+        stop = _parse_day(last) if last else start
+        # Ranges may wrap around the week (fri-mon).
+        days.update((start + i) % 7 for i in range((stop - start) % 7 + 1))
+    return tuple(sorted(days))
+
+
+def parse_capacity_schedule(entries: Optional[Iterable[Any]]) -> Tuple[CapacityWindow, ...]:
+    """
+    Parse the `scaling.schedule` list of functions.yml.
+
+    Raises:
+        ValueError: an entry is malformed
+    """
+    if not entries:
+        return ()
+    windows: List[CapacityWindow] = []
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"schedule entry {index} must be a mapping")
+        try:
+            min_capacity = int(entry["min_capacity"])
+            start = _parse_time(entry["start"], "start")
+            end = _parse_time(entry["end"], "end")
+        except KeyError as e:
+            raise ValueError(f"schedule entry {index} is missing {e.args[0]!r}") from None
+        timezone = str(entry.get("timezone") or "UTC")
+        try:
+            ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown schedule timezone: {timezone!r}") from None
+        days = _parse_days(entry.get("days"))
+        ramp = entry.get("ramp")
+        windows.append(
+            CapacityWindow(
+                name=str(entry.get("name") or f"window-{index}"),
+                start=start,
+                end=end,
+                min_capacity=max(0, min_capacity),
+                days=days,
+                timezone=timezone,
+                ramp=float(ramp) if ramp is not None else None,
+            )
+        )
+    return tuple(windows)
+
+
+def scheduled_floor(
+    windows: Iterable[CapacityWindow],
+    base: int,
+    now: Optional[datetime.datetime] = None,
+    default_ramp: float = 0.0,
+) -> int:
+    """Effective min_capacity at `now`: the highest floor of any window, at least `base`."""
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    floor = base
+    for window in windows:
+        floor = max(floor, window.floor_at(now, base, default_ramp))
+    return floor
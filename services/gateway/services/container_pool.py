@@ -1,27 +1,242 @@
 """
 ContainerPool - Worker Pool Management for Auto-Scaling
 
-Manages a pool of Lambda containers for a single function using Condition-based
-capacity control. Supports concurrent acquire/release with proper notification of waiters.
+Manages a pool of Lambda containers for a single function. Callers that find
+the pool full queue up by priority lane (FIFO within a lane); a released worker
+(or freed provisioning capacity) is handed directly to the next waiter instead
+of waking everyone.
+
+Provisions reserved in the same event loop tick are sent as one batch
+(up to max_provision_batch workers per provision call), so a cold burst
+scales out in a single round trip. A batch may be streamed back: each worker
+is handed to the oldest of the batch's callers as soon as it is ready.
 """
 
 import asyncio
+import contextlib
+import itertools
 import logging
 import time
-from collections import deque
-from typing import Callable, Awaitable, List, Set, Deque
+from collections import OrderedDict
+from typing import (
+    AsyncIterator,
+    Callable,
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+    Tuple,
+    Union,
+)
 
 from services.common.models.internal import WorkerInfo
+from services.gateway.core.exceptions import AdmissionRejectedError, ContainerStartError
+from services.gateway.services.recycle_policy import RecyclePolicy
+
+if TYPE_CHECKING:
+    from services.gateway.core.concurrency import ConcurrencyBudget
 
 logger = logging.getLogger("gateway.container_pool")
 
+SELECTION_MODES = ("lifo", "fifo")
 
-class ContainerPool:
+# Priority lanes, highest first: API traffic routed by routing.yml, the
+# synchronous Invoke API, and asynchronous (InvocationType=Event) invokes.
+LANE_INTERACTIVE = "interactive"
+LANE_SYNC = "sync"
+LANE_ASYNC = "async"
+LANES = (LANE_INTERACTIVE, LANE_SYNC, LANE_ASYNC)
+
+# Smoothing of the per-worker service time used for the admission estimate.
+SERVICE_TIME_ALPHA = 0.2
+
+# provision_callback(function_name) or provision_callback(function_name, count);
+# a batch may also return an async iterator yielding workers as they get ready.
+ProvisionCallback = Callable[..., Union[Awaitable[List[WorkerInfo]], AsyncIterator[WorkerInfo]]]
+
+
+class IdleWorkers:
+    """
+    Idle workers indexed by id, kept in release order (oldest first).
+
+    Membership checks and removal by id are O(1); both ends can be popped so
+    the pool can pick the most recently released worker (LIFO) while the
+    janitor walks the oldest ones first.
+
+    take() prefers workers whose handler is already initialized; it only scans
+    when uninitialized workers are idle, which is rare (failed warm-up).
+    """
+
+    __slots__ = ("_workers", "_uninitialized")
+
+    def __init__(self) -> None:
+        self._workers: "OrderedDict[str, WorkerInfo]" = OrderedDict()
+        self._uninitialized = 0
+
+    def append(self, worker: WorkerInfo) -> None:
+        self.discard(worker.id)
+        self._workers[worker.id] = worker
+        if not worker.initialized:
+            self._uninitialized += 1
+
+    def popleft(self) -> WorkerInfo:
+        return self._removed(self._workers.popitem(last=False)[1])
+
+    def pop(self) -> WorkerInfo:
+        return self._removed(self._workers.popitem(last=True)[1])
+
+    def take(self, newest: bool) -> WorkerInfo:
+        """Pop from one end, skipping uninitialized workers while initialized ones exist."""
+        if 0 < self._uninitialized < len(self._workers):
+            ids = reversed(self._workers) if newest else iter(self._workers)
+            for worker_id in ids:
+                if self._workers[worker_id].initialized:
+                    return self._removed(self._workers.pop(worker_id))
+        return self.pop() if newest else self.popleft()
+
+    def discard(self, worker_id: str) -> Optional[WorkerInfo]:
+        worker = self._workers.pop(worker_id, None)
+        return self._removed(worker) if worker is not None else None
+
+    def clear(self) -> None:
+        self._workers.clear()
+        self._uninitialized = 0
+
+    def _removed(self, worker: WorkerInfo) -> WorkerInfo:
+        if not worker.initialized:
+            self._uninitialized -= 1
+        return worker
+
+    def __contains__(self, worker_id: object) -> bool:
+        return worker_id in self._workers
+
+    def __iter__(self) -> Iterator[WorkerInfo]:
+        return iter(list(self._workers.values()))
+
+    def __len__(self) -> int:
+        return len(self._workers)
+
+
+class _Waiter:
+    __slots__ = ("seq", "lane", "future", "holds_slot")
+
+    def __init__(
+        self,
+        seq: int,
+        lane: str,
+        future: "asyncio.Future[Optional[WorkerInfo]]",
+        holds_slot: bool,
+    ) -> None:
+        self.seq = seq
+        self.lane = lane
+        self.future = future
+        # True while the caller's own provision is in flight (already counted in use).
+        self.holds_slot = holds_slot
+
+
+class WaiterQueue:
+    """
+    Waiters per priority lane, FIFO within a lane.
+
+    Interactive waiters go before sync ones. An async waiter competes by age
+    with them only while `async_ok` (the async lane is below its share of
+    the pool); otherwise it waits until no higher lane is queued.
+
+    Waiters are removed as soon as they are served or withdrawn, so append,
+    remove and the counts are O(1) (a waiter may sit in two queues, see
+    ContainerPool._capacity_waiters).
     """
-    Per-function container pool management (Condition-based).
 
-    Uses asyncio.Condition to resolve semaphore inconsistencies noted in review
-    and a deadlock observed in E2E (waiters not waking on release).
+    __slots__ = ("_lanes",)
+
+    def __init__(self) -> None:
+        self._lanes: Dict[str, "OrderedDict[int, _Waiter]"] = {
+            lane: OrderedDict() for lane in LANES
+        }
+
+    def append(self, waiter: _Waiter) -> None:
+        self._lanes[waiter.lane][waiter.seq] = waiter
+
+    def remove(self, waiter: _Waiter) -> None:
+        self._lanes[waiter.lane].pop(waiter.seq, None)
+
+    def _head(self, lane: str) -> Optional[_Waiter]:
+        queue = self._lanes[lane]
+        for waiter in queue.values():
+            return waiter
+        return None
+
+    def popleft(self, async_ok: bool) -> Optional[_Waiter]:
+        """Pop the next waiter to serve, or None when nobody waits."""
+        waiter = self._head(LANE_INTERACTIVE) or self._head(LANE_SYNC)
+        bulk = self._head(LANE_ASYNC)
+        if bulk is not None and (waiter is None or (async_ok and bulk.seq < waiter.seq)):
+            waiter = bulk
+        if waiter is not None:
+            self.remove(waiter)
+        return waiter
+
+    def count(self, lane: Optional[str] = None) -> int:
+        if lane is not None:
+            return len(self._lanes[lane])
+        return sum(len(queue) for queue in self._lanes.values())
+
+    def count_ahead(self, lane: str) -> int:
+        """Waiters a new caller in `lane` queues behind (its lane and higher ones)."""
+        return sum(len(self._lanes[name]) for name in LANES[: LANES.index(lane) + 1])
+
+    def __bool__(self) -> bool:
+        return any(self._lanes.values())
+
+
+class _LaneWait:
+    """Acquire wait time of one priority lane."""
+
+    __slots__ = ("acquired", "rejected", "total_wait", "max_wait")
+
+    def __init__(self) -> None:
+        self.acquired = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float) -> None:
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "avg_wait_ms": (
+                round(self.total_wait / self.acquired * 1000, 2) if self.acquired else 0.0
+            ),
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+class ContainerPool:
+    """
+    Per-function container pool management.
+
+    All state changes are synchronous (no await between check and update), so
+    the pool needs no lock. Waiters are futures queued per priority lane
+    (see WaiterQueue):
+    - a released worker resolves the next waiter with that worker
+    - freed capacity resolves the next waiter with None after reserving a
+      provisioning slot for it
+
+    While higher lanes are waiting, async callers hold at most
+    `async_share` of max_capacity.
+
+    With admission control, a sync / interactive caller that would have to
+    queue is rejected up front (AdmissionRejectedError) when the queue is at
+    `max_queue` or the expected wait exceeds acquire_timeout. Async callers
+    are never shed: their invocation was already accepted.
     """
 
     def __init__(
@@ -30,17 +245,26 @@ class ContainerPool:
         max_capacity: int = 1,
         min_capacity: int = 0,
         acquire_timeout: float = 30.0,
+        selection: str = "lifo",
+        max_provision_batch: int = 1,
+        async_share: float = 0.5,
+        admission_control: bool = False,
+        max_queue: int = 0,
+        recycle: Optional[RecyclePolicy] = None,
     ):
         self.function_name = function_name
         self.max_capacity = max_capacity
         self.min_capacity = min_capacity
         self.acquire_timeout = acquire_timeout
+        if selection not in SELECTION_MODES:
+            raise ValueError(f"Unknown pool selection mode: {selection}")
+        # lifo: reuse the most recently released worker so surplus ones age out.
+        self.selection = selection
+        # Workers requested per provision call; 1 keeps provision_callback(function_name).
+        self.max_provision_batch = max(1, max_provision_batch)
 
-        # Condition to guard state changes and send notifications.
-        self._cv = asyncio.Condition()
-
-        # Idle workers (managed efficiently with deque).
-        self._idle_workers: Deque[WorkerInfo] = deque()
+        # Idle workers by id, oldest release first.
+        self._idle_workers = IdleWorkers()
 
         # Ledger of all existing containers (busy + idle).
         self._all_workers: Set[WorkerInfo] = set()
@@ -48,80 +272,448 @@ class ContainerPool:
         # Number of in-flight provisions (for capacity checks).
         self._provisioning_count = 0
 
+        # Share of max_capacity async callers may hold while higher lanes wait.
+        self.async_share = min(1.0, max(0.0, async_share))
+
+        # Everyone waiting for a worker, per lane.
+        self._waiters = WaiterQueue()
+        # Subset of _waiters that may also be granted a provisioning slot.
+        self._capacity_waiters = WaiterQueue()
+        self._seq = itertools.count()
+
+        # Callers per lane holding a worker or a provisioning slot, and the
+        # lane / hand-out time of every worker handed out.
+        self._in_use: Dict[str, int] = dict.fromkeys(LANES, 0)
+        self._leases: Dict[str, Tuple[str, float]] = {}
+
+        # Admission: shed callers instead of queueing them past their deadline.
+        self.admission_control = admission_control
+        # Max queued callers (0: unbounded).
+        self.max_queue = max(0, max_queue)
+        # Smoothed seconds a worker is held per invocation (None until measured).
+        self._service_time: Optional[float] = None
+        self._lane_wait: Dict[str, _LaneWait] = {lane: _LaneWait() for lane in LANES}
+
+        # Reserved provisions waiting for this tick's batch dispatch.
+        self._provision_queue: List[Tuple[ProvisionCallback, "asyncio.Future[WorkerInfo]"]] = []
+        self._dispatch_scheduled = False
+
+        # Provision batches and tasks returning late provisioned workers to the idle queue.
+        self._background_tasks: Set[asyncio.Task] = set()
+
+        # Node-wide container budget shared with other pools (set by ConcurrencyBudget.register).
+        self.budget: Optional["ConcurrencyBudget"] = None
+
+        # Limits after which a worker is replaced (applied by PoolManager).
+        self.recycle = recycle
+
+        # Called with every worker that becomes idle (PoolManager arms its timers).
+        self.on_idle: Optional[Callable[[WorkerInfo], None]] = None
+
     async def acquire(
-        self, provision_callback: Callable[[str], Awaitable[List[WorkerInfo]]]
+        self,
+        provision_callback: ProvisionCallback,
+        lane: str = LANE_SYNC,
+        timeout: Optional[float] = None,
     ) -> WorkerInfo:
         """
-        Acquire an available worker, provisioning if needed.
+        Acquire an available worker for a caller in `lane`, provisioning if needed.
+
+        timeout: queue wait budget (the rest of the request deadline), capped
+        by acquire_timeout.
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown priority lane: {lane}")
+        budget = self.acquire_timeout if timeout is None else min(timeout, self.acquire_timeout)
+        if self.admission_control and lane != LANE_ASYNC:
+            self._admit(lane, budget)
+        started = time.monotonic()
+        worker = await self._acquire(provision_callback, lane, budget)
+        now = time.monotonic()
+        self._leases[worker.id] = (lane, now)
+        self._lane_wait[lane].record(now - started)
+        return worker
+
+    def expected_wait(self, lane: str = LANE_SYNC) -> float:
         """
-        async with self._cv:
-            start_time = time.time()
+        Seconds a new caller in `lane` is expected to wait for a worker.
 
-            while True:
-                # 1. Prefer idle workers.
-                if self._idle_workers:
-                    worker = self._idle_workers.popleft()
-                    return worker
+        Little's law: the pool serves size / service_time callers per second,
+        so the caller's queue position divided by that rate is its wait.
+        0 when a worker or capacity is free, or before any service time
+        has been measured.
+        """
+        if self._idle_workers or self.has_capacity() or self._service_time is None:
+            return 0.0
+        position = self._waiters.count_ahead(lane) + 1
+        return position * self._service_time / max(1, len(self._all_workers))
+
+    def _admit(self, lane: str, budget: float) -> None:
+        """Reject the caller now rather than letting it time out in the queue."""
+        if self._idle_workers or self.has_capacity():
+            return
+        wait = self.expected_wait(lane)
+        if self.max_queue and self._waiters.count() >= self.max_queue:
+            reason = f"queue is full ({self.max_queue} waiting)"
+        elif wait > budget:
+            reason = f"expected wait {wait:.1f}s exceeds {budget:.1f}s"
+        else:
+            return
+        self._lane_wait[lane].rejected += 1
+        # Retry once the callers queued ahead are expected to be served.
+        retry_after = max(1.0, wait or (self._service_time or 1.0))
+        raise AdmissionRejectedError(self.function_name, reason, retry_after)
+
+    async def _acquire(
+        self, provision_callback: ProvisionCallback, lane: str, timeout: float
+    ) -> WorkerInfo:
+        worker = self._take_idle()
+        if worker is not None:
+            self._in_use[lane] += 1
+            return worker
+
+        if self.has_capacity():
+            # Reserve a provisioning slot.
+            self._provisioning_count += 1
+            self._in_use[lane] += 1
+        else:
+            worker = await self._wait_for_turn(lane, timeout)
+            if worker is not None:
+                return worker
+            # A slot was reserved for us when capacity was freed.
+
+        # --- Provisioning ---
+        # Race the provision against workers released meanwhile: whichever
+        # yields a worker first wins, a late provisioned worker goes idle.
+        provision_task = asyncio.create_task(self._provision_worker(provision_callback))
+        idle_task = asyncio.create_task(self._wait_for_idle(lane))
+        try:
+            await asyncio.wait({provision_task, idle_task}, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            # Caller cancelled: keep the provision going for the next caller.
+            self._in_use[lane] -= 1
+            await self._abandon_idle_wait(idle_task)
+            self._park_when_ready(provision_task)
+            raise
+
+        if provision_task.done() and provision_task.exception() is None:
+            await self._abandon_idle_wait(idle_task)
+            return provision_task.result()
 
-                # 2. Provision if capacity is available.
-                if len(self._all_workers) + self._provisioning_count < self.max_capacity:
-                    # Reserve a provisioning slot.
-                    self._provisioning_count += 1
-                    break
+        if idle_task.done():
+            self._park_when_ready(provision_task)
+            return idle_task.result()
 
-                # 3. Wait if full.
-                elapsed = time.time() - start_time
-                remaining = self.acquire_timeout - elapsed
-                if remaining <= 0:
-                    raise asyncio.TimeoutError(f"Pool acquire timeout for {self.function_name}")
+        # Provision failed before any worker was released.
+        self._in_use[lane] -= 1
+        await self._abandon_idle_wait(idle_task)
+        return provision_task.result()
 
-                try:
-                    # wait() releases the lock and re-acquires on notify.
-                    await asyncio.wait_for(self._cv.wait(), timeout=remaining)
-                except asyncio.TimeoutError:
-                    raise asyncio.TimeoutError(f"Pool acquire timeout for {self.function_name}")
+    def _has_room(self) -> bool:
+        return len(self._all_workers) + self._provisioning_count < self.max_capacity
 
-        # --- Provisioning (I/O, so do it outside the CV lock) ---
+    def has_capacity(self) -> bool:
+        """Room for one more container (max_capacity and the node budget)."""
+        return self._has_room() and (self.budget is None or self.budget.allows(self.function_name))
+
+    def _take_idle(self) -> Optional[WorkerInfo]:
+        if not self._idle_workers:
+            return None
+        return self._idle_workers.take(newest=self.selection == "lifo")
+
+    def _async_ok(self) -> bool:
+        """Async callers are below their share of the pool."""
+        return self._in_use[LANE_ASYNC] < int(self.async_share * self.max_capacity)
+
+    def _new_waiter(self, lane: str, holds_slot: bool) -> _Waiter:
+        future = asyncio.get_running_loop().create_future()
+        return _Waiter(next(self._seq), lane, future, holds_slot)
+
+    def _serve(self, waiter: _Waiter, worker: Optional[WorkerInfo]) -> None:
+        # Popped from one queue; a capacity waiter also leaves the other one.
+        self._waiters.remove(waiter)
+        self._capacity_waiters.remove(waiter)
+        if not waiter.holds_slot:
+            self._in_use[waiter.lane] += 1
+        waiter.future.set_result(worker)
+
+    async def _wait_for_turn(self, lane: str, timeout: float) -> Optional[WorkerInfo]:
+        """
+        Queue behind earlier waiters until a worker or a provisioning slot is handed over.
+
+        Returns the worker, or None when a provisioning slot was reserved.
+        """
+        waiter = self._new_waiter(lane, holds_slot=False)
+        self._waiters.append(waiter)
+        self._capacity_waiters.append(waiter)
+        if self.budget is not None and self._has_room():
+            # Full node, not a full pool: the budget may reclaim an idle container elsewhere.
+            self.budget.blocked(self.function_name)
         try:
-            workers: List[WorkerInfo] = await provision_callback(self.function_name)
-            worker = workers[0]
-            async with self._cv:
-                # Even if another worker exceeds max_capacity, register and
-                # decrement provision_count (for safety).
-                self._all_workers.add(worker)
-                self._provisioning_count -= 1
-                return worker
+            done, _ = await asyncio.wait((waiter.future,), timeout=timeout)
+        except BaseException:
+            self._withdraw(waiter)
+            raise
+        if not done:
+            self._withdraw(waiter)
+            raise asyncio.TimeoutError(f"Pool acquire timeout for {self.function_name}")
+        return waiter.future.result()
+
+    async def _wait_for_idle(self, lane: str) -> WorkerInfo:
+        """Wait for a released worker (used while our own provision is in flight)."""
+        waiter = self._new_waiter(lane, holds_slot=True)
+        self._waiters.append(waiter)
+        try:
+            return await waiter.future
         except BaseException:
-            # On failure/cancel, release reserved slot and wake waiters.
-            async with self._cv:
-                if self._provisioning_count > 0:
-                    self._provisioning_count -= 1
-                self._cv.notify_all()
+            self._withdraw(waiter)
             raise
 
+    def _withdraw(self, waiter: _Waiter) -> None:
+        """Leave the queue; whatever was already handed over is passed on."""
+        future = waiter.future
+        self._waiters.remove(waiter)
+        self._capacity_waiters.remove(waiter)
+        if not future.done():
+            future.cancel()
+            return
+        if future.cancelled():
+            return
+        if not waiter.holds_slot:
+            self._in_use[waiter.lane] -= 1
+        worker = future.result()
+        if worker is None:
+            self._provisioning_count -= 1
+            self._capacity_freed()
+        else:
+            self._put_idle(worker)
+
+    def _put_idle(self, worker: WorkerInfo) -> None:
+        """Hand a worker to the next waiter, or make it idle when nobody waits."""
+        waiter = self._waiters.popleft(self._async_ok())
+        if waiter is not None:
+            self._serve(waiter, worker)
+            return
+        self._idle_workers.append(worker)
+        if self.on_idle is not None:
+            self.on_idle(worker)
+
+    def _capacity_freed(self) -> None:
+        # With a node budget the freed slot may belong to another pool's waiter.
+        if self.budget is not None:
+            self.budget.rebalance()
+        else:
+            self._grant_capacity()
+
+    @property
+    def has_capacity_waiters(self) -> bool:
+        return bool(self._capacity_waiters)
+
+    def grant_one(self) -> bool:
+        """Reserve a provisioning slot for the next capacity waiter, if any."""
+        if not self.has_capacity():
+            return False
+        waiter = self._capacity_waiters.popleft(self._async_ok())
+        if waiter is None:
+            return False
+        self._provisioning_count += 1
+        self._serve(waiter, None)
+        return True
+
+    def _grant_capacity(self) -> None:
+        """Reserve freed provisioning slots for the next capacity waiters."""
+        while self.grant_one():
+            pass
+
+    async def _provision_worker(self, provision_callback: ProvisionCallback) -> WorkerInfo:
+        """Provision a worker for an already reserved slot (batched with this tick's others)."""
+        loop = asyncio.get_running_loop()
+        future: "asyncio.Future[WorkerInfo]" = loop.create_future()
+        self._provision_queue.append((provision_callback, future))
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch_provisions)
+        return await future
+
+    def _dispatch_provisions(self) -> None:
+        """Send queued provisions, max_provision_batch workers per call."""
+        self._dispatch_scheduled = False
+        queued, self._provision_queue = self._provision_queue, []
+
+        batches: Dict[ProvisionCallback, List["asyncio.Future[WorkerInfo]"]] = {}
+        for callback, future in queued:
+            batches.setdefault(callback, []).append(future)
+
+        for callback, futures in batches.items():
+            for i in range(0, len(futures), self.max_provision_batch):
+                batch = futures[i : i + self.max_provision_batch]
+                self._spawn(self._run_provision(callback, batch))
+
+    async def _run_provision(
+        self, provision_callback: ProvisionCallback, futures: List["asyncio.Future[WorkerInfo]"]
+    ) -> None:
+        """Run one provision call and hand its workers to the callers, oldest first."""
+        count = len(futures)
+        delivered = 0
+        try:
+            if count == 1:
+                result = provision_callback(self.function_name)
+            else:
+                result = provision_callback(self.function_name, count)
+            if hasattr(result, "__aiter__"):
+                async with contextlib.aclosing(result) as workers:
+                    async for worker in workers:
+                        self._deliver(futures[delivered], worker)
+                        delivered += 1
+                        if delivered == count:
+                            break
+            else:
+                for worker in list(await result)[:count]:
+                    self._deliver(futures[delivered], worker)
+                    delivered += 1
+        except BaseException as e:
+            self._fail_provision(futures[delivered:], e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        if delivered < count:
+            self._fail_provision(
+                futures[delivered:],
+                ContainerStartError(
+                    self.function_name,
+                    RuntimeError(f"provisioned {delivered} of {count} requested workers"),
+                ),
+            )
+
+    def _deliver(self, future: "asyncio.Future[WorkerInfo]", worker: WorkerInfo) -> None:
+        # Even if another worker exceeds max_capacity, register and
+        # decrement provision_count (for safety).
+        if not worker.created_at:
+            worker.created_at = time.time()
+        self._all_workers.add(worker)
+        self._provisioning_count = max(0, self._provisioning_count - 1)
+        if future.done():
+            # Nobody is waiting for this one anymore.
+            self._put_idle(worker)
+        else:
+            future.set_result(worker)
+
+    def _fail_provision(
+        self, futures: List["asyncio.Future[WorkerInfo]"], error: BaseException
+    ) -> None:
+        # On failure/cancel, release the reserved slots to the next waiters.
+        self._provisioning_count = max(0, self._provisioning_count - len(futures))
+        self._capacity_freed()
+        for future in futures:
+            if future.done():
+                continue
+            if isinstance(error, Exception):
+                future.set_exception(error)
+            else:
+                future.cancel()
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _abandon_idle_wait(self, idle_task: "asyncio.Task[WorkerInfo]") -> None:
+        """Cancel an idle wait; a worker it already took is put back."""
+        idle_task.cancel()
+        try:
+            worker = await idle_task
+        except asyncio.CancelledError:
+            return
+        await self.release(worker)
+
+    def _park_when_ready(self, provision_task: "asyncio.Task[WorkerInfo]") -> None:
+        """Hand a provision nobody waits for anymore to the idle queue when it lands."""
+
+        def _done(task: "asyncio.Task[WorkerInfo]") -> None:
+            if task.cancelled() or task.exception() is not None:
+                return
+            self._spawn(self.release(task.result()))
+
+        provision_task.add_done_callback(_done)
+
+    @property
+    def warm_deficit(self) -> int:
+        """Workers missing (including in-flight provisions) to reach min_capacity."""
+        floor = min(self.min_capacity, self.max_capacity)
+        return max(0, floor - len(self._all_workers) - self._provisioning_count)
+
+    async def prewarm(
+        self, provision_callback: ProvisionCallback, target: Optional[int] = None
+    ) -> Optional[WorkerInfo]:
+        """
+        Provision one idle worker toward min_capacity (or `target` workers).
+
+        Returns None without provisioning when the floor is already met
+        (counting in-flight provisions).
+        """
+        if target is None:
+            deficit = self.warm_deficit
+        else:
+            floor = min(target, self.max_capacity)
+            deficit = floor - len(self._all_workers) - self._provisioning_count
+        if deficit <= 0 or not self.has_capacity():
+            return None
+        self._provisioning_count += 1
+
+        worker = await self._provision_worker(provision_callback)
+        await self.release(worker)
+        return worker
+
+    async def provision_replacement(self, provision_callback: ProvisionCallback) -> WorkerInfo:
+        """
+        Provision a worker replacing one that is being recycled.
+
+        Capacity is not checked: the pool surges by one until the recycled
+        worker is removed, so callers never wait for the swap.
+        """
+        self._provisioning_count += 1
+        worker = await self._provision_worker(provision_callback)
+        await self.release(worker)
+        return worker
+
+    def recycle_due(self, worker: WorkerInfo) -> Optional[str]:
+        """Why `worker` is due for recycling by invocation count or age, or None."""
+        if self.recycle is None:
+            return None
+        return self.recycle.due(worker, time.time())
+
     async def release(self, worker: WorkerInfo) -> None:
         """
-        Return a worker to the pool.
+        Return a worker to the pool (directly to the next waiter, if any).
         """
-        async with self._cv:
-            worker.last_used_at = time.time()
-            self._idle_workers.append(worker)
-            # Important: notify waiters that a resource is available.
-            self._cv.notify_all()
+        self._end_lease(worker, completed=True)
+        worker.last_used_at = time.time()
+        self._put_idle(worker)
+
+    def _end_lease(self, worker: WorkerInfo, completed: bool = False) -> None:
+        lease = self._leases.pop(worker.id, None)
+        if lease is None:
+            return
+        lane, handed_out_at = lease
+        self._in_use[lane] -= 1
+        if completed:
+            worker.invocations += 1
+            held = time.monotonic() - handed_out_at
+            if self._service_time is None:
+                self._service_time = held
+            else:
+                self._service_time += SERVICE_TIME_ALPHA * (held - self._service_time)
 
     async def evict(self, worker: WorkerInfo) -> None:
         """
         Evict a dead worker from the pool (self-healing).
         """
-        async with self._cv:
-            if worker in self._all_workers:
-                self._all_workers.discard(worker)
-            if self._idle_workers:
-                self._idle_workers = deque(
-                    w for w in self._idle_workers if w.id != worker.id
-                )
-            # Notify because capacity is freed.
-            self._cv.notify_all()
+        self._end_lease(worker)
+        self._all_workers.discard(worker)
+        self._idle_workers.discard(worker.id)
+        # Capacity is freed.
+        self._capacity_freed()
 
     def get_all_names(self) -> List[str]:
         """For heartbeat: list of all names (busy + idle)."""
@@ -131,12 +723,40 @@ class ContainerPool:
         """Get all currently managed workers."""
         return list(self._all_workers)
 
+    def has_worker(self, worker: WorkerInfo) -> bool:
+        """The worker is managed by this pool (busy or idle)."""
+        return worker in self._all_workers
+
     async def is_idle(self, worker_id: str) -> bool:
         """指定ワーカーがアイドルキューに存在するか確認"""
-        async with self._cv:
-            if not any(w.id == worker_id for w in self._idle_workers):
-                return False
-            return any(w.id == worker_id for w in self._all_workers)
+        return worker_id in self._idle_workers
+
+    @property
+    def provisioning(self) -> int:
+        """Provisions in flight (reserved slots)."""
+        return self._provisioning_count
+
+    @property
+    def waiting(self) -> int:
+        """Callers currently queued for a worker."""
+        return self._waiters.count()
+
+    @property
+    def lanes(self) -> Dict[str, Dict[str, float]]:
+        """Per-lane callers waiting / in use and acquire wait times."""
+        return {
+            lane: {
+                "waiting": self._waiters.count(lane),
+                "in_use": self._in_use[lane],
+                **self._lane_wait[lane].stats(),
+            }
+            for lane in LANES
+        }
+
+    @property
+    def service_time(self) -> Optional[float]:
+        """Smoothed seconds a worker is held per invocation."""
+        return self._service_time
 
     @property
     def size(self) -> int:
@@ -145,53 +765,75 @@ class ContainerPool:
 
     async def prune_idle_workers(self, idle_timeout: float) -> List[WorkerInfo]:
         """
-        Remove workers that exceed IDLE_TIMEOUT.
-        """
-        async with self._cv:
-            now = time.time()
-            pruned = []
-            surviving = deque()
+        Remove workers that exceed IDLE_TIMEOUT, never going below min_capacity.
 
-            while self._idle_workers:
-                worker = self._idle_workers.popleft()
-                if now - worker.last_used_at > idle_timeout:
-                    self._all_workers.discard(worker)
-                    pruned.append(worker)
-                else:
-                    surviving.append(worker)
+        Idle workers are visited oldest release first.
+        """
+        now = time.time()
+        pruned = []
+        prunable = len(self._all_workers) - self.min_capacity
+
+        for worker in self._idle_workers:
+            if len(pruned) >= prunable:
+                break
+            if now - worker.last_used_at > idle_timeout:
+                self._idle_workers.discard(worker.id)
+                self._all_workers.discard(worker)
+                pruned.append(worker)
 
-            self._idle_workers = surviving
+        if pruned:
+            # Capacity is freed.
+            self._capacity_freed()
 
-            if pruned:
-                # Notify because capacity is freed.
-                self._cv.notify_all()
+        return pruned
 
-            return pruned
+    def prune_idle(self, worker: WorkerInfo) -> bool:
+        """
+        Remove one idle worker whose idle timeout expired, never going below
+        min_capacity. Returns whether it was removed.
+        """
+        if worker.id not in self._idle_workers or len(self._all_workers) <= self.min_capacity:
+            return False
+        self._idle_workers.discard(worker.id)
+        self._all_workers.discard(worker)
+        self._capacity_freed()
+        return True
+
+    def reclaim_idle(self) -> Optional[WorkerInfo]:
+        """
+        Remove the oldest idle worker (never below min_capacity) so another
+        function can use its share of the node budget.
+        """
+        if not self._idle_workers or len(self._all_workers) <= self.min_capacity:
+            return None
+        worker = self._idle_workers.popleft()
+        self._all_workers.discard(worker)
+        self._capacity_freed()
+        return worker
 
     async def adopt(self, worker: WorkerInfo) -> None:
         """Adopt a container into the pool on startup."""
-        async with self._cv:
-            if len(self._all_workers) + self._provisioning_count < self.max_capacity:
-                # Only set timeout baseline if unset.
-                if worker.last_used_at == 0:
-                    worker.last_used_at = time.time()
-                self._all_workers.add(worker)
-                self._idle_workers.append(worker)
-                self._cv.notify_all()
-            else:
-                logger.warning(
-                    f"Adopt: Capacity limit reached for {self.function_name} while adopting {worker.name}."
-                )
+        if self.has_capacity():
+            # Only set timeout baseline if unset.
+            if worker.last_used_at == 0:
+                worker.last_used_at = time.time()
+            self._all_workers.add(worker)
+            self._put_idle(worker)
+        else:
+            logger.warning(
+                f"Adopt: Capacity limit reached for {self.function_name} while adopting {worker.name}."
+            )
 
     async def drain(self) -> List[WorkerInfo]:
         """Drain all workers on shutdown."""
-        async with self._cv:
-            workers = list(self._all_workers)
-            self._all_workers.clear()
-            self._idle_workers.clear()
-            self._provisioning_count = 0
-            self._cv.notify_all()
-            return workers
+        workers = list(self._all_workers)
+        self._all_workers.clear()
+        self._idle_workers.clear()
+        self._provisioning_count = 0
+        self._leases.clear()
+        self._in_use = dict.fromkeys(LANES, 0)
+        self._capacity_freed()
+        return workers
 
     @property
     def stats(self) -> dict:
@@ -201,5 +843,15 @@ class ContainerPool:
             "total_workers": len(self._all_workers),
             "idle": len(self._idle_workers),
             "provisioning": self._provisioning_count,
+            "waiting": self.waiting,
             "max_capacity": self.max_capacity,
+            "min_capacity": self.min_capacity,
+            "selection": self.selection,
+            "async_share": self.async_share,
+            "max_queue": self.max_queue,
+            "service_time_ms": (
+                round(self._service_time * 1000, 2) if self._service_time is not None else None
+            ),
+            "expected_wait_ms": round(self.expected_wait() * 1000, 2),
+            "lanes": self.lanes,
         }
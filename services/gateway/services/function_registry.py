@@ -3,28 +3,137 @@ Lambda function registry.
 
 Loads functions.yml and provides name-to-config mapping.
 Merges default environment variables into function-specific settings.
+
+Everything the request path needs per function is precomputed at load time
+into an immutable InvocationPlan, so a request costs one dict lookup.
 """
 
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 import yaml
 import logging
 import os
 import string
 
 from ..config import config
+from ..pb import agent_pb2
+from .capacity_schedule import CapacityWindow, parse_capacity_schedule
+from .recycle_policy import RecyclePolicy, parse_recycle_policy
 
 logger = logging.getLogger("gateway.function_registry")
 
 
+@dataclass(frozen=True, slots=True)
+class InvocationPlan:
+    """Precomputed per-function invocation settings (built once per load)."""
+
+    function_name: str
+    # Merged function config (defaults applied). Shared, treat as read-only.
+    config: Dict[str, Any]
+    # Container environment including injected RIE/observability variables.
+    environment: Mapping[str, str]
+    ensure_request: agent_pb2.EnsureContainerRequest
+    max_capacity: int
+    min_capacity: int
+    acquire_timeout: float
+    # Max callers queued for a worker before new ones are rejected (0: unbounded).
+    max_queue: int
+    # Containers guaranteed under the node budget, and share weight beyond them.
+    reserved_concurrency: int
+    weight: float
+    # Windows of raised min_capacity (scaling.schedule).
+    schedule: Tuple[CapacityWindow, ...]
+    # Limits after which a worker is replaced (scaling.recycle).
+    recycle: Optional[RecyclePolicy]
+    # Function timeout in seconds (None when not configured).
+    timeout: Optional[float]
+    # Static RIE request headers; copy before adding per-request values.
+    rie_headers: Mapping[str, str]
+
+
+def build_invocation_plan(function_name: str, func_config: Dict[str, Any]) -> InvocationPlan:
+    """
+    Build the invocation plan for a function from its merged config.
+
+    Args:
+        function_name: function name (container name)
+        func_config: function config with defaults merged
+
+    Returns:
+        InvocationPlan
+    """
+    # Base env from function config
+    env = dict(func_config.get("environment") or {})
+
+    # Inject RIE & Observability Variables
+    env["AWS_LAMBDA_FUNCTION_NAME"] = function_name
+    env["AWS_LAMBDA_FUNCTION_VERSION"] = "$LATEST"
+    env["AWS_REGION"] = env.get("AWS_REGION", "ap-northeast-1")
+
+    victorialogs_url = getattr(config, "VICTORIALOGS_URL", "")
+    if isinstance(victorialogs_url, str) and victorialogs_url:
+        env["VICTORIALOGS_URL"] = victorialogs_url
+
+    # Inject LOG_LEVEL for sitecustomize.py logging filter
+    env["LOG_LEVEL"] = os.environ.get("LOG_LEVEL", "INFO")
+
+    # Inject GATEWAY_INTERNAL_URL for chain invocations
+    gateway_internal_url = getattr(config, "GATEWAY_INTERNAL_URL", "")
+    if isinstance(gateway_internal_url, str) and gateway_internal_url:
+        env["GATEWAY_INTERNAL_URL"] = gateway_internal_url
+
+    # Inject Timeout & Memory from config
+    if "timeout" in func_config:
+        env["AWS_LAMBDA_FUNCTION_TIMEOUT"] = str(func_config["timeout"])
+    if "memory_size" in func_config:
+        env["AWS_LAMBDA_FUNCTION_MEMORY_SIZE"] = str(func_config["memory_size"])
+
+    scaling = func_config.get("scaling") or {}
+    timeout = func_config.get("timeout")
+    try:
+        schedule = parse_capacity_schedule(scaling.get("schedule"))
+    except ValueError as e:
+        logger.error(f"Ignoring invalid capacity schedule of {function_name}: {e}")
+        schedule = ()
+    try:
+        recycle = parse_recycle_policy(scaling.get("recycle"))
+    except ValueError as e:
+        logger.error(f"Ignoring invalid recycle policy of {function_name}: {e}")
+        recycle = None
+
+    return InvocationPlan(
+        function_name=function_name,
+        config=func_config,
+        environment=MappingProxyType(env),
+        ensure_request=agent_pb2.EnsureContainerRequest(
+            function_name=function_name,
+            image=func_config.get("image") or "",
+            env=env,
+        ),
+        max_capacity=scaling.get("max_capacity", config.DEFAULT_MAX_CAPACITY),
+        min_capacity=scaling.get("min_capacity", config.DEFAULT_MIN_CAPACITY),
+        acquire_timeout=scaling.get("acquire_timeout", config.POOL_ACQUIRE_TIMEOUT),
+        max_queue=int(scaling.get("max_queue", config.POOL_MAX_QUEUE)),
+        reserved_concurrency=int(scaling.get("reserved_concurrency", 0)),
+        weight=float(scaling.get("weight", 1.0)),
+        schedule=schedule,
+        recycle=recycle,
+        timeout=float(timeout) if timeout is not None else None,
+        rie_headers=MappingProxyType({"Content-Type": "application/json"}),
+    )
+
+
 class FunctionRegistry:
     def __init__(self):
         self._registry: Dict[str, Dict[str, Any]] = {}
         self._defaults: Dict[str, Any] = {}
+        self._plans: Dict[str, InvocationPlan] = {}
         self.config_path = config.FUNCTIONS_CONFIG_PATH
 
     def load_functions_config(self) -> Dict[str, Dict[str, Any]]:
         """
-        Load and cache functions.yml.
+        Load and cache functions.yml, then rebuild invocation plans.
 
         Returns:
             Dict of function name -> config
@@ -57,24 +166,16 @@ class FunctionRegistry:
             self._registry = {}
             self._defaults = {}
 
-        return self._registry
-
-    def get_function_config(self, function_name: str) -> Optional[Dict[str, Any]]:
-        """
-        Get configuration by function name.
+        self._plans = {
+            name: build_invocation_plan(name, self._merge_defaults(func_config))
+            for name, func_config in self._registry.items()
+        }
 
-        Merge default environment variables into function-specific settings.
-
-        Args:
-            function_name: function name (container name)
-
-        Returns:
-            Function config (with defaults merged), or None if missing
-        """
-        if function_name not in self._registry:
-            return None
+        return self._registry
 
-        func_config = self._registry[function_name] or {}
+    def _merge_defaults(self, func_config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Merge default environment variables into a function config."""
+        func_config = func_config or {}
 
         # Merge default and function-specific environment variables.
         merged_env = {}
@@ -90,3 +191,35 @@ class FunctionRegistry:
         result["environment"] = merged_env
 
         return result
+
+    def list_function_names(self) -> List[str]:
+        """Names of all loaded functions."""
+        return list(self._plans)
+
+    def get_invocation_plan(self, function_name: str) -> Optional[InvocationPlan]:
+        """
+        Get the precomputed invocation plan by function name.
+
+        Args:
+            function_name: function name (container name)
+
+        Returns:
+            InvocationPlan, or None if missing
+        """
+        return self._plans.get(function_name)
+
+    def get_function_config(self, function_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get configuration by function name.
+
+        The returned dict already has default environment variables merged
+        and is shared between callers; copy it before mutating.
+
+        Args:
+            function_name: function name (container name)
+
+        Returns:
+            Function config (with defaults merged), or None if missing
+        """
+        plan = self._plans.get(function_name)
+        return plan.config if plan is not None else None
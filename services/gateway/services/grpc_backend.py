@@ -1,6 +1,6 @@
 import grpc
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from services.common.models.internal import WorkerInfo
 from services.gateway.pb import agent_pb2, agent_pb2_grpc
@@ -9,9 +9,11 @@ from services.gateway.core.exceptions import (
     OrchestratorTimeoutError,
     ContainerStartError,
 )
+from services.gateway.services.container_pool import LANE_SYNC
 from services.gateway.services.lambda_invoker import WorkerState
 from services.gateway.services.function_registry import FunctionRegistry
 from services.gateway.core.concurrency import ConcurrencyManager
+from services.gateway.core.deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
@@ -28,22 +30,27 @@ class GrpcBackend:
         self.function_registry = function_registry
         self.concurrency_manager = concurrency_manager
 
-    async def acquire_worker(self, function_name: str) -> WorkerInfo:
+    async def acquire_worker(
+        self, function_name: str, lane: str = LANE_SYNC, deadline: Optional[Deadline] = None
+    ) -> WorkerInfo:
         """
         Acquire a worker (container) from the agent via gRPC
-        (with flow control applied).
+        (with flow control applied). The agent does not queue by lane;
+        the throttle wait is bounded by the request deadline.
         """
         if self.concurrency_manager:
             throttle = self.concurrency_manager.get_throttle(function_name)
-            await throttle.acquire()
+            timeout = deadline.cap(throttle.default_timeout) if deadline else None
+            await throttle.acquire(timeout=timeout)
 
         try:
-            worker = await self._ensure_container(function_name)
+            worker, ready = await self._ensure_container(function_name)
             logger.info(f"Acquired worker {worker.id} at {worker.ip_address} for {function_name}")
-            # Readiness Check: Wait for port 8080 to be available
-            port = worker.port or 8080
-            await self._wait_for_readiness(function_name, worker.ip_address, port)
-            logger.debug(f"Readiness check passed for {worker.ip_address}:{port}")
+            if not ready:
+                # Readiness Check: Wait for port 8080 to be available
+                port = worker.port or 8080
+                await self._wait_for_readiness(function_name, worker.ip_address, port)
+                logger.debug(f"Readiness check passed for {worker.ip_address}:{port}")
             return worker
         except Exception:
             if self.concurrency_manager:
@@ -77,7 +84,8 @@ class GrpcBackend:
             or Exception(f"Port {port} on {host} did not become ready within {timeout}s"),
         )
 
-    async def _ensure_container(self, function_name: str) -> WorkerInfo:
+    async def _ensure_container(self, function_name: str) -> Tuple[WorkerInfo, bool]:
+        """Ensure a container; also returns whether the Agent already verified readiness."""
         # Get environment variables from FunctionRegistry
         env = {}
         image = ""
@@ -95,9 +103,10 @@ class GrpcBackend:
         try:
             resp = await self.stub.EnsureContainer(req)
             logger.debug(f"Agent EnsureContainer response: {resp.id} / {resp.ip_address}")
-            return WorkerInfo(
+            worker = WorkerInfo(
                 id=resp.id, name=resp.name, ip_address=resp.ip_address, port=resp.port
             )
+            return worker, resp.ready
         except grpc.RpcError as e:
             self._handle_grpc_error(e, function_name)
 
@@ -109,9 +118,12 @@ class GrpcBackend:
             throttle = self.concurrency_manager.get_throttle(function_name)
             await throttle.release()
 
-    async def evict_worker(self, function_name: str, worker: WorkerInfo) -> None:
+    async def evict_worker(
+        self, function_name: str, worker: WorkerInfo, destroy: bool = False, replace: bool = False
+    ) -> None:
         """
-        Explicitly evict a worker.
+        Explicitly evict a worker (the agent always destroys the container
+        and starts containers on demand, so nothing is replaced up front).
         """
         req = agent_pb2.DestroyContainerRequest(function_name=function_name, container_id=worker.id)
         try:
@@ -1,7 +1,13 @@
+import asyncio
+import contextlib
 import logging
-from typing import List, Any
+import time
+from typing import AsyncIterator, List, Any, Optional
 from services.common.models.internal import WorkerInfo, ContainerMetrics
+from services.gateway.core.exceptions import ContainerStartError
 from services.gateway.pb import agent_pb2
+from services.gateway.services.function_registry import build_invocation_plan
+from services.gateway.services.rie_transport import RieTransportPool
 
 logger = logging.getLogger("gateway.grpc_provision")
 
@@ -13,88 +19,133 @@ class GrpcProvisionClient:
         self,
         stub,  # AgentServiceStub
         function_registry: Any,
+        transports: Optional[RieTransportPool] = None,
+        readiness_fallback: bool = True,
     ):
         self.stub = stub
         self.function_registry = function_registry
+        # Pinned RIE connections: opened after readiness, closed on delete.
+        self.transports = transports
+        # Poll the RIE port ourselves when the Agent did not confirm readiness.
+        self.readiness_fallback = readiness_fallback
 
-    async def provision(self, function_name: str) -> List[WorkerInfo]:
-        """Provision a container via gRPC Agent and return WorkerInfo list"""
-        func_config = self.function_registry.get_function_config(function_name)
-        func_config = self.function_registry.get_function_config(function_name)
-        image = func_config.get("image") if func_config else None
+    async def provision(self, function_name: str, count: int = 1) -> List[WorkerInfo]:
+        """
+        Provision containers via gRPC Agent and return WorkerInfo list.
 
-        logger.info(f"Provisioning via gRPC Agent: {function_name}")
+        count > 1 uses the batch EnsureContainers RPC (created concurrently by
+        the Agent); the workers that pass the readiness check are returned.
+        """
+        if count > 1:
+            return [worker async for worker in self.provision_stream(function_name, count)]
 
-        from services.gateway.config import config
+        plan = self._get_plan(function_name)
+        logger.info(f"Provisioning via gRPC Agent: {function_name} (count=1)")
 
-        # Base env from function config
-        env = dict(func_config.get("environment", {})) if func_config else {}
-
-        # Inject RIE & Observability Variables
-        env["AWS_LAMBDA_FUNCTION_NAME"] = function_name
-        env["AWS_LAMBDA_FUNCTION_VERSION"] = "$LATEST"
-        env["AWS_REGION"] = env.get("AWS_REGION", "ap-northeast-1")
-
-        victorialogs_url = getattr(config, "VICTORIALOGS_URL", "")
-        if isinstance(victorialogs_url, str) and victorialogs_url:
-            env["VICTORIALOGS_URL"] = victorialogs_url
-
-        # Inject LOG_LEVEL for sitecustomize.py logging filter
-        import os
-
-        log_level = os.environ.get("LOG_LEVEL", "INFO")
-        env["LOG_LEVEL"] = log_level
-
-        # Inject GATEWAY_INTERNAL_URL for chain invocations
-        gateway_internal_url = getattr(config, "GATEWAY_INTERNAL_URL", "")
-        if isinstance(gateway_internal_url, str) and gateway_internal_url:
-            env["GATEWAY_INTERNAL_URL"] = gateway_internal_url
-
-        # Inject Timeout & Memory from config
-        if func_config:
-            if "timeout" in func_config:
-                env["AWS_LAMBDA_FUNCTION_TIMEOUT"] = str(func_config["timeout"])
-            if "memory_size" in func_config:
-                env["AWS_LAMBDA_FUNCTION_MEMORY_SIZE"] = str(func_config["memory_size"])
+        # EnsureContainerRequest (image + injected env) is prebuilt at load time.
+        try:
+            info = await self.stub.EnsureContainer(plan.ensure_request)
+        except Exception as e:
+            self._log_provision_error(e)
+            raise
 
-        req = agent_pb2.EnsureContainerRequest(
-            function_name=function_name,
-            image=image or "",
-            env=env,
+        worker = self._to_worker(info)
+        error = await self._prepare_or_discard(function_name, worker, info)
+        if error is not None:
+            self._log_provision_error(error)
+            raise error
+        return [worker]
+
+    async def provision_stream(self, function_name: str, count: int) -> AsyncIterator[WorkerInfo]:
+        """
+        Provision `count` containers with the batch EnsureContainers RPC and
+        yield each worker as soon as it is ready.
+
+        The Agent streams workers as they pass its own readiness check, so the
+        first ones can serve requests while the rest of the burst still starts.
+        """
+        plan = self._get_plan(function_name)
+        logger.info(f"Provisioning via gRPC Agent: {function_name} (count={count})")
+
+        call = self.stub.EnsureContainers(
+            agent_pb2.EnsureContainersRequest(container=plan.ensure_request, count=count)
         )
-
+        ready = 0
+        first_error: Optional[BaseException] = None
         try:
-            resp = await self.stub.EnsureContainer(req)
-            worker = WorkerInfo(
-                id=resp.id,
-                name=resp.name,
-                ip_address=resp.ip_address,
-                port=resp.port or 8080,
-                created_at=0.0,
-                last_used_at=0.0,
-            )
+            async for info in call:
+                worker = self._to_worker(info)
+                error = await self._prepare_or_discard(function_name, worker, info)
+                if error is not None:
+                    first_error = first_error or error
+                    continue
+                ready += 1
+                yield worker
+        except Exception as e:
+            self._log_provision_error(e)
+            raise
+        finally:
+            # No-op once the stream has ended; stops the Agent if we quit early.
+            call.cancel()
 
-            # Readiness Check: Wait for port 8080 to be available
-            await self._wait_for_readiness(function_name, worker.ip_address, worker.port)
+        if not ready:
+            error = first_error or ContainerStartError(
+                function_name, Exception("Agent returned no workers")
+            )
+            self._log_provision_error(error)
+            raise error
+
+    def _get_plan(self, function_name: str):
+        plan = self.function_registry.get_invocation_plan(function_name)
+        if plan is None:
+            plan = build_invocation_plan(function_name, {})
+        return plan
+
+    @staticmethod
+    def _to_worker(info: Any) -> WorkerInfo:
+        return WorkerInfo(
+            id=info.id,
+            name=info.name,
+            ip_address=info.ip_address,
+            port=info.port or 8080,
+            created_at=0.0,
+            last_used_at=0.0,
+        )
 
-            return [worker]
+    async def _prepare_or_discard(
+        self, function_name: str, worker: WorkerInfo, info: Any
+    ) -> Optional[Exception]:
+        """Prepare a new worker; on failure delete it and return the error."""
+        try:
+            await self._prepare_worker(function_name, worker, ready=info.ready)
         except Exception as e:
-            # gRPC RpcError details extraction
-            if hasattr(e, "details"):
-                details = e.details()
-                logger.error(f"Failed to provision via Agent: {e} (Details: {details})")
-            else:
-                logger.error(f"Failed to provision via Agent: {e}")
-            raise
+            logger.warning(f"Worker {worker.id} for {function_name} failed readiness: {e}")
+            # Not handed to any pool: remove it now instead of waiting for the Janitor.
+            with contextlib.suppress(Exception):
+                await self.delete_container(worker.id)
+            return e
+        return None
+
+    async def _prepare_worker(self, function_name: str, worker: WorkerInfo, ready: bool = False):
+        # Readiness Check: the Agent already verified the RIE port when `ready`.
+        if not ready and self.readiness_fallback:
+            await self._wait_for_readiness(function_name, worker.ip_address, worker.port)
+        if self.transports is not None:
+            await self.transports.open(worker)
+
+    @staticmethod
+    def _log_provision_error(e: BaseException) -> None:
+        # gRPC RpcError details extraction
+        if hasattr(e, "details"):
+            details = e.details()
+            logger.error(f"Failed to provision via Agent: {e} (Details: {details})")
+        else:
+            logger.error(f"Failed to provision via Agent: {e}")
 
     async def _wait_for_readiness(
         self, function_name: str, host: str, port: int, timeout: float = 10.0
     ):
         """Confirm readiness by attempting to establish a TCP connection."""
-        import asyncio
-        import time
-        from services.gateway.core.exceptions import ContainerStartError
-
         start_time = time.time()
         last_error = None
         while time.time() - start_time < timeout:
@@ -116,6 +167,8 @@ class GrpcProvisionClient:
     async def delete_container(self, container_id: str):
         """Delete a container via gRPC Agent"""
         req = agent_pb2.DestroyContainerRequest(container_id=container_id)
+        if self.transports is not None:
+            await self.transports.close(container_id)
         try:
             await self.stub.DestroyContainer(req)
         except Exception as e:
@@ -29,11 +29,19 @@ class HeartbeatJanitor:
         manager_client,  # ManagerClient or mock
         interval: int = 30,
         idle_timeout: float = 300.0,
+        prune: bool = True,
     ):
+        """
+        Args:
+            prune: scan pools for workers idle longer than idle_timeout; turn
+                off when the PoolManager expires idle workers by timer (only
+                pools below min_capacity are refilled then)
+        """
         self.pool_manager = pool_manager
         self.manager_client = manager_client
         self.interval = interval
         self.idle_timeout = idle_timeout
+        self.prune = prune
         self._task: asyncio.Task | None = None
 
     async def start(self) -> None:
@@ -68,9 +76,12 @@ class HeartbeatJanitor:
         """Send heartbeat after pruning."""
         # 1. Run pruning first.
         try:
-            pruned = await self.pool_manager.prune_all_pools(self.idle_timeout)
-            for fname, workers in pruned.items():
-                logger.info(f"Pruned {len(workers)} idle workers from {fname}")
+            if self.prune:
+                pruned = await self.pool_manager.prune_all_pools(self.idle_timeout)
+                for fname, workers in pruned.items():
+                    logger.info(f"Pruned {len(workers)} idle workers from {fname}")
+            else:
+                self.pool_manager.replenish_below_floor()
         except Exception as e:
             logger.error(f"Pruning failed: {e}")
 
@@ -5,24 +5,44 @@ Acquires workers via the InvocationBackend strategy and sends invoke requests to
 Business logic layer for boto3.client('lambda').invoke()-compatible endpoints.
 """
 
+import asyncio
 import logging
-import json
 import base64
+import time
 import httpx
-from typing import Dict, Optional, Protocol, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Protocol, List, Tuple
 from dataclasses import dataclass
+from services.common.core import json_codec
 from services.common.core.request_context import get_trace_id
-from services.gateway.services.function_registry import FunctionRegistry
+from services.gateway.services.function_registry import FunctionRegistry, InvocationPlan
 from services.gateway.config import GatewayConfig
+from services.gateway.core.adaptive_limiter import (
+    AdaptiveLimiter,
+    ConcurrencyLimitExceededError,
+)
 from services.gateway.core.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from services.gateway.core.deadline import Deadline
+from services.gateway.core.outlier_detector import OutlierDetector
+from services.gateway.core.request_body import Payload
+from services.gateway.services.container_pool import LANE_ASYNC, LANE_SYNC
+from services.gateway.services.rie_transport import RieTransportPool
 from services.gateway.core.exceptions import (
+    AdmissionRejectedError,
     ContainerStartError,
+    DeadlineExceededError,
     LambdaExecutionError,
+    ResourceExhaustedError,
 )
 from services.common.models.internal import WorkerInfo
 
 logger = logging.getLogger("gateway.lambda_invoker")
 
+# RIE call timeout for functions without a configured timeout.
+DEFAULT_INVOKE_TIMEOUT = 300.0
+# Slack over the function timeout so the RIE's own timeout error gets through.
+RIE_TIMEOUT_GRACE = 2.0
+
 
 @dataclass
 class WorkerState:
@@ -40,16 +60,25 @@ class InvocationBackend(Protocol):
     Implemented by PoolManager (Python) and future AgentClient (Go/gRPC).
     """
 
-    async def acquire_worker(self, function_name: str) -> WorkerInfo:
-        """Acquire a worker for function execution."""
+    async def acquire_worker(
+        self, function_name: str, lane: str = LANE_SYNC, deadline: Optional[Deadline] = None
+    ) -> WorkerInfo:
+        """Acquire a worker for function execution (lane: priority class)."""
         ...
 
     async def release_worker(self, function_name: str, worker: WorkerInfo) -> None:
         """Release a worker."""
         ...
 
-    async def evict_worker(self, function_name: str, worker: WorkerInfo) -> None:
-        """Evict a worker."""
+    async def evict_worker(
+        self, function_name: str, worker: WorkerInfo, destroy: bool = False, replace: bool = False
+    ) -> None:
+        """
+        Evict a worker.
+
+        destroy: also remove a container that may still be running
+        replace: provision a replacement in the background
+        """
         ...
 
     async def list_workers(self) -> List[WorkerState]:
@@ -64,6 +93,9 @@ class LambdaInvoker:
         registry: FunctionRegistry,
         config: GatewayConfig,
         backend: InvocationBackend,
+        transports: Optional[RieTransportPool] = None,
+        adaptive_concurrency: bool = False,
+        outlier_detection: bool = False,
     ):
         """
         Args:
@@ -71,24 +103,55 @@ class LambdaInvoker:
             registry: FunctionRegistry instance
             config: GatewayConfig instance
             backend: InvocationBackend implementing Strategy
+            transports: pinned per-worker RIE transports (falls back to client)
+            adaptive_concurrency: limit in-flight invocations per function from
+                observed RTT (bounded by max_capacity)
+            outlier_detection: eject (and replace) workers whose latency or error
+                rate stands out against their siblings
         """
         self.client = client
         self.registry = registry
         self.config = config
         self.backend = backend
+        self.transports = transports
         # Store per-function breakers.
         self.breakers: Dict[str, CircuitBreaker] = {}
+        self.adaptive_concurrency = adaptive_concurrency
+        self.limiters: Dict[str, AdaptiveLimiter] = {}
+        self.outlier_detection = outlier_detection
+        self.detectors: Dict[str, OutlierDetector] = {}
 
     async def invoke_function(
-        self, function_name: str, payload: bytes, timeout: int = 300
+        self,
+        function_name: str,
+        payload: Payload,
+        timeout: Optional[float] = None,
+        lane: str = LANE_SYNC,
+        deadline: Optional[Deadline] = None,
     ) -> httpx.Response:
-        """Invoke the specified Lambda."""
-        func_config = self.registry.get_function_config(function_name)
-        if not func_config:
+        """
+        Invoke the specified Lambda.
+
+        Args:
+            timeout: RIE call timeout (default: the function's timeout)
+            lane: priority class when workers are scarce
+            deadline: client deadline; the request also ends by the pool
+                acquire timeout plus the RIE call timeout
+
+        If the caller is cancelled (client disconnect) while the RIE is
+        running the invocation, the busy worker is destroyed instead of
+        being returned to the pool. With outlier detection, the outcome
+        feeds the worker's statistics and an outlier is ejected instead of
+        being released.
+        """
+        plan = self.registry.get_invocation_plan(function_name)
+        if plan is None:
             raise LambdaExecutionError(function_name, "Function not found in registry")
+        timeout, deadline = self._budget(plan, timeout, deadline)
 
         # Circuit Breaker (State management is done inside breaker.call)
         breaker = self._get_breaker(function_name)
+        limiter = await self._acquire_limit(function_name, plan, lane)
 
         # Trace ID Propagation
         trace_id = get_trace_id()
@@ -98,74 +161,57 @@ class LambdaInvoker:
         try:
             # 1. Acquire worker from backend (strategy pattern).
             try:
-                worker = await self.backend.acquire_worker(function_name)
+                worker = await self.backend.acquire_worker(
+                    function_name, lane=lane, deadline=deadline
+                )
                 host = worker.ip_address
                 port = worker.port or self.config.LAMBDA_PORT
+            except ResourceExhaustedError:
+                # Shed by admission control: surfaced as 429 with Retry-After.
+                raise
             except Exception as e:
+                if deadline.expired:
+                    raise DeadlineExceededError(function_name, "waiting for a worker") from e
                 raise ContainerStartError(function_name, e) from e
+            if deadline.expired:
+                raise DeadlineExceededError(function_name, "waiting for a worker")
 
             # 2. POST to Lambda RIE
             rie_url = f"http://{host}:{port}/2015-03-31/functions/function/invocations"
             logger.info(f"Invoking {function_name} at {rie_url} (trace_id: {trace_id})")
 
+            headers = self._rie_headers(plan, trace_id)
+
             # 3. Execute request via breaker.
-            async def do_post():
-                headers = {
-                    "Content-Type": "application/json",
-                }
-                if trace_id:
-                    headers["X-Amzn-Trace-Id"] = trace_id
-                    # RIE workaround: embed Trace ID in ClientContext.
-                    client_context = {"custom": {"trace_id": trace_id}}
-                    json_ctx = json.dumps(client_context)
-                    b64_ctx = base64.b64encode(json_ctx.encode("utf-8")).decode("utf-8")
-                    headers["X-Amz-Client-Context"] = b64_ctx
-
-                logger.debug(f"Sending request to RIE with headers: {headers}")
-
-                response = await self.client.post(
-                    rie_url,
-                    content=payload,
-                    headers=headers,
-                    timeout=timeout,
+            client = self._client_for(worker)
+            warm = worker.initialized
+            started = time.monotonic()
+            try:
+                result = await breaker.call(
+                    self._post_to_rie, client, rie_url, payload, headers, deadline.cap(timeout)
                 )
-
-                # Determine whether the response counts as a failure.
-                is_failure = False
-                if response.status_code >= 500:
-                    is_failure = True
-                elif response.headers.get("X-Amz-Function-Error"):
-                    is_failure = True
-                elif response.status_code == 200:
-                    try:
-                        if len(response.content) < 1024 * 10:
-                            data = response.json()
-                            if isinstance(data, dict) and (
-                                "errorType" in data or "errorMessage" in data
-                            ):
-                                is_failure = True
-                    except (ValueError, json.JSONDecodeError):
-                        pass
-
-                if is_failure:
-                    if response.status_code >= 400:
-                        response.raise_for_status()
-                    else:
-                        raise httpx.HTTPStatusError(
-                            f"Lambda Logical Error: {response.text[:100]}",
-                            request=response.request,
-                            response=response,
-                        )
-
-                return response
-
-            result = await breaker.call(do_post)
+            except asyncio.CancelledError:
+                # The client went away; the RIE is still busy with this invocation.
+                logger.warning(f"Invocation of {function_name} abandoned; destroying {worker.name}")
+                await self._evict(function_name, worker, destroy=True)
+                worker = None
+                raise
+            # Cold invocations include the handler import: not a latency signal.
+            rtt = time.monotonic() - started if warm else None
+            if limiter is not None and rtt is not None:
+                limiter.record(rtt)
+            # The runtime has imported the handler by now.
+            worker.initialized = True
+            if await self._observe(function_name, worker, rtt, ok=True):
+                worker = None
             return result
 
         except CircuitBreakerOpenError as e:
             logger.error(f"Circuit breaker open for {function_name}: {e}")
             raise LambdaExecutionError(function_name, "Circuit Breaker Open") from e
         except httpx.ConnectError as e:
+            if limiter is not None:
+                limiter.record_drop()
             # Self-Healing: Evict dead worker on connection error
             logger.error(
                 f"Lambda invocation failed for function '{function_name}': {e}",
@@ -177,10 +223,12 @@ class LambdaInvoker:
                 },
             )
             if worker is not None:
-                await self.backend.evict_worker(function_name, worker)
+                await self._evict(function_name, worker)
                 worker = None  # prevent release in finally
             raise LambdaExecutionError(function_name, e) from e
         except (httpx.RequestError, httpx.HTTPStatusError) as e:
+            if limiter is not None and isinstance(e, httpx.TimeoutException):
+                limiter.record_drop()
             logger.error(
                 f"Lambda invocation failed for function '{function_name}': {e}",
                 extra={
@@ -190,7 +238,19 @@ class LambdaInvoker:
                     "error_detail": str(e),
                 },
             )
+            if isinstance(e, httpx.TimeoutException) and deadline.expired:
+                # Cut off by the request deadline: the worker is still running it.
+                if worker is not None:
+                    await self._evict(function_name, worker, destroy=True)
+                    worker = None
+                raise DeadlineExceededError(function_name, "waiting for the function") from e
+            # A function error means the worker itself answered fine.
+            ok = not self._is_worker_fault(e)
+            if worker is not None and await self._observe(function_name, worker, None, ok=ok):
+                worker = None
             raise LambdaExecutionError(function_name, e) from e
+        except (ResourceExhaustedError, DeadlineExceededError):
+            raise
         except Exception as e:
             logger.exception(
                 f"Unexpected error during invocation of {function_name}: {e}",
@@ -209,6 +269,299 @@ class LambdaInvoker:
                     await self.backend.release_worker(function_name, worker)
                 except Exception as e:
                     logger.error(f"Failed to release worker for {function_name}: {e}")
+            if limiter is not None:
+                limiter.release()
+
+    @asynccontextmanager
+    async def stream_function(
+        self,
+        function_name: str,
+        payload: Payload,
+        timeout: Optional[float] = None,
+        lane: str = LANE_SYNC,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Invoke the specified Lambda and yield the RIE response with its body unread.
+
+        The worker stays acquired until the context exits, so the caller can
+        forward body chunks as they arrive. Only the status line and headers
+        are checked for failures; a logical error in a 200 body cannot be
+        detected without buffering it. Streamed invocations do not feed the
+        outlier statistics. A worker whose body was not read to the end, or
+        whose invocation was cancelled before the headers arrived (the client
+        disconnected), is destroyed instead of released.
+        """
+        plan = self.registry.get_invocation_plan(function_name)
+        if plan is None:
+            raise LambdaExecutionError(function_name, "Function not found in registry")
+
+        timeout, deadline = self._budget(plan, timeout, deadline)
+        breaker = self._get_breaker(function_name)
+        trace_id = get_trace_id()
+        limiter = await self._acquire_limit(function_name, plan, lane)
+
+        try:
+            worker = await self.backend.acquire_worker(function_name, lane=lane, deadline=deadline)
+        except (ResourceExhaustedError, asyncio.CancelledError):
+            if limiter is not None:
+                limiter.release()
+            raise
+        except Exception as e:
+            if limiter is not None:
+                limiter.release()
+            if deadline.expired:
+                raise DeadlineExceededError(function_name, "waiting for a worker") from e
+            raise ContainerStartError(function_name, e) from e
+
+        port = worker.port or self.config.LAMBDA_PORT
+        rie_url = f"http://{worker.ip_address}:{port}/2015-03-31/functions/function/invocations"
+        try:
+            logger.info(f"Invoking {function_name} (stream) at {rie_url} (trace_id: {trace_id})")
+            headers = self._rie_headers(plan, trace_id)
+            client = self._client_for(worker)
+            warm = worker.initialized
+            started = time.monotonic()
+            try:
+                response = await breaker.call(
+                    self._open_rie_stream,
+                    client,
+                    rie_url,
+                    payload,
+                    headers,
+                    deadline.cap(timeout),
+                )
+            except asyncio.CancelledError:
+                # The client went away; the RIE is still busy with this invocation.
+                logger.warning(f"Stream of {function_name} abandoned; destroying {worker.name}")
+                await self._evict(function_name, worker, destroy=True)
+                worker = None
+                raise
+            except CircuitBreakerOpenError as e:
+                logger.error(f"Circuit breaker open for {function_name}: {e}")
+                raise LambdaExecutionError(function_name, "Circuit Breaker Open") from e
+            except httpx.ConnectError as e:
+                if limiter is not None:
+                    limiter.record_drop()
+                logger.error(f"Lambda stream invocation failed for function '{function_name}': {e}")
+                await self._evict(function_name, worker)
+                worker = None  # prevent release in finally
+                raise LambdaExecutionError(function_name, e) from e
+            except (httpx.RequestError, httpx.HTTPStatusError) as e:
+                if limiter is not None and isinstance(e, httpx.TimeoutException):
+                    limiter.record_drop()
+                logger.error(f"Lambda stream invocation failed for function '{function_name}': {e}")
+                if isinstance(e, httpx.TimeoutException) and deadline.expired:
+                    await self._evict(function_name, worker, destroy=True)
+                    worker = None
+                    raise DeadlineExceededError(function_name, "waiting for the function") from e
+                raise LambdaExecutionError(function_name, e) from e
+
+            if limiter is not None and warm:
+                # Time to the response headers (the body is forwarded by the caller).
+                limiter.record(time.monotonic() - started)
+            worker.initialized = True
+            try:
+                yield response
+            finally:
+                # httpx closes the response once its body has been read to the end.
+                finished = response.is_closed
+                await response.aclose()
+                if not finished:
+                    # The client went away mid-body; the RIE is still busy with it.
+                    logger.warning(f"Stream of {function_name} abandoned; destroying {worker.name}")
+                    await self._evict(function_name, worker, destroy=True)
+                    worker = None
+        finally:
+            if worker is not None:
+                try:
+                    await self.backend.release_worker(function_name, worker)
+                except Exception as e:
+                    logger.error(f"Failed to release worker for {function_name}: {e}")
+            if limiter is not None:
+                limiter.release()
+
+    def _client_for(self, worker: WorkerInfo) -> httpx.AsyncClient:
+        """Pinned client for the worker when available, else the shared client."""
+        if self.transports is not None:
+            transport = self.transports.get(worker)
+            if transport is not None:
+                return transport.client
+        return self.client
+
+    async def _evict(self, function_name: str, worker: WorkerInfo, **options: bool) -> None:
+        """Evict the worker (options: destroy / replace, see InvocationBackend.evict_worker)."""
+        if self.transports is not None:
+            await self.transports.close(worker.id)
+        detector = self.detectors.get(function_name)
+        if detector is not None:
+            detector.forget(worker.id)
+        await self.backend.evict_worker(function_name, worker, **options)
+
+    async def _observe(
+        self, function_name: str, worker: WorkerInfo, rtt: Optional[float], ok: bool
+    ) -> bool:
+        """
+        Feed the worker's outlier statistics and eject it when it stands out.
+
+        Returns True when the worker was ejected (it must not be released).
+        """
+        if not self.outlier_detection:
+            return False
+        detector = self.detectors.get(function_name)
+        if detector is None:
+            detector = self.detectors[function_name] = OutlierDetector(
+                latency_factor=self.config.OUTLIER_LATENCY_FACTOR,
+                consecutive_errors=self.config.OUTLIER_CONSECUTIVE_ERRORS,
+                interval=self.config.OUTLIER_EJECTION_INTERVAL,
+            )
+        breaker = self._get_breaker(function_name)
+        reason = detector.record(worker.id, rtt, ok, breaker.generation)
+        if reason is None:
+            return False
+        logger.warning(f"Ejecting outlier worker {worker.name} of {function_name}: {reason}")
+        # The worker's failures since the breaker's last reset say nothing
+        # about the function itself.
+        breaker.forgive(detector.forget(worker.id, breaker.generation), breaker.generation)
+        await self._evict(function_name, worker, destroy=True, replace=True)
+        return True
+
+    def outlier_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-worker latency / error statistics and ejections per function."""
+        return {name: detector.stats() for name, detector in self.detectors.items()}
+
+    @staticmethod
+    def _is_worker_fault(error: Exception) -> bool:
+        """
+        The failure points at the worker (timeout, transport error, runtime 5xx)
+        rather than at the function's own error for this payload.
+        """
+        if isinstance(error, httpx.HTTPStatusError):
+            response = error.response
+            return response.status_code >= 500 and not response.headers.get("X-Amz-Function-Error")
+        return True
+
+    @staticmethod
+    def _budget(
+        plan: InvocationPlan, timeout: Optional[float], deadline: Optional[Deadline]
+    ) -> Tuple[float, Deadline]:
+        """RIE call timeout and the request deadline (the earlier of the client's and ours)."""
+        if timeout is None:
+            timeout = plan.timeout + RIE_TIMEOUT_GRACE if plan.timeout else DEFAULT_INVOKE_TIMEOUT
+        return timeout, Deadline.after(plan.acquire_timeout + timeout).earliest(deadline)
+
+    def _rie_headers(self, plan: InvocationPlan, trace_id: Optional[str]) -> Dict[str, str]:
+        """Build RIE request headers, propagating the Trace ID."""
+        headers = dict(plan.rie_headers)
+        if trace_id:
+            headers["X-Amzn-Trace-Id"] = trace_id
+            # RIE workaround: embed Trace ID in ClientContext.
+            client_context = {"custom": {"trace_id": trace_id}}
+            b64_ctx = base64.b64encode(json_codec.dumps(client_context)).decode("ascii")
+            headers["X-Amz-Client-Context"] = b64_ctx
+        return headers
+
+    async def _open_rie_stream(
+        self,
+        client: httpx.AsyncClient,
+        rie_url: str,
+        payload: Payload,
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> httpx.Response:
+        """POST the payload to RIE and return once the response headers arrive."""
+        request = client.build_request(
+            "POST", rie_url, content=payload, headers=headers, timeout=timeout
+        )
+        response = await client.send(request, stream=True)
+
+        if response.status_code >= 500 or response.headers.get("X-Amz-Function-Error"):
+            # Error bodies are small; read them for the error message.
+            try:
+                await response.aread()
+            finally:
+                await response.aclose()
+            if response.status_code >= 400:
+                response.raise_for_status()
+            raise httpx.HTTPStatusError(
+                f"Lambda Function Error: {response.text[:100]}",
+                request=response.request,
+                response=response,
+            )
+        return response
+
+    async def _post_to_rie(
+        self,
+        client: httpx.AsyncClient,
+        rie_url: str,
+        payload: Payload,
+        headers: Dict[str, str],
+        timeout: float,
+    ) -> httpx.Response:
+        """POST the payload to RIE and raise if the response counts as a failure."""
+        logger.debug(f"Sending request to RIE with headers: {headers}")
+
+        response = await client.post(
+            rie_url,
+            content=payload,
+            headers=headers,
+            timeout=timeout,
+        )
+
+        # Determine whether the response counts as a failure.
+        is_failure = False
+        if response.status_code >= 500:
+            is_failure = True
+        elif response.headers.get("X-Amz-Function-Error"):
+            is_failure = True
+        elif response.status_code == 200:
+            try:
+                if len(response.content) < 1024 * 10:
+                    data = json_codec.loads(response.content)
+                    if isinstance(data, dict) and ("errorType" in data or "errorMessage" in data):
+                        is_failure = True
+            except ValueError:
+                pass
+
+        if is_failure:
+            if response.status_code >= 400:
+                response.raise_for_status()
+            else:
+                raise httpx.HTTPStatusError(
+                    f"Lambda Logical Error: {response.text[:100]}",
+                    request=response.request,
+                    response=response,
+                )
+
+        return response
+
+    async def _acquire_limit(
+        self, function_name: str, plan: InvocationPlan, lane: str
+    ) -> Optional[AdaptiveLimiter]:
+        """
+        Take an in-flight slot of the function's adaptive limit (None when disabled).
+
+        Sync callers over the limit are rejected (429); accepted async
+        invocations wait for a slot instead.
+        """
+        if not self.adaptive_concurrency:
+            return None
+        limiter = self.limiters.get(function_name)
+        if limiter is None:
+            limiter = self.limiters[function_name] = AdaptiveLimiter(
+                max_limit=plan.max_capacity,
+                min_limit=self.config.ADAPTIVE_CONCURRENCY_MIN_LIMIT,
+                tolerance=self.config.ADAPTIVE_CONCURRENCY_TOLERANCE,
+            )
+        try:
+            await limiter.acquire(wait=lane == LANE_ASYNC)
+        except ConcurrencyLimitExceededError as e:
+            raise AdmissionRejectedError(function_name, str(e), e.retry_after) from e
+        return limiter
+
+    def limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Adaptive concurrency limit, min-RTT estimate and rejections per function."""
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
 
     def _get_breaker(self, function_name: str) -> CircuitBreaker:
         """Get or create a circuit breaker per function."""
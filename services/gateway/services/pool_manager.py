@@ -7,14 +7,41 @@ capacity management.
 """
 
 import asyncio
+import contextlib
+import datetime
+import functools
 import logging
-from typing import Callable, Dict, List, Any, Optional, Set
-
-from .container_pool import ContainerPool
+import time
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Any,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ..core.concurrency import ConcurrencyBudget
+from ..core.deadline import Deadline
+from ..core.timer_wheel import TimerWheel
+from .autoscaler import PredictiveAutoscaler
+from .capacity_schedule import CapacityWindow, scheduled_floor
+from .container_pool import LANE_SYNC, SELECTION_MODES, ContainerPool
+from .provision_scheduler import ProvisionScheduler
 from services.common.models.internal import WorkerInfo
 
 logger = logging.getLogger("gateway.pool_manager")
 
+# Per-worker timers on PoolManager.timers, keyed (kind, worker id).
+TIMER_PAUSE = "pause"
+TIMER_IDLE = "idle"
+TIMER_RECYCLE = "recycle"
+
 
 class PoolManager:
     """
@@ -30,16 +57,100 @@ class PoolManager:
         config_loader: Callable[[str], Dict[str, Any]],
         pause_enabled: bool = False,
         pause_idle_seconds: float = 0.0,
+        prewarm_concurrency: int = 4,
+        selection: str = "lifo",
+        provision_batch_max: int = 1,
+        warmup: Optional[Callable[[str, WorkerInfo], Awaitable[Any]]] = None,
+        autoscaler: Optional[PredictiveAutoscaler] = None,
+        schedule_interval: float = 30.0,
+        schedule_ramp: float = 300.0,
+        provision_scheduler: Optional[ProvisionScheduler] = None,
+        concurrency_budget: Optional[ConcurrencyBudget] = None,
+        async_share: float = 0.5,
+        admission_control: bool = False,
+        recycle_interval: float = 30.0,
+        idle_timeout: float = 0.0,
     ):
         """
         Args:
             provision_client: client that sends provision requests to the Manager
             config_loader: callback to fetch config by function name (function_name -> config dict)
+            prewarm_concurrency: max parallel provisions when filling min_capacity
+            selection: idle worker selection for every pool ("lifo" or "fifo")
+            provision_batch_max: max workers requested per provision call (burst scale-out)
+            warmup: async callback(function_name, worker) run on every new worker
+                before it is handed out (warm-up invocation)
+            autoscaler: forecaster driving predictive pre-provisioning (start_autoscaler)
+            schedule_interval: seconds between capacity schedule evaluations
+            schedule_ramp: default seconds over which a scheduled floor is raised
+                before its window starts
+            provision_scheduler: gateway-wide rate / in-flight limit for container
+                creations (deepest waiter queue first)
+            concurrency_budget: node-wide container budget (reserved concurrency,
+                shared pool with weighted fair sharing)
+            async_share: share of a pool's max_capacity async invocations may
+                hold while sync / interactive callers are waiting
+            admission_control: reject callers up front (429) when their expected
+                wait exceeds acquire_timeout or the queue is at scaling.max_queue
+            recycle_interval: seconds between scaling.recycle memory checks
+                (invocation counts are checked on every release, max_age by timer)
+            idle_timeout: seconds after which an idle worker above min_capacity is
+                removed by its timer (0: left to prune_all_pools)
         """
         self._pools: Dict[str, ContainerPool] = {}
         self._lock = asyncio.Lock()
         self.provision_client = provision_client
         self.config_loader = config_loader
+        try:
+            prewarm_value = int(prewarm_concurrency)
+        except (TypeError, ValueError):
+            prewarm_value = 1
+        self._prewarm_semaphore = asyncio.Semaphore(max(1, prewarm_value))
+        self._replenish_tasks: Set[asyncio.Task] = set()
+        if selection not in SELECTION_MODES:
+            logger.warning(f"Unknown pool selection {selection!r}; using 'lifo'.")
+            selection = "lifo"
+        self.selection = selection
+        try:
+            self.provision_batch_max = max(1, int(provision_batch_max))
+        except (TypeError, ValueError):
+            self.provision_batch_max = 1
+        # Batches are streamed (workers handed out as they get ready) when supported.
+        self._stream_batches = hasattr(provision_client, "provision_stream")
+        self.warmup = warmup
+        self.autoscaler = autoscaler
+        self._autoscale_task: Optional[asyncio.Task] = None
+        self.schedule_interval = schedule_interval
+        self.schedule_ramp = schedule_ramp
+        # function -> (static min_capacity, windows) for functions with a schedule.
+        self._schedules: Dict[str, Tuple[int, Tuple[CapacityWindow, ...]]] = {}
+        self._schedule_task: Optional[asyncio.Task] = None
+        self.provision_scheduler = provision_scheduler
+        if provision_scheduler is not None:
+            provision_scheduler.queue_depth = self._queue_depth
+        self.concurrency_budget = concurrency_budget
+        try:
+            self.async_share = float(async_share)
+        except (TypeError, ValueError):
+            self.async_share = 0.5
+        self.admission_control = bool(admission_control)
+        try:
+            self.recycle_interval = float(recycle_interval)
+        except (TypeError, ValueError):
+            self.recycle_interval = 30.0
+        self._recycle_task: Optional[asyncio.Task] = None
+        # Workers whose replacement is being provisioned, and workers whose
+        # replacement is ready (removed as soon as they are released).
+        self._recycling: Set[str] = set()
+        self._retired: Set[str] = set()
+        try:
+            self.idle_timeout = max(0.0, float(idle_timeout))
+        except (TypeError, ValueError):
+            self.idle_timeout = 0.0
+        # Pause, idle expiry and max_age deadlines of every worker.
+        self.timers = TimerWheel()
+        if concurrency_budget is not None and concurrency_budget.reclaim is None:
+            concurrency_budget.reclaim = self._reclaim_idle
         try:
             pause_idle_value = float(pause_idle_seconds)
         except (TypeError, ValueError):
@@ -47,6 +158,7 @@ class PoolManager:
 
         self.pause_enabled = bool(pause_enabled) and pause_idle_value > 0
         self.pause_idle_seconds = pause_idle_value
+        # Pause requests in flight (the idle delay itself is a timer).
         self._pause_tasks: Dict[str, asyncio.Task] = {}
         self._paused_ids: Set[str] = set()
 
@@ -66,12 +178,30 @@ class PoolManager:
                 if function_name not in self._pools:
                     config = self.config_loader(function_name)
                     scaling = config.get("scaling", {})
+                    min_capacity = scaling.get("min_capacity", 0)
+                    if function_name in self._schedules:
+                        min_capacity = self._scheduled_min_capacity(function_name)
                     self._pools[function_name] = ContainerPool(
                         function_name=function_name,
                         max_capacity=scaling.get("max_capacity", 1),
-                        min_capacity=scaling.get("min_capacity", 0),
+                        min_capacity=min_capacity,
                         acquire_timeout=scaling.get("acquire_timeout", 5.0),
+                        selection=self.selection,
+                        max_provision_batch=self.provision_batch_max,
+                        async_share=self.async_share,
+                        admission_control=self.admission_control,
+                        max_queue=scaling.get("max_queue", 0),
+                        recycle=scaling.get("recycle"),
+                    )
+                    self._pools[function_name].on_idle = functools.partial(
+                        self._worker_idle, function_name, self._pools[function_name]
                     )
+                    if self.concurrency_budget is not None:
+                        self.concurrency_budget.register(
+                            self._pools[function_name],
+                            reserved=scaling.get("reserved_concurrency", 0),
+                            weight=scaling.get("weight", 1.0),
+                        )
                     logger.info(
                         f"Created pool for {function_name}: "
                         f"max_capacity={self._pools[function_name].max_capacity}"
@@ -79,6 +209,7 @@ class PoolManager:
         return self._pools[function_name]
 
     async def _cancel_pause_task(self, worker_id: str) -> None:
+        self.timers.cancel((TIMER_PAUSE, worker_id))
         task = self._pause_tasks.pop(worker_id, None)
         if task:
             task.cancel()
@@ -87,48 +218,505 @@ class PoolManager:
             except asyncio.CancelledError:
                 pass
 
-    async def _schedule_pause(
-        self, function_name: str, pool: ContainerPool, worker: WorkerInfo
-    ) -> None:
-        if not self.pause_enabled:
+    def _cancel_timers(self, worker_id: str) -> None:
+        """Drop the idle expiry and max_age timers of a removed worker."""
+        self.timers.cancel((TIMER_IDLE, worker_id))
+        self.timers.cancel((TIMER_RECYCLE, worker_id))
+
+    def _worker_idle(self, function_name: str, pool: ContainerPool, worker: WorkerInfo) -> None:
+        """Arm the pause / idle expiry / max_age timers of a worker that just became idle."""
+        if self.pause_enabled and worker.id not in self._paused_ids:
+            self.timers.schedule(
+                (TIMER_PAUSE, worker.id),
+                self.pause_idle_seconds,
+                functools.partial(self._pause_due, function_name, pool, worker),
+            )
+        if self.idle_timeout > 0:
+            self.timers.schedule(
+                (TIMER_IDLE, worker.id),
+                self.idle_timeout,
+                functools.partial(self._idle_due, function_name, pool, worker),
+            )
+        policy = pool.recycle
+        if (
+            policy is not None
+            and policy.max_age
+            and worker.created_at
+            and (TIMER_RECYCLE, worker.id) not in self.timers
+        ):
+            # Busy workers past max_age are caught on release (recycle_due).
+            self.timers.schedule(
+                (TIMER_RECYCLE, worker.id),
+                worker.created_at + policy.max_age - time.time(),
+                functools.partial(self._recycle_due, function_name, pool, worker),
+            )
+
+    def _pause_due(self, function_name: str, pool: ContainerPool, worker: WorkerInfo) -> None:
+        if not self.pause_enabled or worker.id in self._paused_ids:
+            return
+        if worker.id in self._pause_tasks:
+            return
+        task = asyncio.create_task(self._pause(function_name, pool, worker))
+        self._pause_tasks[worker.id] = task
+
+    async def _pause(self, function_name: str, pool: ContainerPool, worker: WorkerInfo) -> None:
+        task_ref = asyncio.current_task()
+        try:
+            if not await pool.is_idle(worker.id):
+                return
+            await self.provision_client.pause_container(function_name, worker)
+            self._paused_ids.add(worker.id)
+        except asyncio.CancelledError:
             return
+        except Exception as e:
+            logger.error(f"Failed to pause container {worker.id} for {function_name}: {e}")
+        finally:
+            if task_ref and self._pause_tasks.get(worker.id) is task_ref:
+                self._pause_tasks.pop(worker.id, None)
+
+    def _idle_due(self, function_name: str, pool: ContainerPool, worker: WorkerInfo) -> None:
+        if pool.prune_idle(worker):
+            self._spawn(self._delete_pruned(function_name, worker))
+        elif pool.has_worker(worker):
+            # Held at min_capacity: check again once the floor may have dropped.
+            self.timers.schedule(
+                (TIMER_IDLE, worker.id),
+                self.idle_timeout,
+                functools.partial(self._idle_due, function_name, pool, worker),
+            )
 
+    async def _delete_pruned(self, function_name: str, worker: WorkerInfo) -> None:
         await self._cancel_pause_task(worker.id)
+        self._paused_ids.discard(worker.id)
+        self._cancel_timers(worker.id)
+        if self.autoscaler is not None:
+            self.autoscaler.record_removed(function_name, worker)
+        try:
+            await self.provision_client.delete_container(worker.id)
+            logger.info(f"Pruned and deleted idle container: {worker.name}")
+        except Exception as e:
+            logger.error(f"Failed to delete pruned container {worker.name}: {e}")
+
+    def _recycle_due(
+        self,
+        function_name: str,
+        pool: ContainerPool,
+        worker: WorkerInfo,
+        reason: Optional[str] = None,
+    ) -> None:
+        if not pool.has_worker(worker):
+            return
+        reason = reason or pool.recycle_due(worker)
+        if reason is not None:
+            self._recycle(function_name, pool, worker, reason)
+
+    def _provision_wrapper(
+        self, function_name: str, count: int = 1
+    ) -> Union[Awaitable[List[WorkerInfo]], AsyncIterator[WorkerInfo]]:
+        """Provision API wrapper (List[WorkerInfo], or a worker stream for batches)."""
+        if count > 1 and self._stream_batches:
+            if self.provision_scheduler is None:
+                workers = self.provision_client.provision_stream(function_name, count)
+            else:
+                workers = self._scheduled_stream(function_name, count)
+            if self.warmup is None:
+                return workers
+            return self._warm_stream(function_name, workers)
+        return self._provision_list(function_name, count)
+
+    def _queue_depth(self, function_name: str) -> int:
+        pool = self._pools.get(function_name)
+        return pool.waiting if pool is not None else 0
+
+    async def _provision_list(self, function_name: str, count: int) -> List[WorkerInfo]:
+        slots = (
+            self.provision_scheduler.slots(function_name, count)
+            if self.provision_scheduler is not None
+            else contextlib.nullcontext()
+        )
+        async with slots:
+            if count == 1:
+                workers = await self.provision_client.provision(function_name)
+            else:
+                workers = await self.provision_client.provision(function_name, count=count)
+        if self.warmup is not None:
+            await asyncio.gather(*(self.warmup(function_name, worker) for worker in workers))
+        return workers
+
+    async def _scheduled_stream(self, function_name: str, count: int) -> AsyncIterator[WorkerInfo]:
+        """Batch stream holding one scheduler slot per container until it is ready."""
+        await self.provision_scheduler.acquire(function_name, count)
+        pending = count
+        try:
+            workers = self.provision_client.provision_stream(function_name, count)
+            async with contextlib.aclosing(workers):
+                async for worker in workers:
+                    if pending > 0:
+                        pending -= 1
+                        self.provision_scheduler.release(1)
+                    yield worker
+        finally:
+            self.provision_scheduler.release(pending)
+
+    async def _warm_stream(
+        self, function_name: str, workers: AsyncIterator[WorkerInfo]
+    ) -> AsyncIterator[WorkerInfo]:
+        async with contextlib.aclosing(workers):
+            async for worker in workers:
+                await self.warmup(function_name, worker)
+                yield worker
+
+    def _reactive_provision(
+        self, function_name: str, count: int = 1
+    ) -> Union[Awaitable[List[WorkerInfo]], AsyncIterator[WorkerInfo]]:
+        """Provision for waiting acquires (counted as autoscaler misses)."""
+        if self.autoscaler is not None:
+            self.autoscaler.record_miss(function_name, count)
+        return self._provision_wrapper(function_name, count)
+
+    async def ensure_min_capacity(self, function_names: Optional[Iterable[str]] = None) -> int:
+        """
+        Provision idle workers up to each pool's min_capacity (provisioned concurrency).
+
+        Args:
+            function_names: functions to warm (defaults to existing pools)
 
-        async def _pause_after_delay() -> None:
-            task_ref = asyncio.current_task()
+        Returns:
+            Number of workers provisioned
+        """
+        if function_names is None:
+            pools = list(self._pools.values())
+        else:
+            pools = []
+            for name in function_names:
+                if name not in self._pools:
+                    scaling = self.config_loader(name).get("scaling", {})
+                    if scaling.get("min_capacity", 0) <= 0:
+                        continue
+                pools.append(await self.get_pool(name))
+
+        jobs = [pool for pool in pools for _ in range(pool.warm_deficit)]
+        if not jobs:
+            return 0
+
+        results = await asyncio.gather(
+            *(self._prewarm_one(pool) for pool in jobs), return_exceptions=True
+        )
+        provisioned = 0
+        for pool, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to pre-provision worker for {pool.function_name}: {result}")
+            elif result is not None:
+                provisioned += 1
+        if provisioned:
+            logger.info(f"Pre-provisioned {provisioned} workers toward min_capacity")
+        return provisioned
+
+    async def _prewarm_one(self, pool: ContainerPool) -> Optional[WorkerInfo]:
+        async with self._prewarm_semaphore:
+            return await pool.prewarm(self._provision_wrapper)
+
+    def schedule_min_capacity(self, function_names: Optional[Iterable[str]] = None) -> None:
+        """Run ensure_min_capacity in the background (startup, after prune/evict)."""
+        names = list(function_names) if function_names is not None else None
+        task = asyncio.create_task(self.ensure_min_capacity(names))
+        self._replenish_tasks.add(task)
+        task.add_done_callback(self._replenish_tasks.discard)
+
+    async def start_recycler(self) -> None:
+        """Start the periodic scaling.recycle memory check."""
+        if self._recycle_task is not None or self.recycle_interval <= 0:
+            return
+        self._recycle_task = asyncio.create_task(self._recycle_loop())
+
+    async def stop_recycler(self) -> None:
+        """Stop the periodic recycle check."""
+        task, self._recycle_task = self._recycle_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _recycle_loop(self) -> None:
+        while True:
             try:
-                await asyncio.sleep(self.pause_idle_seconds)
-                if not self.pause_enabled:
-                    return
-                if worker.id in self._paused_ids:
-                    return
-                if not await pool.is_idle(worker.id):
-                    return
-                await self.provision_client.pause_container(function_name, worker)
-                self._paused_ids.add(worker.id)
+                await asyncio.sleep(self.recycle_interval)
+                await self.check_recycling()
             except asyncio.CancelledError:
-                return
+                break
             except Exception as e:
-                logger.error(
-                    f"Failed to pause container {worker.id} for {function_name}: {e}"
-                )
-            finally:
-                if task_ref and self._pause_tasks.get(worker.id) is task_ref:
-                    self._pause_tasks.pop(worker.id, None)
-
-        task = asyncio.create_task(_pause_after_delay())
-        self._pause_tasks[worker.id] = task
+                logger.error(f"Recycle check failed: {e}")
+
+    async def check_recycling(self) -> int:
+        """
+        Start recycling workers past scaling.recycle memory_high_water.
+
+        Memory usage comes from the agent's container metrics; max_age and
+        max_invocations are enforced by worker timers and on release.
+
+        Returns:
+            Number of workers whose recycling was started
+        """
+        if not hasattr(self.provision_client, "get_container_metrics"):
+            return 0
+        started = 0
+        for fname, pool in list(self._pools.items()):
+            policy = pool.recycle
+            if policy is None or not policy.memory_high_water:
+                continue
+            workers = [
+                w
+                for w in pool.get_all_workers()
+                if w.id not in self._recycling and w.id not in self._retired
+            ]
+            results = await asyncio.gather(
+                *(self.provision_client.get_container_metrics(w.id) for w in workers),
+                return_exceptions=True,
+            )
+            for w, metrics in zip(workers, results):
+                if isinstance(metrics, Exception):
+                    logger.debug(f"No metrics for {w.name}: {metrics}")
+                    continue
+                reason = policy.memory_due(metrics)
+                if reason is not None and pool.has_worker(w):
+                    self._recycle(fname, pool, w, reason)
+                    started += 1
+        return started
+
+    def _recycle(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo, reason: str
+    ) -> None:
+        """Replace `worker` in the background; it keeps serving until the replacement is ready."""
+        if worker.id in self._recycling or worker.id in self._retired:
+            return
+        self._recycling.add(worker.id)
+        logger.info(f"Recycling {worker.name} of {function_name} ({reason})")
+        self._spawn(self._replace_recycled(function_name, pool, worker, reason))
 
-    async def _provision_wrapper(self, function_name: str) -> List[WorkerInfo]:
-        """Provision API wrapper (returns List[WorkerInfo])."""
-        return await self.provision_client.provision(function_name)
+    async def _replace_recycled(
+        self, function_name: str, pool: ContainerPool, worker: WorkerInfo, reason: str
+    ) -> None:
+        try:
+            async with self._prewarm_semaphore:
+                await pool.provision_replacement(self._provision_wrapper)
+        except Exception as e:
+            # The old worker keeps serving; retried after recycle_interval.
+            logger.error(f"Failed to provision replacement for {worker.name}: {e}")
+            self.timers.schedule(
+                (TIMER_RECYCLE, worker.id),
+                self.recycle_interval,
+                functools.partial(self._recycle_due, function_name, pool, worker, reason),
+            )
+            return
+        finally:
+            self._recycling.discard(worker.id)
+        if not pool.has_worker(worker):
+            # Evicted or pruned meanwhile: the replacement simply stays.
+            return
+        if await pool.is_idle(worker.id):
+            await self._retire(function_name, worker)
+        else:
+            self._retired.add(worker.id)
+
+    async def _retire(self, function_name: str, worker: WorkerInfo) -> None:
+        """Remove a recycled worker whose replacement is serving, and delete its container."""
+        self._retired.discard(worker.id)
+        await self.evict_worker(function_name, worker, destroy=True)
+
+    async def start_autoscaler(self) -> None:
+        """Start the predictive scale-out loop (no-op without an autoscaler)."""
+        if self.autoscaler is None or self._autoscale_task is not None:
+            return
+        self._autoscale_task = asyncio.create_task(self._autoscale_loop())
+        logger.info(
+            f"Predictive autoscaler started (interval: {self.autoscaler.interval}s, "
+            f"horizon: {self.autoscaler.horizon}s, cooldown: {self.autoscaler.cooldown}s)"
+        )
+
+    async def stop_autoscaler(self) -> None:
+        """Stop the predictive scale-out loop."""
+        task, self._autoscale_task = self._autoscale_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _autoscale_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.autoscaler.interval)
+                self.autoscale()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Predictive autoscaling failed: {e}")
 
-    async def acquire_worker(self, function_name: str) -> WorkerInfo:
-        """Acquire a worker."""
+    def autoscale(self) -> int:
+        """
+        Update the forecasts and pre-provision where predicted concurrency
+        exceeds warm capacity.
+
+        Returns:
+            Number of pre-provisions started (they run in the background)
+        """
+        self.autoscaler.observe()
+        started = 0
+        for fname, pool in self._pools.items():
+            stats = pool.stats
+            warm = stats["total_workers"] + stats["provisioning"]
+            busy = stats["total_workers"] - stats["idle"]
+            count = self.autoscaler.plan(fname, busy, warm, pool.max_capacity)
+            if count <= 0:
+                continue
+            logger.info(f"Pre-provisioning {count} workers for {fname} (predicted load)")
+            target = warm + count
+            for _ in range(count):
+                task = asyncio.create_task(self._pre_provision_one(fname, pool, target))
+                self._replenish_tasks.add(task)
+                task.add_done_callback(self._replenish_tasks.discard)
+            started += count
+        return started
+
+    async def _pre_provision_one(
+        self, function_name: str, pool: ContainerPool, target: int
+    ) -> None:
+        try:
+            async with self._prewarm_semaphore:
+                worker = await pool.prewarm(self._provision_wrapper, target=target)
+        except Exception as e:
+            logger.error(f"Failed to pre-provision worker for {function_name}: {e}")
+            return
+        if worker is not None:
+            self.autoscaler.record_pre_provisioned(function_name, worker)
+
+    async def start_capacity_schedule(self, function_names: Iterable[str]) -> None:
+        """
+        Start applying scaling.schedule windows of the given functions.
+
+        No-op when none of them has a schedule.
+        """
+        for name in function_names:
+            scaling = self.config_loader(name).get("scaling", {})
+            windows = tuple(scaling.get("schedule") or ())
+            if windows:
+                self._schedules[name] = (scaling.get("min_capacity", 0), windows)
+        if not self._schedules or self._schedule_task is not None:
+            return
+        await self.apply_capacity_schedule()
+        self._schedule_task = asyncio.create_task(self._capacity_schedule_loop())
+        logger.info(
+            f"Capacity schedule started for {len(self._schedules)} functions "
+            f"(interval: {self.schedule_interval}s)"
+        )
+
+    async def stop_capacity_schedule(self) -> None:
+        """Stop the capacity schedule loop."""
+        task, self._schedule_task = self._schedule_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _capacity_schedule_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.schedule_interval)
+                await self.apply_capacity_schedule()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Capacity schedule failed: {e}")
+
+    def _scheduled_min_capacity(
+        self, function_name: str, now: Optional[datetime.datetime] = None
+    ) -> int:
+        base, windows = self._schedules[function_name]
+        return scheduled_floor(windows, base, now=now, default_ramp=self.schedule_ramp)
+
+    async def apply_capacity_schedule(
+        self, now: Optional[datetime.datetime] = None
+    ) -> Dict[str, int]:
+        """
+        Set each scheduled pool's min_capacity for `now` and warm up toward it.
+
+        Raised floors are filled in the background (bounded by PREWARM_CONCURRENCY);
+        lowered floors let the janitor prune the surplus after the idle timeout.
+
+        Args:
+            now: aware datetime (defaults to the current time)
+
+        Returns:
+            function name -> effective min_capacity
+        """
+        floors: Dict[str, int] = {}
+        below_floor = []
+        for name in self._schedules:
+            floor = self._scheduled_min_capacity(name, now)
+            floors[name] = floor
+            pool = self._pools.get(name)
+            if pool is None:
+                if floor <= 0:
+                    continue
+                pool = await self.get_pool(name)
+            if pool.min_capacity != floor:
+                logger.info(f"Scheduled min_capacity for {name}: {pool.min_capacity} -> {floor}")
+                pool.min_capacity = floor
+            if pool.warm_deficit > 0:
+                below_floor.append(name)
+        if below_floor:
+            self.schedule_min_capacity(below_floor)
+        return floors
+
+    def _reclaim_idle(self, function_name: str) -> bool:
+        """Give an idle container of function_name back to the node budget."""
+        pool = self._pools.get(function_name)
+        worker = pool.reclaim_idle() if pool is not None else None
+        if worker is None:
+            return False
+        logger.info(f"Reclaiming idle container {worker.name} of {function_name} (node budget)")
+        task = asyncio.create_task(self._delete_reclaimed(function_name, worker))
+        self._replenish_tasks.add(task)
+        task.add_done_callback(self._replenish_tasks.discard)
+        return True
+
+    async def _delete_reclaimed(self, function_name: str, worker: WorkerInfo) -> None:
+        await self._cancel_pause_task(worker.id)
+        self._paused_ids.discard(worker.id)
+        self._cancel_timers(worker.id)
+        if self.autoscaler is not None:
+            self.autoscaler.record_removed(function_name, worker)
+        try:
+            await self.provision_client.delete_container(worker.id)
+        except Exception as e:
+            logger.error(f"Failed to delete reclaimed container {worker.name}: {e}")
+
+    def _replenish_if_needed(self, function_name: str) -> None:
+        pool = self._pools.get(function_name)
+        if pool is not None and pool.warm_deficit > 0:
+            self.schedule_min_capacity([function_name])
+
+    async def acquire_worker(
+        self, function_name: str, lane: str = LANE_SYNC, deadline: Optional[Deadline] = None
+    ) -> WorkerInfo:
+        """
+        Acquire a worker (queued by priority lane when the pool is full).
+
+        The queue wait is bounded by what is left of the request deadline.
+        """
         pool = await self.get_pool(function_name)
         while True:
-            worker = await pool.acquire(self._provision_wrapper)
+            timeout = deadline.remaining() if deadline is not None else None
+            worker = await pool.acquire(self._reactive_provision, lane, timeout=timeout)
+            self.timers.cancel((TIMER_IDLE, worker.id))
             if self.pause_enabled:
                 await self._cancel_pause_task(worker.id)
                 if worker.id in self._paused_ids:
@@ -141,24 +729,79 @@ class PoolManager:
                             f"Failed to resume container {worker.id} for {function_name}: {e}"
                         )
                         self._paused_ids.discard(worker.id)
-                        await pool.evict(worker)
+                        await self._evict(function_name, pool, worker)
                         continue
+            if self.autoscaler is not None:
+                self.autoscaler.record_acquire(function_name, worker)
             return worker
 
     async def release_worker(self, function_name: str, worker: WorkerInfo) -> None:
-        """Release a worker."""
+        """Release a worker (a recycled one whose replacement is ready is removed instead)."""
         if function_name in self._pools:
             pool = self._pools[function_name]
+            if self.autoscaler is not None:
+                self.autoscaler.record_release(function_name, worker)
+            if worker.id in self._retired:
+                await self._retire(function_name, worker)
+                return
             await pool.release(worker)
-            if self.pause_enabled:
-                await self._schedule_pause(function_name, pool, worker)
+            reason = pool.recycle_due(worker)
+            if reason is not None:
+                self._recycle(function_name, pool, worker, reason)
 
-    async def evict_worker(self, function_name: str, worker: WorkerInfo) -> None:
-        """Evict a dead worker."""
-        if function_name in self._pools:
-            await self._cancel_pause_task(worker.id)
-            self._paused_ids.discard(worker.id)
-            await self._pools[function_name].evict(worker)
+    async def evict_worker(
+        self, function_name: str, worker: WorkerInfo, destroy: bool = False, replace: bool = False
+    ) -> None:
+        """
+        Evict a dead worker.
+
+        destroy: the container may still be running (an abandoned invocation,
+            an outlier), so also delete it in the background instead of
+            leaving it to the Janitor
+        replace: provision a replacement in the background, keeping the pool
+            at its current size
+        """
+        pool = self._pools.get(function_name)
+        if pool is None:
+            return
+        size = pool.size
+        await self._cancel_pause_task(worker.id)
+        self._paused_ids.discard(worker.id)
+        await self._evict(function_name, pool, worker)
+        if destroy:
+            self._spawn(self._destroy(worker))
+        if replace:
+            self._spawn(self._replace(pool, size))
+
+    def _spawn(self, coro: Awaitable[None]) -> None:
+        task = asyncio.create_task(coro)
+        self._replenish_tasks.add(task)
+        task.add_done_callback(self._replenish_tasks.discard)
+
+    async def _destroy(self, worker: WorkerInfo) -> None:
+        try:
+            await self.provision_client.delete_container(worker.id)
+        except Exception as e:
+            logger.error(f"Failed to delete container {worker.name}: {e}")
+
+    async def _replace(self, pool: ContainerPool, size: int) -> None:
+        """Provision back up to `size` workers (a waiter may have refilled the slot already)."""
+        try:
+            async with self._prewarm_semaphore:
+                await pool.prewarm(self._provision_wrapper, target=size)
+        except Exception as e:
+            logger.error(f"Failed to provision replacement worker for {pool.function_name}: {e}")
+
+    async def _evict(self, function_name: str, pool: ContainerPool, worker: WorkerInfo) -> None:
+        await pool.evict(worker)
+        self._cancel_timers(worker.id)
+        if self.autoscaler is not None:
+            self.autoscaler.record_removed(function_name, worker)
+        self._replenish_if_needed(function_name)
+
+    def lane_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Per-lane waiting / in-use callers and wait times of every pool."""
+        return {name: pool.lanes for name, pool in self._pools.items()}
 
     def get_all_worker_names(self) -> Dict[str, List[str]]:
         """For heartbeat: collect all worker names across pools (busy + idle)."""
@@ -221,6 +864,11 @@ class PoolManager:
     async def shutdown_all(self) -> None:
         """Drain all pools and delete containers."""
         logger.info("Shutting down all pools...")
+        await self.stop_recycler()
+        await self.stop_autoscaler()
+        await self.stop_capacity_schedule()
+        await self._cancel_replenish_tasks()
+        await self.timers.stop()
         await self._cancel_all_pause_tasks()
         self._paused_ids.clear()
         for fname, pool in self._pools.items():
@@ -232,7 +880,12 @@ class PoolManager:
                     logger.error(f"Failed to delete {w.name}: {e}")
 
     async def prune_all_pools(self, idle_timeout: float) -> Dict[str, List[WorkerInfo]]:
-        """Prune all pools and delete from orchestrator."""
+        """
+        Prune all pools and delete from orchestrator.
+
+        Pools never shrink below min_capacity; pools that are below it (after
+        evictions or failed pre-provisioning) are refilled afterwards.
+        """
         result = {}
         for fname, pool in self._pools.items():
             pruned = await pool.prune_idle_workers(idle_timeout)
@@ -240,6 +893,9 @@ class PoolManager:
                 for w in pruned:
                     await self._cancel_pause_task(w.id)
                     self._paused_ids.discard(w.id)
+                    self._cancel_timers(w.id)
+                    if self.autoscaler is not None:
+                        self.autoscaler.record_removed(fname, w)
                 result[fname] = pruned
                 # Delete from orchestrator
                 for w in pruned:
@@ -248,8 +904,17 @@ class PoolManager:
                         logger.info(f"Pruned and deleted idle container: {w.name}")
                     except Exception as e:
                         logger.error(f"Failed to delete pruned container {w.name}: {e}")
+
+        self.replenish_below_floor()
         return result
 
+    def replenish_below_floor(self) -> List[str]:
+        """Refill pools below min_capacity in the background; returns their names."""
+        below_floor = [fname for fname, pool in self._pools.items() if pool.warm_deficit > 0]
+        if below_floor:
+            self.schedule_min_capacity(below_floor)
+        return below_floor
+
     async def reconcile_orphans(self) -> int:
         """
         Detect containers not managed by the Gateway (orphans) and delete via Agent (full reconciliation).
@@ -264,18 +929,25 @@ class PoolManager:
         current_time = time.time()
 
         try:
-            # 1. Get all current containers from Agent.
-            actual_containers = await self.provision_client.list_containers()
-            if not actual_containers:
-                return 0
-
-            # 2. Collect all worker IDs known to the Gateway.
+            # 1. Collect all worker IDs known to the Gateway.
             known_ids = set()
             for pool in self._pools.values():
                 workers = pool.get_all_workers()
                 for w in workers:
                     known_ids.add(w.id)
 
+            # Pinned RIE connections of workers that left the pools unnoticed.
+            transports = getattr(self.provision_client, "transports", None)
+            if transports is not None:
+                closed = await transports.retain(known_ids, grace=grace_period)
+                if closed:
+                    logger.info(f"Reconciliation: Closed {closed} stale RIE transports")
+
+            # 2. Get all current containers from Agent.
+            actual_containers = await self.provision_client.list_containers()
+            if not actual_containers:
+                return 0
+
             # 3. Detect orphans (present in actual but not known).
             orphans = [c for c in actual_containers if c.id not in known_ids]
 
@@ -320,3 +992,14 @@ class PoolManager:
                 await task
             except asyncio.CancelledError:
                 pass
+
+    async def _cancel_replenish_tasks(self) -> None:
+        tasks = list(self._replenish_tasks)
+        self._replenish_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
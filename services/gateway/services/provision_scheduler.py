@@ -0,0 +1,216 @@
+"""
+ProvisionScheduler - gateway-wide admission for container creations
+
+Every ContainerPool reserves provisioning slots up to its own max_capacity,
+so a stampede across many cold functions turns into dozens of concurrent
+EnsureContainer calls that slow every cold start down. PoolManager routes
+all provisions (reactive, min_capacity, predictive) through one scheduler:
+
+- token bucket: at most `rate` container creations per second (`burst` at once)
+- in-flight cap: at most `max_in_flight` containers being created at a time
+- priority: when capacity frees up, the function with the deepest waiter
+  queue goes first (FIFO among equals), so background pre-provisions never
+  delay a request that is waiting for a worker
+
+Time spent queued here is reported as provisioning queue latency.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+
+class _Pending:
+    __slots__ = ("seq", "function_name", "count", "future", "enqueued_at")
+
+    def __init__(
+        self, seq: int, function_name: str, count: int, future: "asyncio.Future[None]"
+    ) -> None:
+        self.seq = seq
+        self.function_name = function_name
+        self.count = count
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class _QueueLatency:
+    """Provisioning queue latency of one function."""
+
+    __slots__ = ("granted", "queued", "total_wait", "max_wait", "last_wait")
+
+    def __init__(self) -> None:
+        self.granted = 0
+        self.queued = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    def record(self, wait: float, queued: bool) -> None:
+        self.granted += 1
+        self.queued += queued
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_wait = wait
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "granted": self.granted,
+            "queued": self.queued,
+            "avg_wait_ms": round(self.total_wait / self.granted * 1000, 2) if self.granted else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "last_wait_ms": round(self.last_wait * 1000, 2),
+        }
+
+
+class ProvisionScheduler:
+    """
+    Token bucket + in-flight limit shared by all pools.
+
+    A request for `count` containers is granted as a whole. It needs
+    min(count, burst) tokens and room for `count` more in-flight creations;
+    a request larger than max_in_flight is granted alone so it cannot stall.
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.0,
+        burst: int = 1,
+        max_in_flight: int = 0,
+        queue_depth: Optional[Callable[[str], int]] = None,
+    ):
+        """
+        Args:
+            rate: container creations per second (<= 0 disables the token bucket)
+            burst: token bucket size
+            max_in_flight: max containers being created at once (<= 0: unlimited)
+            queue_depth: callback(function_name) -> requests waiting for a worker
+        """
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.max_in_flight = int(max_in_flight)
+        self.queue_depth = queue_depth or (lambda function_name: 0)
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+        self._in_flight = 0
+        self._pending: List[_Pending] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._latency: Dict[str, _QueueLatency] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self, function_name: str, count: int = 1) -> None:
+        """Wait until `count` container creations may start."""
+        count = max(1, count)
+        if not self._pending and self._can_grant(count):
+            self._grant(function_name, count, 0.0, queued=False)
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = _Pending(next(self._seq), function_name, count, future)
+        self._pending.append(entry)
+        # Grants in priority order, or arms the refill timer.
+        self._dispatch()
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # Granted just as we were cancelled: give the slots back.
+                self.release(count)
+            elif entry in self._pending:
+                self._pending.remove(entry)
+                self._dispatch()
+            raise
+
+    def release(self, count: int = 1) -> None:
+        """Creations finished (or failed); let queued requests in."""
+        if count <= 0:
+            return
+        self._in_flight = max(0, self._in_flight - count)
+        self._dispatch()
+
+    @contextlib.asynccontextmanager
+    async def slots(self, function_name: str, count: int = 1) -> AsyncIterator[None]:
+        await self.acquire(function_name, count)
+        try:
+            yield
+        finally:
+            self.release(max(1, count))
+
+    def _refill(self) -> None:
+        if self.rate <= 0:
+            return
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _missing_tokens(self, count: int) -> float:
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        return max(0.0, min(count, self.burst) - self._tokens)
+
+    def _can_grant(self, count: int) -> bool:
+        if self.max_in_flight > 0 and self._in_flight > 0:
+            if self._in_flight + count > self.max_in_flight:
+                return False
+        return self._missing_tokens(count) <= 0
+
+    def _grant(self, function_name: str, count: int, wait: float, queued: bool) -> None:
+        if self.rate > 0:
+            self._tokens -= count
+        self._in_flight += count
+        latency = self._latency.get(function_name)
+        if latency is None:
+            latency = self._latency[function_name] = _QueueLatency()
+        latency.record(wait, queued)
+
+    def _dispatch(self) -> None:
+        """Grant queued requests, deepest waiter queue first."""
+        while self._pending:
+            entry = max(
+                self._pending,
+                key=lambda p: (self.queue_depth(p.function_name), -p.seq),
+            )
+            if entry.future.done():
+                self._pending.remove(entry)
+                continue
+            if not self._can_grant(entry.count):
+                self._wake_for_tokens(entry.count)
+                return
+            self._pending.remove(entry)
+            self._grant(
+                entry.function_name,
+                entry.count,
+                time.monotonic() - entry.enqueued_at,
+                queued=True,
+            )
+            entry.future.set_result(None)
+
+    def _wake_for_tokens(self, count: int) -> None:
+        """Re-run dispatch once the bucket has refilled (in-flight releases dispatch anyway)."""
+        missing = self._missing_tokens(count)
+        if missing <= 0 or self._timer is not None:
+            return
+
+        def _fire() -> None:
+            self._timer = None
+            self._dispatch()
+
+        self._timer = asyncio.get_running_loop().call_later(missing / self.rate, _fire)
+
+    def stats(self) -> Dict[str, Any]:
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self._in_flight,
+            "tokens": round(self._tokens, 2) if self.rate > 0 else None,
+            "queued": sum(p.count for p in self._pending),
+            "functions": {name: lat.stats() for name, lat in self._latency.items()},
+        }
@@ -0,0 +1,81 @@
+"""
+Worker recycling policy - bound how long one container serves a function
+
+functions.yml may declare limits next to the pool size:
+
+    scaling:
+      max_capacity: 10
+      recycle:
+        max_invocations: 1000     # invocations served by one container
+        max_age: 3600             # seconds since the container was created
+        memory_high_water: 0.8    # fraction of the container memory limit
+
+Handlers with slow leaks (module-level caches, global lists) otherwise grow
+until the container is OOM-killed. A worker due for recycling keeps serving
+until its replacement is ready, so nobody pays a cold start for it; then it
+is removed from the pool and deleted.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from services.common.models.internal import ContainerMetrics, WorkerInfo
+
+
+@dataclass(frozen=True, slots=True)
+class RecyclePolicy:
+    """Recycling limits of one function (0 disables a limit)."""
+
+    max_invocations: int = 0
+    max_age: float = 0.0
+    memory_high_water: float = 0.0
+
+    def due(self, worker: WorkerInfo, now: float) -> Optional[str]:
+        """Why `worker` is due by invocation count or age (`now`: Unix time), or None."""
+        if self.max_invocations and worker.invocations >= self.max_invocations:
+            return f"{worker.invocations} invocations"
+        if self.max_age and worker.created_at and now - worker.created_at >= self.max_age:
+            return f"age {now - worker.created_at:.0f}s"
+        return None
+
+    def memory_due(self, metrics: ContainerMetrics) -> Optional[str]:
+        """Why the container is due by its memory usage, or None."""
+        if not self.memory_high_water:
+            return None
+        if metrics.oom_events:
+            return f"{metrics.oom_events} OOM events"
+        if metrics.memory_max and (
+            metrics.memory_current >= self.memory_high_water * metrics.memory_max
+        ):
+            return f"memory at {metrics.memory_current / metrics.memory_max:.0%} of the limit"
+        return None
+
+
+def parse_recycle_policy(value: Any) -> Optional[RecyclePolicy]:
+    """
+    Parse the `scaling.recycle` mapping of functions.yml.
+
+    Returns None when absent or when every limit is off.
+
+    Raises:
+        ValueError: the mapping is malformed
+    """
+    if not value:
+        return None
+    if not isinstance(value, dict):
+        raise ValueError("recycle must be a mapping")
+    try:
+        policy = RecyclePolicy(
+            max_invocations=max(0, int(value.get("max_invocations") or 0)),
+            max_age=max(0.0, float(value.get("max_age") or 0)),
+            memory_high_water=float(value.get("memory_high_water") or 0),
+        )
+    except (TypeError, ValueError):
+        raise ValueError(f"recycle limits must be numbers, got {value!r}") from None
+    if not 0 <= policy.memory_high_water <= 1:
+        raise ValueError(
+            f"recycle memory_high_water must be a fraction, got {policy.memory_high_water}"
+        )
+    if not (policy.max_invocations or policy.max_age or policy.memory_high_water):
+        return None
+    return policy
@@ -0,0 +1,161 @@
+"""
+Pinned RIE transports.
+
+Each worker gets its own httpx client holding a single persistent HTTP/1.1
+keep-alive connection. The connection is opened right after the readiness
+check and reused for every invocation on that worker, so warm invocations
+never pay for a TCP handshake and never compete for the shared client's
+global keep-alive slots.
+
+A worker serves one invocation at a time (it is acquired exclusively from
+its ContainerPool), so one connection per worker is the whole budget.
+Transports are closed when their worker is deleted or evicted; leftovers of
+workers that went away unnoticed are closed by retain() during reconciliation.
+"""
+
+import logging
+import time
+from typing import Any, Collection, Dict, Optional
+
+import httpx
+
+from services.common.models.internal import WorkerInfo
+
+logger = logging.getLogger("gateway.rie_transport")
+
+# Path used to open the connection. RIE answers 404 without invoking the function.
+_WARM_PATH = "/"
+
+
+class _TimedTransport(httpx.AsyncHTTPTransport):
+    """AsyncHTTPTransport that reports connect and TTFB timings via httpcore traces."""
+
+    def __init__(self, owner: "WorkerTransport", **kwargs: Any):
+        super().__init__(**kwargs)
+        self._owner = owner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"] = self._owner._trace
+        return await super().handle_async_request(request)
+
+
+class WorkerTransport:
+    """One pinned keep-alive connection to a worker's RIE."""
+
+    def __init__(self, worker: WorkerInfo, timeout: float):
+        self.worker_id = worker.id
+        self.opened_at = time.monotonic()
+        self.base_url = f"http://{worker.ip_address}:{worker.port}"
+        self.client = httpx.AsyncClient(
+            transport=_TimedTransport(
+                self,
+                limits=httpx.Limits(
+                    max_connections=1, max_keepalive_connections=1, keepalive_expiry=None
+                ),
+            ),
+            timeout=timeout,
+        )
+        self.connects = 0
+        self.requests = 0
+        self.last_connect_ms: Optional[float] = None
+        self.last_ttfb_ms: Optional[float] = None
+        self._connect_started = 0.0
+        self._request_started = 0.0
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.started":
+            self._connect_started = time.perf_counter()
+        elif event_name == "connection.connect_tcp.complete":
+            self.connects += 1
+            self.last_connect_ms = (time.perf_counter() - self._connect_started) * 1000
+        elif event_name == "http11.send_request_headers.started":
+            self._request_started = time.perf_counter()
+        elif event_name == "http11.receive_response_headers.complete":
+            self.requests += 1
+            self.last_ttfb_ms = (time.perf_counter() - self._request_started) * 1000
+
+    async def warm(self) -> None:
+        """Open the keep-alive connection (failures are left to the first invocation)."""
+        try:
+            response = await self.client.get(self.base_url + _WARM_PATH)
+            await response.aclose()
+        except httpx.HTTPError as e:
+            logger.debug(f"Warm-up connection to {self.base_url} failed: {e}")
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "worker_id": self.worker_id,
+            "connects": self.connects,
+            "requests": self.requests,
+            "last_connect_ms": self.last_connect_ms,
+            "last_ttfb_ms": self.last_ttfb_ms,
+        }
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class RieTransportPool:
+    """
+    Per-worker transports keyed by worker id.
+
+    Shared by GrpcProvisionClient (opens a transport after readiness, closes
+    it on delete) and LambdaInvoker (sends invocations through it).
+    """
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._transports: Dict[str, WorkerTransport] = {}
+
+    def get(self, worker: WorkerInfo) -> Optional[WorkerTransport]:
+        return self._transports.get(worker.id)
+
+    async def open(self, worker: WorkerInfo) -> WorkerTransport:
+        """Create (or return) the worker's transport and open its connection."""
+        transport = self._transports.get(worker.id)
+        if transport is not None:
+            return transport
+
+        transport = WorkerTransport(worker, self.timeout)
+        self._transports[worker.id] = transport
+        await transport.warm()
+        if transport.last_connect_ms is not None:
+            logger.debug(
+                f"Pinned RIE connection for {worker.name} ({transport.last_connect_ms:.1f}ms)"
+            )
+        return transport
+
+    async def close(self, worker_id: str) -> None:
+        transport = self._transports.pop(worker_id, None)
+        if transport is not None:
+            await transport.aclose()
+
+    async def retain(self, worker_ids: Collection[str], grace: float = 0.0) -> int:
+        """
+        Close transports of workers no pool manages anymore.
+
+        Transports opened within `grace` seconds are kept: their worker may
+        still be on its way into a pool.
+
+        Returns:
+            Number of transports closed
+        """
+        now = time.monotonic()
+        stale = [
+            worker_id
+            for worker_id, transport in self._transports.items()
+            if worker_id not in worker_ids and now - transport.opened_at >= grace
+        ]
+        for worker_id in stale:
+            await self.close(worker_id)
+        return len(stale)
+
+    async def aclose(self) -> None:
+        transports = list(self._transports.values())
+        self._transports.clear()
+        for transport in transports:
+            await transport.aclose()
+
+    def stats(self) -> Dict[str, Any]:
+        return {worker_id: t.stats for worker_id, t in self._transports.items()}
@@ -3,6 +3,10 @@ Route matching service.
 
 Loads routing.yml and resolves target containers from request paths/methods.
 
+Routes are compiled once at load time into a per-method segment trie, so
+matching costs O(path segments) regardless of how many routes are defined.
+Recent (method, path) resolutions are kept in a bounded LRU cache.
+
 Note:
     Provides functionality different from FastAPI's APIRouter.
     This module implements config-based route matching logic.
@@ -12,25 +16,159 @@ import re
 from typing import Optional, Tuple, Dict, Any, List
 import yaml
 import logging
+from cachetools import LRUCache
 
 from ..config import config
 
 logger = logging.getLogger(__name__)
 
+# A segment that is exactly "{param}".
+_PARAM_SEGMENT = re.compile(r"^\{(\w+)\}$")
+# "{param}" embedded in a segment with static text (e.g. "{name}.json").
+_EMBEDDED_PARAM = re.compile(r"\{(\w+)\}")
+
+
+class _CompiledRoute:
+    """A routing.yml entry resolved at load time."""
+
+    __slots__ = ("route_path", "target_container", "function_ref", "response_stream")
+
+    def __init__(
+        self,
+        route_path: str,
+        target_container: str,
+        function_ref: Any,
+        response_stream: bool = False,
+    ):
+        self.route_path = route_path
+        self.target_container = target_container
+        # str (new format, resolved via registry) or dict (old format).
+        self.function_ref = function_ref
+        # Forward the Lambda output to the client as it is produced.
+        self.response_stream = response_stream
+
+
+class _RouteNode:
+    """
+    One path segment in the route trie.
+
+    Lookup precedence per segment: static text, then segments mixing text and
+    params (e.g. "{name}.json"), then a bare "{param}" segment.
+    """
+
+    __slots__ = ("static", "patterns", "param_name", "param_child", "route")
+
+    def __init__(self):
+        self.static: Dict[str, "_RouteNode"] = {}
+        self.patterns: List[Tuple[re.Pattern, "_RouteNode"]] = []
+        self.param_name: Optional[str] = None
+        self.param_child: Optional["_RouteNode"] = None
+        self.route: Optional[_CompiledRoute] = None
+
+    def child_for(self, segment: str) -> "_RouteNode":
+        """Get or create the child node for a route pattern segment."""
+        param = _PARAM_SEGMENT.match(segment)
+        if param:
+            name = param.group(1)
+            if self.param_child is None:
+                self.param_name = name
+                self.param_child = _RouteNode()
+            elif self.param_name != name:
+                # Same position, different name: keep the first declared name
+                # so existing lookups stay stable.
+                logger.warning(
+                    f"Conflicting path parameter names '{{{self.param_name}}}' and "
+                    f"'{{{name}}}' at the same position; using '{{{self.param_name}}}'"
+                )
+            return self.param_child
+
+        if "{" in segment:
+            regex = _segment_to_regex(segment)
+            for pattern, node in self.patterns:
+                if pattern.pattern == regex:
+                    return node
+            node = _RouteNode()
+            self.patterns.append((re.compile(regex), node))
+            return node
+
+        node = self.static.get(segment)
+        if node is None:
+            node = _RouteNode()
+            self.static[segment] = node
+        return node
+
+
+def _segment_to_regex(segment: str) -> str:
+    """
+    Convert a single mixed segment to a regular expression.
+
+    Example: "{name}.json" → "^(?P<name>[^/]+)\\.json$"
+    """
+    parts = []
+    last = 0
+    for match in _EMBEDDED_PARAM.finditer(segment):
+        parts.append(re.escape(segment[last : match.start()]))
+        parts.append(f"(?P<{match.group(1)}>[^/]+)")
+        last = match.end()
+    parts.append(re.escape(segment[last:]))
+    return f"^{''.join(parts)}$"
+
+
+def _lookup(
+    node: _RouteNode, segments: List[str], index: int, params: Dict[str, str]
+) -> Optional[_CompiledRoute]:
+    """Depth-first trie walk; backtracks when a more specific branch dead-ends."""
+    if index == len(segments):
+        return node.route
+
+    segment = segments[index]
+
+    child = node.static.get(segment)
+    if child is not None:
+        found = _lookup(child, segments, index + 1, params)
+        if found is not None:
+            return found
+
+    if not segment:
+        # Parameters never match an empty segment (same as "[^/]+").
+        return None
+
+    for pattern, child in node.patterns:
+        match = pattern.match(segment)
+        if match:
+            found = _lookup(child, segments, index + 1, params)
+            if found is not None:
+                params.update(match.groupdict())
+                return found
+
+    if node.param_child is not None:
+        found = _lookup(node.param_child, segments, index + 1, params)
+        if found is not None:
+            params[node.param_name] = segment
+            return found
+
+    return None
+
 
 class RouteMatcher:
-    def __init__(self, function_registry: Any):
+    def __init__(self, function_registry: Any, cache_size: Optional[int] = None):
         """
         Args:
             function_registry: FunctionRegistry instance
+            cache_size: max entries of the (method, path) resolution cache
         """
         self.function_registry = function_registry
         self.config_path = config.ROUTING_CONFIG_PATH
         self._routing_config: List[Dict[str, Any]] = []
+        self._index: Dict[str, _RouteNode] = {}
+        self._loaded = False
+        if cache_size is None:
+            cache_size = config.ROUTE_CACHE_SIZE
+        self._cache: LRUCache = LRUCache(maxsize=max(1, cache_size))
 
     def load_routing_config(self) -> List[Dict[str, Any]]:
         """
-        Load routing.yml and cache it.
+        Load routing.yml, compile the route index and reset the resolution cache.
         """
         try:
             with open(self.config_path, "r", encoding="utf-8") as f:
@@ -44,18 +182,62 @@ class RouteMatcher:
             logger.error(f"Error parsing routing config: {e}")
             self._routing_config = []
 
+        self._index = self._compile(self._routing_config)
+        self._cache.clear()
+        self._loaded = True
+
         return self._routing_config
 
-    def _path_to_regex(self, path_pattern: str) -> str:
-        """
-        Convert a path pattern to a regular expression.
+    def _compile(self, routes: List[Dict[str, Any]]) -> Dict[str, _RouteNode]:
+        """Build the method-keyed segment trie from route definitions."""
+        index: Dict[str, _RouteNode] = {}
+        for route in routes:
+            route_path = route.get("path", "")
+            route_method = route.get("method", "").upper()
 
-        Example: "/users/{user_id}/posts/{post_id}"
-            → "^/users/(?P<user_id>[^/]+)/posts/(?P<post_id>[^/]+)$"
-        """
-        # Replace {param} with named capture groups.
-        regex_pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path_pattern)
-        return f"^{regex_pattern}$"
+            # Get function reference (new format: string, old format: dict).
+            function_ref = route.get("function", {})
+            if isinstance(function_ref, str):
+                target_container = function_ref
+            else:
+                target_container = function_ref.get("container", "")
+
+            node = index.setdefault(route_method, _RouteNode())
+            for segment in route_path.split("/"):
+                node = node.child_for(segment)
+
+            if node.route is not None:
+                # Keep first-declared route, as the linear scan used to.
+                logger.warning(
+                    f"Duplicate route {route_method} {route_path} ignored "
+                    f"(already mapped to {node.route.target_container})"
+                )
+                continue
+            node.route = _CompiledRoute(
+                route_path,
+                target_container,
+                function_ref,
+                response_stream=bool(route.get("response_stream", False)),
+            )
+
+        return index
+
+    def _resolve(self, request_path: str, method: str) -> Tuple[Optional[_CompiledRoute], Dict]:
+        """Resolve (route, path_params) through the LRU cache."""
+        key = (method, request_path)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        route = None
+        params: Dict[str, str] = {}
+        root = self._index.get(method)
+        if root is not None:
+            route = _lookup(root, request_path.split("/"), 0, params)
+
+        resolved = (route, params if route is not None else {})
+        self._cache[key] = resolved
+        return resolved
 
     def match_route(
         self, request_path: str, request_method: str
@@ -74,38 +256,31 @@ class RouteMatcher:
                 - route_path: matched route pattern (for resource)
                 - function_config: function settings (image, environment, etc.)
         """
-        if not self._routing_config:
+        if not self._loaded:
             self.load_routing_config()
 
-        for route in self._routing_config:
-            route_path = route.get("path", "")
-            route_method = route.get("method", "").upper()
-
-            # Check if method matches.
-            if request_method.upper() != route_method:
-                continue
+        route, params = self._resolve(request_path, request_method.upper())
+        if route is None:
+            # No matching route found.
+            return None, {}, None, {}
 
-            # Convert path pattern to regex and match.
-            regex_pattern = self._path_to_regex(route_path)
-            match = re.match(regex_pattern, request_path)
+        if isinstance(route.function_ref, str):
+            # New format: fetch config from function_registry.
+            function_config = self.function_registry.get_function_config(route.function_ref) or {}
+        else:
+            # Old format (backward compatible): use dict directly.
+            function_config = route.function_ref
 
-            if match:
-                # Extract path parameters.
-                path_params = match.groupdict()
+        # Copy so callers cannot mutate cached params.
+        return route.target_container, dict(params), route.route_path, function_config
 
-                # Get function config (new format: string, old format: dict).
-                function_ref = route.get("function", {})
-
-                if isinstance(function_ref, str):
-                    # New format: fetch config from function_registry.
-                    target_container = function_ref
-                    function_config = self.function_registry.get_function_config(function_ref) or {}
-                else:
-                    # Old format (backward compatible): use dict directly.
-                    target_container = function_ref.get("container", "")
-                    function_config = function_ref
-
-                return target_container, path_params, route_path, function_config
+    def is_response_stream(self, request_path: str, request_method: str) -> bool:
+        """
+        Whether the route matching the request opted into response streaming
+        (`response_stream: true` in routing.yml).
+        """
+        if not self._loaded:
+            self.load_routing_config()
 
-        # No matching route found.
-        return None, {}, None, {}
+        route, _ = self._resolve(request_path, request_method.upper())
+        return route is not None and route.response_stream
@@ -0,0 +1,78 @@
+"""
+Warm-up invocations.
+
+RIE starts the runtime and imports the handler module on the first
+invocation, so the first request on a new container pays module import and
+init on top of the container start. PoolManager sends one internal warm-up
+invocation right after provisioning instead; sitecustomize.py recognises the
+ClientContext marker and answers it without calling the handler.
+"""
+
+import base64
+import logging
+from typing import Optional
+
+import httpx
+
+from services.common.core import json_codec
+from services.common.models.internal import WorkerInfo
+from services.gateway.services.rie_transport import RieTransportPool
+
+logger = logging.getLogger("gateway.warmup")
+
+# Must match WARMUP_CONTEXT_KEY in sitecustomize.py.
+WARMUP_CONTEXT_KEY = "esb_warmup"
+
+WARMUP_HEADERS = {
+    "X-Amz-Client-Context": base64.b64encode(
+        json_codec.dumps({"custom": {WARMUP_CONTEXT_KEY: "1"}})
+    ).decode("ascii"),
+}
+
+
+class WarmupInvoker:
+    """Sends the post-provisioning warm-up invocation to a worker's RIE."""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        timeout: float,
+        transports: Optional[RieTransportPool] = None,
+    ):
+        """
+        Args:
+            client: shared httpx.AsyncClient (used when the worker has no pinned transport)
+            timeout: warm-up invocation timeout (seconds), covering runtime start and init
+            transports: pinned per-worker RIE transports
+        """
+        self.client = client
+        self.timeout = timeout
+        self.transports = transports
+
+    async def warm(self, function_name: str, worker: WorkerInfo) -> bool:
+        """
+        Invoke the worker once so RIE starts the runtime and imports the handler.
+
+        A failure only leaves the worker uninitialized (its first real
+        invocation pays the init as before); it never fails the provision.
+        """
+        transport = self.transports.get(worker) if self.transports is not None else None
+        client = transport.client if transport is not None else self.client
+        url = f"http://{worker.ip_address}:{worker.port}/2015-03-31/functions/function/invocations"
+        try:
+            response = await client.post(
+                url, content=b"{}", headers=WARMUP_HEADERS, timeout=self.timeout
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"Warm-up invocation of {worker.id} for {function_name} failed: {e}")
+            return False
+
+        if response.status_code != 200 or response.headers.get("X-Amz-Function-Error"):
+            logger.warning(
+                f"Warm-up invocation of {worker.id} for {function_name} returned "
+                f"{response.status_code}: {response.text[:100]}"
+            )
+            return False
+
+        worker.initialized = True
+        return True
@@ -34,3 +34,73 @@ def main_app():
 def client(main_app):
     with TestClient(main_app) as client:
         yield client
+
+
+@pytest.fixture
+def stub_invocation_plans():
+    """
+    Derive get_invocation_plan from a mocked registry's get_function_config.
+
+    Plans are built lazily (so tests may set return_value after wiring) and
+    cached per function name, like FunctionRegistry does at load time.
+    """
+    from services.gateway.services.function_registry import build_invocation_plan
+
+    def _stub(registry):
+        plans = {}
+
+        def _lookup(function_name):
+            if function_name not in plans:
+                func_config = registry.get_function_config(function_name)
+                if func_config is None:
+                    return None
+                plans[function_name] = build_invocation_plan(function_name, func_config)
+            return plans[function_name]
+
+        registry.get_invocation_plan.side_effect = _lookup
+        return registry
+
+    return _stub
+
+
+@pytest.fixture
+def pool_manager_factory():
+    """
+    Build a PoolManager over a mocked provision client.
+
+    Each provision call returns one new worker (c0, c1, ...). The config loader
+    returns `scaling` on top of max_capacity=2 / min_capacity=0 for every
+    function; `options` go to the PoolManager constructor.
+    """
+    import itertools
+    from unittest.mock import AsyncMock, MagicMock
+
+    from services.common.models.internal import WorkerInfo
+    from services.gateway.services.pool_manager import PoolManager
+
+    def _make(scaling=None, **options):
+        ids = itertools.count()
+        client = MagicMock(
+            spec=[
+                "provision",
+                "delete_container",
+                "pause_container",
+                "resume_container",
+                "get_container_metrics",
+            ]
+        )
+        client.provision = AsyncMock(
+            side_effect=lambda fn: [
+                WorkerInfo(id=f"c{next(ids)}", name=f"lambda-{fn}-x", ip_address="10.0.0.1")
+            ]
+        )
+        client.delete_container = AsyncMock()
+        client.pause_container = AsyncMock()
+        client.resume_container = AsyncMock()
+        client.get_container_metrics = AsyncMock()
+        loader = MagicMock(
+            return_value={"scaling": {"max_capacity": 2, "min_capacity": 0, **(scaling or {})}}
+        )
+        return PoolManager(client, loader, **options), client
+
+    return _make
@@ -0,0 +1,104 @@
+"""
+Tests for the per-function adaptive concurrency limiter.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.gateway.config import GatewayConfig
+from services.gateway.core.adaptive_limiter import (
+    AdaptiveLimiter,
+    ConcurrencyLimitExceededError,
+)
+from services.gateway.core.exceptions import AdmissionRejectedError
+from services.gateway.services.function_registry import FunctionRegistry
+from services.gateway.services.lambda_invoker import LambdaInvoker
+
+
+def _saturate(limiter, rtt, samples):
+    """Record samples while the limit is fully used."""
+    for _ in range(samples):
+        limiter.in_flight = limiter.limit
+        limiter.record(rtt)
+    limiter.in_flight = 0
+
+
+def test_limit_shrinks_when_rtt_rises_and_recovers():
+    limiter = AdaptiveLimiter(max_limit=20, tolerance=1.5)
+    _saturate(limiter, 0.1, 10)
+    assert limiter.limit == 20
+    assert limiter.min_rtt == pytest.approx(0.1)
+
+    # Downstream slows down 4x: the limit backs off.
+    _saturate(limiter, 0.4, 40)
+    assert limiter.limit < 12
+
+    # Latency is back to the baseline: the limit grows back to max_capacity.
+    _saturate(limiter, 0.1, 80)
+    assert limiter.limit == 20
+
+
+def test_limit_does_not_grow_while_unused():
+    limiter = AdaptiveLimiter(max_limit=20, tolerance=1.5)
+    _saturate(limiter, 0.1, 1)
+    _saturate(limiter, 0.4, 40)
+    shrunk = limiter.limit
+    assert shrunk < 20
+
+    for _ in range(50):
+        limiter.record(0.1)  # in_flight == 0: fast, but nobody needs more
+    assert limiter.limit == shrunk
+
+
+def test_drop_backs_off_multiplicatively():
+    limiter = AdaptiveLimiter(max_limit=10)
+    limiter.record_drop()
+    assert limiter.limit == 9
+    for _ in range(50):
+        limiter.record_drop()
+    assert limiter.limit == limiter.min_limit == 1
+
+
+def test_min_rtt_is_rebaselined_every_window():
+    limiter = AdaptiveLimiter(max_limit=4, window=5)
+    limiter.record(0.05)
+    for _ in range(9):
+        limiter.record(0.2)
+    assert limiter.min_rtt == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+async def test_rejects_over_limit_and_queues_waiters():
+    limiter = AdaptiveLimiter(max_limit=1)
+    await limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.acquire()
+    assert limiter.stats()["rejected"] == 1
+
+    waiter = asyncio.create_task(limiter.acquire(wait=True))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    limiter.release()
+    await waiter
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_invoker_rejects_with_429_when_limit_is_in_use(stub_invocation_plans):
+    registry = MagicMock(spec=FunctionRegistry)
+    registry.get_function_config.return_value = {"image": "img", "scaling": {"max_capacity": 1}}
+    stub_invocation_plans(registry)
+    invoker = LambdaInvoker(
+        AsyncMock(), registry, GatewayConfig(), AsyncMock(), adaptive_concurrency=True
+    )
+
+    limiter = await invoker._acquire_limit("f", registry.get_invocation_plan("f"), "sync")
+    with pytest.raises(AdmissionRejectedError):
+        await invoker.invoke_function("f", b"{}")
+    invoker.backend.acquire_worker.assert_not_called()
+
+    limiter.release()
+    assert invoker.limiter_stats()["f"]["rejected"] == 1
@@ -0,0 +1,46 @@
+"""
+Tests for predictive scale-out (PredictiveAutoscaler).
+"""
+
+import math
+
+from services.gateway.services.autoscaler import PredictiveAutoscaler
+
+
+def _ramp(autoscaler, rates, service_time=0.5):
+    """Feed per-second arrival counts with a fixed service time."""
+    autoscaler.observe(now=0.0)
+    load = autoscaler._load("f")
+    load.service_time = service_time
+    for second, arrivals in enumerate(rates, start=1):
+        load.arrivals = arrivals
+        autoscaler.observe(now=float(second))
+
+
+def test_rising_arrival_rate_forecasts_ahead_of_current_load():
+    autoscaler = PredictiveAutoscaler(horizon=5.0, cooldown=0.0)
+    _ramp(autoscaler, [2, 4, 6, 8])
+
+    count = autoscaler.plan("f", busy=2, warm=2, max_capacity=20, now=10.0)
+
+    load = autoscaler._loads["f"]
+    # The trend pushes the forecast past the smoothed rate x service time.
+    assert load.rate_trend > 0
+    assert load.predicted > load.rate_level * 0.5
+    assert count == math.ceil(load.predicted) - 2
+
+
+def test_plan_is_capped_by_max_capacity_and_cooldown():
+    autoscaler = PredictiveAutoscaler(horizon=5.0, cooldown=10.0)
+    _ramp(autoscaler, [10, 20, 40])
+
+    assert autoscaler.plan("f", busy=1, warm=1, max_capacity=4, now=10.0) == 3
+    assert autoscaler.plan("f", busy=1, warm=1, max_capacity=4, now=15.0) == 0
+    assert autoscaler.plan("f", busy=1, warm=1, max_capacity=4, now=20.0) == 3
+
+
+def test_falling_arrival_rate_never_scales_out():
+    autoscaler = PredictiveAutoscaler(horizon=5.0, cooldown=0.0)
+    _ramp(autoscaler, [8, 4, 1, 0])
+
+    assert autoscaler.plan("f", busy=1, warm=3, max_capacity=10, now=10.0) == 0
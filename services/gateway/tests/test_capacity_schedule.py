@@ -0,0 +1,76 @@
+"""
+Tests for scheduled provisioned concurrency (capacity schedule windows).
+"""
+
+import datetime
+
+import pytest
+
+from services.gateway.services.capacity_schedule import (
+    parse_capacity_schedule,
+    scheduled_floor,
+)
+
+UTC = datetime.timezone.utc
+
+
+def _at(hour, minute=0, day=19):
+    # 2026-10-19 is a Monday.
+    return datetime.datetime(2026, 10, day, hour, minute, tzinfo=UTC)
+
+
+SHIFT = parse_capacity_schedule(
+    [
+        {
+            "name": "shift-start",
+            "start": "08:00",
+            "end": "12:00",
+            "min_capacity": 10,
+            "days": "mon-fri",
+            "ramp": 600,
+        },
+        {"name": "batch", "start": "23:30", "end": "01:00", "min_capacity": 3},
+    ]
+)
+
+
+def test_floor_is_raised_inside_window_and_lowered_after():
+    assert scheduled_floor(SHIFT, 1, now=_at(9)) == 10
+    assert scheduled_floor(SHIFT, 1, now=_at(12)) == 1
+    # Saturday: the weekday window does not apply.
+    assert scheduled_floor(SHIFT, 1, now=_at(9, day=24)) == 1
+
+
+def test_floor_ramps_up_before_window_start():
+    assert scheduled_floor(SHIFT, 1, now=_at(7, 45)) == 1
+    assert scheduled_floor(SHIFT, 1, now=_at(7, 55)) == 6
+    assert scheduled_floor(SHIFT, 1, now=_at(8)) == 10
+
+
+def test_window_wraps_midnight():
+    assert scheduled_floor(SHIFT, 0, now=_at(23, 45)) == 3
+    assert scheduled_floor(SHIFT, 0, now=_at(0, 30, day=20)) == 3
+    assert scheduled_floor(SHIFT, 0, now=_at(1, day=20)) == 0
+
+
+def test_window_timezone():
+    windows = parse_capacity_schedule(
+        [{"start": "08:00", "end": "09:00", "min_capacity": 2, "timezone": "Asia/Tokyo"}]
+    )
+    # 08:30 JST == 23:30 UTC the day before.
+    assert scheduled_floor(windows, 0, now=_at(23, 30, day=18)) == 2
+    assert scheduled_floor(windows, 0, now=_at(8, 30)) == 0
+
+
+@pytest.mark.parametrize(
+    "entry",
+    [
+        {"start": "08:00", "min_capacity": 1},
+        {"start": "8am", "end": "09:00", "min_capacity": 1},
+        {"start": "08:00", "end": "09:00", "min_capacity": 1, "days": ["someday"]},
+        {"start": "08:00", "end": "09:00", "min_capacity": 1, "timezone": "Mars/Base"},
+    ],
+)
+def test_invalid_entries_are_rejected(entry):
+    with pytest.raises(ValueError):
+        parse_capacity_schedule([entry])
@@ -8,7 +8,7 @@ from services.gateway.config import GatewayConfig
 
 
 @pytest.mark.asyncio
-async def test_circuit_breaker_on_rie_200_error_FINAL():
+async def test_circuit_breaker_on_rie_200_error_FINAL(stub_invocation_plans):
     config = GatewayConfig(
         JWT_SECRET_KEY="test-secret-key-32-chars-long-!!!",
         X_API_KEY="test",
@@ -23,6 +23,7 @@ async def test_circuit_breaker_on_rie_200_error_FINAL():
     mock_client = httpx.AsyncClient()
     registry = MagicMock()  # It's used synchronously in LambdaInvoker
     registry.get_function_config.return_value = {"image": "test", "environment": {}}
+    stub_invocation_plans(registry)
 
     from services.common.models.internal import WorkerInfo
 
@@ -88,3 +88,38 @@ class TestCircuitBreaker:
 
         assert breaker.state == "OPEN"
         # Failure in HALF_OPEN should return to OPEN immediately.
+
+    @pytest.mark.asyncio
+    async def test_forgive_closes_circuit_opened_by_ejected_worker(self):
+        """Failures of an ejected worker are taken back; the circuit closes."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+
+        async def failing_func():
+            raise ValueError("boom")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await breaker.call(failing_func)
+        assert breaker.state == "OPEN"
+
+        breaker.forgive(2, breaker.generation)
+        assert breaker.failures == 1
+        assert breaker.state == "CLOSED"
+
+    @pytest.mark.asyncio
+    async def test_forgive_ignores_failures_from_before_reset(self):
+        """Failures counted before the last reset cannot be taken back again."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30)
+        stale = breaker.generation
+
+        async def failing_func():
+            raise ValueError("boom")
+
+        breaker.reset()
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await breaker.call(failing_func)
+
+        breaker.forgive(2, stale)
+        assert breaker.failures == 3
+        assert breaker.state == "OPEN"
@@ -118,3 +118,98 @@ async def test_concurrency_manager_with_registry():
     assert manager.get_throttle("func_default").limit == 10
     # 4. Unknown
     assert manager.get_throttle("unknown").limit == 10
+
+
+class TestConcurrencyBudget:
+    """Node-wide container budget shared by ContainerPools."""
+
+    @staticmethod
+    def _pools(budget, **reserved):
+        import itertools
+        from services.common.models.internal import WorkerInfo
+        from services.gateway.services.container_pool import ContainerPool
+
+        ids = itertools.count()
+
+        async def provision(function_name):
+            return [WorkerInfo(id=f"{function_name}-{next(ids)}", name="", ip_address="")]
+
+        pools = {}
+        for name, (count, weight) in reserved.items():
+            pools[name] = ContainerPool(name, max_capacity=10, acquire_timeout=1.0)
+            budget.register(pools[name], reserved=count, weight=weight)
+        return pools, provision
+
+    @pytest.mark.asyncio
+    async def test_reserved_capacity_is_guaranteed(self):
+        from services.gateway.core.concurrency import ConcurrencyBudget
+
+        budget = ConcurrencyBudget(limit=4)
+        pools, provision = self._pools(budget, a=(2, 1.0), b=(0, 1.0))
+
+        held = [await pools["b"].acquire(provision) for _ in range(2)]
+        assert not pools["b"].has_capacity()
+        # a still gets its reservation although b used up the shared pool.
+        held += [await pools["a"].acquire(provision) for _ in range(2)]
+        assert budget.stats()["shared_used"] == 2
+        assert len(held) == 4
+
+    @pytest.mark.asyncio
+    async def test_freed_capacity_goes_to_lowest_weighted_share(self):
+        from services.gateway.core.concurrency import ConcurrencyBudget
+
+        budget = ConcurrencyBudget(limit=3)
+        pools, provision = self._pools(budget, hot=(0, 1.0), cold=(0, 1.0))
+        hot = [await pools["hot"].acquire(provision) for _ in range(3)]
+
+        hot_waiter = asyncio.create_task(pools["hot"].acquire(provision))
+        cold_waiter = asyncio.create_task(pools["cold"].acquire(provision))
+        await asyncio.sleep(0)
+
+        await pools["hot"].evict(hot[0])
+        worker = await asyncio.wait_for(cold_waiter, 1.0)
+        assert worker.id.startswith("cold")
+        assert not hot_waiter.done()
+
+        await pools["hot"].release(hot[1])
+        assert (await hot_waiter).id == hot[1].id
+
+    @pytest.mark.asyncio
+    async def test_blocked_function_reclaims_idle_container(self):
+        from services.gateway.core.concurrency import ConcurrencyBudget
+
+        reclaimed = []
+        budget = ConcurrencyBudget(limit=2)
+        pools, provision = self._pools(budget, hot=(0, 1.0), cold=(0, 1.0))
+
+        def reclaim(name):
+            worker = pools[name].reclaim_idle()
+            reclaimed.append(worker)
+            return worker is not None
+
+        budget.reclaim = reclaim
+        for worker in [await pools["hot"].acquire(provision) for _ in range(2)]:
+            await pools["hot"].release(worker)
+
+        worker = await pools["cold"].acquire(provision)
+
+        assert worker.id.startswith("cold")
+        assert len(reclaimed) == 1 and pools["hot"].size == 1
+        assert budget.stats()["functions"]["hot"]["reclaimed"] == 1
+
+    def test_reservations_above_node_limit_are_rejected(self):
+        from services.gateway.core.concurrency import ConcurrencyBudget
+
+        budget = ConcurrencyBudget(limit=4)
+        with pytest.raises(ValueError, match="adds up to 5"):
+            budget.check_reservations({"a": 3, "b": 2, "c": 0})
+
+    def test_reservations_using_whole_limit_warn(self, caplog):
+        from services.gateway.core.concurrency import ConcurrencyBudget
+
+        budget = ConcurrencyBudget(limit=4)
+        with caplog.at_level("WARNING", logger="gateway.concurrency"):
+            budget.check_reservations({"a": 3, "b": 1})
+            assert not caplog.records
+            budget.check_reservations({"a": 3, "b": 1, "c": 0})
+        assert len(caplog.records) == 1 and "c" in caplog.records[0].getMessage()
@@ -257,3 +257,190 @@ class TestContainerPoolConcurrency:
 
         assert len(successes) == 3
         assert len(timeouts) == 2
+
+    @pytest.mark.asyncio
+    async def test_served_waiters_leave_every_queue(self):
+        """Waiters handed a released worker do not pile up in the capacity queue"""
+        from services.common.models.internal import WorkerInfo
+        from services.gateway.services.container_pool import LANES, ContainerPool
+
+        pool = ContainerPool(function_name="test-function", max_capacity=1)
+        await pool.adopt(WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1"))
+        worker = await pool.acquire(AsyncMock())
+
+        async def invoke():
+            held = await pool.acquire(AsyncMock())
+            await asyncio.sleep(0)
+            await pool.release(held)
+
+        tasks = [asyncio.create_task(invoke()) for _ in range(500)]
+        await asyncio.sleep(0)
+        assert pool.waiting == 500
+        await pool.release(worker)
+        await asyncio.gather(*tasks)
+
+        for queue in (pool._waiters, pool._capacity_waiters):
+            assert sum(len(queue._lanes[lane]) for lane in LANES) == 0
+        assert pool.waiting == 0
+
+
+class TestContainerPoolPriorityLanes:
+    """Waiters are served by priority lane; async is capped at its share"""
+
+    @pytest.fixture
+    def pool(self):
+        from services.gateway.services.container_pool import ContainerPool
+
+        return ContainerPool(function_name="test-function", max_capacity=2, async_share=0.5)
+
+    @staticmethod
+    def _provision():
+        from services.common.models.internal import WorkerInfo
+
+        ids = iter(range(100))
+
+        async def provision_callback(fn):
+            i = next(ids)
+            return [WorkerInfo(id=f"c{i}", name=f"w{i}", ip_address="10.0.0.1")]
+
+        return provision_callback
+
+    @pytest.mark.asyncio
+    async def test_interactive_goes_before_older_sync(self, pool):
+        provision = self._provision()
+        held = [await pool.acquire(provision, "sync") for _ in range(2)]
+
+        sync_waiter = asyncio.create_task(pool.acquire(provision, "sync"))
+        await asyncio.sleep(0)
+        interactive_waiter = asyncio.create_task(pool.acquire(provision, "interactive"))
+        await asyncio.sleep(0)
+
+        await pool.release(held[0])
+        assert (await interactive_waiter).id == held[0].id
+        assert not sync_waiter.done()
+        await pool.release(held[1])
+        assert (await sync_waiter).id == held[1].id
+
+    @pytest.mark.asyncio
+    async def test_async_at_its_share_yields_to_sync(self, pool):
+        provision = self._provision()
+        async_worker = await pool.acquire(provision, "async")
+        sync_worker = await pool.acquire(provision, "sync")
+
+        async_waiter = asyncio.create_task(pool.acquire(provision, "async"))
+        await asyncio.sleep(0)
+        sync_waiter = asyncio.create_task(pool.acquire(provision, "sync"))
+        await asyncio.sleep(0)
+
+        # Async already holds its share (1 of 2): the younger sync waiter goes first.
+        await pool.release(sync_worker)
+        assert (await sync_waiter).id == sync_worker.id
+        assert not async_waiter.done()
+
+        await pool.release(async_worker)
+        assert (await async_waiter).id == async_worker.id
+        lanes = pool.stats["lanes"]
+        assert lanes["async"]["acquired"] == 2
+        assert lanes["async"]["in_use"] == 1
+        assert lanes["sync"]["in_use"] == 1
+        assert lanes["sync"]["acquired"] == 2
+        assert lanes["sync"]["max_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_async_below_its_share_keeps_its_turn(self, pool):
+        provision = self._provision()
+        held = [await pool.acquire(provision, "sync") for _ in range(2)]
+
+        async_waiter = asyncio.create_task(pool.acquire(provision, "async"))
+        await asyncio.sleep(0)
+        sync_waiter = asyncio.create_task(pool.acquire(provision, "sync"))
+        await asyncio.sleep(0)
+
+        await pool.release(held[0])
+        assert (await async_waiter).id == held[0].id
+        assert not sync_waiter.done()
+        await pool.release(held[1])
+        assert (await sync_waiter).id == held[1].id
+
+    def test_unknown_lane_is_rejected(self, pool):
+        with pytest.raises(ValueError):
+            asyncio.run(pool.acquire(AsyncMock(), "batch"))
+
+
+class TestContainerPoolAdmission:
+    """Admission control sheds callers that would wait past their deadline"""
+
+    @pytest.fixture
+    def pool(self):
+        from services.gateway.services.container_pool import ContainerPool
+
+        return ContainerPool(
+            function_name="test-function",
+            max_capacity=1,
+            acquire_timeout=1.0,
+            admission_control=True,
+            max_queue=2,
+        )
+
+    @pytest.fixture
+    def held(self, pool):
+        from services.common.models.internal import WorkerInfo
+
+        worker = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")
+        pool._all_workers.add(worker)
+        return worker
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self, pool, held):
+        from services.gateway.core.exceptions import AdmissionRejectedError
+
+        waiters = [asyncio.create_task(pool.acquire(AsyncMock())) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await pool.acquire(AsyncMock())
+        assert excinfo.value.retry_after >= 1.0
+        assert pool.stats["lanes"]["sync"]["rejected"] == 1
+
+        await pool.release(held)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_expected_wait_exceeds_timeout(self, pool, held):
+        from services.gateway.core.exceptions import AdmissionRejectedError
+
+        # Workers are held for 0.8s per invocation: the 2nd in line waits ~1.6s.
+        pool._service_time = 0.8
+        assert pool.expected_wait() == pytest.approx(0.8)
+        first = asyncio.create_task(pool.acquire(AsyncMock()))
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejectedError) as excinfo:
+            await pool.acquire(AsyncMock())
+        assert excinfo.value.retry_after == pytest.approx(1.6)
+
+        await pool.release(held)
+        assert (await first).id == "c1"
+
+    @pytest.mark.asyncio
+    async def test_async_callers_are_never_shed(self, pool, held):
+        pool._service_time = 5.0
+        waiter = asyncio.create_task(pool.acquire(AsyncMock(), "async"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await pool.release(held)
+        assert (await waiter).id == "c1"
+
+    @pytest.mark.asyncio
+    async def test_service_time_is_measured_on_release(self, pool):
+        from services.common.models.internal import WorkerInfo
+
+        provision = AsyncMock(return_value=[WorkerInfo(id="c9", name="w9", ip_address="")])
+        worker = await pool.acquire(provision)
+        await asyncio.sleep(0.02)
+        await pool.release(worker)
+
+        assert pool.service_time >= 0.02
@@ -1,5 +1,7 @@
+import asyncio
 import pytest
 import time
+from unittest.mock import AsyncMock
 from services.gateway.services.container_pool import ContainerPool
 from services.common.models.internal import WorkerInfo
 
@@ -92,7 +94,7 @@ async def test_adopt_respects_max_capacity():
     """
     import asyncio
 
-    pool = ContainerPool("test-func", max_capacity=2, acquire_timeout=0.5)
+    pool = ContainerPool("test-func", max_capacity=2, acquire_timeout=0.5, selection="fifo")
 
     # Adopt 2 workers (should consume both capacity slots)
     w1 = WorkerInfo(id="c1", name="n1", ip_address="1.1.1.1")
@@ -181,3 +183,315 @@ async def test_prune_and_acquire_no_race_condition():
     # After prune + 2 acquires, pool state should be consistent
     # The exact outcome depends on timing, but there should be no crash
     assert pool.size >= 0  # Basic sanity check
+
+
+@pytest.mark.asyncio
+async def test_pool_prune_keeps_min_capacity():
+    """prune_idle_workers never shrinks the pool below min_capacity (oldest go first)."""
+    pool = ContainerPool("test-func", max_capacity=5, min_capacity=2)
+    workers = [WorkerInfo(id=f"c{i}", name=f"n{i}", ip_address="1.1.1.1") for i in range(3)]
+    for w in workers:
+        await pool.adopt(w)
+    for w in workers:
+        w.last_used_at = time.time() - 100
+
+    pruned = await pool.prune_idle_workers(idle_timeout=50.0)
+
+    assert [w.id for w in pruned] == ["c0"]
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_prewarm_fills_to_min_capacity():
+    pool = ContainerPool("test-func", max_capacity=3, min_capacity=2)
+    counter = 0
+
+    async def provision(fname):
+        nonlocal counter
+        counter += 1
+        return [WorkerInfo(id=f"c{counter}", name=f"n{counter}", ip_address="1.1.1.1")]
+
+    assert pool.warm_deficit == 2
+    assert await pool.prewarm(provision) is not None
+    assert await pool.prewarm(provision) is not None
+    assert await pool.prewarm(provision) is None
+
+    assert counter == 2
+    assert pool.stats["idle"] == 2
+    assert pool.warm_deficit == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_races_provision_against_release():
+    """A worker released during a slow provision is used; the late worker goes idle."""
+    pool = ContainerPool("test-func", max_capacity=2, acquire_timeout=5.0)
+    busy = WorkerInfo(id="busy", name="busy", ip_address="1.1.1.1")
+    fresh = WorkerInfo(id="fresh", name="fresh", ip_address="1.1.1.2")
+    provision_gate = asyncio.Event()
+
+    async def instant(fname):
+        return [busy]
+
+    async def slow(fname):
+        await provision_gate.wait()
+        return [fresh]
+
+    assert await pool.acquire(instant) is busy
+
+    acquire_task = asyncio.create_task(pool.acquire(slow))
+    await asyncio.sleep(0.01)
+    assert pool.stats["provisioning"] == 1
+
+    await pool.release(busy)
+    assert await asyncio.wait_for(acquire_task, timeout=1.0) is busy
+
+    provision_gate.set()
+    for _ in range(10):
+        await asyncio.sleep(0)
+    stats = pool.stats
+    assert (stats["total_workers"], stats["idle"], stats["provisioning"]) == (2, 1, 0)
+    assert await pool.acquire(instant) is fresh
+
+
+@pytest.mark.asyncio
+async def test_acquire_provision_failure_still_raises():
+    pool = ContainerPool("test-func", max_capacity=1)
+
+    async def failing(fname):
+        raise RuntimeError("agent down")
+
+    with pytest.raises(RuntimeError):
+        await pool.acquire(failing)
+    assert pool.stats["provisioning"] == 0
+
+
+def _workers(count):
+    return [WorkerInfo(id=f"c{i}", name=f"n{i}", ip_address="1.1.1.1") for i in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_release_hands_worker_to_oldest_waiter():
+    """Waiters are served in arrival order, one released worker per waiter."""
+    pool = ContainerPool("test-func", max_capacity=1, acquire_timeout=5.0)
+    (worker,) = _workers(1)
+    await pool.adopt(worker)
+    held = await pool.acquire(AsyncMock())
+
+    served = []
+
+    async def waiter(tag):
+        w = await pool.acquire(AsyncMock())
+        served.append(tag)
+        await pool.release(w)
+
+    tasks = [asyncio.create_task(waiter(i)) for i in range(5)]
+    await asyncio.sleep(0.01)
+    assert pool.stats["waiting"] == 5
+
+    await pool.release(held)
+    await asyncio.wait_for(asyncio.gather(*tasks), timeout=1.0)
+
+    assert served == [0, 1, 2, 3, 4]
+    assert pool.stats["idle"] == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_waiter_does_not_swallow_worker():
+    pool = ContainerPool("test-func", max_capacity=1, acquire_timeout=0.05)
+    (worker,) = _workers(1)
+    await pool.adopt(worker)
+    held = await pool.acquire(AsyncMock())
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.acquire(AsyncMock())
+    assert pool.stats["waiting"] == 0
+
+    await pool.release(held)
+    assert await pool.is_idle(worker.id)
+
+
+@pytest.mark.asyncio
+async def test_evict_grants_provisioning_slot_to_oldest_waiter():
+    pool = ContainerPool("test-func", max_capacity=1, acquire_timeout=5.0)
+    dead, fresh = _workers(2)
+    await pool.adopt(dead)
+    await pool.acquire(AsyncMock())
+
+    acquire_task = asyncio.create_task(pool.acquire(AsyncMock(return_value=[fresh])))
+    await asyncio.sleep(0.01)
+
+    await pool.evict(dead)
+    assert pool.stats["provisioning"] == 1
+    assert await asyncio.wait_for(acquire_task, timeout=1.0) is fresh
+    assert pool.get_all_workers() == [fresh]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("selection,expected", [("lifo", "c2"), ("fifo", "c0")])
+async def test_idle_selection_order(selection, expected):
+    pool = ContainerPool("test-func", max_capacity=3, selection=selection)
+    for w in _workers(3):
+        await pool.adopt(w)
+
+    assert (await pool.acquire(AsyncMock())).id == expected
+
+
+@pytest.mark.asyncio
+async def test_lifo_lets_surplus_workers_age_out():
+    """Under LIFO a single hot worker keeps serving; the others go stale for the janitor."""
+    pool = ContainerPool("test-func", max_capacity=3)
+    workers = _workers(3)
+    for w in workers:
+        await pool.adopt(w)
+        w.last_used_at = time.time() - 100
+
+    for _ in range(5):
+        await pool.release(await pool.acquire(AsyncMock()))
+
+    pruned = await pool.prune_idle_workers(idle_timeout=50.0)
+    assert [w.id for w in pruned] == ["c0", "c1"]
+    assert await pool.is_idle("c2")
+
+
+@pytest.mark.asyncio
+async def test_acquire_contention_serves_every_acquirer():
+    """1k concurrent acquirers sharing a small pool."""
+    acquirers, capacity = 1000, 8
+    pool = ContainerPool("bench", max_capacity=capacity, acquire_timeout=60.0)
+    for w in _workers(capacity):
+        await pool.adopt(w)
+
+    served = []
+
+    async def invoke():
+        worker = await pool.acquire(AsyncMock())
+        served.append(worker.id)
+        await asyncio.sleep(0)
+        await pool.release(worker)
+
+    await asyncio.gather(*(invoke() for _ in range(acquirers)))
+
+    assert len(served) == acquirers
+    assert pool.stats["idle"] == capacity
+    assert not pool._waiters and not pool._capacity_waiters
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_acquire_contention_benchmark(capsys):
+    """1k concurrent acquirers sharing a small pool; queueing cost stays linear."""
+    capacity = 8
+
+    async def run(acquirers):
+        pool = ContainerPool("bench", max_capacity=capacity, acquire_timeout=60.0)
+        for w in _workers(capacity):
+            await pool.adopt(w)
+
+        waits = []
+
+        async def invoke():
+            started = time.perf_counter()
+            worker = await pool.acquire(AsyncMock())
+            waits.append(time.perf_counter() - started)
+            await asyncio.sleep(0)
+            await pool.release(worker)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(invoke() for _ in range(acquirers)))
+        elapsed = time.perf_counter() - started
+
+        assert len(waits) == acquirers
+        assert pool.stats["idle"] == capacity
+        return elapsed, sorted(waits)
+
+    elapsed, waits = await run(1000)
+    elapsed_4k, _ = await run(4000)
+
+    with capsys.disabled():
+        print(
+            f"\n[container_pool] acquirers=1000 capacity={capacity} "
+            f"total={elapsed * 1000:.1f}ms p50={waits[len(waits) // 2] * 1000:.2f}ms "
+            f"p99={waits[int(len(waits) * 0.99)] * 1000:.2f}ms "
+            f"acquirers=4000 total={elapsed_4k * 1000:.1f}ms"
+        )
+
+    # Waiter bookkeeping is O(1): 4x the acquirers costs ~4x the time, not ~16x.
+    assert elapsed_4k < elapsed * 10
+
+
+@pytest.mark.asyncio
+async def test_cold_burst_provisions_in_one_batch():
+    pool = ContainerPool("test-func", max_capacity=5, max_provision_batch=8)
+    calls = []
+
+    async def provision(fname, count=1):
+        calls.append(count)
+        return [
+            WorkerInfo(id=f"b{len(calls)}-{i}", name=f"n{i}", ip_address="1.1.1.1")
+            for i in range(count)
+        ]
+
+    workers = await asyncio.gather(*(pool.acquire(provision) for _ in range(5)))
+
+    assert calls == [5]
+    assert len({w.id for w in workers}) == 5
+    assert (pool.size, pool.stats["provisioning"]) == (5, 0)
+
+
+@pytest.mark.asyncio
+async def test_batch_shortfall_fails_only_unserved_callers():
+    from services.gateway.core.exceptions import ContainerStartError
+
+    pool = ContainerPool("test-func", max_capacity=3, max_provision_batch=3, acquire_timeout=0.1)
+
+    async def provision(fname, count=1):
+        return _workers(count - 1)
+
+    results = await asyncio.gather(
+        *(pool.acquire(provision) for _ in range(3)), return_exceptions=True
+    )
+
+    assert sum(isinstance(r, WorkerInfo) for r in results) == 2
+    assert sum(isinstance(r, ContainerStartError) for r in results) == 1
+    assert (pool.size, pool.stats["provisioning"]) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_streamed_batch_serves_callers_as_workers_arrive():
+    pool = ContainerPool("test-func", max_capacity=2, max_provision_batch=2)
+    second_ready = asyncio.Event()
+
+    async def provision(fname, count=1):
+        yield WorkerInfo(id="w1", name="n1", ip_address="1.1.1.1")
+        await second_ready.wait()
+        yield WorkerInfo(id="w2", name="n2", ip_address="1.1.1.1")
+
+    first = asyncio.ensure_future(pool.acquire(provision))
+    second = asyncio.ensure_future(pool.acquire(provision))
+
+    assert (await first).id == "w1"
+    assert not second.done()
+    assert pool.stats["provisioning"] == 1
+
+    second_ready.set()
+    assert (await second).id == "w2"
+    assert (pool.size, pool.stats["provisioning"]) == (2, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("selection", ["lifo", "fifo"])
+async def test_initialized_workers_are_preferred(selection):
+    pool = ContainerPool("test-func", max_capacity=3, selection=selection)
+    workers = _workers(3)
+    workers[0].initialized = True
+    workers[2].initialized = True
+    for worker in workers:
+        await pool.adopt(worker)
+
+    first = await pool.acquire(AsyncMock())
+    second = await pool.acquire(AsyncMock())
+    third = await pool.acquire(AsyncMock())
+
+    expected = ["c2", "c0", "c1"] if selection == "lifo" else ["c0", "c2", "c1"]
+    assert [first.id, second.id, third.id] == expected
+    assert pool.stats["idle"] == 0
@@ -0,0 +1,137 @@
+"""
+Tests for request deadline propagation and client-disconnect cancellation.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.config import GatewayConfig
+from services.gateway.core.deadline import Deadline, parse_timeout_header
+from services.gateway.core.exceptions import DeadlineExceededError
+from services.gateway.main import _unless_disconnected
+from services.gateway.services.container_pool import ContainerPool
+from services.gateway.services.function_registry import FunctionRegistry
+from services.gateway.services.lambda_invoker import LambdaInvoker
+
+
+def test_deadline_cap_and_earliest():
+    soon = Deadline.after(1.0)
+    later = Deadline.after(60.0)
+    assert soon.earliest(later) is soon
+    assert later.earliest(soon) is soon
+    assert later.earliest(None) is later
+    assert soon.cap(30.0) <= 1.0
+    assert not soon.expired
+    assert Deadline.after(-5).remaining() == 0.0
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("2.5", 2.5), ("10", 10.0), (None, None), ("", None), ("abc", None), ("0", None)],
+)
+def test_parse_timeout_header(value, expected):
+    assert parse_timeout_header(value) == expected
+
+
+def _invoker(stub_invocation_plans, client=None):
+    registry = MagicMock(spec=FunctionRegistry)
+    registry.get_function_config.return_value = {"image": "img", "timeout": 3}
+    stub_invocation_plans(registry)
+    backend = AsyncMock()
+    backend.acquire_worker.return_value = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")
+    return LambdaInvoker(client or AsyncMock(), registry, GatewayConfig(), backend)
+
+
+@pytest.mark.asyncio
+async def test_rie_timeout_derives_from_function_timeout(stub_invocation_plans):
+    client = AsyncMock()
+    client.post.return_value = MagicMock(status_code=200, headers={})
+    invoker = _invoker(stub_invocation_plans, client)
+
+    await invoker.invoke_function("f", b"{}")
+    assert client.post.call_args.kwargs["timeout"] == pytest.approx(5.0, abs=0.1)
+
+    # A shorter client deadline caps the RIE call.
+    await invoker.invoke_function("f", b"{}", deadline=Deadline.after(1.0))
+    assert client.post.call_args.kwargs["timeout"] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_expired_deadline_while_waiting_raises_deadline_exceeded(stub_invocation_plans):
+    invoker = _invoker(stub_invocation_plans)
+    invoker.backend.acquire_worker.side_effect = asyncio.TimeoutError()
+
+    with pytest.raises(DeadlineExceededError):
+        await invoker.invoke_function("f", b"{}", deadline=Deadline.after(0))
+
+
+@pytest.mark.asyncio
+async def test_cancelled_invocation_destroys_busy_worker(stub_invocation_plans):
+    async def hang(*args, **kwargs):
+        await asyncio.sleep(3600)
+
+    client = AsyncMock()
+    client.post.side_effect = hang
+    invoker = _invoker(stub_invocation_plans, client)
+
+    task = asyncio.create_task(invoker.invoke_function("f", b"{}"))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    worker = invoker.backend.acquire_worker.return_value
+    invoker.backend.evict_worker.assert_awaited_once_with("f", worker, destroy=True)
+    invoker.backend.release_worker.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_is_bounded_by_remaining_deadline():
+    pool = ContainerPool("f", min_capacity=0, max_capacity=1, acquire_timeout=30.0)
+    worker = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")
+    await pool.acquire(AsyncMock(return_value=[worker]))
+
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.acquire(AsyncMock(), timeout=0.05)
+    assert time.monotonic() - started < 1.0
+    assert pool.stats["waiting"] == 0
+
+
+class _DisconnectingRequest:
+    """Request stub whose client disconnects after `after` seconds."""
+
+    def __init__(self, after: float):
+        self.after = after
+        self.url = MagicMock(path="/invoke")
+
+    async def receive(self):
+        await asyncio.sleep(self.after)
+        return {"type": "http.disconnect"}
+
+
+@pytest.mark.asyncio
+async def test_unless_disconnected_cancels_invocation_on_disconnect():
+    cancelled = asyncio.Event()
+
+    async def invocation():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    assert await _unless_disconnected(_DisconnectingRequest(0.01), invocation()) is None
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_unless_disconnected_returns_result():
+    async def invocation():
+        return "ok"
+
+    assert await _unless_disconnected(_DisconnectingRequest(3600), invocation()) == "ok"
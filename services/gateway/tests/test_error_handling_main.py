@@ -20,3 +20,18 @@ def test_resource_exhausted_error_returns_429():
         # Before implementation: 500 (or unhandled exception)
         assert response.status_code == 429
         assert response.json()["message"] == "Too Many Requests"
+
+
+def test_admission_rejection_sets_retry_after():
+    """Shed requests tell the client when to retry."""
+    import asyncio
+    from unittest.mock import MagicMock
+    from services.gateway.core.exceptions import AdmissionRejectedError
+    from services.gateway.main import resource_exhausted_handler
+
+    exc = AdmissionRejectedError("f", "queue is full (4 waiting)", retry_after=2.2)
+    response = asyncio.run(resource_exhausted_handler(MagicMock(), exc))
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "3"
+    assert response.headers["x-amzn-ErrorType"] == "TooManyRequestsException"
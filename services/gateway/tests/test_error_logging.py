@@ -68,7 +68,7 @@ def mock_dependencies(main_app):
 
 
 @pytest.mark.asyncio
-async def test_lambda_connection_error_logged_at_error_level(caplog):
+async def test_lambda_connection_error_logged_at_error_level(caplog, stub_invocation_plans):
     """
     Verify Lambda connection failures are logged at error level.
     """
@@ -89,6 +89,7 @@ async def test_lambda_connection_error_logged_at_error_level(caplog):
     # Create Invoker with mock client
     mock_registry = MagicMock(spec=FunctionRegistry)
     mock_registry.get_function_config.return_value = {"image": "test-image", "environment": {}}
+    stub_invocation_plans(mock_registry)
 
     # Backend Mock
     mock_backend = AsyncMock()
@@ -137,7 +138,7 @@ async def test_lambda_connection_error_logged_at_error_level(caplog):
 
 
 @pytest.mark.asyncio
-async def test_lambda_connection_error_includes_detailed_info(caplog):
+async def test_lambda_connection_error_includes_detailed_info(caplog, stub_invocation_plans):
     """
     Verify logs include detailed info (host, port, timeout, error_detail) on connection failure.
     """
@@ -156,6 +157,7 @@ async def test_lambda_connection_error_includes_detailed_info(caplog):
 
     mock_registry = MagicMock(spec=FunctionRegistry)
     mock_registry.get_function_config.return_value = {"image": "test-image", "environment": {}}
+    stub_invocation_plans(mock_registry)
 
     # Backend Mock
     mock_backend = AsyncMock()
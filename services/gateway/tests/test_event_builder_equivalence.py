@@ -0,0 +1,109 @@
+"""
+Equivalence tests: V1FastProxyEventBuilder must produce exactly the event
+V1ProxyEventBuilder (Pydantic reference) produces, including key order.
+"""
+
+import gzip
+import json
+import pytest
+from unittest.mock import patch
+from fastapi import Request
+from services.gateway.core.event_builder import (
+    V1ProxyEventBuilder,
+    V1FastProxyEventBuilder,
+    create_event_builder,
+)
+
+
+def _scope(
+    method="POST",
+    path="/api/items/42",
+    query_string=b"",
+    headers=None,
+    client=("10.0.0.5", 40000),
+    http_version="1.1",
+):
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": query_string,
+        "headers": headers if headers is not None else [],
+        "http_version": http_version,
+    }
+    if client is not None:
+        scope["client"] = client
+    return scope
+
+
+CASES = {
+    "basic": (
+        _scope(
+            headers=[(b"content-type", b"application/json"), (b"user-agent", b"ua/1.0")],
+        ),
+        b'{"key": "value"}',
+        {"user_id": "alice", "path_params": {"id": "42"}, "route_path": "/api/items/{id}"},
+    ),
+    "multi_value_headers_and_query": (
+        _scope(
+            method="GET",
+            query_string=b"a=1&b=2&a=3&empty=&plus=x+y&enc=%E3%81%82",
+            headers=[
+                (b"x-forwarded-for", b"1.1.1.1"),
+                (b"user-agent", b"first"),
+                (b"x-forwarded-for", b"2.2.2.2"),
+                (b"user-agent", b"second"),
+            ],
+        ),
+        b"",
+        {"user_id": "bob", "path_params": {}, "route_path": "/api/items"},
+    ),
+    "no_client_no_user_agent": (
+        _scope(client=None, http_version="2"),
+        b"plain text",
+        {"user_id": "carol"},
+    ),
+    "gzip_body": (
+        _scope(headers=[(b"content-encoding", b"GZIP")]),
+        gzip.compress(b"compressed"),
+        {"user_id": "dave", "path_params": {"id": "1"}, "route_path": "/api/items/{id}"},
+    ),
+    "binary_body": (
+        _scope(headers=[(b"content-type", b"application/octet-stream")]),
+        b"\xff\xfe\x00\x01",
+        {"user_id": "erin"},
+    ),
+    "query_without_values": (
+        _scope(method="DELETE", query_string=b"&&"),
+        b"",
+        {},
+    ),
+    "anonymous_user_none": (
+        _scope(headers=[(b"user-agent", b"ua")]),
+        b"{}",
+        {"user_id": None, "route_path": "/api/items/{id}"},
+    ),
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("case", sorted(CASES))
+async def test_fast_builder_matches_pydantic_builder(case):
+    scope, body, kwargs = CASES[case]
+
+    with patch(
+        "services.gateway.core.event_builder.get_request_id",
+        return_value="req-fixed",
+    ):
+        expected = await V1ProxyEventBuilder().build(Request(scope), body, **kwargs)
+        actual = await V1FastProxyEventBuilder().build(Request(scope), body, **kwargs)
+
+    assert actual == expected
+    # Same serialized form (key order included), as the payload sent to RIE.
+    assert json.dumps(actual) == json.dumps(expected)
+
+
+def test_create_event_builder_selection():
+    assert isinstance(create_event_builder("pydantic"), V1ProxyEventBuilder)
+    assert isinstance(create_event_builder(" Fast "), V1FastProxyEventBuilder)
+    assert isinstance(create_event_builder("unknown"), V1FastProxyEventBuilder)
@@ -39,3 +39,50 @@ def test_function_registry_get_nonexistent():
             registry = FunctionRegistry()
             registry.load_functions_config()
             assert registry.get_function_config("nonexistent") is None
+
+
+def test_function_registry_builds_invocation_plan(mock_functions_yaml):
+    with patch("builtins.open", mock_open(read_data=mock_functions_yaml)):
+        with patch("services.gateway.config.config.FUNCTIONS_CONFIG_PATH", "dummy/path.yml"):
+            registry = FunctionRegistry()
+            registry.load_functions_config()
+
+    plan = registry.get_invocation_plan("test-func")
+
+    assert plan is not None
+    assert plan.config is registry.get_function_config("test-func")
+    assert plan.ensure_request.function_name == "test-func"
+    assert plan.ensure_request.image == "test-image:latest"
+    assert plan.ensure_request.env["GLOBAL_ENV"] == "true"
+    assert plan.ensure_request.env["AWS_LAMBDA_FUNCTION_NAME"] == "test-func"
+    assert plan.environment["FUNC_ENV"] == "123"
+    assert plan.rie_headers["Content-Type"] == "application/json"
+    assert plan.timeout is None
+    assert registry.get_invocation_plan("nonexistent") is None
+
+
+def test_function_registry_plan_scaling_defaults():
+    yaml_text = """
+functions:
+  scaled:
+    timeout: 15
+    scaling:
+      max_capacity: 4
+  plain: {}
+"""
+    with patch("builtins.open", mock_open(read_data=yaml_text)):
+        with patch("services.gateway.config.config.FUNCTIONS_CONFIG_PATH", "dummy/path.yml"):
+            registry = FunctionRegistry()
+            registry.load_functions_config()
+
+    from services.gateway.config import config
+
+    scaled = registry.get_invocation_plan("scaled")
+    assert scaled.max_capacity == 4
+    assert scaled.min_capacity == config.DEFAULT_MIN_CAPACITY
+    assert scaled.timeout == 15.0
+    assert scaled.ensure_request.env["AWS_LAMBDA_FUNCTION_TIMEOUT"] == "15"
+
+    plain = registry.get_invocation_plan("plain")
+    assert plain.max_capacity == config.DEFAULT_MAX_CAPACITY
+    assert plain.acquire_timeout == config.POOL_ACQUIRE_TIMEOUT
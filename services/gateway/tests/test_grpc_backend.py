@@ -68,6 +68,20 @@ async def test_acquire_worker_success(backend, mock_stub):
     assert req.function_name == "test-func"
 
 
+@pytest.mark.asyncio
+async def test_acquire_worker_skips_readiness_when_agent_verified(backend, mock_stub):
+    mock_stub.EnsureContainer = AsyncMock()
+    mock_stub.EnsureContainer.return_value = agent_pb2.WorkerInfo(
+        id="cat-id", name="cat-name", ip_address="10.0.0.5", port=8080, ready=True
+    )
+
+    with patch.object(backend, "_wait_for_readiness", new_callable=AsyncMock) as mock_ready:
+        worker = await backend.acquire_worker("test-func")
+
+    assert worker.id == "cat-id"
+    mock_ready.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_evict_worker_success(backend, mock_stub):
     mock_stub.DestroyContainer = AsyncMock()
@@ -7,6 +7,22 @@ from services.gateway.pb import agent_pb2
 os.environ["CONTAINERS_NETWORK"] = "test-net"
 
 
+class _StreamCall:
+    """Stand-in for a grpc.aio server-streaming call."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.cancelled = False
+
+    async def __aiter__(self):
+        for message in self.messages:
+            yield message
+
+    def cancel(self):
+        self.cancelled = True
+        return True
+
+
 @pytest.fixture
 def mock_stub():
     with patch("services.gateway.pb.agent_pb2_grpc.AgentServiceStub") as mock:
@@ -31,7 +47,7 @@ def grpc_client(mock_stub, mock_registry):
 
 
 @pytest.mark.asyncio
-async def test_provision_success(grpc_client, mock_stub, mock_registry):
+async def test_provision_success(grpc_client, mock_stub, mock_registry, stub_invocation_plans):
     """Test successful provision with env var injection"""
     # 1. Setup mock
     mock_registry.get_function_config.return_value = {
@@ -49,12 +65,13 @@ async def test_provision_success(grpc_client, mock_stub, mock_registry):
     )
     mock_stub.EnsureContainer = AsyncMock(return_value=mock_response)
 
-    # Mock config.VICTORIALOGS_URL (config object)
+    # Mock config.VICTORIALOGS_URL (read when the invocation plan is built)
     with (
-        patch("services.gateway.config.config") as mock_config,
+        patch("services.gateway.services.function_registry.config") as mock_config,
         patch.object(grpc_client, "_wait_for_readiness", new_callable=AsyncMock),
     ):
         mock_config.VICTORIALOGS_URL = "http://victorialogs:8428"
+        stub_invocation_plans(mock_registry)
 
         # 2. Call
         workers = await grpc_client.provision("my-func")
@@ -121,3 +138,111 @@ async def test_grpc_list_containers(mock_stub, mock_registry):
     assert workers[0].id == "id-1"
     assert workers[0].name == "lambda-func-1-unique"
     assert workers[0].last_used_at == 123456789
+
+
+@pytest.mark.asyncio
+async def test_provision_opens_pinned_transport(mock_stub, mock_registry, stub_invocation_plans):
+    """Pinned RIE transport is opened after readiness and closed on delete."""
+    from services.gateway.services.grpc_provision import GrpcProvisionClient
+
+    transports = MagicMock()
+    transports.open = AsyncMock()
+    transports.close = AsyncMock()
+    client = GrpcProvisionClient(mock_stub, mock_registry, transports=transports)
+    stub_invocation_plans(mock_registry)
+
+    mock_stub.EnsureContainer = AsyncMock(
+        return_value=agent_pb2.WorkerInfo(id="w1", name="w1", ip_address="10.0.0.1", port=8080)
+    )
+    mock_stub.DestroyContainer = AsyncMock()
+
+    with patch.object(client, "_wait_for_readiness", new_callable=AsyncMock):
+        workers = await client.provision("my-func")
+
+    transports.open.assert_awaited_once_with(workers[0])
+
+    await client.delete_container("w1")
+    transports.close.assert_awaited_once_with("w1")
+
+
+@pytest.mark.asyncio
+async def test_provision_batch_uses_ensure_containers(
+    grpc_client, mock_stub, mock_registry, stub_invocation_plans
+):
+    """count > 1 is one EnsureContainers call; workers failing readiness are dropped and deleted."""
+    from services.gateway.core.exceptions import ContainerStartError
+
+    stub_invocation_plans(mock_registry)
+    mock_stub.EnsureContainers = MagicMock(
+        return_value=_StreamCall(
+            [
+                agent_pb2.WorkerInfo(id="w1", name="w1", ip_address="10.0.0.1", port=8080),
+                agent_pb2.WorkerInfo(id="w2", name="w2", ip_address="10.0.0.2", port=8080),
+            ]
+        )
+    )
+    mock_stub.DestroyContainer = AsyncMock()
+
+    async def readiness(function_name, host, port):
+        if host == "10.0.0.2":
+            raise ContainerStartError(function_name, Exception("not ready"))
+
+    with patch.object(grpc_client, "_wait_for_readiness", side_effect=readiness):
+        workers = await grpc_client.provision("my-func", count=2)
+
+    assert [w.id for w in workers] == ["w1"]
+    request = mock_stub.EnsureContainers.call_args[0][0]
+    assert request.count == 2
+    assert request.container.function_name == "my-func"
+    assert mock_stub.DestroyContainer.call_args[0][0].container_id == "w2"
+
+
+@pytest.mark.parametrize("value", [0, 33])
+def test_provision_batch_max_stays_within_agent_limit(value):
+    """The Agent accepts EnsureContainers with 1..32 containers."""
+    from pydantic import ValidationError
+
+    from services.gateway.config import GatewayConfig
+
+    with pytest.raises(ValidationError):
+        GatewayConfig(PROVISION_BATCH_MAX=value)
+    assert GatewayConfig(PROVISION_BATCH_MAX=32).PROVISION_BATCH_MAX == 32
+
+
+@pytest.mark.asyncio
+async def test_agent_verified_workers_skip_readiness_poll(
+    grpc_client, mock_stub, mock_registry, stub_invocation_plans
+):
+    """Workers marked ready by the Agent are used as is; unmarked ones are still polled."""
+    stub_invocation_plans(mock_registry)
+    call = _StreamCall(
+        [
+            agent_pb2.WorkerInfo(id="w1", ip_address="10.0.0.1", port=8080, ready=True),
+            agent_pb2.WorkerInfo(id="w2", ip_address="10.0.0.2", port=8080),
+        ]
+    )
+    mock_stub.EnsureContainers = MagicMock(return_value=call)
+
+    with patch.object(grpc_client, "_wait_for_readiness", new_callable=AsyncMock) as mock_ready:
+        workers = [w async for w in grpc_client.provision_stream("my-func", 2)]
+
+    assert [w.id for w in workers] == ["w1", "w2"]
+    mock_ready.assert_awaited_once_with("my-func", "10.0.0.2", 8080)
+    assert call.cancelled is True
+
+
+@pytest.mark.asyncio
+async def test_readiness_fallback_can_be_disabled(mock_stub, mock_registry, stub_invocation_plans):
+    from services.gateway.services.grpc_provision import GrpcProvisionClient
+
+    client = GrpcProvisionClient(mock_stub, mock_registry, readiness_fallback=False)
+    stub_invocation_plans(mock_registry)
+    mock_stub.EnsureContainer = AsyncMock(
+        return_value=agent_pb2.WorkerInfo(id="w1", ip_address="10.0.0.1", port=8080)
+    )
+
+    with patch.object(client, "_wait_for_readiness", new_callable=AsyncMock) as mock_ready:
+        workers = await client.provision("my-func")
+
+    assert [w.id for w in workers] == ["w1"]
+    mock_ready.assert_not_called()
@@ -10,10 +10,10 @@ from services.common.models.internal import WorkerInfo
 
 
 @pytest.fixture
-def mock_registry():
+def mock_registry(stub_invocation_plans):
     registry = MagicMock(spec=FunctionRegistry)
     registry.get_function_config.return_value = {"image": "hello-world", "environment": {}}
-    return registry
+    return stub_invocation_plans(registry)
 
 
 @pytest.fixture
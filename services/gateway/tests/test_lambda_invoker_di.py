@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import ANY, MagicMock, AsyncMock, patch
 from services.gateway.services.lambda_invoker import LambdaInvoker
 from services.gateway.services.function_registry import FunctionRegistry
 from services.gateway.config import GatewayConfig
@@ -22,7 +22,7 @@ async def test_lambda_invoker_di_initialization():
 
 
 @pytest.mark.asyncio
-async def test_lambda_invoker_invoke_flow():
+async def test_lambda_invoker_invoke_flow(stub_invocation_plans):
     """Test invoke_function uses injected dependencies"""
     # Arrange
     client = AsyncMock()
@@ -41,6 +41,7 @@ async def test_lambda_invoker_invoke_flow():
         "image": "test-image",
         "environment": {"VAR": "VAL"},
     }
+    stub_invocation_plans(registry)
 
     # Mock Backend
     mock_worker = MagicMock()
@@ -60,11 +61,11 @@ async def test_lambda_invoker_invoke_flow():
     await invoker.invoke_function(function_name, payload)
 
     # Assert
-    # 1. Registry called
-    registry.get_function_config.assert_called_with(function_name)
+    # 1. Registry plan looked up
+    registry.get_invocation_plan.assert_called_with(function_name)
 
     # 2. Backend called with correct args
-    backend.acquire_worker.assert_called_once_with(function_name)
+    backend.acquire_worker.assert_called_once_with(function_name, lane="sync", deadline=ANY)
     backend.release_worker.assert_called_once_with(function_name, mock_worker)
 
     # 3. HTTP Client called
@@ -74,7 +75,7 @@ async def test_lambda_invoker_invoke_flow():
 
 
 @pytest.mark.asyncio
-async def test_lambda_invoker_logging_on_error():
+async def test_lambda_invoker_logging_on_error(stub_invocation_plans):
     """Test LambdaInvoker logs errors with extra context"""
     from services.gateway.core.exceptions import LambdaExecutionError
     import httpx
@@ -88,6 +89,7 @@ async def test_lambda_invoker_logging_on_error():
 
     # Setup mocks
     registry.get_function_config.return_value = {"image": "img", "environment": {}}
+    stub_invocation_plans(registry)
     mock_worker = MagicMock()
     mock_worker.ip_address = "host"
     mock_worker.port = 8080
@@ -131,6 +133,8 @@ async def test_lambda_invoker_always_uses_pool_backend():
         mock_config.POOL_ACQUIRE_TIMEOUT = 30.0
         mock_config.HEARTBEAT_INTERVAL = 30
         mock_config.GATEWAY_IDLE_TIMEOUT_SECONDS = 300
+        mock_config.PREDICTIVE_SCALING = False
+        mock_config.NODE_CONCURRENCY_LIMIT = 0
 
         # Use TestClient to run lifespan.
         with TestClient(app) as _:
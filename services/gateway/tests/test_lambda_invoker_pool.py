@@ -5,7 +5,7 @@ TDD: Tests for pool-based invocation with self-healing.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 import httpx
 
 
@@ -13,7 +13,7 @@ class TestLambdaInvokerPoolMode:
     """Tests for LambdaInvoker with PoolManager integration"""
 
     @pytest.fixture
-    def mock_registry(self):
+    def mock_registry(self, stub_invocation_plans):
         """Mock FunctionRegistry"""
         registry = MagicMock()
         registry.get_function_config = MagicMock(
@@ -22,7 +22,7 @@ class TestLambdaInvokerPoolMode:
                 "environment": {"LOG_LEVEL": "DEBUG"},
             }
         )
-        return registry
+        return stub_invocation_plans(registry)
 
     @pytest.fixture
     def mock_config(self):
@@ -81,7 +81,9 @@ class TestLambdaInvokerPoolMode:
         await invoker.invoke_function("hello-world", b'{"test": 1}')
 
         # Pool manager should be used
-        mock_pool_manager.acquire_worker.assert_called_once_with("hello-world")
+        mock_pool_manager.acquire_worker.assert_called_once_with(
+            "hello-world", lane="sync", deadline=ANY
+        )
 
     @pytest.mark.asyncio
     async def test_invoke_with_pool_releases_on_success(
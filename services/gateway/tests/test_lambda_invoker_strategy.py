@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, AsyncMock
+from unittest.mock import ANY, MagicMock, AsyncMock
 from services.gateway.services.lambda_invoker import LambdaInvoker
 from services.gateway.services.function_registry import FunctionRegistry
 from services.gateway.config import GatewayConfig
@@ -7,7 +7,7 @@ from typing import Any, Protocol
 
 
 class InvocationBackend(Protocol):
-    async def acquire_worker(self, function_name: str) -> Any: ...
+    async def acquire_worker(self, function_name: str, lane: str = "sync") -> Any: ...
     async def release_worker(self, function_name: str, worker: Any) -> None: ...
     async def evict_worker(self, function_name: str, worker: Any) -> None: ...
 
@@ -27,7 +27,7 @@ async def test_lambda_invoker_strategy_initialization():
 
 
 @pytest.mark.asyncio
-async def test_lambda_invoker_calls_backend_acquire():
+async def test_lambda_invoker_calls_backend_acquire(stub_invocation_plans):
     """TDD RED: Test LambdaInvoker calls backend.acquire_worker"""
     client = AsyncMock()
     registry = MagicMock(spec=FunctionRegistry)
@@ -42,6 +42,7 @@ async def test_lambda_invoker_calls_backend_acquire():
     invoker = LambdaInvoker(client, registry, config, backend)
 
     registry.get_function_config.return_value = {"image": "img"}
+    stub_invocation_plans(registry)
 
     mock_response = MagicMock()
     mock_response.status_code = 200
@@ -51,5 +52,5 @@ async def test_lambda_invoker_calls_backend_acquire():
 
     await invoker.invoke_function("test-func", b"{}")
 
-    backend.acquire_worker.assert_called_once_with("test-func")
+    backend.acquire_worker.assert_called_once_with("test-func", lane="sync", deadline=ANY)
     backend.release_worker.assert_called_once_with("test-func", mock_worker)
@@ -0,0 +1,158 @@
+"""
+Tests for per-worker outlier detection and ejection.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.config import GatewayConfig
+from services.gateway.core.exceptions import LambdaExecutionError
+from services.gateway.core.outlier_detector import MIN_SAMPLES, OutlierDetector
+from services.gateway.services.function_registry import FunctionRegistry
+from services.gateway.services.lambda_invoker import LambdaInvoker
+
+
+def _warm_up(detector, rtt=0.1, workers=("a", "b", "c")):
+    for _ in range(MIN_SAMPLES):
+        for worker_id in workers:
+            assert detector.record(worker_id, rtt, ok=True) is None
+
+
+def test_slow_worker_is_ejected():
+    detector = OutlierDetector(latency_factor=3.0, interval=0)
+    _warm_up(detector)
+
+    for _ in range(10):
+        reason = detector.record("c", 1.0, ok=True)
+        if reason is not None:
+            break
+    assert reason.startswith("latency")
+    assert detector.stats()["ejected"] == 1
+
+
+def test_failing_worker_is_ejected_while_siblings_are_healthy():
+    detector = OutlierDetector(consecutive_errors=3, interval=0)
+    _warm_up(detector)
+
+    assert detector.record("c", None, ok=False) is None
+    assert detector.record("c", None, ok=False) is None
+    assert detector.record("c", None, ok=False) == "3 consecutive errors"
+    assert detector.forget("c") == 3
+
+
+def test_forget_counts_only_failures_since_the_breaker_reset():
+    detector = OutlierDetector(interval=3600)
+    detector.record("c", None, ok=False, generation=0)
+    detector.record("c", None, ok=False, generation=0)
+    detector.record("c", None, ok=False, generation=1)
+    detector.record("d", None, ok=False, generation=0)
+
+    assert detector.forget("c", generation=1) == 1
+    # "d" failed before the reset; the breaker has already dropped that failure.
+    assert detector.forget("d", generation=1) == 0
+
+
+def test_no_ejection_without_enough_siblings_or_when_all_fail():
+    lonely = OutlierDetector(interval=0)
+    _warm_up(lonely, workers=("a", "b"))
+    for _ in range(10):
+        assert lonely.record("b", 5.0, ok=False) is None
+
+    detector = OutlierDetector(interval=0)
+    _warm_up(detector)
+    for _ in range(10):
+        for worker_id in ("a", "b", "c"):
+            # The function is broken, not one worker: the breaker's job.
+            assert detector.record(worker_id, None, ok=False) is None
+
+
+def test_ejections_are_rate_limited():
+    detector = OutlierDetector(consecutive_errors=1, interval=3600)
+    _warm_up(detector, workers=("a", "b", "c", "d"))
+
+    assert detector.record("c", None, ok=False) is not None
+    assert detector.record("d", None, ok=False) is None
+
+
+@pytest.mark.asyncio
+async def test_invoker_ejects_outlier_without_opening_breaker(stub_invocation_plans):
+    registry = MagicMock(spec=FunctionRegistry)
+    registry.get_function_config.return_value = {"image": "img"}
+    stub_invocation_plans(registry)
+    config = GatewayConfig(CIRCUIT_BREAKER_THRESHOLD=3, OUTLIER_EJECTION_INTERVAL=0)
+    workers = [
+        WorkerInfo(id=f"c{n}", name=f"w{n}", ip_address=f"10.0.0.{n}", initialized=True)
+        for n in range(3)
+    ]
+    sick = workers[2]
+
+    async def post(url, **kwargs):
+        if sick.ip_address in url:
+            raise httpx.ReadTimeout("stuck")
+        return MagicMock(status_code=200, headers={}, content=b"{}")
+
+    client = AsyncMock()
+    client.post.side_effect = post
+    invoker = LambdaInvoker(client, registry, config, AsyncMock(), outlier_detection=True)
+
+    for _ in range(MIN_SAMPLES):
+        for worker in workers[:2]:
+            invoker.backend.acquire_worker.return_value = worker
+            await invoker.invoke_function("f", b"{}")
+
+    invoker.backend.acquire_worker.return_value = sick
+    for _ in range(MIN_SAMPLES):
+        with pytest.raises(LambdaExecutionError):
+            await invoker.invoke_function("f", b"{}")
+        if invoker.backend.evict_worker.await_count:
+            break
+
+    invoker.backend.evict_worker.assert_awaited_once_with("f", sick, destroy=True, replace=True)
+    breaker = invoker.breakers["f"]
+    assert breaker.state == "CLOSED"
+    assert breaker.failures == 0
+    assert invoker.outlier_stats()["f"]["ejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_function_errors_do_not_eject_the_worker(stub_invocation_plans):
+    registry = MagicMock(spec=FunctionRegistry)
+    registry.get_function_config.return_value = {"image": "img"}
+    stub_invocation_plans(registry)
+    config = GatewayConfig(CIRCUIT_BREAKER_THRESHOLD=100, OUTLIER_EJECTION_INTERVAL=0)
+    workers = [
+        WorkerInfo(id=f"c{n}", name=f"w{n}", ip_address=f"10.0.0.{n}", initialized=True)
+        for n in range(3)
+    ]
+    target = workers[2]
+
+    async def post(url, **kwargs):
+        if target.ip_address in url:
+            # The handler rejects this client's payload.
+            return httpx.Response(
+                200,
+                headers={"X-Amz-Function-Error": "Unhandled"},
+                json={"errorType": "ValueError"},
+                request=httpx.Request("POST", url),
+            )
+        return MagicMock(status_code=200, headers={}, content=b"{}")
+
+    client = AsyncMock()
+    client.post.side_effect = post
+    invoker = LambdaInvoker(client, registry, config, AsyncMock(), outlier_detection=True)
+
+    for _ in range(MIN_SAMPLES):
+        for worker in workers[:2]:
+            invoker.backend.acquire_worker.return_value = worker
+            await invoker.invoke_function("f", b"{}")
+
+    invoker.backend.acquire_worker.return_value = target
+    for _ in range(MIN_SAMPLES):
+        with pytest.raises(LambdaExecutionError):
+            await invoker.invoke_function("f", b"{}")
+
+    invoker.backend.evict_worker.assert_not_called()
+    assert invoker.outlier_stats()["f"]["workers"]["c2"]["consecutive_errors"] == 0
@@ -4,9 +4,18 @@ Tests for PoolManager class
 TDD: RED phase - write tests first, then implement.
 """
 
+import asyncio
+import datetime
+import time
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from services.common.models.internal import ContainerMetrics
+from services.gateway.services.autoscaler import PredictiveAutoscaler
+from services.gateway.services.capacity_schedule import parse_capacity_schedule
+from services.gateway.services.pool_manager import TIMER_IDLE, TIMER_RECYCLE
+from services.gateway.services.recycle_policy import RecyclePolicy
+
 
 class TestPoolManagerBasics:
     """Basic tests for PoolManager creation and pool access"""
@@ -196,3 +205,414 @@ class TestPoolManagerHeartbeat:
         assert len(names["function-b"]) == 1
         assert "w1" in names["function-a"]
         assert "w2" in names["function-b"]
+
+    @pytest.mark.asyncio
+    async def test_reconcile_closes_transports_of_unmanaged_workers(
+        self, pool_manager, mock_provision_client
+    ):
+        """reconcile_orphans keeps pinned transports of pooled workers only"""
+        mock_provision_client.list_containers = AsyncMock(return_value=[])
+        mock_provision_client.transports.retain = AsyncMock(return_value=1)
+        await pool_manager.acquire_worker("function-a")
+
+        await pool_manager.reconcile_orphans()
+
+        args, kwargs = mock_provision_client.transports.retain.await_args
+        assert args == ({"c1"},)
+        assert kwargs["grace"] > 0
+
+
+class TestPoolManagerMinCapacity:
+    """Provisioned concurrency: pools are kept warm at min_capacity"""
+
+    @pytest.fixture
+    def mock_provision_client(self):
+        from services.common.models.internal import WorkerInfo
+
+        client = MagicMock()
+        counter = {"n": 0}
+
+        async def provision(function_name):
+            counter["n"] += 1
+            n = counter["n"]
+            return [WorkerInfo(id=f"c{n}", name=f"w{n}", ip_address=f"10.0.0.{n}")]
+
+        client.provision = AsyncMock(side_effect=provision)
+        client.delete_container = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def pool_manager(self, mock_provision_client):
+        from services.gateway.services.pool_manager import PoolManager
+
+        def loader(function_name):
+            min_capacity = 2 if function_name == "warm" else 0
+            return {"scaling": {"max_capacity": 3, "min_capacity": min_capacity}}
+
+        return PoolManager(
+            provision_client=mock_provision_client,
+            config_loader=loader,
+            prewarm_concurrency=2,
+        )
+
+    @pytest.mark.asyncio
+    async def test_ensure_min_capacity_provisions_floor(self, pool_manager, mock_provision_client):
+        provisioned = await pool_manager.ensure_min_capacity(["warm", "cold"])
+
+        assert provisioned == 2
+        assert mock_provision_client.provision.await_count == 2
+        pool = await pool_manager.get_pool("warm")
+        assert pool.stats["idle"] == 2
+        # No pool is created for functions without provisioned concurrency.
+        assert "cold" not in pool_manager._pools
+
+        # Already at the floor: nothing more to do.
+        assert await pool_manager.ensure_min_capacity(["warm"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_evict_replenishes_floor(self, pool_manager, mock_provision_client):
+        await pool_manager.ensure_min_capacity(["warm"])
+        worker = await pool_manager.acquire_worker("warm")
+
+        await pool_manager.evict_worker("warm", worker)
+        await asyncio.gather(*pool_manager._replenish_tasks)
+
+        pool = await pool_manager.get_pool("warm")
+        assert pool.size == 2
+        assert mock_provision_client.provision.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_evict_with_replace_destroys_and_keeps_pool_size(
+        self, pool_manager, mock_provision_client
+    ):
+        first = await pool_manager.acquire_worker("cold")
+        second = await pool_manager.acquire_worker("cold")
+        await pool_manager.release_worker("cold", second)
+
+        await pool_manager.evict_worker("cold", first, destroy=True, replace=True)
+        await asyncio.gather(*pool_manager._replenish_tasks)
+
+        mock_provision_client.delete_container.assert_awaited_once_with(first.id)
+        pool = await pool_manager.get_pool("cold")
+        assert pool.size == 2
+        assert first.id not in {w.id for w in pool.get_all_workers()}
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_floor(self, pool_manager, mock_provision_client):
+        await pool_manager.ensure_min_capacity(["warm"])
+
+        pruned = await pool_manager.prune_all_pools(idle_timeout=-1)
+
+        assert pruned == {}
+        mock_provision_client.delete_container.assert_not_called()
+        pool = await pool_manager.get_pool("warm")
+        assert pool.size == 2
+
+
+class TestPoolManagerWarmup:
+    """Warm-up invocation runs on new workers before they are handed out"""
+
+    @staticmethod
+    def _loader(function_name):
+        return {"scaling": {"max_capacity": 2, "min_capacity": 0}}
+
+    @staticmethod
+    def _warmup(events):
+        async def warmup(function_name, worker):
+            events.append(("warm", worker.id))
+            worker.initialized = True
+
+        return warmup
+
+    @pytest.mark.asyncio
+    async def test_warmup_before_handout(self):
+        from services.common.models.internal import WorkerInfo
+        from services.gateway.services.pool_manager import PoolManager
+
+        events = []
+        client = MagicMock(spec=["provision"])
+        client.provision = AsyncMock(
+            return_value=[WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1")]
+        )
+        manager = PoolManager(client, self._loader, warmup=self._warmup(events))
+
+        worker = await manager.acquire_worker("f")
+
+        assert events == [("warm", "c1")]
+        assert worker.initialized is True
+
+    @pytest.mark.asyncio
+    async def test_streamed_batch_is_warmed_per_worker(self):
+        from services.common.models.internal import WorkerInfo
+        from services.gateway.services.pool_manager import PoolManager
+
+        events = []
+
+        async def provision_stream(function_name, count):
+            for i in range(count):
+                events.append(("ready", f"c{i}"))
+                yield WorkerInfo(id=f"c{i}", name=f"w{i}", ip_address=f"10.0.0.{i}")
+
+        client = MagicMock(spec=["provision", "provision_stream"])
+        client.provision_stream = provision_stream
+        manager = PoolManager(
+            client, self._loader, provision_batch_max=2, warmup=self._warmup(events)
+        )
+
+        workers = await asyncio.gather(manager.acquire_worker("f"), manager.acquire_worker("f"))
+
+        assert [w.id for w in workers] == ["c0", "c1"]
+        assert all(w.initialized for w in workers)
+        assert events == [("ready", "c0"), ("warm", "c0"), ("ready", "c1"), ("warm", "c1")]
+
+
+class TestPoolManagerCapacitySchedule:
+    """Scheduled provisioned concurrency raises and lowers the pool floor"""
+
+    SHIFT = parse_capacity_schedule(
+        [{"start": "08:00", "end": "12:00", "min_capacity": 10, "days": "mon-fri"}]
+    )
+
+    @staticmethod
+    def _at(hour):
+        # 2026-10-19 is a Monday.
+        return datetime.datetime(2026, 10, 19, hour, tzinfo=datetime.timezone.utc)
+
+    @pytest.mark.asyncio
+    async def test_scheduled_floor_is_warmed_and_released(self, pool_manager_factory):
+        manager, _ = pool_manager_factory(
+            {"max_capacity": 20, "min_capacity": 1, "schedule": self.SHIFT},
+            prewarm_concurrency=2,
+            schedule_ramp=0,
+        )
+        manager._schedules["f"] = (1, self.SHIFT)
+
+        assert await manager.apply_capacity_schedule(now=self._at(9)) == {"f": 10}
+        await asyncio.gather(*manager._replenish_tasks)
+        pool = await manager.get_pool("f")
+        assert pool.min_capacity == 10
+        assert pool.size == 10
+
+        await manager.apply_capacity_schedule(now=self._at(13))
+        assert pool.min_capacity == 1
+        pruned = await manager.prune_all_pools(idle_timeout=-1)
+        assert len(pruned["f"]) == 9
+
+    @pytest.mark.asyncio
+    async def test_start_only_tracks_functions_with_a_schedule(self, pool_manager_factory):
+        manager, _ = pool_manager_factory()
+        manager.config_loader = MagicMock(
+            side_effect=lambda name: {
+                "scaling": {"min_capacity": 0, "schedule": self.SHIFT if name == "f" else ()}
+            }
+        )
+        manager.schedule_interval = 3600
+
+        await manager.start_capacity_schedule(["f", "g"])
+
+        assert set(manager._schedules) == {"f"}
+        assert manager._schedule_task is not None
+        await manager.shutdown_all()
+        assert manager._schedule_task is None
+
+
+class TestPoolManagerAutoscale:
+    """Predictive scale-out pre-provisions workers ahead of demand"""
+
+    @staticmethod
+    def _manager(factory, max_capacity=4):
+        autoscaler = PredictiveAutoscaler(interval=0.01, cooldown=0.0)
+        manager, _ = factory({"max_capacity": max_capacity}, autoscaler=autoscaler)
+        return manager, autoscaler
+
+    @pytest.mark.asyncio
+    async def test_pre_provisioned_workers_count_hits_misses_and_waste(self, pool_manager_factory):
+        manager, autoscaler = self._manager(pool_manager_factory)
+
+        first = await manager.acquire_worker("f")
+        assert autoscaler.stats()["f"]["misses"] == 1
+        await manager.release_worker("f", first)
+
+        autoscaler.plan = MagicMock(return_value=2)
+        assert manager.autoscale() == 2
+        await asyncio.gather(*manager._replenish_tasks)
+        pool = await manager.get_pool("f")
+        assert pool.size == 3
+
+        # LIFO hands out a pre-provisioned worker first.
+        served = await manager.acquire_worker("f")
+        assert served.id != first.id
+        await manager.release_worker("f", served)
+
+        await manager.prune_all_pools(idle_timeout=-1)
+
+        stats = autoscaler.stats()["f"]
+        assert stats["pre_provisioned"] == 2
+        assert stats["hits"] == 1
+        assert stats["wasted"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_pre_provisioning_stops_at_max_capacity(self, pool_manager_factory):
+        manager, autoscaler = self._manager(pool_manager_factory, max_capacity=2)
+        worker = await manager.acquire_worker("f")
+
+        autoscaler.plan = MagicMock(return_value=5)
+        manager.autoscale()
+        await asyncio.gather(*manager._replenish_tasks)
+
+        pool = await manager.get_pool("f")
+        assert pool.size == 2
+        assert autoscaler.stats()["f"]["pre_provisioned"] == 1
+        await manager.release_worker("f", worker)
+
+    @pytest.mark.asyncio
+    async def test_loop_starts_and_stops(self, pool_manager_factory):
+        manager, autoscaler = self._manager(pool_manager_factory)
+        await manager.acquire_worker("f")
+
+        await manager.start_autoscaler()
+        await asyncio.sleep(0.05)
+        await manager.shutdown_all()
+
+        assert manager._autoscale_task is None
+        assert autoscaler.stats()["f"]["arrival_rate"] >= 0
+
+
+class TestPoolManagerRecycling:
+    """Workers are replaced once scaling.recycle says they are due"""
+
+    @staticmethod
+    def _metrics(current, limit):
+        return ContainerMetrics(
+            container_id="c",
+            function_name="f",
+            container_name="w",
+            state="running",
+            memory_current=current,
+            memory_max=limit,
+            oom_events=0,
+            cpu_usage_ns=0,
+            exit_code=0,
+            restart_count=0,
+            exit_time=0,
+            collected_at=0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_is_replaced_after_max_invocations(self, pool_manager_factory):
+        manager, client = pool_manager_factory(
+            {"max_capacity": 1, "recycle": RecyclePolicy(max_invocations=2)}
+        )
+
+        first = await manager.acquire_worker("f")
+        await manager.release_worker("f", first)
+        assert await manager.acquire_worker("f") is first
+        await manager.release_worker("f", first)
+        await asyncio.gather(*manager._replenish_tasks)
+
+        pool = await manager.get_pool("f")
+        client.delete_container.assert_awaited_once_with(first.id)
+        assert [w.id for w in pool.get_all_workers()] == ["c1"]
+        # The replacement was ready before the old worker went: no cold start.
+        assert pool.stats["idle"] == 1
+
+    @pytest.mark.asyncio
+    async def test_busy_worker_is_removed_on_release_once_replaced(self, pool_manager_factory):
+        manager, client = pool_manager_factory(
+            {"max_capacity": 1, "recycle": RecyclePolicy(memory_high_water=0.8)}
+        )
+        client.get_container_metrics.return_value = self._metrics(90, 100)
+
+        busy = await manager.acquire_worker("f")
+        assert await manager.check_recycling() == 1
+        await asyncio.gather(*manager._replenish_tasks)
+
+        pool = await manager.get_pool("f")
+        # Surged past max_capacity until the old worker is released.
+        assert pool.size == 2
+        client.delete_container.assert_not_called()
+
+        await manager.release_worker("f", busy)
+        await asyncio.gather(*manager._replenish_tasks)
+        client.delete_container.assert_awaited_once_with(busy.id)
+        assert pool.size == 1
+        assert not pool.has_worker(busy)
+
+
+class TestPoolManagerTimers:
+    """Idle expiry, pause and max_age run off the manager's timer wheel"""
+
+    @staticmethod
+    async def _expire(manager, seconds):
+        manager.timers.advance(time.monotonic() + seconds)
+        await asyncio.gather(*manager._replenish_tasks, *manager._pause_tasks.values())
+
+    @pytest.mark.asyncio
+    async def test_idle_worker_expires_by_timer(self, pool_manager_factory):
+        manager, client = pool_manager_factory(idle_timeout=300)
+
+        worker = await manager.acquire_worker("f")
+        assert (TIMER_IDLE, worker.id) not in manager.timers
+        await manager.release_worker("f", worker)
+        assert (TIMER_IDLE, worker.id) in manager.timers
+
+        await self._expire(manager, 299)
+        client.delete_container.assert_not_called()
+        await self._expire(manager, 301)
+        client.delete_container.assert_awaited_once_with(worker.id)
+        assert (await manager.get_pool("f")).size == 0
+        await manager.shutdown_all()
+
+    @pytest.mark.asyncio
+    async def test_reacquired_worker_does_not_expire(self, pool_manager_factory):
+        manager, client = pool_manager_factory(idle_timeout=300)
+
+        worker = await manager.acquire_worker("f")
+        await manager.release_worker("f", worker)
+        assert await manager.acquire_worker("f") is worker
+
+        await self._expire(manager, 301)
+        client.delete_container.assert_not_called()
+        assert len(manager.timers) == 0
+        await manager.shutdown_all()
+
+    @pytest.mark.asyncio
+    async def test_worker_at_min_capacity_is_kept_and_rearmed(self, pool_manager_factory):
+        manager, client = pool_manager_factory({"min_capacity": 1}, idle_timeout=300)
+
+        worker = await manager.acquire_worker("f")
+        await manager.release_worker("f", worker)
+        await self._expire(manager, 301)
+
+        client.delete_container.assert_not_called()
+        assert (TIMER_IDLE, worker.id) in manager.timers
+        await manager.shutdown_all()
+
+    @pytest.mark.asyncio
+    async def test_idle_worker_is_paused_and_resumed(self, pool_manager_factory):
+        manager, client = pool_manager_factory(pause_enabled=True, pause_idle_seconds=30)
+
+        worker = await manager.acquire_worker("f")
+        await manager.release_worker("f", worker)
+        await self._expire(manager, 31)
+        client.pause_container.assert_awaited_once_with("f", worker)
+
+        assert await manager.acquire_worker("f") is worker
+        client.resume_container.assert_awaited_once_with("f", worker)
+        await manager.shutdown_all()
+
+    @pytest.mark.asyncio
+    async def test_worker_past_max_age_is_recycled_by_timer(self, pool_manager_factory):
+        manager, client = pool_manager_factory({"recycle": RecyclePolicy(max_age=3600)})
+
+        worker = await manager.acquire_worker("f")
+        await manager.release_worker("f", worker)
+        assert (TIMER_RECYCLE, worker.id) in manager.timers
+
+        worker.created_at -= 3600
+        await self._expire(manager, 3601)
+        client.delete_container.assert_awaited_once_with(worker.id)
+        pool = await manager.get_pool("f")
+        assert [w.id for w in pool.get_all_workers()] == ["c1"]
+        await manager.shutdown_all()
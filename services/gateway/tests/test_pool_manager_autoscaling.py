@@ -66,6 +66,7 @@ async def test_pm_prune_all_pools():
     mock_pool = AsyncMock()
     w1 = WorkerInfo(id="c1", name="n1", ip_address="1.1.1.1")
     mock_pool.prune_idle_workers.return_value = [w1]
+    mock_pool.warm_deficit = 0
     pm._pools["func1"] = mock_pool
 
     result = await pm.prune_all_pools(idle_timeout=60.0)
@@ -0,0 +1,111 @@
+"""
+Tests for the gateway-wide provisioning scheduler (cold-start burst limiter).
+"""
+
+import asyncio
+import itertools
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.services.pool_manager import PoolManager
+from services.gateway.services.provision_scheduler import ProvisionScheduler
+
+
+@pytest.mark.asyncio
+async def test_in_flight_limit_queues_extra_provisions():
+    scheduler = ProvisionScheduler(max_in_flight=2)
+
+    await scheduler.acquire("f")
+    await scheduler.acquire("f")
+    third = asyncio.create_task(scheduler.acquire("f"))
+    await asyncio.sleep(0)
+    assert not third.done()
+    assert scheduler.stats()["queued"] == 1
+
+    scheduler.release()
+    await third
+    assert scheduler.in_flight == 2
+    stats = scheduler.stats()["functions"]["f"]
+    assert stats["granted"] == 3
+    assert stats["queued"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deepest_queue_goes_first():
+    depths = {"shallow": 1, "deep": 5}
+    scheduler = ProvisionScheduler(max_in_flight=1, queue_depth=lambda name: depths[name])
+    await scheduler.acquire("shallow")
+
+    order = []
+
+    async def provision(name):
+        await scheduler.acquire(name)
+        order.append(name)
+
+    tasks = [asyncio.create_task(provision(n)) for n in ("shallow", "deep")]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["deep", "shallow"]
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_creations():
+    scheduler = ProvisionScheduler(rate=50.0, burst=2)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    for _ in range(4):
+        await scheduler.acquire("f")
+        scheduler.release()
+
+    # Two tokens up front, the other two refill at 50/s.
+    assert loop.time() - started >= 0.03
+    assert scheduler.stats()["functions"]["f"]["max_wait_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue():
+    scheduler = ProvisionScheduler(max_in_flight=1)
+    await scheduler.acquire("f")
+    waiter = asyncio.create_task(scheduler.acquire("g"))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+
+    assert scheduler.stats()["queued"] == 0
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_manager_limits_concurrent_creations():
+    ids = itertools.count()
+    active = 0
+    peak = 0
+
+    async def provision(function_name):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return [WorkerInfo(id=f"c{next(ids)}", name=f"lambda-{function_name}-x", ip_address="")]
+
+    client = MagicMock(spec=["provision"])
+    client.provision = AsyncMock(side_effect=provision)
+    loader = MagicMock(return_value={"scaling": {"max_capacity": 10}})
+    manager = PoolManager(client, loader, provision_scheduler=ProvisionScheduler(max_in_flight=2))
+
+    workers = await asyncio.gather(*(manager.acquire_worker(n) for n in ("a", "b") * 3))
+
+    assert len({w.id for w in workers}) == 6
+    assert peak == 2
+    assert manager.provision_scheduler.in_flight == 0
@@ -0,0 +1,65 @@
+"""
+Tests for worker recycling (scaling.recycle).
+"""
+
+import time
+
+import pytest
+
+from services.common.models.internal import ContainerMetrics, WorkerInfo
+from services.gateway.services.function_registry import build_invocation_plan
+from services.gateway.services.recycle_policy import RecyclePolicy, parse_recycle_policy
+
+
+def _metrics(current, limit, oom_events=0):
+    return ContainerMetrics(
+        container_id="c",
+        function_name="f",
+        container_name="w",
+        state="running",
+        memory_current=current,
+        memory_max=limit,
+        oom_events=oom_events,
+        cpu_usage_ns=0,
+        exit_code=0,
+        restart_count=0,
+        exit_time=0,
+        collected_at=0,
+    )
+
+
+def test_parse_recycle_policy():
+    policy = parse_recycle_policy(
+        {"max_invocations": 100, "max_age": 3600, "memory_high_water": 0.8}
+    )
+    assert policy == RecyclePolicy(max_invocations=100, max_age=3600.0, memory_high_water=0.8)
+    assert parse_recycle_policy(None) is None
+    assert parse_recycle_policy({"max_invocations": 0}) is None
+
+
+@pytest.mark.parametrize("value", [["max_age"], {"max_age": "soon"}, {"memory_high_water": 80}])
+def test_invalid_recycle_policy_is_rejected(value):
+    with pytest.raises(ValueError):
+        parse_recycle_policy(value)
+
+
+def test_invalid_recycle_policy_is_ignored_by_plan():
+    plan = build_invocation_plan("f", {"scaling": {"recycle": {"max_age": "soon"}}})
+    assert plan.recycle is None
+
+
+def test_policy_limits():
+    policy = RecyclePolicy(max_invocations=3, max_age=60, memory_high_water=0.8)
+    now = time.time()
+    worker = WorkerInfo(id="c1", name="w1", ip_address="10.0.0.1", created_at=now)
+    assert policy.due(worker, now) is None
+    worker.invocations = 3
+    assert policy.due(worker, now) == "3 invocations"
+    worker.invocations = 0
+    assert policy.due(worker, now + 61).startswith("age")
+
+    assert policy.memory_due(_metrics(70, 100)) is None
+    assert policy.memory_due(_metrics(85, 100)) is not None
+    assert policy.memory_due(_metrics(10, 100, oom_events=1)) == "1 OOM events"
+    # No memory limit reported.
+    assert policy.memory_due(_metrics(10**9, 0)) is None
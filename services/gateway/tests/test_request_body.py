@@ -0,0 +1,100 @@
+"""
+Tests for services.gateway.core.request_body: spooled bodies must render the
+same proxy event the builders produce for the fully buffered body.
+"""
+
+import gzip
+import json
+import os
+import pytest
+from unittest.mock import patch
+from fastapi import Request
+from services.gateway.core.event_builder import V1FastProxyEventBuilder
+from services.gateway.core.request_body import (
+    SpooledRequestBody,
+    render_proxy_event,
+)
+
+
+def _request(body: bytes, headers=None, chunk_size: int = 1000) -> Request:
+    chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+
+    async def receive():
+        if chunks:
+            return {"type": "http.request", "body": chunks.pop(0), "more_body": bool(chunks)}
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/upload",
+        "query_string": b"",
+        "headers": headers or [],
+        "http_version": "1.1",
+        "client": ("10.0.0.5", 40000),
+    }
+    return Request(scope, receive)
+
+
+async def _render(body: bytes, headers=None, max_memory: int = 1024):
+    builder = V1FastProxyEventBuilder()
+    with patch(
+        "services.gateway.core.event_builder.get_request_id",
+        return_value="req-fixed",
+    ):
+        expected = await builder.build(_request(body, headers), body, user_id="alice")
+        request = _request(body, headers)
+        spool = await SpooledRequestBody.from_request(request, max_memory)
+        event = await builder.build(request, b"", user_id="alice")
+
+    try:
+        payload = render_proxy_event(event, spool)
+        if not isinstance(payload, bytes):
+            payload = b"".join([chunk async for chunk in payload])
+        return spool, payload, expected
+    finally:
+        spool.close()
+
+
+# Multi-byte characters straddle the 1000-byte read chunks and the stream chunks.
+TEXT_BODY = ('{"msg": "こんにちは \\"quoted\\"\\n", "pad": "' + "あ" * 40000 + '"}').encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body,headers",
+    [
+        (TEXT_BODY, None),
+        (os.urandom(200_000), [(b"content-type", b"application/octet-stream")]),
+        (gzip.compress(os.urandom(50_000)), [(b"content-encoding", b"gzip")]),
+        (b"\xe3\x81" * 5000 + b"\xe3", None),  # truncated trailing UTF-8 sequence
+    ],
+    ids=["text", "binary", "gzip", "truncated_utf8"],
+)
+async def test_spilled_body_streams_same_event(body, headers):
+    spool, payload, expected = await _render(body, headers)
+
+    assert not spool.in_memory
+    assert payload == json.dumps(expected, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("body", [b"", b'{"key": "value"}', b"\xff\xfe"])
+async def test_in_memory_body_renders_bytes(body):
+    spool, payload, expected = await _render(body, max_memory=1024 * 1024)
+
+    assert spool.in_memory
+    assert isinstance(payload, bytes)
+    assert json.loads(payload) == expected
+
+
+@pytest.mark.asyncio
+async def test_as_payload_streams_spilled_raw_body():
+    body = os.urandom(100_000)
+    spool = await SpooledRequestBody.from_request(_request(body), max_memory=1024)
+    try:
+        payload = spool.as_payload()
+        assert not isinstance(payload, bytes)
+        assert b"".join([chunk async for chunk in payload]) == body
+    finally:
+        spool.close()
@@ -0,0 +1,376 @@
+"""
+Tests for Lambda response streaming: InvokeWithResponseStream endpoint,
+streamed routes and LambdaInvoker.stream_function.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+import respx
+from botocore.eventstream import EventStreamBuffer
+from fastapi.testclient import TestClient
+
+from services.gateway.api.deps import (
+    get_function_registry,
+    get_lambda_invoker,
+    resolve_lambda_target,
+    verify_authorization,
+)
+from services.gateway.config import GatewayConfig
+from services.gateway.core.exceptions import LambdaExecutionError
+from services.gateway.core.response_stream import (
+    PRELUDE_DELIMITER,
+    encode_invoke_complete,
+    encode_payload_chunk,
+    read_stream_prelude,
+)
+from services.gateway.main import app
+from services.gateway.models import TargetFunction
+from services.gateway.services.function_registry import FunctionRegistry
+from services.gateway.services.lambda_invoker import LambdaInvoker
+
+
+async def _aiter(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def _streaming_invoker(chunks, status_code=200):
+    """Invoker mock whose stream_function yields an RIE response over `chunks`."""
+    invoker = AsyncMock()
+    invoker.closed = False
+
+    @asynccontextmanager
+    async def stream_function(function_name, payload, timeout=None, lane="sync", deadline=None):
+        try:
+            yield httpx.Response(status_code, content=_aiter(chunks))
+        finally:
+            invoker.closed = True
+
+    invoker.stream_function = stream_function
+    return invoker
+
+
+def _decode_events(data: bytes):
+    buffer = EventStreamBuffer()
+    buffer.add_data(data)
+    return [(message.headers[":event-type"], message.payload) for message in buffer]
+
+
+@pytest.fixture
+def streamed_route():
+    app.dependency_overrides[verify_authorization] = lambda: "test-user"
+    app.dependency_overrides[resolve_lambda_target] = lambda: TargetFunction(
+        container_name="stream-func",
+        function_config={},
+        path_params={},
+        route_path="/api/export",
+        response_stream=True,
+    )
+    yield
+    app.dependency_overrides = {}
+
+
+# ===========================================
+# Event stream / prelude helpers
+# ===========================================
+
+
+def test_event_stream_messages_decode_with_botocore():
+    data = encode_payload_chunk(b"hello ") + encode_payload_chunk(b"world")
+    data += encode_invoke_complete()
+
+    assert _decode_events(data) == [
+        ("PayloadChunk", b"hello "),
+        ("PayloadChunk", b"world"),
+        ("InvokeComplete", b"{}"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_read_stream_prelude_splits_metadata():
+    prelude = b'{"statusCode": 201, "headers": {"X-A": "1"}}'
+    chunks = _aiter(
+        [
+            prelude[:10],
+            prelude[10:] + PRELUDE_DELIMITER[:3],
+            PRELUDE_DELIMITER[3:] + b"body",
+            b"more",
+        ]
+    )
+
+    metadata, buffered, exhausted = await read_stream_prelude(chunks)
+
+    assert metadata == {"statusCode": 201, "headers": {"X-A": "1"}}
+    assert buffered == b"body"
+    assert exhausted is False
+    assert [chunk async for chunk in chunks] == [b"more"]
+
+
+@pytest.mark.asyncio
+async def test_read_stream_prelude_raw_and_buffered_output():
+    raw = _aiter([b"plain text", b"rest"])
+    assert await read_stream_prelude(raw) == (None, b"plain text", False)
+
+    envelope = _aiter([b'{"statusCode": 200, ', b'"body": "ok"}'])
+    assert await read_stream_prelude(envelope) == (
+        None,
+        b'{"statusCode": 200, "body": "ok"}',
+        True,
+    )
+
+
+# ===========================================
+# Endpoints
+# ===========================================
+
+
+def test_streamed_route_forwards_prelude_and_chunks(streamed_route):
+    invoker = _streaming_invoker(
+        [
+            b'{"statusCode": 206, "headers": {"Content-Type": "text/plain"}, "cookies": ["a=1"]}',
+            PRELUDE_DELIMITER + b"part1,",
+            b"part2",
+        ]
+    )
+    app.dependency_overrides[get_lambda_invoker] = lambda: invoker
+
+    with TestClient(app) as client:
+        response = client.get("/api/export")
+
+    assert response.status_code == 206
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["set-cookie"] == "a=1"
+    assert response.content == b"part1,part2"
+    assert invoker.closed is True
+
+
+def test_streamed_route_falls_back_to_envelope(streamed_route):
+    invoker = _streaming_invoker([b'{"statusCode": 404, ', b'"body": "{\\"m\\": 1}"}'])
+    app.dependency_overrides[get_lambda_invoker] = lambda: invoker
+
+    with TestClient(app) as client:
+        response = client.get("/api/export")
+
+    assert response.status_code == 404
+    assert response.json() == {"m": 1}
+    assert invoker.closed is True
+
+
+def test_invoke_with_response_stream_endpoint():
+    registry = MagicMock()
+    invoker = _streaming_invoker([b'{"chunk": 1}', b'{"chunk": 2}'])
+    app.dependency_overrides[get_function_registry] = lambda: registry
+    app.dependency_overrides[get_lambda_invoker] = lambda: invoker
+
+    try:
+        with TestClient(app) as client:
+            response = client.post(
+                "/2021-11-15/functions/stream-func/response-streaming-invocations",
+                content=b'{"in": 1}',
+            )
+    finally:
+        app.dependency_overrides = {}
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.amazon.eventstream"
+    assert _decode_events(response.content) == [
+        ("PayloadChunk", b'{"chunk": 1}'),
+        ("PayloadChunk", b'{"chunk": 2}'),
+        ("InvokeComplete", b"{}"),
+    ]
+    assert invoker.closed is True
+
+
+def _failing_invoker(error):
+    invoker = AsyncMock()
+
+    @asynccontextmanager
+    async def stream_function(function_name, payload, timeout=None, lane="sync", deadline=None):
+        raise error
+        yield
+
+    invoker.stream_function = stream_function
+    return invoker
+
+
+def _post_stream_invocation(invoker):
+    app.dependency_overrides[get_function_registry] = lambda: MagicMock()
+    app.dependency_overrides[get_lambda_invoker] = lambda: invoker
+    try:
+        with TestClient(app) as client:
+            return client.post(
+                "/2021-11-15/functions/stream-func/response-streaming-invocations",
+                content=b"{}",
+            )
+    finally:
+        app.dependency_overrides = {}
+
+
+def test_invoke_with_response_stream_reports_function_error_in_stream():
+    request = httpx.Request("POST", "http://10.0.0.9:8080/")
+    rie_response = httpx.Response(
+        200,
+        headers={"X-Amz-Function-Error": "Unhandled"},
+        content=b'{"errorType": "Boom"}',
+        request=request,
+    )
+    cause = httpx.HTTPStatusError("Lambda Function Error", request=request, response=rie_response)
+
+    response = _post_stream_invocation(_failing_invoker(LambdaExecutionError("stream-func", cause)))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.amazon.eventstream"
+    assert response.content == encode_invoke_complete(
+        error_code="Unhandled", error_details='{"errorType": "Boom"}'
+    )
+
+
+def test_invoke_with_response_stream_gateway_failure_is_502():
+    cause = httpx.ConnectError("connection refused")
+
+    response = _post_stream_invocation(_failing_invoker(LambdaExecutionError("stream-func", cause)))
+
+    assert response.status_code == 502
+
+
+# ===========================================
+# LambdaInvoker.stream_function
+# ===========================================
+
+
+@pytest.fixture
+def stream_invoker(stub_invocation_plans):
+    registry = MagicMock(spec=FunctionRegistry)
+    registry.get_function_config.return_value = {"image": "img"}
+    stub_invocation_plans(registry)
+
+    backend = AsyncMock()
+    worker = MagicMock(ip_address="10.0.0.9", port=8080)
+    backend.acquire_worker.return_value = worker
+
+    invoker = LambdaInvoker(httpx.AsyncClient(), registry, GatewayConfig(), backend)
+    return invoker, backend, worker
+
+
+RIE_URL = "http://10.0.0.9:8080/2015-03-31/functions/function/invocations"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_function_holds_worker_until_exit(stream_invoker):
+    invoker, backend, worker = stream_invoker
+    respx.post(RIE_URL).mock(return_value=httpx.Response(200, content=b"streamed"))
+
+    async with invoker.stream_function("stream-func", b"{}") as response:
+        backend.release_worker.assert_not_called()
+        assert await response.aread() == b"streamed"
+
+    backend.release_worker.assert_called_once_with("stream-func", worker)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_function_raises_on_function_error(stream_invoker):
+    invoker, backend, worker = stream_invoker
+    respx.post(RIE_URL).mock(
+        return_value=httpx.Response(
+            200, headers={"X-Amz-Function-Error": "Unhandled"}, json={"errorType": "Boom"}
+        )
+    )
+
+    with pytest.raises(LambdaExecutionError):
+        async with invoker.stream_function("stream-func", b"{}"):
+            pass
+
+    backend.release_worker.assert_called_once_with("stream-func", worker)
+    assert invoker.breakers["stream-func"].failures == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_function_destroys_worker_on_disconnect(stream_invoker):
+    invoker, backend, worker = stream_invoker
+    respx.post(RIE_URL).mock(
+        return_value=httpx.Response(200, stream=httpx.ByteStream(b"first chunk"))
+    )
+
+    async def forward():
+        async with invoker.stream_function("stream-func", b"{}") as response:
+            async for _ in response.aiter_raw():
+                # The client disconnects after the first chunk.
+                raise asyncio.CancelledError
+
+    with pytest.raises(asyncio.CancelledError):
+        await forward()
+
+    backend.evict_worker.assert_awaited_once_with("stream-func", worker, destroy=True)
+    backend.release_worker.assert_not_called()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_function_destroys_worker_cancelled_before_headers(stream_invoker):
+    invoker, backend, worker = stream_invoker
+    sent = asyncio.Event()
+
+    async def hang(request):
+        sent.set()
+        await asyncio.sleep(3600)
+
+    respx.post(RIE_URL).mock(side_effect=hang)
+
+    async def forward():
+        async with invoker.stream_function("stream-func", b"{}"):
+            pass
+
+    task = asyncio.ensure_future(forward())
+    await sent.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    backend.evict_worker.assert_awaited_once_with("stream-func", worker, destroy=True)
+    backend.release_worker.assert_not_called()
+
+
+class _DisconnectingRequest:
+    """Request stub whose client disconnects after `after` seconds."""
+
+    def __init__(self, after: float):
+        self.after = after
+        self.url = MagicMock(path="/api/export")
+
+    async def receive(self):
+        await asyncio.sleep(self.after)
+        return {"type": "http.disconnect"}
+
+
+@pytest.mark.asyncio
+async def test_streamed_route_cancels_open_on_disconnect():
+    from services.gateway.main import CLIENT_CLOSED_REQUEST, _stream_lambda_response
+
+    events = []
+    invoker = AsyncMock()
+
+    @asynccontextmanager
+    async def stream_function(function_name, payload, timeout=None, lane="sync", deadline=None):
+        try:
+            # No response headers from the RIE yet.
+            await asyncio.sleep(3600)
+            yield
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    invoker.stream_function = stream_function
+
+    response = await _stream_lambda_response(
+        _DisconnectingRequest(0.01), invoker, "stream-func", b"{}"
+    )
+
+    assert response.status_code == CLIENT_CLOSED_REQUEST
+    assert events == ["cancelled"]
@@ -0,0 +1,142 @@
+"""
+Tests for pinned per-worker RIE transports.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.config import GatewayConfig
+from services.gateway.services.function_registry import FunctionRegistry
+from services.gateway.services.lambda_invoker import LambdaInvoker
+from services.gateway.services.rie_transport import RieTransportPool
+
+
+class _FakeRie:
+    """Minimal keep-alive HTTP/1.1 server counting accepted connections."""
+
+    def __init__(self):
+        self.connections = 0
+        self.paths = []
+        self.server = None
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                lines = head.decode().split("\r\n")
+                self.paths.append(lines[0].split(" ")[1])
+                length = 0
+                for line in lines[1:]:
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":")[1])
+                if length:
+                    await reader.readexactly(length)
+                status = b"404 Not Found" if self.paths[-1] == "/" else b"200 OK"
+                writer.write(
+                    b"HTTP/1.1 " + status + b"\r\nContent-Length: 2\r\n"
+                    b"Content-Type: application/json\r\n\r\n{}"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self.server.close()
+
+
+def _worker(port, worker_id="c1"):
+    return WorkerInfo(id=worker_id, name=f"lambda-f-{worker_id}", ip_address="127.0.0.1", port=port)
+
+
+@pytest.mark.asyncio
+async def test_transport_opens_connection_once_and_reuses_it():
+    async with _FakeRie() as rie:
+        pool = RieTransportPool(timeout=5.0)
+        worker = _worker(rie.port)
+
+        transport = await pool.open(worker)
+        assert rie.connections == 1
+        assert rie.paths == ["/"]
+        assert transport.last_connect_ms is not None
+
+        url = f"http://127.0.0.1:{rie.port}/2015-03-31/functions/function/invocations"
+        for _ in range(3):
+            response = await transport.client.post(url, content=b"{}")
+            assert response.status_code == 200
+
+        assert rie.connections == 1
+        assert transport.connects == 1
+        assert transport.requests == 4
+        assert transport.last_ttfb_ms is not None
+        assert pool.stats()["c1"]["requests"] == 4
+
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_only_transports_of_unmanaged_workers_are_closed():
+    async with _FakeRie() as rie:
+        pool = RieTransportPool(timeout=5.0)
+        live = _worker(rie.port, "c1")
+        surge = _worker(rie.port, "c2")
+        gone = _worker(rie.port, "c3")
+        for worker in (live, surge, gone):
+            await pool.open(worker)
+
+        # No cap: a recycling surge above max_capacity keeps every live client.
+        assert all(pool.get(w) is not None for w in (live, surge, gone))
+        assert await pool.retain({"c1", "c2"}, grace=60) == 0
+        assert await pool.retain({"c1", "c2"}) == 1
+        assert pool.get(gone) is None
+        assert not pool.get(live).client.is_closed
+
+        await pool.close("c2")
+        assert pool.get(surge) is None
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_invoker_sends_through_pinned_transport(stub_invocation_plans):
+    async with _FakeRie() as rie:
+        pool = RieTransportPool(timeout=5.0)
+        worker = _worker(rie.port)
+        await pool.open(worker)
+
+        registry = MagicMock(spec=FunctionRegistry)
+        registry.get_function_config.return_value = {"image": "img"}
+        stub_invocation_plans(registry)
+        backend = AsyncMock()
+        backend.acquire_worker.return_value = worker
+        shared = AsyncMock()
+
+        invoker = LambdaInvoker(shared, registry, GatewayConfig(), backend, transports=pool)
+        response = await invoker.invoke_function("f", b"{}")
+
+        assert response.status_code == 200
+        shared.post.assert_not_called()
+        assert rie.connections == 1
+        await pool.aclose()
+
+
+@pytest.mark.asyncio
+async def test_warm_failure_is_not_fatal():
+    pool = RieTransportPool(timeout=0.5)
+    # Nothing listens on port 9 (discard) on loopback.
+    transport = await pool.open(_worker(9))
+
+    assert transport.connects == 0
+    with pytest.raises(httpx.ConnectError):
+        await transport.client.get("http://127.0.0.1:9/")
+    await pool.aclose()
@@ -46,3 +46,119 @@ def test_route_matcher_no_match(mock_registry):
 
             container, _, _, _ = matcher.match_route("/unknown", "GET")
             assert container is None
+
+
+@pytest.fixture
+def overlapping_routes_yaml():
+    return """
+routes:
+  - path: "/api/users/{user_id}"
+    method: "GET"
+    function: "get-user"
+  - path: "/api/users/me"
+    method: "GET"
+    function: "get-me"
+  - path: "/api/users/{user_id}/posts/{post_id}"
+    method: "GET"
+    function: "get-post"
+  - path: "/api/files/{name}.json"
+    method: "GET"
+    function: "get-file"
+  - path: "/api/users/{user_id}"
+    method: "delete"
+    function: "delete-user"
+"""
+
+
+def _load_matcher(registry, yaml_text, **kwargs):
+    with patch("builtins.open", mock_open(read_data=yaml_text)):
+        with patch("services.gateway.config.config.ROUTING_CONFIG_PATH", "dummy/routes.yml"):
+            matcher = RouteMatcher(registry, **kwargs)
+            matcher.load_routing_config()
+    return matcher
+
+
+def test_route_matcher_static_segment_precedence(mock_registry, overlapping_routes_yaml):
+    matcher = _load_matcher(mock_registry, overlapping_routes_yaml)
+
+    container, params, route_path, _ = matcher.match_route("/api/users/me", "GET")
+    assert container == "get-me"
+    assert params == {}
+    assert route_path == "/api/users/me"
+
+    container, params, _, _ = matcher.match_route("/api/users/42", "GET")
+    assert container == "get-user"
+    assert params == {"user_id": "42"}
+
+
+def test_route_matcher_nested_params_and_backtracking(mock_registry, overlapping_routes_yaml):
+    matcher = _load_matcher(mock_registry, overlapping_routes_yaml)
+
+    # "me" first follows the static branch, which has no /posts child.
+    container, params, _, _ = matcher.match_route("/api/users/me/posts/7", "GET")
+    assert container == "get-post"
+    assert params == {"user_id": "me", "post_id": "7"}
+
+
+def test_route_matcher_embedded_param_segment(mock_registry, overlapping_routes_yaml):
+    matcher = _load_matcher(mock_registry, overlapping_routes_yaml)
+
+    container, params, _, _ = matcher.match_route("/api/files/report.json", "GET")
+    assert container == "get-file"
+    assert params == {"name": "report"}
+
+    container, _, _, _ = matcher.match_route("/api/files/report.xml", "GET")
+    assert container is None
+
+
+def test_route_matcher_method_and_segment_boundaries(mock_registry, overlapping_routes_yaml):
+    matcher = _load_matcher(mock_registry, overlapping_routes_yaml)
+
+    container, _, _, _ = matcher.match_route("/api/users/42", "DELETE")
+    assert container == "delete-user"
+    assert matcher.match_route("/api/users/42", "PUT")[0] is None
+    # Params never match empty or multiple segments.
+    assert matcher.match_route("/api/users/", "GET")[0] is None
+    assert matcher.match_route("/api/users/1/2", "GET")[0] is None
+
+
+def test_route_matcher_cache_returns_independent_params(mock_registry, overlapping_routes_yaml):
+    matcher = _load_matcher(mock_registry, overlapping_routes_yaml, cache_size=2)
+
+    _, params, _, _ = matcher.match_route("/api/users/42", "GET")
+    params["user_id"] = "mutated"
+    _, params, _, _ = matcher.match_route("/api/users/42", "GET")
+    assert params == {"user_id": "42"}
+
+    matcher.match_route("/api/users/1", "GET")
+    matcher.match_route("/api/users/2", "GET")
+    assert len(matcher._cache) == 2
+
+
+def test_route_matcher_does_not_reload_empty_config(mock_registry):
+    matcher = _load_matcher(mock_registry, "routes: []")
+
+    with patch("builtins.open", mock_open(read_data="routes: []")) as opened:
+        matcher.match_route("/unknown", "GET")
+        matcher.match_route("/unknown", "GET")
+        opened.assert_not_called()
+
+
+def test_route_matcher_response_stream_flag(mock_registry):
+    matcher = _load_matcher(
+        mock_registry,
+        """
+routes:
+  - path: "/api/export/{id}"
+    method: "GET"
+    function: "export"
+    response_stream: true
+  - path: "/api/items/{id}"
+    method: "GET"
+    function: "items"
+""",
+    )
+
+    assert matcher.is_response_stream("/api/export/1", "get") is True
+    assert matcher.is_response_stream("/api/items/1", "GET") is False
+    assert matcher.is_response_stream("/unknown", "GET") is False
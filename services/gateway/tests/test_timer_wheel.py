@@ -0,0 +1,112 @@
+"""
+Tests for the timer wheel.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.gateway.core.timer_wheel import TimerWheel
+from services.gateway.services.janitor import HeartbeatJanitor
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_timer_fires_within_one_tick_of_its_deadline():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+    fired = []
+    wheel.schedule("a", 2.5, lambda: fired.append(clock.now))
+
+    for step in range(1, 41):
+        clock.now = step / 10
+        wheel.advance()
+    assert len(fired) == 1
+    assert 2.5 <= fired[0] < 3.5
+    assert len(wheel) == 0
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_reschedule_and_cancel():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, slots=8, clock=clock)
+    fired = []
+    wheel.schedule("a", 5, lambda: fired.append("first"))
+    wheel.schedule("a", 1, lambda: fired.append("moved"))
+    wheel.schedule("b", 1, lambda: fired.append("b"))
+    assert wheel.cancel("b")
+    assert not wheel.cancel("b")
+
+    clock.now = 10
+    assert wheel.advance() == 1
+    assert fired == ["moved"]
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_deadline_beyond_one_revolution():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, slots=4, clock=clock)
+    fired = []
+    wheel.schedule("late", 10, lambda: fired.append(clock.now))
+    wheel.schedule("early", 2, lambda: fired.append(clock.now))
+
+    for second in range(1, 12):
+        clock.now = second
+        wheel.advance()
+    assert fired == [2, 10]
+    await wheel.stop()
+
+
+@pytest.mark.asyncio
+async def test_stalled_wheel_fires_everything_due_in_deadline_order():
+    clock = FakeClock()
+    wheel = TimerWheel(tick=1.0, slots=4, clock=clock)
+    fired = []
+    for delay in (30, 5, 17):
+        wheel.schedule(delay, delay, lambda delay=delay: fired.append(delay))
+    wheel.schedule("boom", 1, lambda: 1 / 0)
+    wheel.schedule("pending", 500, lambda: fired.append("pending"))
+
+    clock.now = 100
+    assert wheel.advance() == 4
+    assert fired == [5, 17, 30]
+    assert "pending" in wheel
+    await wheel.stop()
+    assert len(wheel) == 0
+
+
+@pytest.mark.asyncio
+async def test_driver_task_runs_only_while_timers_are_pending():
+    wheel = TimerWheel(tick=0.02)
+    fired = asyncio.Event()
+    wheel.schedule("a", 0.05, fired.set)
+    await asyncio.wait_for(fired.wait(), timeout=1)
+    await asyncio.sleep(0.05)
+    assert wheel._task is None
+
+    wheel.schedule("b", 60, lambda: None)
+    assert wheel._task is not None
+    await wheel.stop()
+    assert wheel._task is None
+
+
+@pytest.mark.asyncio
+async def test_janitor_without_pruning_only_refills():
+    pool_manager = MagicMock()
+    pool_manager.prune_all_pools = AsyncMock()
+    pool_manager.reconcile_orphans = AsyncMock()
+    janitor = HeartbeatJanitor(pool_manager, manager_client=None, prune=False)
+
+    await janitor._send_heartbeat()
+    pool_manager.prune_all_pools.assert_not_called()
+    pool_manager.replenish_below_floor.assert_called_once_with()
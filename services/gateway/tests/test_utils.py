@@ -1,5 +1,7 @@
+import base64
 from unittest.mock import patch
 import httpx
+from services.common.core import json_codec
 from services.gateway.core.utils import parse_lambda_response
 
 
@@ -27,3 +29,81 @@ def test_parse_lambda_response_logs_warning_on_invalid_json_body():
 
         # Result should remain the original string.
         assert result["content"] == "{invalid json here"
+
+
+def test_passthrough_emits_string_body_as_is():
+    body = '{"items": [1, 2, 3]}'
+    response = httpx.Response(
+        200,
+        json={"statusCode": 201, "headers": {"X-Custom": 1}, "body": body},
+    )
+
+    with patch("services.gateway.core.utils.json_codec.loads", wraps=json_codec.loads) as loads:
+        result = parse_lambda_response(response, passthrough=True)
+        # Only the envelope is parsed, never the body.
+        loads.assert_called_once()
+
+    assert result["status_code"] == 201
+    assert result["raw_content"] == body.encode("utf-8")
+    assert result["headers"] == {"X-Custom": "1", "Content-Type": "application/json"}
+
+
+def test_passthrough_keeps_lambda_content_type_for_text():
+    response = httpx.Response(
+        200,
+        json={"statusCode": 200, "headers": {"content-type": "text/html"}, "body": "<p>hi</p>"},
+    )
+
+    result = parse_lambda_response(response, passthrough=True)
+
+    assert result["raw_content"] == b"<p>hi</p>"
+    assert result["headers"] == {"content-type": "text/html"}
+
+
+def test_passthrough_decodes_base64_body():
+    payload = b"\x89PNG\r\n\x1a\n\x00binary"
+    response = httpx.Response(
+        200,
+        json={
+            "statusCode": 200,
+            "headers": {"Content-Type": "image/png"},
+            "body": base64.b64encode(payload).decode(),
+            "isBase64Encoded": True,
+        },
+    )
+
+    result = parse_lambda_response(response, passthrough=True)
+
+    assert result["raw_content"] == payload
+    assert result["headers"]["Content-Type"] == "image/png"
+
+
+def test_passthrough_forwards_non_envelope_output_without_parsing():
+    content = b'[{"id": 1}, {"id": 2}]'
+    response = httpx.Response(200, content=content)
+
+    with patch("services.gateway.core.utils.json_codec.loads") as loads:
+        result = parse_lambda_response(response, passthrough=True)
+        loads.assert_not_called()
+
+    assert result["status_code"] == 200
+    assert result["raw_content"] == content
+    assert result["headers"] == {"Content-Type": "application/json"}
+
+
+def test_passthrough_nested_status_code_is_not_an_envelope():
+    content = b'{"result": {"statusCode": 1}}'
+    result = parse_lambda_response(httpx.Response(200, content=content), passthrough=True)
+
+    assert result["status_code"] == 200
+    assert result["raw_content"] == content
+
+
+def test_passthrough_invalid_json_returns_rie_response():
+    response = httpx.Response(502, content=b'"statusCode" garbage', headers={"X-Rie": "1"})
+
+    result = parse_lambda_response(response, passthrough=True)
+
+    assert result["status_code"] == 502
+    assert result["raw_content"] == b'"statusCode" garbage'
+    assert result["headers"]["x-rie"] == "1"
@@ -0,0 +1,63 @@
+"""
+Tests for the post-provisioning warm-up invocation.
+"""
+
+import base64
+import json
+
+import httpx
+import pytest
+import respx
+
+from services.common.models.internal import WorkerInfo
+from services.gateway.services.warmup import WARMUP_CONTEXT_KEY, WarmupInvoker
+
+RIE_URL = "http://10.0.0.7:8080/2015-03-31/functions/function/invocations"
+
+
+def _worker():
+    return WorkerInfo(id="c1", name="lambda-f-c1", ip_address="10.0.0.7", port=8080)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_warmup_marks_worker_initialized():
+    route = respx.post(RIE_URL).mock(return_value=httpx.Response(200, json={"warmup": True}))
+    worker = _worker()
+
+    async with httpx.AsyncClient() as client:
+        assert await WarmupInvoker(client, timeout=5.0).warm("f", worker) is True
+
+    assert worker.initialized is True
+    context = json.loads(base64.b64decode(route.calls[0].request.headers["X-Amz-Client-Context"]))
+    assert context["custom"][WARMUP_CONTEXT_KEY]
+
+
+@pytest.mark.asyncio
+@respx.mock
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(502),
+        httpx.Response(200, headers={"X-Amz-Function-Error": "Unhandled"}, json={}),
+    ],
+    ids=["rie_error", "init_error"],
+)
+async def test_failed_warmup_leaves_worker_uninitialized(response):
+    respx.post(RIE_URL).mock(return_value=response)
+    worker = _worker()
+
+    async with httpx.AsyncClient() as client:
+        assert await WarmupInvoker(client, timeout=5.0).warm("f", worker) is False
+
+    assert worker.initialized is False
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_warmup_connect_error_is_not_fatal():
+    respx.post(RIE_URL).mock(side_effect=httpx.ConnectError("refused"))
+    worker = _worker()
+
+    async with httpx.AsyncClient() as client:
+        assert await WarmupInvoker(client, timeout=5.0).warm("f", worker) is False
@@ -5,9 +5,13 @@ Parse SAM template (YAML) and extract Lambda function information.
 Safely handle CloudFormation intrinsic functions (!Sub, !Ref, etc.).
 """
 
+import logging
+import re
 import yaml
 from typing import Any
 
+logger = logging.getLogger(__name__)
+
 
 class CfnLoader(yaml.SafeLoader):
     """YAML loader that handles CloudFormation intrinsic functions."""
@@ -103,6 +107,9 @@ def parse_sam_template(content: str, parameters: dict | None = None) -> dict:
 
         # --- Phase 1: Events (API Gateway) parsing ---
         events = props.get("Events", {})
+        # Function URL streaming mode applies to all of the function's routes.
+        invoke_mode = props.get("FunctionUrlConfig", {}).get("InvokeMode", "BUFFERED")
+        response_stream = invoke_mode == "RESPONSE_STREAM"
         api_routes = []
         for event_name, event_props in events.items():
             # Only handle Type: Api (API Gateway).
@@ -112,7 +119,10 @@ def parse_sam_template(content: str, parameters: dict | None = None) -> dict:
                 method = evt_properties.get("Method")
 
                 if path and method:
-                    api_routes.append({"path": path, "method": method})
+                    route = {"path": path, "method": method}
+                    if response_stream:
+                        route["response_stream"] = True
+                    api_routes.append(route)
 
         # --- Phase 1.5: Scaling (SAM Standard) parsing ---
         max_capacity = props.get("ReservedConcurrentExecutions")
@@ -122,6 +132,8 @@ def parse_sam_template(content: str, parameters: dict | None = None) -> dict:
         scaling_config = {}
         if max_capacity is not None:
             scaling_config["max_capacity"] = max_capacity
+            # Lambda's reserved concurrency also guarantees capacity (node budget).
+            scaling_config["reserved_concurrency"] = max_capacity
         if min_capacity is not None:
             scaling_config["min_capacity"] = min_capacity
 
@@ -140,6 +152,24 @@ def parse_sam_template(content: str, parameters: dict | None = None) -> dict:
             }
         )
 
+    # --- Phase 1.6: Scheduled provisioned concurrency (ScalableTarget) ---
+    for resource in resources.values():
+        if resource.get("Type") != "AWS::ApplicationAutoScaling::ScalableTarget":
+            continue
+        props = resource.get("Properties", {})
+        if props.get("ScalableDimension") != "lambda:function:ProvisionedConcurrency":
+            continue
+        func = _find_scalable_target_function(
+            props.get("ResourceId"), functions, resources, parameters
+        )
+        if func is None:
+            continue
+        schedule = _scheduled_actions_to_windows(
+            props.get("ScheduledActions", []), func["scaling"].get("min_capacity", 0)
+        )
+        if schedule:
+            func["scaling"].setdefault("schedule", []).extend(schedule)
+
     # --- Phase 2: Resources & Layers parsing ---
     dynamodb_tables = []
     s3_buckets = []
@@ -222,10 +252,129 @@ def _resolve_intrinsic(value: Any, parameters: dict) -> str:
         return str(value) if value is not None else ""
 
     # Replace ${Param} format.
-    import re
-
     def replace_param(match):
         param_name = match.group(1)
         return parameters.get(param_name, f"${{{param_name}}}")
 
     return re.sub(r"\$\{(\w+)\}", replace_param, value)
+
+
+def _find_scalable_target_function(
+    resource_id: Any, functions: list[dict], resources: dict, parameters: dict
+) -> dict | None:
+    """
+    Find the function a ScalableTarget's ResourceId (function:<name>:<alias>) points to.
+
+    The name may be a function name, a function logical ID (!Ref / ${Fn}) or the
+    alias SAM generates for AutoPublishAlias ({LogicalId}Alias{alias}).
+    """
+    if isinstance(resource_id, list) and len(resource_id) == 2:
+        # !Join [delimiter, [parts...]]
+        delimiter, parts = resource_id
+        resource_id = str(delimiter).join(str(part) for part in parts)
+    if not isinstance(resource_id, str):
+        return None
+
+    parts = resource_id.split(":")
+    if len(parts) < 2 or parts[0] != "function":
+        return None
+    target = parts[1]
+    token = target[2:-1] if target.startswith("${") and target.endswith("}") else target
+    resolved = _resolve_intrinsic(target, parameters)
+
+    for func in functions:
+        props = resources.get(func["logical_id"], {}).get("Properties", {})
+        alias = props.get("AutoPublishAlias")
+        if token == func["logical_id"] or resolved == func["name"]:
+            return func
+        if alias and token == f"{func['logical_id']}Alias{alias}":
+            return func
+    return None
+
+
+_CRON_DAYS = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+
+
+def _cron_day(token: str) -> str:
+    """Convert one cron day-of-week token (1-7 or SUN-SAT) to a schedule day."""
+    # AWS cron numbers days 1 (SUN) to 7 (SAT).
+    if token.isdigit() and 1 <= int(token) <= 7:
+        return _CRON_DAYS[int(token) - 1]
+    if token.lower() in _CRON_DAYS:
+        return token.lower()
+    raise ValueError(f"unsupported day of week {token!r}")
+
+
+def _cron_days(field: str) -> str | None:
+    """
+    Convert a cron day-of-week field (MON-FRI, 2-6, ...) to schedule days.
+
+    Raises:
+        ValueError: for anything but lists and ranges of 1-7 / SUN-SAT
+            (e.g. L, MON#1, 0, 8)
+    """
+    if field in ("*", "?"):
+        return None
+    days = []
+    for item in field.split(","):
+        bounds = item.split("-")
+        if len(bounds) > 2:
+            raise ValueError(f"unsupported day of week {item!r}")
+        days.append("-".join(_cron_day(day) for day in bounds))
+    return ",".join(days)
+
+
+def _scheduled_actions_to_windows(actions: list, base_capacity: int) -> list[dict]:
+    """
+    Convert ScheduledActions into functions.yml schedule windows.
+
+    AWS scheduled actions set the capacity at a point in time; a window runs
+    from one daily action to the next one. Only actions that raise
+    MinCapacity above the function's min_capacity produce a window.
+    Supported schedules: cron(M H ? * DOW *) with fixed minute and hour and
+    DOW made of 1-7 / SUN-SAT. Other actions are skipped with a warning.
+    """
+    daily = []
+    for index, action in enumerate(actions or []):
+        name = action.get("ScheduledActionName", f"window-{index}")
+        schedule = str(action.get("Schedule", "")).strip()
+        match = re.fullmatch(r"cron\((.+)\)", schedule)
+        fields = match.group(1).split() if match else []
+        if (
+            len(fields) != 6
+            or not (fields[0].isdigit() and int(fields[0]) < 60)
+            or not (fields[1].isdigit() and int(fields[1]) < 24)
+            or fields[2] not in ("*", "?")
+            or fields[3] != "*"
+        ):
+            logger.warning(f"Skipping scheduled action {name}: unsupported schedule {schedule!r}")
+            continue
+        try:
+            days = _cron_days(fields[4])
+            min_capacity = action.get("ScalableTargetAction", {}).get("MinCapacity")
+            if min_capacity is not None:
+                min_capacity = int(min_capacity)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping scheduled action {name}: {e}")
+            continue
+        daily.append((int(fields[1]) * 60 + int(fields[0]), name, days, min_capacity, action))
+
+    daily.sort(key=lambda item: item[0])
+    windows = []
+    for index, (start, name, days, min_capacity, action) in enumerate(daily):
+        if min_capacity is None or min_capacity <= base_capacity:
+            continue
+        # A single action raises the floor for the rest of the day.
+        end = daily[(index + 1) % len(daily)][0]
+        window = {
+            "name": name,
+            "start": f"{start // 60:02d}:{start % 60:02d}",
+            "end": f"{end // 60:02d}:{end % 60:02d}",
+            "min_capacity": min_capacity,
+        }
+        if days:
+            window["days"] = days
+        if action.get("Timezone"):
+            window["timezone"] = action["Timezone"]
+        windows.append(window)
+    return windows
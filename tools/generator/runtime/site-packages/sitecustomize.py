@@ -17,6 +17,9 @@ _trace_context = threading.local()
 # --- Config ---
 LOG_LEVEL_MAP = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
 
+# ClientContext.custom key the Gateway sets on its post-provisioning warm-up invocation.
+WARMUP_CONTEXT_KEY = "esb_warmup"
+
 SERVICE_CONFIG = {
     "s3": {
         "env_var": "S3_ENDPOINT",
@@ -56,6 +59,20 @@ def _sync_to_environ(trace_id):
     os.environ["_X_AMZN_TRACE_ID"] = trace_id
 
 
+def _is_warmup_invocation(client_context):
+    """Return True for the Gateway's warm-up invocation (marker in ClientContext.custom)."""
+    if not client_context:
+        return False
+    ctx = client_context
+    if isinstance(ctx, (str, bytes)):
+        try:
+            ctx = json.loads(ctx)
+        except Exception:
+            return False
+    custom = ctx.get("custom") if isinstance(ctx, dict) else getattr(ctx, "custom", None)
+    return isinstance(custom, dict) and bool(custom.get(WARMUP_CONTEXT_KEY))
+
+
 def _log_json(message, level="INFO", **kwargs):
     """Emit internal sitecustomize logs as JSON."""
     entry = {
@@ -332,6 +349,15 @@ def _patch_awslambdaric():
         *args,
         **kwargs,
     ):
+        # Warm-up invocation: RIE has started the runtime and imported the
+        # handler module by now, which is all it is for. Answer it without
+        # calling the handler.
+        if _is_warmup_invocation(client_context):
+            lambda_runtime_client.post_invocation_result(
+                invoke_id, '{"warmup": true}', "application/json"
+            )
+            return
+
         # Set up stdout/stderr hooks.
         # Do this before hydration to capture hydration logs.
         original_stdout = sys.stdout
@@ -160,6 +160,42 @@ class TestSiteCustomize(unittest.TestCase):
                 # Ensure print was called (if logs are redirected to stdout).
                 mock_print.assert_called()
 
+    def test_warmup_invocation_skips_handler(self):
+        """The Gateway's warm-up invocation is answered without running the handler."""
+        original_handle = MagicMock()
+        mock_bootstrap = MagicMock(handle_event_request=original_handle)
+        mock_awslambdaric = MagicMock(bootstrap=mock_bootstrap)
+        modules = {
+            "boto3": MagicMock(),
+            "botocore.config": MagicMock(),
+            "awslambdaric": mock_awslambdaric,
+            "awslambdaric.bootstrap": mock_bootstrap,
+        }
+
+        with patch.dict(sys.modules, modules), patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("VICTORIALOGS_URL", None)
+            import sitecustomize  # noqa: F401
+
+            patched = mock_bootstrap.handle_event_request
+            runtime_client = MagicMock()
+
+            patched(
+                runtime_client,
+                "handler",
+                "req-1",
+                b"{}",
+                "application/json",
+                '{"custom": {"esb_warmup": "1"}}',
+            )
+            original_handle.assert_not_called()
+            runtime_client.post_invocation_result.assert_called_once_with(
+                "req-1", '{"warmup": true}', "application/json"
+            )
+
+            with patch("time.sleep"):
+                patched(runtime_client, "handler", "req-2", b"{}", "application/json", None)
+            original_handle.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -136,6 +136,33 @@ Resources:
         assert func["events"][0]["path"] == "/api/hello"
         assert func["events"][0]["method"] == "post"
 
+    def test_parse_response_stream_invoke_mode(self):
+        """FunctionUrlConfig InvokeMode RESPONSE_STREAM marks the routes as streamed."""
+        sam_content = """
+AWSTemplateFormatVersion: '2010-09-09'
+Transform: AWS::Serverless-2016-10-31
+
+Resources:
+  ExportFunction:
+    Type: AWS::Serverless::Function
+    Properties:
+      FunctionName: lambda-export
+      FunctionUrlConfig:
+        AuthType: NONE
+        InvokeMode: RESPONSE_STREAM
+      Events:
+        ApiEvent:
+          Type: Api
+          Properties:
+            Path: /api/export
+            Method: get
+"""
+        result = parse_sam_template(sam_content)
+
+        assert result["functions"][0]["events"] == [
+            {"path": "/api/export", "method": "get", "response_stream": True}
+        ]
+
     def test_parse_function_with_scaling(self):
         """Parse scaling settings (SAM standard properties)."""
         sam_content = """
@@ -156,8 +183,115 @@ Resources:
         assert len(result["functions"]) == 1
         func = result["functions"][0]
         assert func["scaling"]["max_capacity"] == 5
+        assert func["scaling"]["reserved_concurrency"] == 5
         assert func["scaling"]["min_capacity"] == 2
 
+    def test_parse_scheduled_provisioned_concurrency(self):
+        """Map ScalableTarget scheduled actions to scaling.schedule windows."""
+        sam_content = """
+AWSTemplateFormatVersion: '2010-09-09'
+Transform: AWS::Serverless-2016-10-31
+
+Resources:
+  ShiftFunction:
+    Type: AWS::Serverless::Function
+    Properties:
+      FunctionName: lambda-shift
+      AutoPublishAlias: live
+      ProvisionedConcurrencyConfig:
+        ProvisionedConcurrentExecutions: 1
+  ShiftScalableTarget:
+    Type: AWS::ApplicationAutoScaling::ScalableTarget
+    Properties:
+      ServiceNamespace: lambda
+      ScalableDimension: lambda:function:ProvisionedConcurrency
+      ResourceId: !Sub function:${ShiftFunction}:live
+      MinCapacity: 1
+      MaxCapacity: 20
+      ScheduledActions:
+        - ScheduledActionName: shift-start
+          Schedule: cron(0 8 ? * MON-FRI *)
+          Timezone: Asia/Tokyo
+          ScalableTargetAction:
+            MinCapacity: 10
+        - ScheduledActionName: shift-end
+          Schedule: cron(0 12 ? * MON-FRI *)
+          Timezone: Asia/Tokyo
+          ScalableTargetAction:
+            MinCapacity: 1
+  BatchScalableTarget:
+    Type: AWS::ApplicationAutoScaling::ScalableTarget
+    Properties:
+      ServiceNamespace: lambda
+      ScalableDimension: lambda:function:ProvisionedConcurrency
+      ResourceId: !Join [":", [function, !Ref ShiftFunctionAliaslive, live]]
+      ScheduledActions:
+        - ScheduledActionName: batch
+          Schedule: cron(45 1 * * ? *)
+          ScalableTargetAction:
+            MinCapacity: 4
+        - ScheduledActionName: weekly
+          Schedule: rate(7 days)
+          ScalableTargetAction:
+            MinCapacity: 9
+"""
+        result = parse_sam_template(sam_content)
+
+        assert result["functions"][0]["scaling"]["schedule"] == [
+            {
+                "name": "shift-start",
+                "start": "08:00",
+                "end": "12:00",
+                "min_capacity": 10,
+                "days": "mon-fri",
+                "timezone": "Asia/Tokyo",
+            },
+            {"name": "batch", "start": "01:45", "end": "01:45", "min_capacity": 4},
+        ]
+
+    def test_unsupported_scheduled_actions_are_skipped(self, caplog):
+        """Day-of-week values outside 1-7 / SUN-SAT skip the action instead of failing."""
+        actions = "".join(
+            f"""
+        - ScheduledActionName: {name}
+          Schedule: cron(0 {hour} ? * {dow} *)
+          ScalableTargetAction:
+            MinCapacity: 5"""
+            for name, hour, dow in [
+                ("zero", 1, "0"),
+                ("eight", 2, "8"),
+                ("last", 3, "L"),
+                ("nth", 4, "MON#1"),
+                ("bogus", 5, "MONDAY"),
+                ("sunday", 6, "1"),
+            ]
+        )
+        sam_content = f"""
+AWSTemplateFormatVersion: '2010-09-09'
+Transform: AWS::Serverless-2016-10-31
+
+Resources:
+  ShiftFunction:
+    Type: AWS::Serverless::Function
+    Properties:
+      FunctionName: lambda-shift
+  ShiftScalableTarget:
+    Type: AWS::ApplicationAutoScaling::ScalableTarget
+    Properties:
+      ScalableDimension: lambda:function:ProvisionedConcurrency
+      ResourceId: function:lambda-shift:live
+      ScheduledActions:{actions}
+"""
+        with caplog.at_level("WARNING"):
+            result = parse_sam_template(sam_content)
+
+        assert result["functions"][0]["scaling"]["schedule"] == [
+            {"name": "sunday", "start": "06:00", "end": "06:00", "min_capacity": 5, "days": "sun"}
+        ]
+        skipped = [r.getMessage() for r in caplog.records]
+        assert len(skipped) == 5
+        assert all(message.startswith("Skipping scheduled action") for message in skipped)
+
     def test_parse_resources(self):
         """Parse DynamoDB and S3 resources."""
         sam_content = """
@@ -95,6 +95,25 @@ class TestFunctionsYmlRenderer:
         assert "max_capacity: 5" in result
         assert "min_capacity: 1" in result
 
+    def test_render_functions_yml_with_schedule(self):
+        """Render scaling.schedule windows as a YAML list."""
+        import yaml
+
+        window = {"name": "shift", "start": "08:00", "end": "12:00", "min_capacity": 10}
+        functions = [
+            {
+                "name": "lambda-shift",
+                "environment": {},
+                "scaling": {"min_capacity": 1, "schedule": [window]},
+            },
+        ]
+
+        result = yaml.safe_load(render_functions_yml(functions))
+
+        scaling = result["functions"]["lambda-shift"]["scaling"]
+        assert scaling["min_capacity"] == 1
+        assert scaling["schedule"] == [window]
+
     def test_render_routing_yml(self):
         """Generate routing.yml."""
         from tools.generator.renderer import render_routing_yml
@@ -121,3 +140,27 @@ class TestFunctionsYmlRenderer:
         assert "/api/s3/test" in result
         assert "/api/s3/check" in result
         assert "GET" in result
+        assert "response_stream" not in result
+
+    def test_render_routing_yml_response_stream(self):
+        """Streamed routes carry response_stream: true."""
+        import yaml
+        from tools.generator.renderer import render_routing_yml
+
+        functions = [
+            {
+                "name": "lambda-export",
+                "events": [{"path": "/api/export", "method": "get", "response_stream": True}],
+            },
+        ]
+
+        routes = yaml.safe_load(render_routing_yml(functions))["routes"]
+
+        assert routes == [
+            {
+                "path": "/api/export",
+                "method": "GET",
+                "function": "lambda-export",
+                "response_stream": True,
+            }
+        ]